@@ -6,10 +6,45 @@ Agent 상태 관리 시스템
 """
 
 import json
+import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable, Awaitable
 from dataclasses import dataclass, field
 from enum import Enum
+import time
+
+
+# 토큰 추정 단위: 한글 음절 연속, 영문/숫자 연속, 그 외 기호 1자
+_TOKEN_PIECE_PATTERN = re.compile(r"[가-힣]+|[A-Za-z0-9_]+|[^\sA-Za-z0-9_가-힣]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    로컬 토큰 수 추정 (SentencePiece 계열 토크나이저 근사)
+
+    공백 단위 단어 수는 한국어에서 실제 토큰 수보다 크게 적으므로 문자 종류별로 셉니다:
+    한글은 약 1.5음절당 1토큰, 영문/숫자는 약 4자당 1토큰, 기호/기타 문자는 1자당 1토큰.
+    API 응답의 usage_metadata 가 없을 때의 대체값과 예산 계산에 사용합니다.
+    """
+    if not text:
+        return 0
+    total = 0
+    for piece in _TOKEN_PIECE_PATTERN.findall(text):
+        first = piece[0]
+        if "가" <= first <= "힣":
+            total += -(-len(piece) * 2 // 3)
+        elif first.isascii() and (first.isalnum() or first == "_"):
+            total += -(-len(piece) // 4)
+        else:
+            total += 1
+    return max(1, total)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """긴 텍스트를 앞부분만 남기고 생략 표시"""
+    if limit <= 0 or len(text) <= limit:
+        return text
+    return f"{text[:limit]}... ({len(text) - limit}자 생략)"
 
 
 class ActionType(Enum):
@@ -80,6 +115,7 @@ class ObservationRecord:
     timestamp: datetime = field(default_factory=datetime.now)
     analysis: Optional[str] = None  # AI의 결과 분석
     lessons_learned: List[str] = field(default_factory=list)
+    cached: bool = False  # 같은 요청의 이전 도구 결과를 재사용했는지
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -88,7 +124,8 @@ class ObservationRecord:
             "data": self.data,
             "timestamp": self.timestamp.isoformat(),
             "analysis": self.analysis,
-            "lessons_learned": self.lessons_learned
+            "lessons_learned": self.lessons_learned,
+            "cached": self.cached
         }
 
 
@@ -136,9 +173,23 @@ class AgentScratchpad:
     LLM이 다음 사고 과정에서 참조할 수 있는 구조화된 메모리를 제공합니다.
     """
     
-    def __init__(self, goal: str, max_steps: int = 10):
+    def __init__(self, goal: str, max_steps: int = 10,
+                 token_budget: Optional[int] = None,
+                 keep_recent_steps: int = 3,
+                 max_observation_chars: int = 400):
+        """
+        Args:
+            goal: 목표
+            max_steps: 최대 단계 수
+            token_budget: 히스토리 프롬프트 토큰 예산 (None이면 제한 없음)
+            keep_recent_steps: 예산 초과 시에도 원문 그대로 유지할 최근 단계 수
+            max_observation_chars: 압축된 단계의 관찰/파라미터 최대 길이
+        """
         self.goal = goal
         self.max_steps = max_steps
+        self.token_budget = token_budget
+        self.keep_recent_steps = keep_recent_steps
+        self.max_observation_chars = max_observation_chars
         self.steps: List[ReActStep] = []
         self.current_step_number = 0
         self.start_time = datetime.now()
@@ -152,6 +203,22 @@ class AgentScratchpad:
         self.failed_tool_calls = 0
         self.unique_tools_used = set()
         
+        # LLM 호출 통계
+        self.llm_calls = 0
+        self.llm_input_tokens = 0
+        self.llm_output_tokens = 0
+        
+        # 목표 달성 확인 통계 (LLM 판정 / 로컬 판단으로 생략)
+        self.goal_checks = {"llm": 0, "skipped": 0}
+        
+        # 렌더링 버퍼: 다음 스텝이 시작되어 더 이상 바뀌지 않는 스텝만 추가 (append-only)
+        # key: (include_metadata, compact) -> 스텝별 렌더링 문자열 목록
+        self._rendered_steps: Dict[tuple, List[str]] = {}
+        self._rendered_tokens: Dict[tuple, List[int]] = {}
+        
+        # 반복(스텝)별 히스토리 프롬프트 크기 지표
+        self.prompt_metrics: Dict[int, Dict[str, Any]] = {}
+        
     def start_new_step(self) -> ReActStep:
         """새로운 ReAct 스텝 시작"""
         self.current_step_number += 1
@@ -199,7 +266,8 @@ class AgentScratchpad:
     
     def add_observation(self, content: str, success: bool = True, 
                        data: Optional[Dict[str, Any]] = None, analysis: Optional[str] = None,
-                       lessons_learned: Optional[List[str]] = None) -> ObservationRecord:
+                       lessons_learned: Optional[List[str]] = None,
+                       cached: bool = False) -> ObservationRecord:
         """현재 스텝에 관찰 기록 추가"""
         if not self.steps:
             self.start_new_step()
@@ -210,7 +278,8 @@ class AgentScratchpad:
             success=success,
             data=data,
             analysis=analysis,
-            lessons_learned=lessons_learned or []
+            lessons_learned=lessons_learned or [],
+            cached=cached
         )
         current_step.observation = observation
         
@@ -227,6 +296,13 @@ class AgentScratchpad:
                 
         return observation
     
+    def record_llm_usage(self, usage: Optional[Dict[str, Any]]):
+        """LLM 호출 1회의 토큰 사용량 기록"""
+        self.llm_calls += 1
+        usage = usage or {}
+        self.llm_input_tokens += int(usage.get("input_tokens") or 0)
+        self.llm_output_tokens += int(usage.get("output_tokens") or 0)
+    
     def update_action_status(self, status: StepStatus, execution_time: Optional[float] = None, 
                            error_message: Optional[str] = None):
         """현재 스텝의 행동 상태 업데이트"""
@@ -237,49 +313,131 @@ class AgentScratchpad:
             action.error_message = error_message
     
     def get_formatted_history(self, include_metadata: bool = False) -> str:
-        """LLM이 이해할 수 있는 포맷으로 히스토리 반환"""
+        """LLM이 이해할 수 있는 포맷으로 히스토리 반환
+
+        완료된(다음 스텝이 시작된) 스텝은 한 번만 렌더링해 버퍼에 보관하고,
+        진행 중인 마지막 스텝만 매번 다시 렌더링합니다.
+        token_budget 을 넘으면 최근 keep_recent_steps 개를 제외한 이전 스텝은
+        관찰/파라미터를 잘라낸 압축 형태로, 그래도 넘치면 요약 한 줄로 대체합니다.
+        """
+        started = time.perf_counter()
         if not self.steps:
             return f"목표: {self.goal}\n\n아직 수행된 단계가 없습니다."
         
-        history = [f"목표: {self.goal}\n"]
+        verbatim, verbatim_tokens = self._rendered_history(include_metadata, compact=False)
+        total_tokens = sum(verbatim_tokens)
+        compacted = 0
+        elided = 0
         
-        for step in self.steps:
-            history.append(f"\n--- 단계 {step.step_number} ---")
-            
-            if step.thought:
-                history.append(f"🤔 사고: {step.thought.content}")
-                if include_metadata:
-                    history.append(f"   (신뢰도: {step.thought.confidence:.2f}, 깊이: {step.thought.reasoning_depth})")
-            
-            if step.action:
-                if step.action.action_type == ActionType.TOOL_CALL:
-                    history.append(f"🔧 행동: {step.action.tool_name} 도구 사용")
-                    if step.action.parameters:
-                        history.append(f"   파라미터: {json.dumps(step.action.parameters, ensure_ascii=False, indent=2)}")
-                elif step.action.action_type == ActionType.FINAL_ANSWER:
-                    history.append("✅ 최종 답변 준비")
-                else:
-                    history.append(f"⚡ 행동: {step.action.action_type.value}")
+        if self.token_budget is None or total_tokens <= self.token_budget:
+            blocks = verbatim
+        else:
+            # 오래된 스텝은 압축 형태 사용, 최근 스텝은 원문 유지
+            compact, compact_tokens = self._rendered_history(include_metadata, compact=True)
+            split = max(len(self.steps) - self.keep_recent_steps, 0)
+            blocks = compact[:split] + verbatim[split:]
+            block_tokens = compact_tokens[:split] + verbatim_tokens[split:]
+            compacted = split
+            total_tokens = sum(block_tokens)
             
-            if step.observation:
-                status_emoji = "✅" if step.observation.success else "❌"
-                history.append(f"{status_emoji} 관찰: {step.observation.content}")
-                
-                if step.observation.analysis:
-                    history.append(f"   분석: {step.observation.analysis}")
-                    
-                if step.observation.lessons_learned:
-                    history.append("   교훈:")
-                    for lesson in step.observation.lessons_learned:
-                        history.append(f"   - {lesson}")
+            # 그래도 예산을 넘으면 가장 오래된 압축 스텝부터 생략
+            while elided < split and total_tokens > self.token_budget:
+                total_tokens -= block_tokens[elided]
+                elided += 1
+            if elided:
+                omitted = self.steps[:elided]
+                calls = sum(1 for st in omitted if st.action and st.action.action_type == ActionType.TOOL_CALL)
+                ok = sum(1 for st in omitted if st.observation and st.observation.success)
+                blocks = [f"\n... (이전 {elided}개 단계 생략: 도구 호출 {calls}회, 성공 {ok}회) ..."] + blocks[elided:]
+                compacted -= elided
+        
+        history = [f"목표: {self.goal}\n"] + blocks
         
         if include_metadata:
             history.append(f"\n📊 통계:")
             history.append(f"- 총 단계: {len(self.steps)}")
             history.append(f"- 도구 호출: {self.total_tool_calls} (성공: {self.successful_tool_calls}, 실패: {self.failed_tool_calls})")
             history.append(f"- 사용된 도구: {', '.join(self.unique_tools_used)}")
+        
+        result = "\n".join(history)
+        self._record_prompt_metrics(result, compacted, elided, started)
+        return result
+    
+    def _rendered_history(self, include_metadata: bool, compact: bool) -> tuple:
+        """스텝별 렌더링 결과와 토큰 추정치 (완료된 스텝은 버퍼 재사용)"""
+        key = (include_metadata, compact)
+        rendered = self._rendered_steps.setdefault(key, [])
+        tokens = self._rendered_tokens.setdefault(key, [])
+        
+        # 마지막 스텝 이전까지는 더 이상 변경되지 않으므로 버퍼에 추가만 함
+        for step in self.steps[len(rendered):-1]:
+            text = self._render_step(step, include_metadata, compact)
+            rendered.append(text)
+            tokens.append(estimate_tokens(text))
+        
+        last = self._render_step(self.steps[-1], include_metadata, compact)
+        return rendered + [last], tokens + [estimate_tokens(last)]
+    
+    def _render_step(self, step: ReActStep, include_metadata: bool, compact: bool) -> str:
+        """스텝 하나를 렌더링 (compact=True면 긴 관찰/파라미터를 잘라냄)"""
+        limit = self.max_observation_chars if compact else 0
+        lines = [f"\n--- 단계 {step.step_number} ---"]
+        
+        if step.thought:
+            lines.append(f"🤔 사고: {_truncate(step.thought.content, limit)}")
+            if include_metadata:
+                lines.append(f"   (신뢰도: {step.thought.confidence:.2f}, 깊이: {step.thought.reasoning_depth})")
+        
+        if step.action:
+            if step.action.action_type == ActionType.TOOL_CALL:
+                lines.append(f"🔧 행동: {step.action.tool_name} 도구 사용")
+                if step.action.parameters:
+                    if compact:
+                        params = json.dumps(step.action.parameters, ensure_ascii=False, default=str)
+                    else:
+                        params = json.dumps(step.action.parameters, ensure_ascii=False, indent=2, default=str)
+                    lines.append(f"   파라미터: {_truncate(params, limit)}")
+            elif step.action.action_type == ActionType.FINAL_ANSWER:
+                lines.append("✅ 최종 답변 준비")
+            else:
+                lines.append(f"⚡ 행동: {step.action.action_type.value}")
+        
+        if step.observation:
+            status_emoji = "✅" if step.observation.success else "❌"
+            lines.append(f"{status_emoji} 관찰: {_truncate(step.observation.content, limit)}")
             
-        return "\n".join(history)
+            if step.observation.analysis:
+                lines.append(f"   분석: {_truncate(step.observation.analysis, limit)}")
+                
+            if step.observation.lessons_learned:
+                lines.append("   교훈:")
+                for lesson in step.observation.lessons_learned:
+                    lines.append(f"   - {lesson}")
+        
+        return "\n".join(lines)
+    
+    def _record_prompt_metrics(self, text: str, compacted: int, elided: int, started: float) -> None:
+        """현재 반복의 히스토리 프롬프트 크기 기록 (반복당 최대값 유지)"""
+        tokens = estimate_tokens(text)
+        current = self.prompt_metrics.get(self.current_step_number)
+        if current is None or tokens >= current["estimated_tokens"]:
+            self.prompt_metrics[self.current_step_number] = {
+                "step": self.current_step_number,
+                "chars": len(text),
+                "estimated_tokens": tokens,
+                "compacted_steps": compacted,
+                "elided_steps": elided,
+                "render_ms": (time.perf_counter() - started) * 1000
+            }
+    
+    def get_prompt_metrics(self) -> Dict[str, Any]:
+        """반복별 히스토리 프롬프트 크기 지표"""
+        per_iteration = [self.prompt_metrics[k] for k in sorted(self.prompt_metrics)]
+        return {
+            "token_budget": self.token_budget,
+            "max_estimated_tokens": max((m["estimated_tokens"] for m in per_iteration), default=0),
+            "per_iteration": per_iteration
+        }
     
     def get_latest_context(self, steps_back: int = 3) -> str:
         """최근 N개 스텝의 컨텍스트 반환 (토큰 절약용)"""
@@ -357,7 +515,10 @@ class AgentScratchpad:
             "total_tool_calls": self.total_tool_calls,
             "successful_tool_calls": self.successful_tool_calls,
             "failed_tool_calls": self.failed_tool_calls,
-            "unique_tools_used": list(self.unique_tools_used)
+            "unique_tools_used": list(self.unique_tools_used),
+            "llm_calls": self.llm_calls,
+            "llm_input_tokens": self.llm_input_tokens,
+            "llm_output_tokens": self.llm_output_tokens
         }
 
 
@@ -372,6 +533,8 @@ class AgentContext:
     constraints: Dict[str, Any] = field(default_factory=dict)
     max_iterations: int = 10
     timeout_seconds: int = 300
+    # 최종 답변 스트리밍 콜백 (누적 텍스트를 받음, 직렬화 대상 아님)
+    stream_callback: Optional[Callable[[str], Awaitable[None]]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -108,7 +108,7 @@ class DynamicPlanAdapter:
     
     def __init__(self, llm_provider: LLMProvider):
         self.llm_provider = llm_provider
-        self.adaptation_history = AdaptationHistory()
+        # 적응 이력은 요청마다 호출자가 history 로 넘김 (공유 인스턴스에 누적하지 않음)
         
         logger.info("동적 계획 수정 시스템 초기화 완료")
     
@@ -117,7 +117,8 @@ class DynamicPlanAdapter:
         plan: ExecutionPlan,
         current_step: PlanStep,
         execution_result: Dict[str, Any],
-        context: AgentContext
+        context: AgentContext,
+        history: Optional[AdaptationHistory] = None
     ) -> Optional[AdaptationEvent]:
         """
         현재 상황 분석하여 적응 필요성 판단
@@ -127,6 +128,7 @@ class DynamicPlanAdapter:
             current_step: 현재 실행 단계
             execution_result: 실행 결과
             context: 에이전트 컨텍스트
+            history: 요청 단위 적응 이력 (있으면 기록)
             
         Returns:
             AdaptationEvent: 적응 이벤트 (필요한 경우)
@@ -198,7 +200,8 @@ class DynamicPlanAdapter:
                 severity=primary_trigger["severity"]
             )
             
-            self.adaptation_history.add_event(event)
+            if history is not None:
+                history.add_event(event)
             logger.info(f"적응 이벤트 감지: {event.description}")
             return event
         
@@ -209,7 +212,8 @@ class DynamicPlanAdapter:
         event: AdaptationEvent,
         plan: ExecutionPlan,
         goal_hierarchy: Optional[GoalHierarchy] = None,
-        context: Optional[AgentContext] = None
+        context: Optional[AgentContext] = None,
+        history: Optional[AdaptationHistory] = None
     ) -> AdaptationAction:
         """
         적응 전략 생성
@@ -219,6 +223,7 @@ class DynamicPlanAdapter:
             plan: 현재 실행 계획
             goal_hierarchy: 목표 계층 구조
             context: 에이전트 컨텍스트
+            history: 요청 단위 적응 이력 (있으면 기록)
             
         Returns:
             AdaptationAction: 적응 행동
@@ -245,13 +250,17 @@ class DynamicPlanAdapter:
                 estimated_time=strategy_data.get("estimated_time", 30.0)
             )
             
-            self.adaptation_history.add_action(action)
+            if history is not None:
+                history.add_action(action)
             logger.info(f"적응 전략 생성 완료: {action.strategy.value}")
             return action
             
         except Exception as e:
             logger.error(f"적응 전략 생성 실패: {e}")
-            return self._create_fallback_strategy(event)
+            action = self._create_fallback_strategy(event)
+            if history is not None:
+                history.add_action(action)
+            return action
     
     async def apply_adaptation(
         self,
@@ -0,0 +1,249 @@
+"""
+목표 달성 빠른 판단 (Deterministic Fast-Path)
+
+도구 관찰마다 LLM 판정(_is_goal_achieved)을 호출하는 대신, 할일 추가/조회, 메모 작성,
+시간 조회처럼 흔한 단일 행동 의도는 로컬에서 목표 달성 여부를 판단합니다.
+
+판단 근거:
+- 의도 분류: 목표 문장의 주제/동사 키워드 규칙
+- 도구 메타데이터: ToolMetadata.is_terminal_call (도구가 선언한 종결 행동)
+- 관찰 성공 여부: 의도에 해당하는 행동이 성공적으로 관찰되었는지
+- 학습 신호: 같은 서명(의도 + 마지막 행동)에 대한 과거 LLM 판정 결과
+
+신뢰도가 임계값 이상이면 LLM 판정을 건너뛰고, 미만이면 LLM 판정 결과를 학습 신호로 누적합니다.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .agent_state import AgentContext, AgentScratchpad, ReActStep
+from ..mcp.registry import ToolRegistry
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+_TODO_TOPIC = ("할일", "할 일", "todo", "투두", "task", "태스크")
+_CALENDAR_TOPIC = ("일정", "캘린더", "calendar", "스케줄", "약속", "회의")
+_NOTE_TOPIC = ("메모", "노트", "note")
+
+_CREATE_VERBS = ("추가", "만들", "등록", "생성", "넣어", "적어", "잡아", "작성", "남겨", "저장")
+_LIST_VERBS = ("보여", "알려", "목록", "리스트", "조회", "확인", "뭐", "뭔지", "있어", "찾아", "검색", "읽어")
+_COMPLETE_VERBS = ("완료", "끝냈", "끝났", "체크")
+_DELETE_VERBS = ("삭제", "지워", "없애", "취소")
+
+# 여러 항목/여러 단계를 암시하는 표현 (단일 행동으로 끝나지 않을 수 있음)
+_MULTI_ITEM_PATTERN = re.compile(r"\d+\s*개|두 개|세 개|여러|모두|전부|각각")
+_SEQUENCE_PATTERN = re.compile(r"그리고|하고|한 다음|한 뒤|한 후|후에|그 다음| 및 ")
+
+
+@dataclass(frozen=True)
+class GoalIntent:
+    """단일 행동 의도 규칙"""
+    name: str
+    tool_name: str
+    actions: Optional[Tuple[str, ...]]  # None 이면 action 값과 무관
+    topics: Tuple[str, ...]
+    verbs: Tuple[str, ...] = ()  # 비어 있으면 주제 키워드만으로 분류
+
+    def matches_goal(self, goal: str) -> bool:
+        if not any(k in goal for k in self.topics):
+            return False
+        return not self.verbs or any(v in goal for v in self.verbs)
+
+    def matches_step(self, step: ReActStep) -> bool:
+        action = step.action
+        if not action or action.tool_name != self.tool_name:
+            return False
+        return self.actions is None or (action.parameters or {}).get("action") in self.actions
+
+
+@dataclass
+class GoalDecision:
+    """로컬 목표 달성 판단 결과"""
+    achieved: bool
+    confidence: float
+    signature: str
+    intents: Tuple[str, ...] = ()
+    reason: str = ""
+
+
+class GoalCompletionClassifier:
+    """
+    규칙 + 학습 신호 기반 목표 달성 판단기
+
+    사용 흐름:
+        decision = classifier.evaluate(scratchpad, context)
+        if classifier.should_skip_llm(decision): ... 달성 처리
+        else: verdict = LLM 판정 → classifier.record_llm_verdict(decision, verdict, latency)
+    """
+
+    DEFAULT_INTENTS: List[GoalIntent] = [
+        GoalIntent("todo_create", "notion_todo", ("create",), _TODO_TOPIC, _CREATE_VERBS),
+        GoalIntent("todo_complete", "notion_todo", ("complete", "update"), _TODO_TOPIC, _COMPLETE_VERBS),
+        GoalIntent("todo_delete", "notion_todo", ("delete",), _TODO_TOPIC, _DELETE_VERBS),
+        GoalIntent("todo_list", "notion_todo", ("list", "get"), _TODO_TOPIC, _LIST_VERBS),
+        GoalIntent("calendar_create", "notion_calendar", ("create",), _CALENDAR_TOPIC, _CREATE_VERBS),
+        GoalIntent("calendar_delete", "notion_calendar", ("delete",), _CALENDAR_TOPIC, _DELETE_VERBS),
+        GoalIntent("calendar_list", "notion_calendar", ("list", "get"), _CALENDAR_TOPIC, _LIST_VERBS),
+        GoalIntent("note_create", "apple_notes", ("create",), _NOTE_TOPIC, _CREATE_VERBS),
+        GoalIntent("note_search", "apple_notes", ("search", "read"), _NOTE_TOPIC, _LIST_VERBS),
+        GoalIntent("time_query", "system_time", None,
+                   ("몇 시", "몇시", "시간", "날짜", "며칠", "요일", "오늘이")),
+    ]
+
+    # 규칙 신뢰도
+    SINGLE_INTENT_CONFIDENCE = 0.9
+    MULTI_INTENT_CONFIDENCE = 0.85
+    UNCLASSIFIED_CONFIDENCE = 0.4
+    MULTI_ITEM_PENALTY = 0.25
+    SEQUENCE_PENALTY = 0.2
+
+    def __init__(self, tool_registry: ToolRegistry, threshold: float = 0.8,
+                 min_samples: int = 3, audit_every: int = 5,
+                 intents: Optional[List[GoalIntent]] = None):
+        """
+        Args:
+            tool_registry: 종결 행동 메타데이터를 조회할 도구 레지스트리
+            threshold: 이 신뢰도 이상이면 LLM 판정 생략
+            min_samples: 학습 신호를 반영하기 시작하는 최소 LLM 판정 수
+            audit_every: 빠른 판단 N회마다 1회는 LLM으로 검증해 학습 신호 갱신 (0이면 검증 안 함)
+            intents: 의도 규칙 (None이면 DEFAULT_INTENTS)
+        """
+        self.tool_registry = tool_registry
+        self.threshold = threshold
+        self.min_samples = max(1, min_samples)
+        self.audit_every = max(0, audit_every)
+        self.intents = intents if intents is not None else self.DEFAULT_INTENTS
+
+        # 서명별 LLM 판정 누적 (달성 판정 수, 전체 판정 수)
+        self._verdicts: Dict[str, List[int]] = {}
+        self._fastpath_seen = 0
+
+        self.stats: Dict[str, float] = {
+            "checks": 0, "fastpath_skips": 0, "heuristic_skips": 0,
+            "llm_checks": 0, "audits": 0, "audit_disagreements": 0,
+            "llm_latency_total": 0.0
+        }
+
+    # ---- 판단 ----
+
+    def classify(self, goal: str) -> Tuple[GoalIntent, ...]:
+        """목표 문장에 해당하는 단일 행동 의도 목록"""
+        goal_lower = goal.lower()
+        return tuple(intent for intent in self.intents if intent.matches_goal(goal_lower))
+
+    def evaluate(self, scratchpad: AgentScratchpad, context: AgentContext) -> Optional[GoalDecision]:
+        """
+        마지막 관찰 기준 로컬 목표 달성 판단
+
+        Returns:
+            GoalDecision (마지막 단계가 성공한 종결 행동이 아니면 None)
+        """
+        if not scratchpad.steps:
+            return None
+        last_step = scratchpad.steps[-1]
+        if not self._is_successful_terminal(last_step):
+            return None
+
+        goal_lower = context.goal.lower()
+        intents = self.classify(goal_lower)
+        last_action = last_step.action
+        signature = "+".join(i.name for i in intents) or "unclassified"
+        signature += f"|{last_action.tool_name}.{(last_action.parameters or {}).get('action', '*')}"
+
+        if intents:
+            unsatisfied = [
+                intent.name for intent in intents
+                if not any(intent.matches_step(step) and self._is_successful_terminal(step)
+                           for step in scratchpad.steps)
+            ]
+            if unsatisfied:
+                return GoalDecision(False, 0.0, signature, tuple(i.name for i in intents),
+                                    f"미수행 의도: {', '.join(unsatisfied)}")
+            if not any(intent.matches_step(last_step) for intent in intents):
+                # 의도는 모두 수행했지만 이후 다른 행동이 이어진 경우 (추가 작업 가능성)
+                confidence = self.UNCLASSIFIED_CONFIDENCE
+                reason = "의도 외 후속 행동"
+            else:
+                confidence = self.SINGLE_INTENT_CONFIDENCE if len(intents) == 1 else self.MULTI_INTENT_CONFIDENCE
+                reason = f"의도 수행 완료: {', '.join(i.name for i in intents)}"
+        else:
+            confidence = self.UNCLASSIFIED_CONFIDENCE
+            reason = "분류되지 않은 목표의 종결 행동 성공"
+
+        if _MULTI_ITEM_PATTERN.search(goal_lower):
+            confidence -= self.MULTI_ITEM_PENALTY
+            signature += "|multi"
+        if len(intents) <= 1 and _SEQUENCE_PATTERN.search(goal_lower):
+            confidence -= self.SEQUENCE_PENALTY
+            signature += "|seq"
+
+        confidence = self._blend_learned(signature, max(0.0, confidence))
+        return GoalDecision(True, confidence, signature, tuple(i.name for i in intents), reason)
+
+    def should_skip_llm(self, decision: Optional[GoalDecision]) -> bool:
+        """LLM 판정을 생략하고 달성으로 처리할지 (일정 주기로 검증용 LLM 판정 허용)"""
+        if decision is None or not decision.achieved or decision.confidence < self.threshold:
+            return False
+        self._fastpath_seen += 1
+        if self.audit_every and self._fastpath_seen % self.audit_every == 0:
+            self.stats["audits"] += 1
+            return False
+        return True
+
+    def _is_successful_terminal(self, step: ReActStep) -> bool:
+        if not step.action or not step.action.tool_name:
+            return False
+        if not step.observation or not step.observation.success:
+            return False
+        metadata = self.tool_registry.get_tool_metadata(step.action.tool_name)
+        return bool(metadata) and metadata.is_terminal_call(step.action.parameters or {})
+
+    def _blend_learned(self, signature: str, rule_confidence: float) -> float:
+        """과거 LLM 판정 비율을 표본 수에 비례한 가중치로 규칙 신뢰도와 혼합"""
+        achieved, total = self._verdicts.get(signature, (0, 0))
+        if total < self.min_samples:
+            return rule_confidence
+        learned = (achieved + 1) / (total + 2)
+        weight = total / (total + 5)
+        return (1 - weight) * rule_confidence + weight * learned
+
+    # ---- 기록 ----
+
+    def record_skip(self, kind: str = "fastpath") -> None:
+        """LLM 판정을 생략한 목표 확인 기록 (fastpath / heuristic)"""
+        self.stats["checks"] += 1
+        self.stats[f"{kind}_skips"] += 1
+
+    def record_llm_verdict(self, decision: Optional[GoalDecision], achieved: bool, latency: float) -> None:
+        """LLM 판정 결과와 지연 기록, 로컬 판단 대상이었다면 학습 신호로 누적"""
+        self.stats["checks"] += 1
+        self.stats["llm_checks"] += 1
+        self.stats["llm_latency_total"] += latency
+        if decision is None or not decision.achieved:
+            return
+        if decision.achieved and decision.confidence >= self.threshold and not achieved:
+            self.stats["audit_disagreements"] += 1
+            logger.info(f"목표 빠른 판단 검증 불일치: {decision.signature}")
+        counts = self._verdicts.setdefault(decision.signature, [0, 0])
+        counts[0] += int(achieved)
+        counts[1] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 생략률과 추정 절감 지연 (생략 횟수 × 평균 LLM 판정 지연)"""
+        checks = self.stats["checks"]
+        skips = self.stats["fastpath_skips"] + self.stats["heuristic_skips"]
+        llm_checks = self.stats["llm_checks"]
+        avg_latency = self.stats["llm_latency_total"] / llm_checks if llm_checks else 0.0
+        audits = self.stats["audits"]
+        return {
+            **self.stats,
+            "skip_rate": skips / checks if checks else 0.0,
+            # 검증한 빠른 판단 중 LLM 판정과 일치한 비율 (audit_every 를 늘릴지 판단하는 근거)
+            "audit_agreement_rate": 1.0 - self.stats["audit_disagreements"] / audits if audits else 0.0,
+            "avg_llm_latency": avg_latency,
+            "estimated_saved_latency": skips * avg_latency,
+            "learned_signatures": len(self._verdicts)
+        }
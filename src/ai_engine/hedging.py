@@ -0,0 +1,157 @@
+"""지연 헤징 (Hedged Requests)
+
+지연에 민감한 LLM 호출에서 1차 호출이 해당 호출 지점의 p90 지연 안에 끝나지 않으면
+빠른 모델 계층으로 2차 호출을 보내고 먼저 끝난 유효한 응답을 사용합니다.
+진 쪽 작업은 취소합니다 (워커 스레드의 HTTP 호출 자체는 끝까지 진행되지만 결과는 버리고
+스케줄러 슬롯은 즉시 반납됩니다).
+
+꼬리 지연 절감량은 헤지가 이긴 시점 이후 1차 호출이 더 걸렸을 시간을
+같은 호출 지점의 과거 지연 분포(승리 시점보다 긴 표본의 평균)로 추정합니다.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class HedgedRequester:
+    """
+    호출 지점별 지연 분포 기반 헤지 요청 실행기
+
+    사용 예:
+        response = await hedger.run(
+            "goal_check",
+            primary=lambda: call(model="strong"),
+            hedge=lambda: call(model="fast"),
+            is_valid=lambda r: bool(r.content)
+        )
+    """
+
+    def __init__(self, percentile: float = 90.0, min_samples: int = 20, max_samples: int = 200,
+                 min_delay: float = 0.05):
+        """
+        Args:
+            percentile: 헤지를 보내기 전 기다릴 지연 백분위수
+            min_samples: 헤지를 시작하는 최소 지연 표본 수 (부족하면 헤지하지 않음)
+            max_samples: 호출 지점별 보관할 최근 지연 표본 수
+            min_delay: 헤지 대기 최소 시간 (초)
+        """
+        self.percentile = percentile
+        self.min_samples = max(1, min_samples)
+        self.max_samples = max_samples
+        self.min_delay = min_delay
+        self._latencies: Dict[str, Deque[float]] = {}
+
+        self.stats: Dict[str, float] = {
+            "calls": 0, "hedged": 0, "hedge_wins": 0, "primary_wins": 0,
+            "both_failed": 0, "skipped_no_capacity": 0, "estimated_saved_latency": 0.0
+        }
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = deque(maxlen=self.max_samples)
+        samples.append(seconds)
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """헤지를 보낼 대기 시간 (표본이 부족하면 None)"""
+        samples = self._latencies.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(math.ceil(self.percentile / 100 * len(ordered))) - 1)
+        return max(self.min_delay, ordered[max(0, index)])
+
+    def _expected_remaining(self, key: str, elapsed: float) -> float:
+        """이미 elapsed 초 걸린 1차 호출이 더 걸렸을 것으로 추정되는 시간"""
+        tail = [s for s in self._latencies.get(key, ()) if s > elapsed]
+        return (sum(tail) / len(tail) - elapsed) if tail else 0.0
+
+    async def run(self, key: str,
+                  primary: Callable[[], Awaitable[T]],
+                  hedge: Optional[Callable[[], Awaitable[T]]] = None,
+                  is_valid: Callable[[T], bool] = lambda result: True,
+                  can_hedge: Callable[[], bool] = lambda: True) -> T:
+        """1차 호출 실행, p90 지연을 넘기면 헤지 호출과 경쟁시켜 먼저 끝난 유효 응답 반환"""
+        self.stats["calls"] += 1
+        started = time.monotonic()
+        delay = self.hedge_delay(key) if hedge is not None else None
+        primary_task = asyncio.ensure_future(primary())
+
+        if delay is None:
+            result = await primary_task
+            self.record_latency(key, time.monotonic() - started)
+            return result
+
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+        except BaseException:
+            primary_task.cancel()
+            raise
+        if done:
+            self.record_latency(key, time.monotonic() - started)
+            return primary_task.result()
+        if not can_hedge():
+            self.stats["skipped_no_capacity"] += 1
+            result = await primary_task
+            self.record_latency(key, time.monotonic() - started)
+            return result
+
+        self.stats["hedged"] += 1
+        hedge_task = asyncio.ensure_future(hedge())
+        pending = {primary_task, hedge_task}
+        fallback: Optional[asyncio.Future] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and is_valid(task.result()):
+                        return self._finish(key, started, task is hedge_task, task.result())
+                    fallback = fallback or task
+        finally:
+            for task in pending:
+                task.cancel()  # 진 쪽 호출 취소
+
+        # 둘 다 실패하면 1차 결과(없으면 먼저 끝난 쪽)를 그대로 반환/전파
+        self.stats["both_failed"] += 1
+        source = primary_task if primary_task.done() and not primary_task.cancelled() else fallback
+        return source.result()  # type: ignore[union-attr]
+
+    def _finish(self, key: str, started: float, hedge_won: bool, result: T) -> T:
+        elapsed = time.monotonic() - started
+        if hedge_won:
+            saved = self._expected_remaining(key, elapsed)
+            self.stats["hedge_wins"] += 1
+            self.stats["estimated_saved_latency"] += saved
+            logger.debug(f"헤지 응답 채택: key={key}, 지연={elapsed:.2f}초, 추정 절감={saved:.2f}초")
+        else:
+            self.stats["primary_wins"] += 1
+        # 헤지가 이긴 경우 1차 지연은 최소 elapsed 이상 (하한값으로 기록)
+        self.record_latency(key, elapsed)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """헤지 발생률/승률/추정 꼬리 지연 절감과 호출 지점별 현재 헤지 대기 시간"""
+        hedged = self.stats["hedged"]
+        return {
+            **self.stats,
+            "hedge_rate": hedged / self.stats["calls"] if self.stats["calls"] else 0.0,
+            "hedge_win_rate": self.stats["hedge_wins"] / hedged if hedged else 0.0,
+            "hedge_delays": {key: self.hedge_delay(key) for key in self._latencies}
+        }
+
+
+def create_hedged_requester(config: Any) -> Optional[HedgedRequester]:
+    """설정에 따라 헤지 요청 실행기 생성 (비활성화 시 None)"""
+    if not getattr(config, "llm_hedging_enabled", False):
+        return None
+    return HedgedRequester(
+        percentile=getattr(config, "llm_hedge_percentile", 90.0),
+        min_samples=getattr(config, "llm_hedge_min_samples", 20),
+    )
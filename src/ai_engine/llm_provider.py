@@ -5,10 +5,14 @@ Google Gemini 2.5 Pro API 래퍼 및 통합 인터페이스 제공
 """
 
 import asyncio
+import contextlib
 import os
+import threading
+import time
 import json
+import datetime
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Union, AsyncGenerator
+from typing import Dict, List, Optional, Any, Tuple, Union, AsyncGenerator
 from dataclasses import dataclass
 from enum import Enum
 
@@ -21,10 +25,16 @@ try:
     except Exception:
         HarmCategory = None  # type: ignore
         HarmBlockThreshold = None  # type: ignore
+    # 컨텍스트 캐싱 API (구버전 SDK에는 없음)
+    try:
+        from google.generativeai import caching as genai_caching  # type: ignore
+    except Exception:
+        genai_caching = None  # type: ignore
     GENAI_AVAILABLE = True
 except ImportError as e:
     GENAI_AVAILABLE = False
     genai = None
+    genai_caching = None
 
 from loguru import logger
 from typing import TYPE_CHECKING
@@ -35,6 +45,12 @@ from ..utils.performance import (
     cache_result, performance_monitor
 )
 from ..utils.error_handler import handle_errors, retry_on_failure, APIError
+from .response_cache import LLMResponseCache, create_response_cache, get_prompt_type
+from .prompt_profiles import PromptProfileRegistry, create_prompt_profiles
+from .llm_scheduler import LLMScheduler, get_llm_scheduler, get_message_priority, is_overload_error
+from .hedging import HedgedRequester, create_hedged_requester
+from .prompt_prefix_cache import PromptPrefixCache, create_prompt_prefix_cache, split_stable_prefix
+from .agent_state import estimate_tokens
 
 if TYPE_CHECKING:
     from ..config import Settings
@@ -83,6 +99,14 @@ class LLMProvider(ABC):
     def __init__(self, config: Optional[Settings] = None):
         self.config = config or Settings()
         self.model_name: str = ""
+        # 선택적 응답 캐시 (llm_response_cache_enabled 설정 시 생성)
+        self.response_cache: Optional[LLMResponseCache] = None
+        # 호출 지점별 출력 예산/중단 시퀀스/스키마 (llm_prompt_profiles_enabled 설정 시 생성)
+        self.prompt_profiles: Optional[PromptProfileRegistry] = None
+        # 공용 호출 스케줄러 (헤지 여유 슬롯 판단에도 사용)
+        self.scheduler: Optional[LLMScheduler] = None
+        # p90 지연 초과 시 빠른 계층으로 헤지 요청 (llm_hedging_enabled 설정 시 생성)
+        self.hedger: Optional[HedgedRequester] = None
         
     @abstractmethod
     async def initialize(self) -> bool:
@@ -104,6 +128,154 @@ class LLMProvider(ABC):
     def is_available(self) -> bool:
         """프로바이더 사용 가능 여부"""
         pass
+    
+    async def _generate_uncached(
+        self,
+        messages: List[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> LLMResponse:
+        """프롬프트 프로필 적용 후 프로필의 모델 계층으로 모델 호출 (프로필 예산에서 잘리면 상한 예산으로 1회 재시도)"""
+        prompt_type = get_prompt_type(messages)
+        if self.prompt_profiles is None:
+            return await self._call_hedged(messages, prompt_type, "strong", temperature, max_tokens, kwargs)
+        
+        budget, options = self.prompt_profiles.apply(prompt_type, max_tokens, kwargs)
+        tier = self.prompt_profiles.tier(prompt_type)
+        response = await self._call_hedged(messages, prompt_type, tier, temperature, budget, options)
+        retry_budget = self.prompt_profiles.record(
+            prompt_type, response.content, (response.metadata or {}).get("finish_reason")
+        )
+        if retry_budget is not None and max_tokens is None and retry_budget > (budget or 0):
+            self.prompt_profiles.record_retry(prompt_type)
+            response = await self._call_model(messages, temperature, retry_budget, model_tier=tier, **options)
+            self.prompt_profiles.record(
+                prompt_type, response.content, (response.metadata or {}).get("finish_reason")
+            )
+        return response
+    
+    async def _call_hedged(
+        self,
+        messages: List[ChatMessage],
+        prompt_type: str,
+        tier: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        options: Dict[str, Any]
+    ) -> LLMResponse:
+        """사용자 대기 호출은 호출 지점의 p90 지연을 넘기면 빠른 모델로 헤지 요청 (헤지 비활성 시 바로 호출)"""
+        def _call(model_tier: str) -> Any:
+            return lambda: self._call_model(messages, temperature, max_tokens, model_tier=model_tier, **options)
+        
+        if self.hedger is None or get_message_priority(messages) != "interactive":
+            return await _call(tier)()
+        return await self.hedger.run(
+            f"{prompt_type}:{tier}",
+            primary=_call(tier),
+            hedge=_call("fast"),
+            is_valid=lambda r: bool(r.content) and not (r.metadata or {}).get("error"),
+            # 스케줄러 여유 슬롯이 없으면 헤지가 부하만 늘리므로 보내지 않음
+            can_hedge=lambda: self.scheduler is None or self.scheduler.has_capacity()
+        )
+    
+    async def stream_generate(
+        self,
+        messages: List[Union[Dict[str, str], ChatMessage]],
+        usage_sink: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """
+        스트림 형태로 응답 생성 (프롬프트 프로필 예산/모델 계층 적용)
+
+        스트림이 프로필 예산에서 잘리면(MAX_TOKENS) 이미 보낸 텍스트는 되돌릴 수 없으므로,
+        받은 부분을 이어서 상한 예산으로 1회 더 생성해 뒤에 붙입니다.
+        usage_sink 를 넘기면 스트림 완료 시 토큰 사용량(이어 쓰기 포함 합계)을 채웁니다.
+        """
+        chat_messages = [
+            msg if isinstance(msg, ChatMessage)
+            else ChatMessage(role=msg["role"], content=msg["content"], metadata=msg.get("metadata"))
+            for msg in messages
+        ]
+        options = dict(kwargs)
+        max_tokens = options.pop('max_tokens', None)
+        temperature = options.pop('temperature', 0.7)
+        prompt_type = get_prompt_type(chat_messages)
+        budget, tier = max_tokens, "strong"
+        if self.prompt_profiles is not None:
+            budget, options = self.prompt_profiles.apply(prompt_type, max_tokens, options)
+            tier = self.prompt_profiles.tier(prompt_type)
+
+        result: Dict[str, Any] = {}
+        parts: List[str] = []
+        async for chunk in self._stream_model(chat_messages, temperature, budget, model_tier=tier,
+                                              result=result, **options):
+            parts.append(chunk)
+            yield chunk
+        usage = dict(result.get("usage") or {})
+
+        if self.prompt_profiles is not None:
+            retry_budget = self.prompt_profiles.record(prompt_type, "".join(parts), result.get("finish_reason"))
+            if retry_budget is not None and max_tokens is None and retry_budget > (budget or 0):
+                self.prompt_profiles.record_retry(prompt_type)
+                metadata = chat_messages[-1].metadata if chat_messages else None
+                continuation = chat_messages + [
+                    ChatMessage(role="assistant", content="".join(parts), metadata=metadata),
+                    ChatMessage(
+                        role="user",
+                        content="직전 답변이 길이 제한으로 끊겼습니다. 이미 작성한 부분은 반복하지 말고 끊긴 지점부터 바로 이어서 작성하세요.",
+                        metadata=metadata
+                    ),
+                ]
+                continued: Dict[str, Any] = {}
+                tail: List[str] = []
+                async for chunk in self._stream_model(continuation, temperature, retry_budget, model_tier=tier,
+                                                      result=continued, **options):
+                    tail.append(chunk)
+                    yield chunk
+                self.prompt_profiles.record(
+                    prompt_type, "".join(parts + tail), continued.get("finish_reason")
+                )
+                for key, value in (continued.get("usage") or {}).items():
+                    if isinstance(value, (int, float)) and isinstance(usage.get(key, 0), (int, float)):
+                        usage[key] = usage.get(key, 0) + value
+                    else:
+                        usage.setdefault(key, value)
+
+        if usage_sink is not None and usage:
+            usage_sink.update(usage)
+    
+    async def _stream_model(
+        self,
+        messages: List[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        model_tier: str = "strong",
+        result: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """
+        모델 계층 하나로 스트림 호출 (스트리밍 미지원 프로바이더는 _call_model 응답을 한 번에 반환)
+
+        result 에는 완료 시 usage 와 finish_reason 을 채웁니다.
+        """
+        response = await self._call_model(messages, temperature, max_tokens, model_tier=model_tier, **kwargs)
+        if result is not None:
+            result.update(usage=response.usage, finish_reason=(response.metadata or {}).get("finish_reason"))
+        if response.content:
+            yield response.content
+    
+    @abstractmethod
+    async def _call_model(
+        self,
+        messages: List[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        model_tier: str = "strong",
+        **kwargs
+    ) -> LLMResponse:
+        """모델 계층(model_tier) 하나로 실제 호출 (계층/헤지 경로에서 사용)"""
+        pass
 
 
 class GeminiProvider(LLMProvider):
@@ -113,7 +285,19 @@ class GeminiProvider(LLMProvider):
         super().__init__(config)
         self.model_name = getattr(self.config, 'ai_model', 'gemini-2.5-pro')
         self.model = None
+        # 빠른 계층 모델 (프롬프트 프로필 tier="fast" 호출 및 헤지 요청용, 미설정 시 기본 모델 사용)
+        self.fast_model_name = getattr(self.config, 'ai_fast_model', '') or self.model_name
+        self.fast_model = None
         self.safety_settings = None
+        self.response_cache = create_response_cache(self.config)
+        self.prompt_profiles = create_prompt_profiles(self.config)
+        # 프로세스 공용 호출 스케줄러 (AIMD 동시성, RPM/TPM, 우선순위/마감)
+        self.scheduler = get_llm_scheduler(self.config)
+        self.hedger = create_hedged_requester(self.config)
+        # 고정 접두부(cacheable 시스템 프롬프트) 버퍼 + Gemini 컨텍스트 캐시
+        self.prefix_cache: Optional[PromptPrefixCache] = create_prompt_prefix_cache(
+            self.config, self._create_context_model if genai_caching is not None else None
+        )
         
     async def initialize(self) -> bool:
         """Gemini API 초기화"""
@@ -151,11 +335,15 @@ class GeminiProvider(LLMProvider):
 
                 # 모델 생성
                 if hasattr(genai, 'GenerativeModel'):
-                    if self.safety_settings is not None:
-                        self.model = genai.GenerativeModel(self.model_name, safety_settings=self.safety_settings)  # type: ignore
-                    else:
-                        self.model = genai.GenerativeModel(self.model_name)  # type: ignore
+                    self.model = self._create_model(self.model_name)
                     logger.info(f"Gemini 모델 '{self.model_name}' 생성 완료")
+                    if self.fast_model_name != self.model_name:
+                        try:
+                            self.fast_model = self._create_model(self.fast_model_name)
+                            logger.info(f"Gemini 빠른 계층 모델 '{self.fast_model_name}' 생성 완료")
+                        except Exception as e:
+                            logger.warning(f"빠른 계층 모델 생성 실패, 기본 모델 사용: {e}")
+                            self.fast_model_name = self.model_name
                 else:
                     logger.error("genai.GenerativeModel 클래스를 찾을 수 없습니다.")
                     return False
@@ -170,6 +358,46 @@ class GeminiProvider(LLMProvider):
             logger.error(f"Gemini 초기화 실패: {e}")
             return False
     
+    def _create_model(self, model_name: str) -> Any:
+        if self.safety_settings is not None:
+            return genai.GenerativeModel(model_name, safety_settings=self.safety_settings)  # type: ignore
+        return genai.GenerativeModel(model_name)  # type: ignore
+    
+    def _create_context_model(self, model_name: str, prefix_text: str, ttl_seconds: int) -> Any:
+        """고정 접두부를 Gemini 컨텍스트 캐시에 등록하고 캐시에 바인딩된 모델 반환 (워커 스레드에서 실행)"""
+        cached = genai_caching.CachedContent.create(  # type: ignore
+            model=model_name if model_name.startswith("models/") else f"models/{model_name}",
+            system_instruction=prefix_text,
+            ttl=datetime.timedelta(seconds=ttl_seconds),
+        )
+        return genai.GenerativeModel.from_cached_content(  # type: ignore
+            cached_content=cached, safety_settings=self.safety_settings
+        )
+    
+    def _prepare_prompt(self, messages: List[ChatMessage], model: Any, model_name: str) -> Tuple[str, str, Any]:
+        """
+        (전체 프롬프트, 실제 전송할 프롬프트, 호출할 모델) 반환
+        
+        고정 접두부는 버퍼에서 재사용하고, 컨텍스트 캐시가 준비되어 있으면 접미부만 캐시 바인딩 모델로 전송합니다.
+        """
+        prefix, suffix = split_stable_prefix(messages) if self.prefix_cache is not None else ([], messages)
+        if not prefix:
+            prompt = self._convert_messages_to_prompt(messages)
+            return prompt, prompt, model
+        key, prefix_text = self.prefix_cache.render_prefix(prefix, self._convert_messages_to_prompt)  # type: ignore[union-attr]
+        suffix_text = self._convert_messages_to_prompt(suffix)
+        prompt = f"{prefix_text}\n\n{suffix_text}" if suffix_text else prefix_text
+        context_model = self.prefix_cache.get_context(model_name, key, prefix_text)  # type: ignore[union-attr]
+        if context_model is not None and suffix_text:
+            return prompt, suffix_text, context_model
+        return prompt, prompt, model
+    
+    def _model_for(self, tier: str) -> Tuple[Any, str]:
+        """모델 계층에 해당하는 (모델, 모델명) - 빠른 계층 모델이 없으면 기본 모델"""
+        if tier == "fast" and self.fast_model is not None:
+            return self.fast_model, self.fast_model_name
+        return self.model, self.model_name
+    
     def is_available(self) -> bool:
         """프로바이더 사용 가능 여부"""
         return GENAI_AVAILABLE and self.model is not None
@@ -181,13 +409,34 @@ class GeminiProvider(LLMProvider):
         max_tokens: Optional[int] = None,
         **kwargs
     ) -> LLMResponse:
-        """응답 생성"""
+        """응답 생성 (응답 캐시가 설정되어 있으면 캐시 경유)"""
+        if self.response_cache is None:
+            return await self._generate_uncached(messages, temperature, max_tokens, **kwargs)
+        return await self.response_cache.get_or_generate(
+            messages,
+            lambda: self._generate_uncached(messages, temperature, max_tokens, **kwargs),
+            model=self.model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            options=kwargs
+        )
+    
+    async def _call_model(
+        self,
+        messages: List[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        model_tier: str = "strong",
+        **kwargs
+    ) -> LLMResponse:
+        """Gemini API 호출 (model_tier 가 "fast" 면 빠른 계층 모델 사용)"""
+        model, model_name = self._model_for(model_tier)
         try:
-            if not self.model:
+            if not model:
                 raise LLMProviderError("Gemini 모델이 초기화되지 않았습니다.")
                 
-            # 메시지 변환
-            prompt = self._convert_messages_to_prompt(messages)
+            # 메시지 변환 (고정 접두부는 버퍼/컨텍스트 캐시 재사용)
+            prompt, request_prompt, request_model = self._prepare_prompt(messages, model, model_name)
             
             # 생성 설정 (독립 테스트와 동일하게 최소한만 설정)
             config_dict = {
@@ -205,23 +454,28 @@ class GeminiProvider(LLMProvider):
             # 응답 생성
             try:
                 logger.debug(
-                    f"Gemini generate: model={self.model_name}, temp={config_dict.get('temperature')}, max_tokens={config_dict.get('max_output_tokens')}, mime={config_dict.get('response_mime_type')}, prompt_len={len(prompt)}"
+                    f"Gemini generate: model={model_name}, temp={config_dict.get('temperature')}, max_tokens={config_dict.get('max_output_tokens')}, mime={config_dict.get('response_mime_type')}, prompt_len={len(prompt)}"
                 )
             except Exception:
                 pass
             def _do_generate() -> Any:
                 # 모델 생성 시 이미 안전 설정을 적용했으므로 호출 시에는 제거
                 try:
-                    return self.model.generate_content(  # type: ignore
-                        prompt,
+                    return request_model.generate_content(  # type: ignore
+                        request_prompt,
                         generation_config=config_dict,
                     )
                 except Exception as e:
+                    # 429/과부하는 바로 재호출하지 않고 스케줄러가 동시성을 줄이도록 전파
+                    if is_overload_error(e):
+                        raise
                     # 혹시 모를 fallback
-                    return self.model.generate_content(prompt)  # type: ignore
+                    return request_model.generate_content(request_prompt)  # type: ignore
 
-            if hasattr(self.model, 'generate_content'):
-                response = await asyncio.to_thread(_do_generate)
+            if hasattr(model, 'generate_content'):
+                started = time.monotonic()
+                response = await self._run_scheduled(messages, prompt, config_dict, _do_generate)
+                latency = time.monotonic() - started
 
                 # 독립 테스트와 동일한 단순한 텍스트 추출
                 content = ""
@@ -259,18 +513,16 @@ class GeminiProvider(LLMProvider):
                     # 내용이 비어도 예외 대신 빈 응답을 반환하여 상위 로직이 폴백하도록 함
                     return LLMResponse(
                         content="",
-                        model=self.model_name,
-                        usage={"input_tokens": len(prompt.split()), "output_tokens": 0},
+                        model=model_name,
+                        usage=self._record_usage(messages, getattr(response, 'usage_metadata', None), prompt, "", latency),
                         metadata={"finish_reason": finish_reason or "unknown"}
                     )
 
                 return LLMResponse(
                     content=content,
-                    model=self.model_name,
-                    usage={
-                        "input_tokens": len(prompt.split()),
-                        "output_tokens": len(content.split())
-                    }
+                    model=model_name,
+                    usage=self._record_usage(messages, getattr(response, 'usage_metadata', None), prompt, content, latency),
+                    metadata={"finish_reason": finish_reason} if finish_reason is not None else None
                 )
             else:
                 raise LLMProviderError("모델의 generate_content 메서드를 찾을 수 없습니다.")
@@ -284,47 +536,168 @@ class GeminiProvider(LLMProvider):
                 pass
             return LLMResponse(
                 content="",
-                model=self.model_name or "gemini",
+                model=model_name or "gemini",
                 usage={"input_tokens": 0, "output_tokens": 0},
                 metadata={"error": str(e)}
             )
     
-    async def stream_generate(self, messages: List[Dict[str, str]], **kwargs) -> AsyncGenerator[str, None]:
-        """스트림 형태로 응답 생성"""
-        try:
-            if not self.model:
-                raise LLMProviderError("Gemini 모델이 초기화되지 않았습니다.")
-                
-            # 메시지를 ChatMessage로 변환
-            chat_messages = [ChatMessage(role=msg["role"], content=msg["content"]) for msg in messages]
-            prompt = self._convert_messages_to_prompt(chat_messages)
-            
-            # 생성 설정
-            config_dict = kwargs
-            
-            if hasattr(self.model, 'generate_content'):
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt,
-                    generation_config=config_dict,  # type: ignore
+    async def _stream_model(
+        self,
+        messages: List[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        model_tier: str = "strong",
+        result: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ) -> AsyncGenerator[str, None]:
+        """Gemini 스트림 호출
+
+        동기 청크 이터레이터는 워커 스레드에서 소비하고, 청크는 asyncio.Queue 로
+        이벤트 루프에 전달하므로 청크 사이에 다른 코루틴이 막히지 않습니다.
+        """
+        model, model_name = self._model_for(model_tier)
+        if not model:
+            raise LLMProviderError("Gemini 모델이 초기화되지 않았습니다.")
+        if not hasattr(model, 'generate_content'):
+            raise LLMProviderError("모델의 generate_content 메서드를 찾을 수 없습니다.")
+
+        prompt, request_prompt, request_model = self._prepare_prompt(messages, model, model_name)
+        config_dict = {'temperature': temperature, **kwargs}
+        if max_tokens is not None:
+            config_dict['max_output_tokens'] = max_tokens
+
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[tuple]" = asyncio.Queue()
+        stop_event = threading.Event()
+
+        # 사용량/종료 사유 집계용 (마지막 청크의 usage_metadata·finish_reason, 받은 텍스트)
+        streamed: Dict[str, Any] = {"usage_metadata": None, "finish_reason": None, "text": []}
+
+        def _emit(kind: str, value: Any = None) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, (kind, value))
+
+        def _finish_reason(chunk: Any) -> Any:
+            try:
+                candidates = getattr(chunk, 'candidates', None)
+                if candidates:
+                    return getattr(candidates[0], 'finish_reason', None)
+                return getattr(chunk, 'finish_reason', None)
+            except Exception:
+                return None
+
+        def _pump() -> None:
+            # 워커 스레드: 스트림 요청 및 청크 이터레이션
+            try:
+                response = request_model.generate_content(  # type: ignore
+                    request_prompt,
+                    generation_config=config_dict,
                     stream=True
                 )
-                
                 if hasattr(response, '__iter__'):
                     for chunk in response:
-                        if hasattr(chunk, 'text') and chunk.text:
-                            yield chunk.text
-                elif hasattr(response, 'text'):
-                    yield response.text
-                else:
-                    yield str(response)
-            else:
-                raise LLMProviderError("모델의 generate_content 메서드를 찾을 수 없습니다.")
-                    
-        except Exception as e:
-            logger.error(f"Gemini 스트림 생성 중 오류: {e}")
-            raise LLMProviderError(f"스트림 생성 실패: {e}")
+                        if stop_event.is_set():
+                            break
+                        streamed["usage_metadata"] = getattr(chunk, 'usage_metadata', None) or streamed["usage_metadata"]
+                        streamed["finish_reason"] = _finish_reason(chunk) or streamed["finish_reason"]
+                        text = getattr(chunk, 'text', None)
+                        if text:
+                            streamed["text"].append(text)
+                            _emit("chunk", text)
+                elif getattr(response, 'text', None):
+                    streamed["usage_metadata"] = getattr(response, 'usage_metadata', None)
+                    streamed["finish_reason"] = _finish_reason(response)
+                    streamed["text"].append(response.text)
+                    _emit("chunk", response.text)
+                _emit("done")
+            except Exception as e:
+                _emit("error", e)
+
+        # 스트림 전체를 스케줄러 슬롯 하나로 실행 (스트리밍 중에도 동시 실행 수에 포함)
+        slot = contextlib.nullcontext()
+        if self.scheduler is not None:
+            slot = self.scheduler.slot(
+                get_message_priority(messages),
+                estimated_tokens=self._estimate_call_tokens(prompt, config_dict)
+            )
+        async with slot:
+            started = time.monotonic()
+            worker = loop.run_in_executor(None, _pump)
+            try:
+                while True:
+                    kind, value = await queue.get()
+                    if kind == "chunk":
+                        yield value
+                    elif kind == "error":
+                        logger.error(f"Gemini 스트림 생성 중 오류: {value}")
+                        raise LLMProviderError(f"스트림 생성 실패: {value}")
+                    else:
+                        usage = self._record_usage(messages, streamed["usage_metadata"], prompt,
+                                                   "".join(streamed["text"]), time.monotonic() - started)
+                        if result is not None:
+                            result.update(usage=usage, finish_reason=streamed["finish_reason"])
+                        break
+            finally:
+                # 소비자가 중단하면 워커도 다음 청크에서 멈추도록 신호
+                stop_event.set()
+                if worker.done():
+                    worker.result()
+    
+    @staticmethod
+    def _extract_usage(usage_metadata: Any, prompt: str, content: str) -> Dict[str, Any]:
+        """응답 usage_metadata 의 실제 토큰 수 (없으면 로컬 추정값, source 로 구분)"""
+        prompt_tokens = getattr(usage_metadata, 'prompt_token_count', None)
+        if not prompt_tokens:
+            output_tokens = estimate_tokens(content)
+            return {
+                "input_tokens": estimate_tokens(prompt),
+                "output_tokens": output_tokens,
+                "total_tokens": estimate_tokens(prompt) + output_tokens,
+                "source": "estimate"
+            }
+        output_tokens = getattr(usage_metadata, 'candidates_token_count', None) or 0
+        thoughts_tokens = getattr(usage_metadata, 'thoughts_token_count', None) or 0
+        return {
+            "input_tokens": prompt_tokens,
+            "output_tokens": output_tokens,
+            "thoughts_tokens": thoughts_tokens,
+            "cached_tokens": getattr(usage_metadata, 'cached_content_token_count', None) or 0,
+            "total_tokens": (getattr(usage_metadata, 'total_token_count', None)
+                             or prompt_tokens + output_tokens + thoughts_tokens),
+            "source": "api"
+        }
+    
+    def _record_usage(self, messages: List[ChatMessage], usage_metadata: Any, prompt: str,
+                      content: str, latency: float) -> Dict[str, Any]:
+        """호출 지점별 토큰 사용량/지연을 성능 모니터에 기록하고 usage 반환 (출력에는 추론 토큰 포함)"""
+        usage = self._extract_usage(usage_metadata, prompt, content)
+        global_performance_monitor.record_llm_usage(
+            get_prompt_type(messages),
+            usage["input_tokens"],
+            usage["output_tokens"] + usage.get("thoughts_tokens", 0),
+            latency,
+            from_api=usage["source"] == "api"
+        )
+        return usage
+    
+    @staticmethod
+    def _estimate_call_tokens(prompt: str, config_dict: Dict[str, Any]) -> int:
+        """스케줄러 TPM 예약용 추정 토큰 (입력 + 출력 상한, 출력은 최대 2048로 제한)"""
+        return estimate_tokens(prompt) + min(int(config_dict.get('max_output_tokens') or 0), 2048)
     
+    async def _run_scheduled(self, messages: List[ChatMessage], prompt: str,
+                             config_dict: Dict[str, Any], func: Any) -> Any:
+        """공용 LLM 스케줄러 슬롯 안에서 동기 생성 함수 실행 (스케줄러 비활성 시 바로 실행)"""
+        if self.scheduler is None:
+            return await asyncio.to_thread(func)
+        async with self.scheduler.slot(
+            get_message_priority(messages),
+            estimated_tokens=self._estimate_call_tokens(prompt, config_dict)
+        ) as ticket:
+            response = await asyncio.to_thread(func)
+            usage = getattr(response, 'usage_metadata', None)
+            ticket.tokens = getattr(usage, 'total_token_count', None) or ticket.estimated_tokens
+            return response
+
     def _convert_messages_to_prompt(self, messages: List[ChatMessage]) -> str:
         """메시지들을 Gemini 프롬프트로 변환"""
         prompt_parts = []
@@ -362,6 +735,11 @@ class MockLLMProvider(LLMProvider):
     def __init__(self, config: Optional[Settings] = None):
         super().__init__(config)
         self.model_name = "mock-llm"
+        # 인위적 응답 지연 (초) - 헤지/스케줄러 동작 확인 시 조정, tier_delays 로 계층별 지정
+        self.response_delay = 0.05
+        self.tier_delays: Dict[str, float] = {}
+        self.prompt_profiles = create_prompt_profiles(self.config)
+        self.hedger = create_hedged_requester(self.config)
     
     async def initialize(self) -> bool:
         """Mock 초기화 - 항상 성공"""
@@ -378,8 +756,25 @@ class MockLLMProvider(LLMProvider):
         temperature: float = 0.7,
         **kwargs
     ) -> LLMResponse:
+        """Mock 응답 생성 (기본 프로바이더의 계층/헤지 경로 경유)"""
+        return await self._generate_uncached(messages, temperature, max_tokens, **kwargs)
+    
+    async def _call_model(
+        self,
+        messages: List[ChatMessage],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        model_tier: str = "strong",
+        **kwargs
+    ) -> LLMResponse:
+        """계층별 인위적 지연 후 Mock 응답 반환 (metadata["model_tier"] 에 응답한 계층 기록)"""
+        await asyncio.sleep(self.tier_delays.get(model_tier, self.response_delay))  # 실제 API 호출 시뮬레이션
+        response = self._mock_response(messages)
+        response.metadata = {**(response.metadata or {}), "model_tier": model_tier}
+        return response
+    
+    def _mock_response(self, messages: List[ChatMessage]) -> LLMResponse:
         """Mock 응답 생성 - 의사결정용 JSON 응답 포함"""
-        await asyncio.sleep(0.05)  # 실제 API 호출 시뮬레이션
         mode = os.getenv("PAI_MOCK_MODE", "off").lower()
         # 운영 기본값: off → Mock 사용 불가
         if mode == "off":
@@ -553,6 +948,8 @@ class LLMManager:
         self.config = config or Settings()
         self.providers: Dict[str, LLMProvider] = {}
         self.default_provider = "gemini"
+        # 모든 GeminiProvider 인스턴스가 공유하는 호출 스케줄러 (LLMManager를 거치지 않는 호출도 포함)
+        self.scheduler: Optional[LLMScheduler] = get_llm_scheduler(self.config)
         
     async def initialize(self) -> bool:
         """모든 프로바이더 초기화"""
@@ -584,6 +981,10 @@ class LLMManager:
         """사용 가능한 프로바이더 목록"""
         return list(self.providers.keys())
     
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """공용 LLM 스케줄러 통계 (비활성 시 빈 dict)"""
+        return self.scheduler.get_stats() if self.scheduler else {}
+    
     async def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -596,7 +997,7 @@ class LLMManager:
             raise LLMProviderError(f"Provider {provider_name} not found")
         
         # Dict를 ChatMessage로 변환
-        chat_messages = [ChatMessage(role=msg["role"], content=msg["content"]) for msg in messages]
+        chat_messages = [ChatMessage(role=msg["role"], content=msg["content"], metadata=msg.get("metadata")) for msg in messages]
         
         return await provider.generate_response(chat_messages, **kwargs)
     
@@ -611,15 +1012,9 @@ class LLMManager:
         if not provider:
             raise ValueError(f"사용 가능한 프로바이더가 없습니다: {provider_name}")
             
-        # GeminiProvider인 경우에만 스트림 지원
-        if isinstance(provider, GeminiProvider):
-            async for chunk in provider.stream_generate(messages, **kwargs):
-                yield chunk
-        else:
-            # 다른 프로바이더는 일반 응답을 한 번에 반환
-            chat_messages = [ChatMessage(role=msg["role"], content=msg["content"]) for msg in messages]
-            response = await provider.generate_response(chat_messages, **kwargs)
-            yield response.content
+        # 스트리밍 미지원 프로바이더는 기본 _stream_model 이 일반 응답을 한 번에 반환
+        async for chunk in provider.stream_generate(messages, **kwargs):
+            yield chunk
 
 
 # 하위 호환성을 위한 기본 인스턴스
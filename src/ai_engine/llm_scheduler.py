@@ -0,0 +1,320 @@
+"""LLM 호출 스케줄러
+
+ReactEngine, PlanningEngine, GoalManager, DynamicPlanAdapter, ResponseGenerator,
+MCPIntegration, 프로액티브 루프 등 여러 곳의 Gemini 호출을 프로세스 단위로 한 곳에서 조율합니다.
+
+- AIMD 동시성: 성공하면 한도를 조금씩 올리고(+1/한도), 429/과부하 오류면 절반으로 줄임
+- 분당 요청/토큰(RPM/TPM) 회계: 60초 슬라이딩 윈도우, 한도를 넘으면 윈도우가 빌 때까지 대기
+- 우선순위: interactive(사용자 대기 중) > normal > background(프로액티브 등)
+- 마감 시간: 대기열에서 마감을 넘긴 요청은 실행하지 않고 LLMDeadlineExceeded 로 폐기
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Tuple
+
+from loguru import logger
+
+
+PRIORITIES = ("interactive", "normal", "background")
+
+# 프롬프트 유형(ChatMessage.metadata["prompt_type"])별 기본 우선순위
+PROMPT_PRIORITIES: Dict[str, str] = {
+    "complexity": "interactive",
+    "thought": "interactive",
+    "action": "interactive",
+    "action_repair": "interactive",
+    "fused": "interactive",
+    "goal_check": "interactive",
+    "final_answer": "interactive",
+    "proactive": "background",
+}
+
+DEFAULT_DEADLINES: Dict[str, float] = {"interactive": 30.0, "normal": 60.0, "background": 120.0}
+
+_WINDOW_SECONDS = 60.0
+
+
+class LLMDeadlineExceeded(Exception):
+    """대기열에서 마감 시간을 넘겨 실행하지 않고 폐기된 LLM 요청"""
+    pass
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """429/할당량/과부하 계열 오류인지 (AIMD 감소 및 재호출 금지 판단용)"""
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in (
+        "429", "resourceexhausted", "resource_exhausted", "resource has been exhausted",
+        "quota", "rate limit", "too many requests", "503", "serviceunavailable", "overloaded"
+    ))
+
+
+def get_message_priority(messages: Iterable[Any]) -> str:
+    """메시지 metadata 의 "priority" 또는 "prompt_type" 으로 우선순위 결정"""
+    for msg in messages:
+        metadata = getattr(msg, "metadata", None) or {}
+        priority = metadata.get("priority")
+        if priority in PRIORITIES:
+            return priority
+        prompt_type = metadata.get("prompt_type")
+        if prompt_type:
+            return PROMPT_PRIORITIES.get(prompt_type, "normal")
+    return "normal"
+
+
+@dataclass
+class LLMTicket:
+    """실행 슬롯 1건 (실제 사용 토큰은 호출 후 tokens 에 기록)"""
+    priority: str
+    estimated_tokens: int
+    tokens: Optional[int] = None
+    queued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    seq: int
+    ticket: LLMTicket = field(compare=False)
+    deadline: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class LLMScheduler:
+    """
+    AIMD 동시성 + RPM/TPM 회계 + 우선순위/마감 대기열
+
+    사용 예:
+        async with scheduler.slot("interactive", estimated_tokens=1200) as ticket:
+            response = await asyncio.to_thread(generate)
+            ticket.tokens = actual_tokens
+    """
+
+    def __init__(self,
+                 initial_limit: int = 4,
+                 min_limit: int = 1,
+                 max_limit: int = 16,
+                 requests_per_minute: int = 0,
+                 tokens_per_minute: int = 0,
+                 deadlines: Optional[Dict[str, float]] = None,
+                 decrease_cooldown: float = 2.0):
+        """
+        Args:
+            initial_limit: 시작 동시 실행 한도
+            min_limit / max_limit: AIMD 한도 범위
+            requests_per_minute: 분당 요청 한도 (0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 한도 (0이면 회계만 하고 제한 없음)
+            deadlines: 우선순위별 대기 마감 시간 (초)
+            decrease_cooldown: 연속된 과부하 오류로 한도가 한 번에 여러 번 줄지 않도록 하는 간격 (초)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self.requests_per_minute = max(0, requests_per_minute)
+        self.tokens_per_minute = max(0, tokens_per_minute)
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self.decrease_cooldown = decrease_cooldown
+
+        self._in_flight = 0
+        self._queue: List[_Waiter] = []
+        self._seq = itertools.count()
+        # 60초 윈도우 내 (시각, 토큰) 기록 (진행 중 요청은 추정 토큰으로 예약)
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._last_decrease = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self.stats: Dict[str, Any] = {
+            "started": 0, "succeeded": 0, "failed": 0, "overloaded": 0,
+            "dropped_deadline": 0, "throttled": 0, "decreases": 0,
+            "tokens": 0, "max_in_flight": 0,
+            "wait_total": {p: 0.0 for p in PRIORITIES},
+            "started_by_priority": {p: 0 for p in PRIORITIES}
+        }
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: str = "normal", estimated_tokens: int = 0,
+                   deadline: Optional[float] = None) -> AsyncIterator[LLMTicket]:
+        """실행 슬롯 획득 (우선순위/마감 대기 후), 종료 시 반납 및 AIMD 갱신"""
+        if priority not in PRIORITIES:
+            priority = "normal"
+        ticket = LLMTicket(priority=priority, estimated_tokens=max(0, estimated_tokens))
+        await self._acquire(ticket, deadline)
+        try:
+            yield ticket
+        except (asyncio.CancelledError, GeneratorExit):
+            self._release(ticket, completed=False)
+            raise
+        except BaseException as e:
+            self._release(ticket, error=e)
+            raise
+        else:
+            self._release(ticket)
+
+    async def _acquire(self, ticket: LLMTicket, deadline: Optional[float]) -> None:
+        timeout = deadline if deadline is not None else self.deadlines.get(ticket.priority)
+        if not self._queue and self._can_start(ticket):
+            self._start(ticket)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(PRIORITIES.index(ticket.priority), next(self._seq), ticket,
+                         ticket.queued_at + timeout if timeout else float("inf"), future)
+        heapq.heappush(self._queue, waiter)
+        self._dispatch()
+        try:
+            if timeout:
+                await asyncio.wait_for(future, max(0.0, waiter.deadline - time.monotonic()))
+            else:
+                await future
+        except asyncio.TimeoutError:
+            self.stats["dropped_deadline"] += 1
+            logger.warning(f"LLM 요청 대기 마감 초과로 폐기: priority={ticket.priority}, "
+                           f"대기={time.monotonic() - ticket.queued_at:.1f}초")
+            raise LLMDeadlineExceeded(f"LLM 요청이 {timeout:.0f}초 안에 시작되지 못했습니다")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(ticket, completed=False)  # 슬롯을 받은 직후 취소
+            raise
+
+    def _can_start(self, ticket: LLMTicket) -> bool:
+        if self._in_flight >= int(self.limit):
+            return False
+        now = time.monotonic()
+        self._expire_window(now)
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            return False
+        if (self.tokens_per_minute and self._window
+                and self._window_tokens + ticket.estimated_tokens > self.tokens_per_minute):
+            return False
+        return True
+
+    def _start(self, ticket: LLMTicket) -> None:
+        now = time.monotonic()
+        ticket.started_at = now
+        self._in_flight += 1
+        self._window.append((now, ticket.estimated_tokens))
+        self._window_tokens += ticket.estimated_tokens
+        self.stats["started"] += 1
+        self.stats["started_by_priority"][ticket.priority] += 1
+        self.stats["wait_total"][ticket.priority] += now - ticket.queued_at
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self._in_flight)
+
+    def _release(self, ticket: LLMTicket, error: Optional[BaseException] = None,
+                 completed: bool = True) -> None:
+        self._in_flight -= 1
+        if ticket.tokens is not None:
+            self._reconcile(ticket)
+        if completed:
+            if error is None:
+                self.stats["succeeded"] += 1
+                # 가산 증가: 한도만큼 성공하면 +1
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            elif is_overload_error(error):
+                self.stats["overloaded"] += 1
+                self._decrease()
+            else:
+                self.stats["failed"] += 1
+        self._dispatch()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.min_limit), self.limit / 2)
+        self.stats["decreases"] += 1
+        logger.warning(f"LLM 과부하 감지 - 동시 실행 한도 감소: {self.limit:.1f}")
+
+    def _reconcile(self, ticket: LLMTicket) -> None:
+        """예약한 추정 토큰을 실제 사용량으로 교체"""
+        actual = max(0, int(ticket.tokens or 0))
+        self.stats["tokens"] += actual
+        for i, (started, tokens) in enumerate(self._window):
+            if started == ticket.started_at and tokens == ticket.estimated_tokens:
+                self._window[i] = (started, actual)
+                self._window_tokens += actual - tokens
+                break
+
+    def _expire_window(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= _WINDOW_SECONDS:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+
+    def _dispatch(self) -> None:
+        """우선순위 순서대로 시작 가능한 대기자에게 슬롯 배분"""
+        while self._queue:
+            head = self._queue[0]
+            if head.future.done():
+                heapq.heappop(self._queue)  # 마감/취소된 대기자 정리
+                continue
+            if not self._can_start(head.ticket):
+                if self._in_flight < int(self.limit):
+                    self.stats["throttled"] += 1
+                    self._schedule_retry()  # RPM/TPM 윈도우가 빌 때 다시 배분
+                return
+            heapq.heappop(self._queue)
+            self._start(head.ticket)
+            head.future.set_result(None)
+
+    def _schedule_retry(self) -> None:
+        if (self._timer is not None and not self._timer.cancelled()) or not self._window:
+            return
+        delay = max(0.05, _WINDOW_SECONDS - (time.monotonic() - self._window[0][0]))
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        def _fire() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = loop.call_later(delay, _fire)
+
+    def has_capacity(self) -> bool:
+        """대기열 없이 지금 바로 시작할 수 있는 여유 슬롯이 있는지 (헤지 요청 허용 판단용)"""
+        return not self._queue and self._in_flight < int(self.limit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 한도/대기열 및 누적 통계 (우선순위별 평균 대기 포함)"""
+        self._expire_window(time.monotonic())
+        started = self.stats["started_by_priority"]
+        return {
+            **self.stats,
+            "limit": round(self.limit, 2),
+            "in_flight": self._in_flight,
+            "queued": sum(1 for w in self._queue if not w.future.done()),
+            "window_requests": len(self._window),
+            "window_tokens": self._window_tokens,
+            "avg_wait": {p: self.stats["wait_total"][p] / started[p] if started[p] else 0.0 for p in PRIORITIES}
+        }
+
+
+_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler(config: Any = None) -> Optional[LLMScheduler]:
+    """프로세스 공용 LLM 스케줄러 (설정 llm_scheduler_enabled 가 꺼져 있으면 None)"""
+    global _scheduler
+    if _scheduler is not None:
+        return _scheduler
+    if config is None or not getattr(config, "llm_scheduler_enabled", False):
+        return None
+    deadlines = config.get_llm_queue_deadlines() if hasattr(config, "get_llm_queue_deadlines") else None
+    _scheduler = LLMScheduler(
+        initial_limit=getattr(config, "llm_initial_concurrency", 4),
+        max_limit=getattr(config, "llm_max_concurrency", 16),
+        requests_per_minute=getattr(config, "gemini_api_rate_limit", 0),
+        tokens_per_minute=getattr(config, "llm_tokens_per_minute", 0),
+        deadlines=deadlines,
+    )
+    logger.info(f"LLM 스케줄러 활성화: 동시 실행 한도={_scheduler.limit:.0f}~{_scheduler.max_limit}, "
+                f"RPM={_scheduler.requests_per_minute or '무제한'}, TPM={_scheduler.tokens_per_minute or '무제한'}")
+    return _scheduler
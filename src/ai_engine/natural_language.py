@@ -119,8 +119,8 @@ class NaturalLanguageProcessor:
             current_time = datetime.now().isoformat()
             memory_context = context.get("memory_context", "관련 기억 없음") if context else "관련 기억 없음"
             
-            # 명령 분석 프롬프트 렌더링
-            prompt_text = self.prompt_manager.render_template(
+            # 명령 분석 프롬프트 렌더링 (고정 지침은 캐시 가능한 접두부로 분리)
+            messages = self.prompt_manager.render_messages(
                 "command_analysis",
                 {
                     "user_command": user_command,
@@ -132,7 +132,6 @@ class NaturalLanguageProcessor:
             )
             
             # AI 응답 생성
-            messages = [{"role": "user", "content": prompt_text}]
             response = await self.llm_manager.generate_response(
                 messages, 
                 temperature=0.3  # 낮은 온도로 일관된 분석
@@ -497,12 +496,11 @@ class NaturalLanguageProcessor:
                 "expertise_level": "중급"
             }
             
-            prompt_text = self.prompt_manager.get_context_aware_prompt(
+            messages = self.prompt_manager.get_context_aware_messages(
                 template_name, user_id, variables
             )
             
             # AI 응답 생성
-            messages = [{"role": "user", "content": prompt_text}]
             response = await self.llm_manager.generate_response(messages, temperature=0.7)
             
             # A/B 테스트 결과 기록 (변형이 있는 경우)
@@ -599,12 +597,11 @@ class NaturalLanguageProcessor:
                 "system_capabilities": ["일정관리", "파일조작", "정보검색", "자동화"]
             }
             
-            prompt_text = self.prompt_manager.get_context_aware_prompt(
+            messages = self.prompt_manager.get_context_aware_messages(
                 "context_aware_planning", user_id, variables
             )
             
             # AI 응답 생성
-            messages = [{"role": "user", "content": prompt_text}]
             response = await self.llm_manager.generate_response(messages, temperature=0.4)
             
             # 응답 파싱
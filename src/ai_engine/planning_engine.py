@@ -89,6 +89,18 @@ class ExecutionPlan:
         # 우선순위 순으로 정렬
         return sorted(ready_steps, key=lambda x: x.priority.value, reverse=True)
     
+    def get_next_wave(self, max_parallel: int = 1) -> List[PlanStep]:
+        """
+        함께 실행할 다음 단계 묶음 반환
+        
+        의존성이 모두 충족된 단계들은 서로 독립적이므로 동시에 실행할 수 있습니다.
+        순차 전략이거나 max_parallel이 1 이하이면 한 단계만 반환합니다.
+        """
+        ready_steps = self.get_next_steps()
+        if self.execution_strategy == "sequential" or max_parallel <= 1:
+            return ready_steps[:1]
+        return ready_steps[:max_parallel]
+    
     def is_completed(self) -> bool:
         """계획 완료 여부"""
         return all(step.status in [TaskStatus.COMPLETED, TaskStatus.SKIPPED] 
@@ -246,6 +258,8 @@ class PlanningEngine:
    - 실패 시 복구 방안
    - 우선순위 (1-4, 4가 가장 높음)
 3. 단계 간 의존성이 있다면 명시해주세요
+   - 이전 단계의 결과가 필요한 단계는 반드시 "dependencies"에 해당 step_id를 넣으세요
+   - 서로 독립적인 단계(예: 할일 여러 개 추가, 할일과 일정 동시 등록)는 의존성을 비우고 "strategy"를 "parallel"로 지정하면 동시에 실행됩니다
 
 응답은 반드시 다음 JSON 형식으로 해주세요 (정확한 필드명 사용 필수):
 
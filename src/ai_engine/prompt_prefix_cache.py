@@ -0,0 +1,190 @@
+"""프롬프트 고정 접두부 캐시
+
+도구 카탈로그 버전별 행동 결정 프롬프트, 목표 판정 프롬프트처럼 크고 변하지 않는 시스템 프롬프트는
+ChatMessage.metadata["cacheable"] = True 로 표시합니다. 메시지 목록 앞쪽의 연속된 cacheable 메시지가
+고정 접두부(prefix), 나머지가 가변 접미부(suffix)입니다.
+
+- 접두부 버퍼: 내용 해시별로 렌더링된 접두부 문자열을 재사용 (매 호출 재조립 생략)
+- 컨텍스트 캐시: 프로바이더가 컨텍스트 캐싱 API(Gemini CachedContent)를 제공하면
+  접두부를 (모델, 내용 해시) 단위로 TTL 과 함께 등록하고, 이후 호출은 접미부만 전송
+  등록은 백그라운드에서 진행되며 준비되기 전 호출은 전체 프롬프트로 보냅니다.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from .agent_state import estimate_tokens
+
+
+CACHEABLE_KEY = "cacheable"
+
+
+def split_stable_prefix(messages: Sequence[Any]) -> Tuple[List[Any], List[Any]]:
+    """메시지 목록을 (앞쪽의 연속된 cacheable 메시지, 나머지) 로 분리"""
+    index = 0
+    while index < len(messages) and (getattr(messages[index], "metadata", None) or {}).get(CACHEABLE_KEY):
+        index += 1
+    return list(messages[:index]), list(messages[index:])
+
+
+@dataclass
+class _ContextEntry:
+    """등록된 컨텍스트 캐시 1건 (handle 은 캐시에 바인딩된 모델)"""
+    handle: Any
+    tokens: int
+    expires_at: float
+
+
+class PromptPrefixCache:
+    """
+    고정 접두부 버퍼 + 프로바이더 컨텍스트 캐시 관리
+
+    사용 예:
+        key, prefix_text = cache.render_prefix(prefix_messages, render)
+        handle = cache.get_context(model_name, key, prefix_text)  # 없으면 None (백그라운드 등록 시작)
+    """
+
+    def __init__(self,
+                 create_context: Optional[Callable[[str, str, int], Any]] = None,
+                 ttl_seconds: int = 3600,
+                 min_tokens: int = 1024,
+                 max_entries: int = 64,
+                 refresh_margin: float = 60.0):
+        """
+        Args:
+            create_context: (모델명, 접두부 텍스트, TTL 초) → 캐시에 바인딩된 모델을 반환하는 동기 함수
+                            (None 이면 접두부 버퍼만 사용)
+            ttl_seconds: 컨텍스트 캐시 TTL
+            min_tokens: 컨텍스트 캐시에 등록할 최소 접두부 토큰 수 (API 최소 크기 미만은 등록하지 않음)
+            max_entries: 접두부 버퍼/컨텍스트 캐시 최대 항목 수
+            refresh_margin: 만료 이 시간 전부터는 만료된 것으로 보고 재등록 (초)
+        """
+        self.create_context = create_context
+        self.ttl_seconds = max(60, ttl_seconds)
+        self.min_tokens = max(0, min_tokens)
+        self.max_entries = max(1, max_entries)
+        self.refresh_margin = refresh_margin
+
+        self._buffers: "OrderedDict[str, str]" = OrderedDict()
+        self._contexts: "OrderedDict[Tuple[str, str], _ContextEntry]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], asyncio.Task] = {}
+        # 등록 실패한 (모델, 키) → 재시도 가능 시각
+        self._failed: Dict[Tuple[str, str], float] = {}
+
+        self.stats: Dict[str, int] = {
+            "buffer_hits": 0, "buffer_misses": 0,
+            "context_hits": 0, "context_misses": 0, "context_creates": 0,
+            "context_failures": 0, "cached_prompt_tokens": 0
+        }
+
+    @staticmethod
+    def prefix_key(prefix: Sequence[Any]) -> str:
+        digest = hashlib.sha256()
+        for msg in prefix:
+            digest.update(getattr(msg, "role", "").encode("utf-8"))
+            digest.update(b"\x00")
+            digest.update(getattr(msg, "content", "").encode("utf-8"))
+            digest.update(b"\x01")
+        return digest.hexdigest()
+
+    def render_prefix(self, prefix: Sequence[Any], render: Callable[[List[Any]], str]) -> Tuple[str, str]:
+        """접두부의 (내용 해시, 렌더링된 텍스트) - 같은 내용이면 버퍼 재사용"""
+        key = self.prefix_key(prefix)
+        text = self._buffers.get(key)
+        if text is not None:
+            self._buffers.move_to_end(key)
+            self.stats["buffer_hits"] += 1
+            return key, text
+        self.stats["buffer_misses"] += 1
+        text = render(list(prefix))
+        self._buffers[key] = text
+        if len(self._buffers) > self.max_entries:
+            self._buffers.popitem(last=False)
+        return key, text
+
+    def get_context(self, model_name: str, key: str, prefix_text: str) -> Optional[Any]:
+        """
+        접두부에 바인딩된 모델 핸들 반환
+
+        없거나 만료되었으면 None 을 반환하고 (조건이 맞으면) 백그라운드 등록을 시작합니다.
+        """
+        if self.create_context is None:
+            return None
+        cache_key = (model_name, key)
+        now = time.monotonic()
+        entry = self._contexts.get(cache_key)
+        if entry is not None:
+            if now < entry.expires_at - self.refresh_margin:
+                self._contexts.move_to_end(cache_key)
+                self.stats["context_hits"] += 1
+                self.stats["cached_prompt_tokens"] += entry.tokens
+                return entry.handle
+            del self._contexts[cache_key]
+
+        self.stats["context_misses"] += 1
+        tokens = estimate_tokens(prefix_text)
+        if (tokens >= self.min_tokens and cache_key not in self._pending
+                and self._failed.get(cache_key, 0.0) <= now):
+            self._schedule_create(cache_key, prefix_text, tokens)
+        return None
+
+    def _schedule_create(self, cache_key: Tuple[str, str], prefix_text: str, tokens: int) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        create = self.create_context
+        task = loop.create_task(asyncio.to_thread(create, cache_key[0], prefix_text, self.ttl_seconds))  # type: ignore[arg-type]
+        self._pending[cache_key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            self._pending.pop(cache_key, None)
+            if finished.cancelled():
+                return
+            error = finished.exception()
+            if error is not None:
+                self.stats["context_failures"] += 1
+                self._failed[cache_key] = time.monotonic() + self.ttl_seconds
+                logger.warning(f"컨텍스트 캐시 등록 실패 (전체 프롬프트로 계속): model={cache_key[0]}, {error}")
+                return
+            self.stats["context_creates"] += 1
+            self._contexts[cache_key] = _ContextEntry(
+                handle=finished.result(), tokens=tokens,
+                expires_at=time.monotonic() + self.ttl_seconds
+            )
+            if len(self._contexts) > self.max_entries:
+                self._contexts.popitem(last=False)  # 서버 측 캐시는 TTL 로 만료
+            logger.info(f"컨텍스트 캐시 등록: model={cache_key[0]}, 접두부 약 {tokens}토큰, TTL={self.ttl_seconds}초")
+
+        task.add_done_callback(_done)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """접두부 버퍼/컨텍스트 캐시 적중률과 캐시로 대체된 추정 프롬프트 토큰 수"""
+        lookups = self.stats["context_hits"] + self.stats["context_misses"]
+        buffers = self.stats["buffer_hits"] + self.stats["buffer_misses"]
+        return {
+            **self.stats,
+            "buffer_hit_rate": self.stats["buffer_hits"] / buffers if buffers else 0.0,
+            "context_hit_rate": self.stats["context_hits"] / lookups if lookups else 0.0,
+            "active_contexts": len(self._contexts),
+            "context_caching": self.create_context is not None
+        }
+
+
+def create_prompt_prefix_cache(config: Any,
+                               create_context: Optional[Callable[[str, str, int], Any]] = None
+                               ) -> Optional[PromptPrefixCache]:
+    """설정에 따라 접두부 캐시 생성 (비활성화 시 None, 컨텍스트 캐싱은 별도 설정으로 opt-in)"""
+    if not getattr(config, "llm_prompt_prefix_cache_enabled", False):
+        return None
+    return PromptPrefixCache(
+        create_context=create_context if getattr(config, "llm_context_cache_enabled", False) else None,
+        ttl_seconds=getattr(config, "llm_context_cache_ttl", 3600),
+        min_tokens=getattr(config, "llm_context_cache_min_tokens", 1024),
+    )
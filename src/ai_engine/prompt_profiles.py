@@ -0,0 +1,263 @@
+"""프롬프트 프로필 레지스트리
+
+호출 지점(prompt_type)별 출력 토큰 예산, 중단 시퀀스, 응답 스키마를 한 곳에서 선언합니다.
+GeminiProvider 는 ChatMessage.metadata 의 "prompt_type" 으로 프로필을 찾아
+max_tokens 가 지정되지 않은 호출에 예산/중단 시퀀스/스키마를 적용합니다.
+
+실제 출력 토큰 분포를 프로필별로 기록하여 예산을 자동 조정합니다:
+- 예산 = p95 × 여유 배율 + 내부 추론 예약분 (하한/상한 사이로 제한)
+- 추론 예약분은 모델 계층별로 다르며(빠른 모델은 짧게 생각), 상한은 보이는 출력 기준이라
+  실제 상한 예산 = max_tokens_ceiling + 예약분 (항상 초기 예산보다 큼)
+- 출력이 예산에서 잘리면(MAX_TOKENS) 예약분을 두 배로 늘리고(계층별 최대 예약분까지)
+  상한 예산으로 1회 재시도
+
+모델 계층(tier): 점수/분류/판정처럼 짧고 구조화된 내부 호출은 "fast"(ai_fast_model),
+행동 결정처럼 추론이 필요한 호출과 사용자에게 보이는 최종 답변은 "strong"(ai_model) 모델을 사용합니다.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .agent_state import estimate_tokens
+
+
+@dataclass
+class PromptProfile:
+    """호출 지점별 생성 설정"""
+    name: str
+    max_tokens: int  # 보이는 출력에 대한 초기 예산 (추론 예약분 제외)
+    min_tokens: int = 64
+    max_tokens_ceiling: int = 8192  # 보이는 출력 상한 (추론 예약분 제외)
+    stop_sequences: Tuple[str, ...] = ()
+    response_mime_type: Optional[str] = None
+    response_schema: Optional[Dict[str, Any]] = None
+    auto_tune: bool = True
+    tier: str = "strong"  # "fast" | "strong"
+
+
+@dataclass
+class _ProfileUsage:
+    """프로필별 출력 토큰 분포 및 현재 예산"""
+    budget: int
+    reserve: int
+    samples: Deque[int] = field(default_factory=lambda: deque(maxlen=200))
+    calls: int = 0
+    truncations: int = 0
+    retries: int = 0
+    since_tune: int = 0
+
+
+DEFAULT_PROFILES: Tuple[PromptProfile, ...] = (
+    # "분류/점수"만 파싱하므로 "이유:" 이전에서 중단
+    PromptProfile("complexity", max_tokens=48, min_tokens=32, max_tokens_ceiling=256,
+                  stop_sequences=("이유:",), tier="fast"),
+    # 3개 항목 사고만 요청
+    PromptProfile("thought", max_tokens=384, max_tokens_ceiling=2048, stop_sequences=("\n4.",)),
+    PromptProfile("action", max_tokens=512, max_tokens_ceiling=4096,
+                  response_mime_type="application/json"),
+    # final_answer 금지 재시도 (행동 결정 자가 수정)
+    PromptProfile("action_repair", max_tokens=512, max_tokens_ceiling=4096,
+                  response_mime_type="application/json"),
+    PromptProfile("fused", max_tokens=768, max_tokens_ceiling=4096,
+                  response_mime_type="application/json"),
+    PromptProfile("goal_check", max_tokens=128, min_tokens=64, max_tokens_ceiling=1024,
+                  response_mime_type="application/json",
+                  response_schema={
+                      "type": "OBJECT",
+                      "properties": {
+                          "goal_achieved": {"type": "BOOLEAN"},
+                          "confidence": {"type": "NUMBER"},
+                          "reason": {"type": "STRING"},
+                      },
+                      "required": ["goal_achieved", "confidence"],
+                  }, tier="fast"),
+    # 관찰 결과 요약 보고 (사용자에게 보이는 답변이므로 기본 모델 유지)
+    PromptProfile("final_answer", max_tokens=512, max_tokens_ceiling=4096),
+)
+
+# 모델 계층별 내부 추론(thinking) 예약분 기본값
+DEFAULT_REASONING_RESERVES: Dict[str, int] = {"strong": 1024, "fast": 256}
+# 잘림 발생 시 예약분을 늘릴 수 있는 계층별 상한
+DEFAULT_MAX_REASONING_RESERVES: Dict[str, int] = {"strong": 8192, "fast": 2048}
+
+
+def is_truncated(finish_reason: Any) -> bool:
+    """finish_reason 이 출력 토큰 한도 도달을 뜻하는지 (enum/int/문자열 모두 허용)"""
+    if finish_reason is None:
+        return False
+    name = getattr(finish_reason, "name", None) or str(finish_reason)
+    return "MAX_TOKENS" in name.upper() or name == "2"
+
+
+class PromptProfileRegistry:
+    """
+    프롬프트 프로필 + 출력 토큰 분포 기반 예산 자동 조정
+
+    특징:
+    - prompt_type 별 예산/중단 시퀀스/응답 스키마 선언
+    - 실제 출력 토큰 p50/p95 추적, tune_every 회마다 예산 재계산
+    - 잘림 발생 시 예약분 증가 및 상한 예산으로 재시도할 값 제공
+    """
+
+    def __init__(self, profiles: Tuple[PromptProfile, ...] = DEFAULT_PROFILES,
+                 reasoning_reserves: Optional[Dict[str, int]] = None,
+                 max_reasoning_reserves: Optional[Dict[str, int]] = None, auto_tune: bool = True,
+                 headroom: float = 1.5, tune_every: int = 20, min_samples: int = 20):
+        """
+        Args:
+            profiles: 등록할 프로필
+            reasoning_reserves: 모델 계층별로 내부 추론(thinking)용으로 예산에 더하는 토큰 수
+                                (추론 없는 모델은 0, 없는 계층은 "strong" 값 사용)
+            max_reasoning_reserves: 잘림 시 두 배씩 늘리는 예약분의 계층별 상한
+            auto_tune: 출력 분포 기반 예산 자동 조정 여부
+            headroom: p95 대비 예산 여유 배율
+            tune_every: 예산 재계산 주기 (기록 횟수)
+            min_samples: 자동 조정을 시작하는 최소 표본 수
+        """
+        self.reasoning_reserves = {
+            tier: max(0, reserve)
+            for tier, reserve in {**DEFAULT_REASONING_RESERVES, **(reasoning_reserves or {})}.items()
+        }
+        self.max_reasoning_reserves = {**DEFAULT_MAX_REASONING_RESERVES, **(max_reasoning_reserves or {})}
+        self.auto_tune = auto_tune
+        self.headroom = headroom
+        self.tune_every = max(1, tune_every)
+        self.min_samples = max(1, min_samples)
+        self._profiles: Dict[str, PromptProfile] = {}
+        self._usage: Dict[str, _ProfileUsage] = {}
+        for profile in profiles:
+            self.register(profile)
+
+    def register(self, profile: PromptProfile) -> None:
+        """프로필 등록 (같은 이름이면 교체, 누적 분포 초기화)"""
+        self._profiles[profile.name] = profile
+        reserve = self.reasoning_reserves.get(profile.tier, self.reasoning_reserves["strong"])
+        usage = _ProfileUsage(budget=0, reserve=reserve)
+        usage.budget = self._clamp(profile, usage, profile.max_tokens + reserve)
+        self._usage[profile.name] = usage
+
+    def get(self, prompt_type: str) -> Optional[PromptProfile]:
+        return self._profiles.get(prompt_type)
+
+    def tier(self, prompt_type: str) -> str:
+        """호출 지점의 모델 계층 (프로필 없으면 "strong")"""
+        profile = self._profiles.get(prompt_type)
+        return profile.tier if profile else "strong"
+
+    def budget(self, prompt_type: str) -> Optional[int]:
+        """현재 max_tokens 예산 (프로필 없으면 None)"""
+        usage = self._usage.get(prompt_type)
+        return usage.budget if usage else None
+
+    def apply(self, prompt_type: str, max_tokens: Optional[int],
+              options: Dict[str, Any]) -> Tuple[Optional[int], Dict[str, Any]]:
+        """
+        호출 설정에 프로필 적용
+
+        호출자가 max_tokens 를 지정하면 그대로 두고, 생성 옵션은 호출자가 지정하지 않은 것만 채웁니다.
+        """
+        profile = self._profiles.get(prompt_type)
+        if profile is None:
+            return max_tokens, options
+        options = dict(options)
+        if profile.stop_sequences:
+            options.setdefault("stop_sequences", list(profile.stop_sequences))
+        if profile.response_mime_type:
+            options.setdefault("response_mime_type", profile.response_mime_type)
+        if profile.response_schema and options.get("response_mime_type") == "application/json":
+            options.setdefault("response_schema", profile.response_schema)
+        if max_tokens is None:
+            max_tokens = self._usage[prompt_type].budget
+        return max_tokens, options
+
+    def record(self, prompt_type: str, content: str, finish_reason: Any = None) -> Optional[int]:
+        """
+        응답 1건의 출력 토큰 기록
+
+        Returns:
+            잘린 응답이면 재시도에 사용할 상한 예산, 아니면 None
+        """
+        profile = self._profiles.get(prompt_type)
+        if profile is None:
+            return None
+        usage = self._usage[prompt_type]
+        usage.calls += 1
+
+        if is_truncated(finish_reason):
+            usage.truncations += 1
+            max_reserve = self.max_reasoning_reserves.get(profile.tier, self.max_reasoning_reserves["strong"])
+            usage.reserve = max(usage.reserve, min(max_reserve, max(usage.reserve * 2, profile.min_tokens)))
+            usage.budget = self._clamp(profile, usage, max(usage.budget * 2, self._target(profile, usage)))
+            logger.warning(f"프롬프트 출력 잘림: type={prompt_type}, 예산 상향 → {usage.budget}")
+            return self._ceiling(profile, usage)
+
+        usage.samples.append(estimate_tokens(content))
+        usage.since_tune += 1
+        if (self.auto_tune and profile.auto_tune and usage.since_tune >= self.tune_every
+                and len(usage.samples) >= self.min_samples):
+            usage.since_tune = 0
+            tuned = self._clamp(profile, usage, self._target(profile, usage))
+            if tuned != usage.budget:
+                logger.info(f"프롬프트 예산 자동 조정: type={prompt_type}, {usage.budget} → {tuned}")
+                usage.budget = tuned
+        return None
+
+    def record_retry(self, prompt_type: str) -> None:
+        usage = self._usage.get(prompt_type)
+        if usage:
+            usage.retries += 1
+
+    def _target(self, profile: PromptProfile, usage: _ProfileUsage) -> int:
+        p95 = self._percentile(usage.samples, 95) if usage.samples else profile.max_tokens
+        return int(math.ceil(p95 * self.headroom)) + usage.reserve
+
+    @staticmethod
+    def _ceiling(profile: PromptProfile, usage: _ProfileUsage) -> int:
+        """상한 예산 (보이는 출력 상한 + 현재 추론 예약분)"""
+        return profile.max_tokens_ceiling + usage.reserve
+
+    @classmethod
+    def _clamp(cls, profile: PromptProfile, usage: _ProfileUsage, tokens: int) -> int:
+        return max(profile.min_tokens, min(cls._ceiling(profile, usage), tokens))
+
+    @staticmethod
+    def _percentile(samples: Deque[int], percentile: float) -> int:
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(math.ceil(percentile / 100 * len(ordered))) - 1)
+        return ordered[max(0, index)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로필별 현재 예산과 출력 토큰 분포"""
+        stats: Dict[str, Any] = {}
+        for name, usage in self._usage.items():
+            samples = usage.samples
+            stats[name] = {
+                "tier": self._profiles[name].tier,
+                "budget": usage.budget,
+                "reserve": usage.reserve,
+                "ceiling": self._ceiling(self._profiles[name], usage),
+                "calls": usage.calls,
+                "truncations": usage.truncations,
+                "retries": usage.retries,
+                "p50_output_tokens": self._percentile(samples, 50) if samples else 0,
+                "p95_output_tokens": self._percentile(samples, 95) if samples else 0,
+                "max_output_tokens": max(samples) if samples else 0,
+            }
+        return stats
+
+
+def create_prompt_profiles(config: Any) -> Optional[PromptProfileRegistry]:
+    """설정에 따라 프롬프트 프로필 레지스트리 생성 (비활성화 시 None)"""
+    if not getattr(config, "llm_prompt_profiles_enabled", False):
+        return None
+    return PromptProfileRegistry(
+        reasoning_reserves={
+            "strong": getattr(config, "llm_reasoning_token_reserve", DEFAULT_REASONING_RESERVES["strong"]),
+            "fast": getattr(config, "llm_fast_reasoning_token_reserve", DEFAULT_REASONING_RESERVES["fast"]),
+        },
+        auto_tune=getattr(config, "llm_prompt_budget_autotune", True),
+    )
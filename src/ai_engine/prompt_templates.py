@@ -4,7 +4,7 @@ AI 에이전트의 다양한 작업에 대한 프롬프트 템플릿 관리
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -68,6 +68,22 @@ class PromptTemplate:
         except Exception as e:
             logger.error(f"템플릿 렌더링 중 오류 ({self.name}): {e}")
             raise
+    
+    def render_parts(self, variables: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        (고정 접두부, 변수가 채워진 나머지) 로 렌더링
+        
+        첫 변수가 나오는 문단 이전까지는 호출마다 같으므로 LLM 호출 시 캐시 가능한 접두부로 보낼 수 있습니다.
+        """
+        rendered = self.render(variables)
+        for match in Template.pattern.finditer(self.template):
+            if match.group("named") or match.group("braced"):
+                split_at = self.template.rfind("\n\n", 0, match.start()) + 2
+                if split_at < 2:
+                    break
+                prefix = Template(self.template[:split_at]).safe_substitute({}).rstrip()
+                return prefix, Template(self.template[split_at:]).safe_substitute(variables)
+        return "", rendered
 
 
 class PromptManager:
@@ -440,6 +456,20 @@ $behavior_patterns
             raise ValueError(f"템플릿을 찾을 수 없습니다: {name}")
             
         return template.render(variables)
+    
+    def render_messages(self, name: str, variables: Dict[str, Any], role: str = "user") -> List[Dict[str, Any]]:
+        """템플릿을 LLM 메시지로 렌더링 (고정 접두부는 cacheable 시스템 메시지로 분리)"""
+        template = self.get_template(name)
+        if not template:
+            raise ValueError(f"템플릿을 찾을 수 없습니다: {name}")
+        
+        prefix, rest = template.render_parts(variables)
+        if not prefix:
+            return [{"role": role, "content": rest}]
+        return [
+            {"role": "system", "content": prefix, "metadata": {"cacheable": True}},
+            {"role": role, "content": rest}
+        ]
         
     def save_templates(self, file_path: Path):
         """템플릿을 파일로 저장"""
@@ -746,6 +776,19 @@ $feedback_history
             optional_variables=["task_context", "feedback_history"]
         ))
         
+    def _context_variables(self, user_id: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """사용자 컨텍스트를 추가한 템플릿 변수"""
+        enhanced_variables = variables.copy()
+        if user_id in self.user_contexts:
+            user_context = self.user_contexts[user_id]
+            enhanced_variables.update({
+                "user_preferences": user_context.preferences,
+                "conversation_history": user_context.conversation_history[-5:],  # 최근 5개
+                "recent_tasks": user_context.recent_tasks[-3:],  # 최근 3개
+                "current_mood": user_context.current_mood or "neutral"
+            })
+        return enhanced_variables
+    
     def get_context_aware_prompt(self, template_name: str, user_id: str, variables: Dict[str, Any]) -> str:
         """컨텍스트를 고려한 프롬프트 생성"""
         try:
@@ -753,22 +796,20 @@ $feedback_history
             if not template:
                 raise ValueError(f"템플릿을 찾을 수 없습니다: {template_name}")
                 
-            # 사용자 컨텍스트 추가
-            enhanced_variables = variables.copy()
-            if user_id in self.user_contexts:
-                user_context = self.user_contexts[user_id]
-                enhanced_variables.update({
-                    "user_preferences": user_context.preferences,
-                    "conversation_history": user_context.conversation_history[-5:],  # 최근 5개
-                    "recent_tasks": user_context.recent_tasks[-3:],  # 최근 3개
-                    "current_mood": user_context.current_mood or "neutral"
-                })
-                
-            return template.render(enhanced_variables)
+            return template.render(self._context_variables(user_id, variables))
             
         except Exception as e:
             logger.error(f"컨텍스트 인식 프롬프트 생성 중 오류: {e}")
             raise
+    
+    def get_context_aware_messages(self, template_name: str, user_id: str,
+                                   variables: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """컨텍스트를 고려한 LLM 메시지 생성 (고정 접두부 분리)"""
+        try:
+            return self.render_messages(template_name, self._context_variables(user_id, variables))
+        except Exception as e:
+            logger.error(f"컨텍스트 인식 프롬프트 생성 중 오류: {e}")
+            raise
             
     def update_user_context(self, user_id: str, context_update: Dict[str, Any]):
         """사용자 컨텍스트 업데이트"""
@@ -8,26 +8,43 @@ Reasoning and Acting (ReAct) 패러다임을 구현하여 에이전트가 목표
 import asyncio
 import json
 import time
+from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from .agent_state import (
     AgentScratchpad, AgentContext, AgentResult, ActionType, 
-    StepStatus, ThoughtRecord, ActionRecord, ObservationRecord
+    StepStatus, ThoughtRecord, ActionRecord, ObservationRecord, estimate_tokens
 )
 from .llm_provider import LLMProvider, ChatMessage
 from .prompt_templates import PromptManager
-from .planning_engine import PlanningEngine, ExecutionPlan, TaskStatus as PlanTaskStatus
+from .planning_engine import PlanningEngine, ExecutionPlan, PlanStep, TaskStatus as PlanTaskStatus
 from .goal_manager import GoalManager, GoalHierarchy
-from .dynamic_adapter import DynamicPlanAdapter, AdaptationEvent
+from .dynamic_adapter import DynamicPlanAdapter, AdaptationEvent, AdaptationHistory
+from .tool_prefetch import SpeculativePrefetcher
+from .goal_fastpath import GoalCompletionClassifier
 from ..mcp.registry import ToolRegistry
-from ..mcp.base_tool import ToolMetadata
 from ..mcp.executor import ToolExecutor
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class RequestExecutionContext:
+    """
+    요청 1건의 계획 실행 상태
+    
+    ReactEngine 인스턴스는 여러 사용자 요청이 동시에 공유하므로,
+    계획/목표 계층/적응 이력처럼 요청마다 달라지는 상태는 엔진 필드가 아닌 이 객체에 보관합니다.
+    """
+    context: AgentContext
+    plan: Optional[ExecutionPlan] = None
+    hierarchy: Optional[GoalHierarchy] = None
+    adaptation_history: AdaptationHistory = field(default_factory=AdaptationHistory)
+    started_at: float = field(default_factory=time.time)
+
+
 class ReactEngine:
     """
     ReAct (Reasoning and Acting) 엔진
@@ -43,7 +60,12 @@ class ReactEngine:
         tool_executor: ToolExecutor,
         prompt_manager: PromptManager,
         max_iterations: int = 15,
-        timeout_seconds: int = 600  # 10분으로 증가
+        timeout_seconds: int = 600,  # 10분으로 증가
+        fused_mode: Optional[bool] = None,
+        history_token_budget: Optional[int] = None,
+        plan_max_parallel: Optional[int] = None,
+        tool_prefetch: Optional[bool] = None,
+        goal_fastpath: Optional[bool] = None
     ):
         self.llm_provider = llm_provider
         self.tool_registry = tool_registry
@@ -57,11 +79,51 @@ class ReactEngine:
         self.goal_manager = GoalManager(llm_provider)
         self.dynamic_adapter = DynamicPlanAdapter(llm_provider)
         
-        # 현재 활성 계획 및 목표
-        self.current_plan: Optional[ExecutionPlan] = None
-        self.current_hierarchy: Optional[GoalHierarchy] = None
+        # 요청별 계획/목표 계층/적응 이력은 RequestExecutionContext 로 전달 (엔진 인스턴스는 요청 간 공유)
+        
+        # 융합 모드: 사고+행동+목표 달성 판단을 JSON 호출 1회로 처리 (설정 react_fused_mode)
+        if fused_mode is None:
+            fused_mode = bool(getattr(getattr(llm_provider, "config", None), "react_fused_mode", False))
+        self.fused_mode = fused_mode
+        
+        # Scratchpad 히스토리 토큰 예산 (설정 react_history_token_budget, 0 이하면 제한 없음)
+        if history_token_budget is None:
+            history_token_budget = getattr(getattr(llm_provider, "config", None), "react_history_token_budget", None)
+        self.history_token_budget = history_token_budget if history_token_budget and history_token_budget > 0 else None
+        
+        # 계획 실행 시 한 웨이브에서 병렬 실행할 최대 단계 수 (설정 react_plan_max_parallel)
+        if plan_max_parallel is None:
+            plan_max_parallel = getattr(getattr(llm_provider, "config", None), "react_plan_max_parallel", 1)
+        self.plan_max_parallel = max(1, int(plan_max_parallel or 1))
+        
+        # 읽기 전용 도구 추측 실행 (설정 react_tool_prefetch)
+        if tool_prefetch is None:
+            tool_prefetch = bool(getattr(getattr(llm_provider, "config", None), "react_tool_prefetch", False))
+        self.tool_prefetcher: Optional[SpeculativePrefetcher] = (
+            SpeculativePrefetcher(tool_executor, tool_registry) if tool_prefetch else None
+        )
+        
+        # 단일 행동 의도의 목표 달성 로컬 판단 (설정 react_goal_fastpath)
+        config = getattr(llm_provider, "config", None)
+        if goal_fastpath is None:
+            goal_fastpath = bool(getattr(config, "react_goal_fastpath", False))
+        self.goal_classifier: Optional[GoalCompletionClassifier] = (
+            GoalCompletionClassifier(
+                tool_registry,
+                threshold=float(getattr(config, "react_goal_fastpath_threshold", 0.8)),
+                audit_every=int(getattr(config, "react_goal_fastpath_audit_every", 5))
+            ) if goal_fastpath else None
+        )
+        
+        # 도구 카탈로그 버전별 캐시 (도구 정보, 행동 프롬프트 템플릿)
+        self._tools_info_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        self._action_prompt_cache: Dict[Tuple[int, Tuple[str, ...]], str] = {}
+        
+        # 실행 모드별 지연/토큰 통계 (A/B 비교용)
+        self.mode_stats: Dict[str, Dict[str, float]] = {}
         
-        logger.info(f"ReAct 엔진 초기화 완료 (최대 반복: {max_iterations}, 타임아웃: {timeout_seconds}초)")
+        logger.info(f"ReAct 엔진 초기화 완료 (최대 반복: {max_iterations}, 타임아웃: {timeout_seconds}초, "
+                    f"모드: {'fused' if fused_mode else 'split'})")
     
     async def execute_goal_with_planning(self, context: AgentContext) -> AgentResult:
         """
@@ -77,39 +139,45 @@ class ReactEngine:
         
         start_time = time.time()
         
+        execution = RequestExecutionContext(context=context, started_at=start_time)
+        with self.tool_executor.request_scope():
+            return await self._execute_goal_with_planning(execution)
+    
+    async def _execute_goal_with_planning(self, execution: RequestExecutionContext) -> AgentResult:
+        """계획 수립 및 실행 본체 (요청 메모 범위 안에서 호출)"""
+        context = execution.context
         try:
             # 1. 목표 분해
             available_tools = self._get_available_tools_info()
-            self.current_hierarchy = await self.goal_manager.decompose_goal(
+            execution.hierarchy = await self.goal_manager.decompose_goal(
                 context.goal, context, available_tools
             )
             
             # 2. 실행 계획 생성
-            self.current_plan = await self.planning_engine.create_execution_plan(
+            execution.plan = await self.planning_engine.create_execution_plan(
                 context.goal, context, available_tools
             )
             
             # 3. 계획 기반 실행
-            return await self._execute_plan_with_adaptation(context, start_time)
+            return await self._execute_plan_with_adaptation(execution)
             
         except Exception as e:
             logger.error(f"고급 계획 실행 실패: {e}")
             # 기본 ReAct 루프로 폴백
             return await self.execute_goal(context)
     
-    async def _execute_plan_with_adaptation(
-        self, 
-        context: AgentContext, 
-        start_time: float
-    ) -> AgentResult:
+    async def _execute_plan_with_adaptation(self, execution: RequestExecutionContext) -> AgentResult:
         """적응형 계획 실행"""
+        context = execution.context
+        start_time = execution.started_at
         
         scratchpad = AgentScratchpad(
             goal=context.goal,
-            max_steps=context.max_iterations
+            max_steps=context.max_iterations,
+            token_budget=self.history_token_budget
         )
         
-        plan = self.current_plan
+        plan = execution.plan
         if not plan:
             raise ValueError("실행할 계획이 없습니다")
         
@@ -141,7 +209,8 @@ class ReactEngine:
                         {
                             "iterations": iteration + 1,
                             "execution_time": time.time() - start_time,
-                            "plan_id": plan.plan_id
+                            "plan_id": plan.plan_id,
+                            "adaptations": len(execution.adaptation_history.actions)
                         }
                     )
                 else:
@@ -149,36 +218,35 @@ class ReactEngine:
                     logger.warning("실행 가능한 단계가 없음 - 계획 재검토 필요")
                     break
             
-            # 첫 번째 단계 실행
-            current_step = next_steps[0]
-            current_step.status = PlanTaskStatus.IN_PROGRESS
+            # 의존성이 충족된 단계들을 한 웨이브로 동시 실행
+            wave = plan.get_next_wave(self.plan_max_parallel)
+            for step in wave:
+                step.status = PlanTaskStatus.IN_PROGRESS
             
-            step_start_time = time.time()
+            wave_results = await self._execute_plan_wave(wave, scratchpad, context)
             
-            # 단계 실행
-            execution_result = await self._execute_plan_step(
-                current_step, scratchpad, context
-            )
-            
-            execution_result["execution_time"] = time.time() - step_start_time
-            execution_result["total_elapsed"] = time.time() - start_time
+            for execution_result in wave_results:
+                execution_result["total_elapsed"] = time.time() - start_time
             
-            # 적응 필요성 분석
+            # 적응 필요성 분석 (웨이브당 1회, 가장 문제가 큰 단계 기준)
+            current_step, execution_result = self._select_wave_for_adaptation(wave, wave_results)
             adaptation_event = await self.dynamic_adapter.analyze_situation(
-                plan, current_step, execution_result, context
+                plan, current_step, execution_result, context,
+                history=execution.adaptation_history
             )
             
             if adaptation_event:
                 # 적응 전략 생성 및 적용
                 adaptation_action = await self.dynamic_adapter.generate_adaptation_strategy(
-                    adaptation_event, plan, self.current_hierarchy, context
+                    adaptation_event, plan, execution.hierarchy, context,
+                    history=execution.adaptation_history
                 )
                 
                 plan = await self.dynamic_adapter.apply_adaptation(
-                    adaptation_action, plan, self.current_hierarchy
+                    adaptation_action, plan, execution.hierarchy
                 )
                 
-                self.current_plan = plan  # 업데이트된 계획 저장
+                execution.plan = plan  # 업데이트된 계획 저장
                 
                 logger.info(f"계획 적응 완료: {adaptation_action.strategy.value}")
         
@@ -193,10 +261,139 @@ class ReactEngine:
                 "iterations": context.max_iterations,
                 "execution_time": time.time() - start_time,
                 "partial_result": partial_result,
-                "plan_id": plan.plan_id if plan else None
+                "plan_id": plan.plan_id if plan else None,
+                "adaptations": len(execution.adaptation_history.actions)
             }
         )
     
+    async def _execute_plan_wave(
+        self,
+        wave: List[PlanStep],
+        scratchpad: AgentScratchpad,
+        context: AgentContext
+    ) -> List[Dict[str, Any]]:
+        """
+        계획 단계 묶음 실행
+        
+        도구 호출 단계는 ToolExecutor.execute_multiple(parallel=True)로 한 번에 실행하고
+        (전체/도구별 동시성 제한은 실행기에서 적용), 나머지 단계는 그대로 처리합니다.
+        결과는 wave 순서대로 반환되며 Scratchpad 기록 순서도 wave 순서를 따릅니다.
+        """
+        if len(wave) == 1:
+            step_start_time = time.time()
+            execution_result = await self._execute_plan_step(wave[0], scratchpad, context)
+            execution_result["execution_time"] = time.time() - step_start_time
+            return [execution_result]
+        
+        wave_start_time = time.time()
+        tool_steps: List[Tuple[PlanStep, Dict[str, Any]]] = []
+        for step in wave:
+            if step.action_type != "tool_call" or not step.tool_name:
+                continue
+            validated_params = self._validate_and_fix_tool_params(step.tool_name, step.tool_params or {})
+            if validated_params is not None:
+                tool_steps.append((step, validated_params))
+        
+        executed: Dict[str, Any] = {}
+        if tool_steps:
+            logger.info(f"계획 단계 병렬 실행: {[step.step_id for step, _ in tool_steps]}")
+            try:
+                exec_results = await self.tool_executor.execute_multiple(
+                    [{"tool_name": step.tool_name, "parameters": params} for step, params in tool_steps],
+                    parallel=True,
+                    max_concurrency=self.plan_max_parallel
+                )
+                executed = {step.step_id: exec_result for (step, _), exec_result in zip(tool_steps, exec_results)}
+            except Exception as e:
+                logger.error(f"계획 웨이브 병렬 실행 실패, 순차 실행으로 폴백: {e}")
+        wave_elapsed = time.time() - wave_start_time
+        
+        results: List[Dict[str, Any]] = []
+        tool_params = {step.step_id: params for step, params in tool_steps}
+        for step in wave:
+            exec_result = executed.get(step.step_id)
+            if exec_result is None:
+                # 도구 외 단계, 매개변수 검증 실패, 병렬 실행 실패 시 기존 단일 단계 경로
+                step_start_time = time.time()
+                execution_result = await self._execute_plan_step(step, scratchpad, context)
+                execution_result["execution_time"] = time.time() - step_start_time
+            else:
+                try:
+                    execution_result = self._record_plan_tool_result(
+                        step, tool_params[step.step_id], exec_result, scratchpad
+                    )
+                except Exception as e:
+                    step.status = PlanTaskStatus.FAILED
+                    step.error = str(e)
+                    execution_result = {
+                        "status": "failed",
+                        "error": str(e),
+                        "expected_duration": step.estimated_duration
+                    }
+                execution_result["execution_time"] = exec_result.result.execution_time or wave_elapsed
+            results.append(execution_result)
+        
+        return results
+    
+    def _select_wave_for_adaptation(
+        self,
+        wave: List[PlanStep],
+        wave_results: List[Dict[str, Any]]
+    ) -> Tuple[PlanStep, Dict[str, Any]]:
+        """웨이브 중 적응 분석 대상 선택 (실패한 단계 우선, 없으면 예상 대비 가장 느린 단계)"""
+        pairs = list(zip(wave, wave_results))
+        for step, execution_result in pairs:
+            if execution_result.get("status") == "failed":
+                return step, execution_result
+        return max(
+            pairs,
+            key=lambda pair: pair[1].get("execution_time", 0) / max(pair[0].estimated_duration or 1.0, 1e-6)
+        )
+    
+    def _record_plan_tool_result(
+        self,
+        step: PlanStep,
+        validated_params: Dict[str, Any],
+        result: Any,
+        scratchpad: AgentScratchpad
+    ) -> Dict[str, Any]:
+        """도구 실행 결과를 계획 단계와 Scratchpad에 반영"""
+        if result.result.is_success:
+            step.status = PlanTaskStatus.COMPLETED
+            step.result = result.result
+            
+            # Scratchpad에 기록
+            action_record = ActionRecord(
+                action_type=ActionType.TOOL_CALL,
+                tool_name=step.tool_name,
+                parameters=validated_params
+            )
+            
+            observation_record = ObservationRecord(
+                content=str(step.result),
+                cached=result.cached
+            )
+            
+            step_record = scratchpad.start_new_step()
+            step_record.action = action_record
+            step_record.observation = observation_record
+            step_record.end_time = datetime.now()
+            
+            return {
+                "status": "success",
+                "result": step.result,
+                "expected_duration": step.estimated_duration
+            }
+        else:
+            step.status = PlanTaskStatus.FAILED
+            step.error = result.result.error_message if result.result.error_message else "도구 실행 실패"
+            
+            return {
+                "status": "failed",
+                "error": step.error,
+                "expected_duration": step.estimated_duration
+            }
+    
     async def _execute_plan_step(
         self, 
         step: Any, 
@@ -228,40 +425,7 @@ class ReactEngine:
                     validated_params
                 )
                 
-                if result.result.is_success:
-                    step.status = PlanTaskStatus.COMPLETED
-                    step.result = result.result
-                    
-                    # Scratchpad에 기록
-                    action_record = ActionRecord(
-                        action_type=ActionType.TOOL_CALL,
-                        tool_name=step.tool_name,
-                        parameters=validated_params
-                    )
-                    
-                    observation_record = ObservationRecord(
-                        content=str(step.result)
-                    )
-                    
-                    step_record = scratchpad.start_new_step()
-                    step_record.action = action_record
-                    step_record.observation = observation_record
-                    step_record.end_time = datetime.now()
-                    
-                    return {
-                        "status": "success",
-                        "result": step.result,
-                        "expected_duration": step.estimated_duration
-                    }
-                else:
-                    step.status = PlanTaskStatus.FAILED
-                    step.error = result.result.error_message if result.result.error_message else "도구 실행 실패"
-                    
-                    return {
-                        "status": "failed",
-                        "error": step.error,
-                        "expected_duration": step.estimated_duration
-                    }
+                return self._record_plan_tool_result(step, validated_params, result, scratchpad)
             
             elif step.action_type == "reasoning":
                 # 추론 단계
@@ -301,12 +465,14 @@ class ReactEngine:
             }
     
     def _get_available_tools_info(self) -> List[Dict[str, Any]]:
-        """사용 가능한 도구의 상세 메타데이터를 반환"""
+        """사용 가능한 도구의 상세 메타데이터를 반환 (카탈로그 버전이 같으면 캐시 재사용, 읽기 전용)"""
+        snapshot = self.tool_registry.get_catalog_snapshot()
+        cached = self._tools_info_cache
+        if cached is not None and cached[0] == snapshot.version:
+            return cached[1]
+        
         tools: List[Dict[str, Any]] = []
-        for tool_name in self.tool_registry.list_tools():
-            md: Optional[ToolMetadata] = self.tool_registry.get_tool_metadata(tool_name)
-            if not md:
-                continue
+        for md in snapshot.tools:
             params: List[Dict[str, Any]] = []
             for p in md.parameters:
                 try:
@@ -327,8 +493,39 @@ class ReactEngine:
                 "category": md.category.value,
                 "tags": md.tags
             })
+        self._tools_info_cache = (snapshot.version, tools)
         return tools
     
+    def _get_action_system_prompt(self, excluded_tools: Tuple[str, ...] = ()) -> str:
+        """카탈로그 버전별로 미리 렌더링한 행동 결정 프롬프트 (목표는 별도 메시지, 고정 접두부로 캐시 가능)"""
+        version = self.tool_registry.catalog_version
+        key = (version, tuple(sorted(excluded_tools)))
+        template = self._action_prompt_cache.get(key)
+        if template is None:
+            tools_info = [t for t in self._get_available_tools_info() if t["name"] not in excluded_tools]
+            template = self._render_action_system_prompt(tools_info)
+            # 이전 버전의 템플릿은 폐기
+            self._action_prompt_cache = {k: v for k, v in self._action_prompt_cache.items() if k[0] == version}
+            self._action_prompt_cache[key] = template
+            logger.debug(f"행동 프롬프트 렌더링: 카탈로그 v{version}, 도구 {len(tools_info)}개")
+        return template
+    
+    @staticmethod
+    def _build_messages(prompt_type: str, system_prompt: str, user_prompt: str,
+                        context: Optional[AgentContext] = None) -> List[ChatMessage]:
+        """
+        고정 시스템 프롬프트 + (목표) + 사용자 프롬프트 메시지 구성
+        
+        시스템 프롬프트는 호출마다 변하지 않는 고정 접두부로 표시(cacheable)하고,
+        목표처럼 요청마다 달라지는 내용은 그 뒤 메시지로 분리합니다.
+        """
+        messages = [ChatMessage(role="system", content=system_prompt,
+                                metadata={"prompt_type": prompt_type, "cacheable": True})]
+        if context is not None:
+            messages.append(ChatMessage(role="system", content=f"목표: {context.goal}"))
+        messages.append(ChatMessage(role="user", content=user_prompt))
+        return messages
+    
     async def execute_goal(self, context: AgentContext) -> AgentResult:
         """
         목표 달성을 위한 ReAct 루프 실행
@@ -339,16 +536,27 @@ class ReactEngine:
         Returns:
             AgentResult: 실행 결과 (성공/실패, 최종 답변, 실행 과정)
         """
-        logger.info(f"ReAct 실행 시작: 목표='{context.goal[:100]}...', 최대반복={context.max_iterations}")
+        mode = "fused" if self.fused_mode else "split"
+        logger.info(f"ReAct 실행 시작: 목표='{context.goal[:100]}...', 최대반복={context.max_iterations}, 모드={mode}")
         
         # Scratchpad 초기화
         scratchpad = AgentScratchpad(
             goal=context.goal,
-            max_steps=context.max_iterations
+            max_steps=context.max_iterations,
+            token_budget=self.history_token_budget
         )
         
         start_time = time.time()
-        
+        # 요청 단위 도구 결과 메모 범위 (반복 호출/추측 실행 결과 재사용)
+        with self.tool_executor.request_scope() as memo:
+            result = await self._run_react_loop(context, scratchpad, start_time)
+        self._record_mode_metrics(mode, result, scratchpad, time.time() - start_time)
+        self._record_memo_metrics(result, memo)
+        return result
+    
+    async def _run_react_loop(self, context: AgentContext, scratchpad: AgentScratchpad,
+                              start_time: float) -> AgentResult:
+        """ReAct 메인 루프 (사고 -> 행동 -> 관찰)"""
         try:
             # 메인 ReAct 루프
             for iteration in range(context.max_iterations):
@@ -372,15 +580,52 @@ class ReactEngine:
                 step = scratchpad.start_new_step()
                 logger.debug(f"새 스텝 시작: 단계 {len(scratchpad.steps)}")
                 
-                # 1. Reasoning (사고)
-                thought = await self._generate_thought(scratchpad, context)
-                if not thought:
-                    logger.error("사고 생성 실패")
-                    break
-                logger.debug(f"사고 생성 완료: {thought.content[:50]}...")
+                # LLM 응답을 기다리는 동안 읽기 전용 도구를 미리 실행
+                if self.tool_prefetcher:
+                    self.tool_prefetcher.prefetch(context, scratchpad)
+                
+                # 융합 모드: 사고/행동/목표 달성 판단을 한 번에 요청 (파싱 실패 시 분리 경로)
+                fused = await self._generate_fused_step(scratchpad, context) if self.fused_mode else None
+                
+                if fused and fused.get("goal_achieved"):
+                    answer = (fused.get("answer") or "").strip()
+                    if fused["action"] is None and not answer:
+                        final_result = await self._generate_final_answer(scratchpad, context)
+                    else:
+                        action = fused["action"] or scratchpad.add_action(
+                            ActionType.FINAL_ANSWER, parameters={"answer": answer}
+                        )
+                        await self._observe_final_answer(action, scratchpad)
+                        final_result = action.parameters.get("answer") or answer
+                    scratchpad.finalize(final_result, success=True)
+                    
+                    execution_time = time.time() - start_time
+                    logger.info(f"ReAct 완료: 목표 달성(융합 판단) (반복={iteration + 1}회, "
+                               f"실행시간={execution_time:.2f}초)")
+                    return AgentResult.success_result(
+                        final_result,
+                        scratchpad,
+                        {
+                            "iterations": iteration + 1,
+                            "execution_time": execution_time
+                        }
+                    )
+                
+                if fused:
+                    thought = fused["thought"]
+                    action = fused["action"]
+                else:
+                    # 1. Reasoning (사고)
+                    thought = await self._generate_thought(scratchpad, context)
+                    if not thought:
+                        logger.error("사고 생성 실패")
+                        break
+                    logger.debug(f"사고 생성 완료: {thought.content[:50]}...")
+                    action = None
                 
                 # 2. Acting (행동)
-                action = await self._decide_action(thought, scratchpad, context)
+                if action is None:
+                    action = await self._decide_action(thought, scratchpad, context)
                 if not action:
                     logger.error("행동 결정 실패")
                     break
@@ -415,8 +660,8 @@ class ReactEngine:
                                f"단계={len(scratchpad.steps)}, "
                                f"경과시간={elapsed:.1f}초")
                 
-                # 목표 달성 여부 확인
-                if await self._is_goal_achieved(scratchpad, context):
+                # 목표 달성 여부 확인 (융합 모드는 다음 융합 호출이 LLM 판단을 대신함)
+                if await self._is_goal_achieved(scratchpad, context, use_llm=not fused):
                     final_result = await self._generate_final_answer(scratchpad, context)
                     scratchpad.finalize(final_result, success=True)
                     
@@ -461,6 +706,159 @@ class ReactEngine:
                 }
             )
     
+    async def _call_llm(self, scratchpad: AgentScratchpad, messages: List[ChatMessage], **kwargs):
+        """LLM 호출 후 scratchpad에 토큰 사용량 기록"""
+        response = await self.llm_provider.generate_response(messages=messages, **kwargs)
+        scratchpad.record_llm_usage(getattr(response, "usage", None))
+        return response
+    
+    def _record_mode_metrics(self, mode: str, result: AgentResult, scratchpad: AgentScratchpad,
+                             execution_time: float) -> None:
+        """요청 1건의 모드별 지연/토큰 통계 기록"""
+        stats = self._mode_stat(mode)
+        stats["requests"] += 1
+        stats["total_latency"] += execution_time
+        stats["llm_calls"] += scratchpad.llm_calls
+        stats["input_tokens"] += scratchpad.llm_input_tokens
+        stats["output_tokens"] += scratchpad.llm_output_tokens
+        
+        result.metadata.update({
+            "react_mode": mode,
+            "llm_calls": scratchpad.llm_calls,
+            "llm_input_tokens": scratchpad.llm_input_tokens,
+            "llm_output_tokens": scratchpad.llm_output_tokens,
+            "end_to_end_latency": execution_time,
+            "history_prompt": scratchpad.get_prompt_metrics(),
+            "goal_checks": self._goal_check_metrics(scratchpad)
+        })
+        logger.info(f"ReAct 요청 통계: 모드={mode}, LLM 호출={scratchpad.llm_calls}회, "
+                    f"토큰(입력/출력)={scratchpad.llm_input_tokens}/{scratchpad.llm_output_tokens}, "
+                    f"지연={execution_time:.2f}초")
+    
+    def _goal_check_metrics(self, scratchpad: AgentScratchpad) -> Dict[str, Any]:
+        """요청 1건의 목표 달성 확인 생략 횟수와 추정 절감 지연"""
+        metrics: Dict[str, Any] = dict(scratchpad.goal_checks)
+        if self.goal_classifier:
+            avg_latency = self.goal_classifier.get_stats()["avg_llm_latency"]
+            metrics["estimated_saved_latency"] = metrics["skipped"] * avg_latency
+        return metrics
+    
+    def get_goal_check_stats(self) -> Dict[str, Any]:
+        """목표 달성 LLM 판정 생략률 및 추정 절감 지연 (빠른 판단 비활성 시 빈 dict)"""
+        return self.goal_classifier.get_stats() if self.goal_classifier else {}
+    
+    def _record_memo_metrics(self, result: AgentResult, memo: Any) -> None:
+        """요청 메모(반복 호출 재사용, 추측 실행) 통계 기록"""
+        stats = dict(memo.stats)
+        if self.tool_prefetcher:
+            self.tool_prefetcher.record(stats)
+        result.metadata["tool_memo"] = stats
+        if stats["hits"]:
+            logger.info(f"요청 메모 재사용: {stats['hits']}회 (추측 실행 적중 {stats['prefetch_hits']}회)")
+    
+    def _mode_stat(self, mode: str) -> Dict[str, float]:
+        return self.mode_stats.setdefault(mode, {
+            "requests": 0, "total_latency": 0.0, "llm_calls": 0,
+            "input_tokens": 0, "output_tokens": 0, "fallbacks": 0
+        })
+    
+    def get_mode_stats(self) -> Dict[str, Dict[str, float]]:
+        """실행 모드별 평균 지연/LLM 호출/토큰 통계 (fused vs split A/B 비교)"""
+        summary = {}
+        for mode, stats in self.mode_stats.items():
+            requests = max(stats["requests"], 1)
+            summary[mode] = {
+                **stats,
+                "avg_latency": stats["total_latency"] / requests,
+                "avg_llm_calls": stats["llm_calls"] / requests,
+                "avg_input_tokens": stats["input_tokens"] / requests,
+                "avg_output_tokens": stats["output_tokens"] / requests
+            }
+        return summary
+    
+    async def _generate_fused_step(self, scratchpad: AgentScratchpad,
+                                   context: AgentContext) -> Optional[Dict[str, Any]]:
+        """
+        사고, 행동, 목표 달성 여부를 한 번의 JSON 호출로 결정
+        
+        Returns:
+            {"thought", "action", "goal_achieved", "answer"} 또는 파싱 실패 시 None (분리 경로로 폴백)
+        """
+        try:
+            system_prompt = self._create_fused_system_prompt()
+            user_prompt = (
+                self._create_thinking_user_prompt(scratchpad, context)
+                + "\n\n위 내용을 바탕으로 융합 응답 형식의 JSON 하나만 출력하세요."
+            )
+            messages = self._build_messages("fused", system_prompt, user_prompt, context)
+            
+            logger.debug("LLM에게 융합(사고+행동+목표판단) 요청 중...")
+            response = await self._call_llm(
+                scratchpad,
+                messages,
+                temperature=0.3,
+                response_mime_type='application/json'
+            )
+            data = self._parse_fused_response(response.content)
+        except Exception as e:
+            logger.warning(f"융합 응답 처리 실패, 분리 경로로 폴백: {e}")
+            self._mode_stat("fused")["fallbacks"] += 1
+            return None
+        
+        thought_content = data["thought"]
+        thought = scratchpad.add_thought(
+            content=thought_content,
+            reasoning_depth=self._assess_reasoning_depth(thought_content),
+            confidence=self._evaluate_thought_quality(thought_content),
+            tags=self._extract_thought_tags(thought_content) + ["fused"]
+        )
+        
+        action_type = data.get("action_type")
+        answer = data.get("answer") or ""
+        # 도구를 한 번도 쓰지 않았다면 직접 답변이 있는 경우에만 목표 달성으로 인정
+        goal_achieved = bool(data.get("goal_achieved")) and (
+            scratchpad.total_tool_calls > 0 or (action_type == "final_answer" and bool(answer.strip()))
+        )
+        
+        action: Optional[ActionRecord] = None
+        if action_type == "final_answer":
+            # 도구 호출 전의 final_answer는 분리 경로(_decide_action)의 재시도 정책에 맡김
+            if goal_achieved or scratchpad.total_tool_calls > 0:
+                action = scratchpad.add_action(ActionType.FINAL_ANSWER, parameters={"answer": answer})
+        elif not goal_achieved:
+            tool_name = data.get("tool_name")
+            action = scratchpad.add_action(
+                ActionType.TOOL_CALL,
+                tool_name=tool_name,
+                parameters=data.get("parameters") or {}
+            )
+            logger.info(f"도구 호출 행동 결정(융합): '{tool_name}'")
+        
+        return {
+            "thought": thought,
+            "action": action,
+            "goal_achieved": goal_achieved,
+            "answer": answer
+        }
+    
+    def _parse_fused_response(self, response_content: str) -> Dict[str, Any]:
+        """융합 응답 파싱 및 검증 (형식 오류 시 ValueError)"""
+        data = self._parse_action_response(response_content)
+        if not isinstance(data, dict):
+            raise ValueError("융합 응답이 JSON 객체가 아닙니다")
+        
+        thought = data.get("thought") or data.get("reasoning")
+        if not isinstance(thought, str) or not thought.strip():
+            raise ValueError("융합 응답에 thought가 없습니다")
+        data["thought"] = thought.strip()
+        
+        action_type = data.get("action_type")
+        if action_type not in ("tool_call", "final_answer"):
+            raise ValueError(f"알 수 없는 action_type: {action_type}")
+        if action_type == "tool_call" and not (isinstance(data.get("tool_name"), str) and data["tool_name"]):
+            raise ValueError("tool_call 응답에 tool_name이 없습니다")
+        return data
+    
     async def _generate_thought(self, scratchpad: AgentScratchpad, context: AgentContext) -> Optional[ThoughtRecord]:
         """현재 상황을 분석하고 다음 행동에 대해 사고"""
         logger.debug(f"사고 과정 생성 시작: 현재단계={len(scratchpad.steps)}")
@@ -473,16 +871,16 @@ class ReactEngine:
             user_prompt = self._create_thinking_user_prompt(scratchpad, context)
             
             messages = [
-                ChatMessage(role="system", content=system_prompt),
+                ChatMessage(role="system", content=system_prompt, metadata={"prompt_type": "thought"}),
                 ChatMessage(role="user", content=user_prompt)
             ]
             
-            # LLM에게 사고 요청
+            # LLM에게 사고 요청 (출력 예산/중단 시퀀스는 "thought" 프롬프트 프로필)
             logger.debug("LLM에게 사고 분석 요청 중...")
-            response = await self.llm_provider.generate_response(
-                messages=messages,
-                temperature=0.4,  # 빠른 결정을 위해 온도 감소
-                max_tokens=1024  # 사고 과정 토큰 수 대폭 감소 (4096->1024)
+            response = await self._call_llm(
+                scratchpad,
+                messages,
+                temperature=0.4  # 빠른 결정을 위해 온도 감소
             )
             
             thought_content = response.content.strip()
@@ -524,31 +922,24 @@ class ReactEngine:
             # 컨텍스트에 날짜가 있고 system_time 호출이 불필요한지 확인
             has_date_context = self._has_date_in_context(context, thought)
             
-            # 사용 가능한 도구 정보 수집 (자세한 메타데이터 포함)
-            tools_info = self._get_available_tools_info()
-            
             # 날짜 컨텍스트가 있으면 system_time 도구 제외
+            excluded_tools: Tuple[str, ...] = ()
             if has_date_context:
-                tools_info = [tool for tool in tools_info if tool['name'] != 'system_time']
+                excluded_tools = ("system_time",)
                 logger.debug("컨텍스트에 날짜 정보가 있어 system_time 도구 제외")
             
-            logger.debug(f"사용가능 도구: {len(tools_info)}개 ({[t['name'] for t in tools_info[:3]]}...)")
-            
-            # 행동 결정 프롬프트 생성
-            system_prompt = self._create_action_system_prompt(context, tools_info)
+            # 행동 결정 프롬프트 (카탈로그 버전별로 미리 렌더링된 템플릿 사용)
+            system_prompt = self._get_action_system_prompt(excluded_tools)
             user_prompt = self._create_action_user_prompt(thought, scratchpad)
             
-            messages = [
-                ChatMessage(role="system", content=system_prompt),
-                ChatMessage(role="user", content=user_prompt)
-            ]
+            messages = self._build_messages("action", system_prompt, user_prompt, context)
             
-            # LLM에게 행동 결정 요청
+            # LLM에게 행동 결정 요청 (출력 예산은 "action" 프롬프트 프로필)
             logger.debug("LLM에게 행동 결정 요청 중...")
-            response = await self.llm_provider.generate_response(
-                messages=messages,
+            response = await self._call_llm(
+                scratchpad,
+                messages,
                 temperature=0.3,  # 정확한 행동 결정을 위해 낮은 온도
-                max_tokens=4096,  # 행동 결정 토큰 수 축소
                 response_mime_type='application/json'
             )
             
@@ -563,15 +954,12 @@ class ReactEngine:
                     + "반드시 tool_call을 출력하세요. 사용할 도구를 목록에서 선택하고, 필요한 파라미터를 메타데이터에 맞게 채우세요.\n"
                     + "모호한 경우에도 합리적 기본값을 사용하세요. JSON 이외 형식은 허용되지 않습니다."
                 )
-                strict_messages = [
-                    ChatMessage(role="system", content=strict_system_prompt),
-                    ChatMessage(role="user", content=user_prompt),
-                ]
+                strict_messages = self._build_messages("action_repair", strict_system_prompt, user_prompt, context)
                 try:
-                    strict_response = await self.llm_provider.generate_response(
-                        messages=strict_messages,
+                    strict_response = await self._call_llm(
+                        scratchpad,
+                        strict_messages,
                         temperature=0.2,
-                        max_tokens=4096,
                         response_mime_type='application/json'
                     )
                     strict_data = self._parse_action_response(strict_response.content)
@@ -654,15 +1042,18 @@ class ReactEngine:
                     execution_time=execution_time
                 )
                 
-                # 성공적인 관찰
+                # 성공적인 관찰 (요청 메모에서 재사용한 결과는 캐시로 표시)
+                cached_note = " (같은 요청의 이전 결과 재사용)" if execution_result.cached else ""
                 observation = scratchpad.add_observation(
-                    content=f"도구 '{action.tool_name}' 실행 성공: {execution_result.result.data}",
+                    content=f"도구 '{action.tool_name}' 실행 성공{cached_note}: {execution_result.result.data}",
                     success=True,
                     data=execution_result.result.data,
-                    analysis=await self._analyze_execution_result(execution_result, context)
+                    analysis=await self._analyze_execution_result(execution_result, context),
+                    cached=execution_result.cached
                 )
                 
-                logger.info(f"도구 실행 성공: '{action.tool_name}' (실행시간={execution_time:.2f}초)")
+                logger.info(f"도구 실행 성공: '{action.tool_name}' (실행시간={execution_time:.2f}초"
+                            f"{', 캐시' if execution_result.cached else ''})")
                 
             else:
                 scratchpad.update_action_status(
@@ -766,20 +1157,33 @@ class ReactEngine:
         
         return False
     
-    async def _is_goal_achieved(self, scratchpad: AgentScratchpad, context: AgentContext) -> bool:
-        """목표 달성 여부를 판단 (휴리스틱 + LLM)"""
+    async def _is_goal_achieved(self, scratchpad: AgentScratchpad, context: AgentContext,
+                                use_llm: bool = True) -> bool:
+        """목표 달성 여부를 판단 (휴리스틱 + LLM, use_llm=False면 휴리스틱만)"""
         logger.debug(f"목표 달성 여부 확인: 현재단계={len(scratchpad.steps)}")
         
         # 1. 빠른 휴리스틱 판단
         if self._quick_goal_check(scratchpad, context):
             logger.info("휴리스틱으로 목표 달성 확인됨")
+            self._record_goal_check_skip(scratchpad, "heuristic", use_llm)
+            return True
+        
+        # 2. 의도 분류 + 종결 행동 + 관찰 성공 기반 로컬 판단 (신뢰도 임계값 이상이면 LLM 생략)
+        decision = self.goal_classifier.evaluate(scratchpad, context) if self.goal_classifier else None
+        if decision and self.goal_classifier.should_skip_llm(decision):
+            logger.info(f"로컬 판단으로 목표 달성 확인됨 (신뢰도={decision.confidence:.2f}) - {decision.reason}")
+            self._record_goal_check_skip(scratchpad, "fastpath", use_llm)
             return True
             
-        # 2. 반복 행동 감지 및 조기 종료
+        # 3. 반복 행동 감지 및 조기 종료
         if self._detect_repetitive_actions(scratchpad):
             logger.warning("반복 행동 감지됨 - 목표 달성으로 간주")
+            self._record_goal_check_skip(scratchpad, "heuristic", use_llm)
             return True
 
+        if not use_llm:
+            return False
+
         try:
             # 목표 달성 판단 프롬프트 (typo 보정 포함)
             system_prompt = """당신은 에이전트의 목표 달성 여부를 판단하는 전문가입니다.
@@ -812,16 +1216,14 @@ class ReactEngine:
 
 목표가 달성되었는지 판단해주세요."""
             
-            messages = [
-                ChatMessage(role="system", content=system_prompt),
-                ChatMessage(role="user", content=user_prompt)
-            ]
+            messages = self._build_messages("goal_check", system_prompt, user_prompt)
             
             logger.debug("LLM에게 목표 달성 여부 판단 요청 중...")
-            response = await self.llm_provider.generate_response(
-                messages=messages,
+            llm_started = time.time()
+            response = await self._call_llm(
+                scratchpad,
+                messages,
                 temperature=0.2,
-                max_tokens=32768,
                 response_mime_type='application/json'
             )
             
@@ -832,7 +1234,11 @@ class ReactEngine:
             
             logger.info(f"목표 달성 판단 결과: {achieved} (신뢰도={confidence:.2f}) - {reason[:50]}...")
             
-            return achieved and confidence > 0.7
+            verdict = bool(achieved) and confidence > 0.7
+            scratchpad.goal_checks["llm"] += 1
+            if self.goal_classifier:
+                self.goal_classifier.record_llm_verdict(decision, verdict, time.time() - llm_started)
+            return verdict
             
         except Exception as e:
             logger.error(f"목표 달성 판단 실패: {e}")
@@ -870,19 +1276,15 @@ class ReactEngine:
 
 위 작업을 완료했습니다. 사용자에게 간결하고 친절한 결과 보고를 해주세요."""
         
-        messages = [
-            ChatMessage(role="system", content=system_prompt),
-            ChatMessage(role="user", content=user_prompt)
-        ]
+        messages = self._build_messages("final_answer", system_prompt, user_prompt)
         
         logger.debug("LLM에게 최종 답변 생성 요청 중...")
-        response = await self.llm_provider.generate_response(
-            messages=messages,
-            temperature=0.3  # 더 일관된 간결한 응답을 위해 낮춤
-            # max_tokens 제거 - 자동으로 적절한 길이 생성
+        final_answer = await self._generate_user_facing_text(
+            messages,
+            context,
+            scratchpad,
+            temperature=0.3  # 더 일관된 간결한 응답을 위해 낮춤 (출력 예산은 "final_answer" 프로필)
         )
-        
-        final_answer = response.content.strip()
         logger.info(f"최종 답변 생성 완료: 길이={len(final_answer)}자")
         
         return final_answer
@@ -909,25 +1311,59 @@ class ReactEngine:
 
 작업이 아직 완료되지 않았습니다. 사용자에게 간결한 중간 보고를 해주세요."""
         
-        messages = [
-            ChatMessage(role="system", content=system_prompt),
-            ChatMessage(role="user", content=user_prompt)
-        ]
+        messages = self._build_messages("final_answer", system_prompt, user_prompt)
         
         logger.debug("LLM에게 부분 결과 생성 요청 중...")
-        response = await self.llm_provider.generate_response(
-            messages=messages,
+        partial_result = await self._generate_user_facing_text(
+            messages,
+            context,
+            scratchpad,
             temperature=0.3
-            # max_tokens 제거 - 자동으로 적절한 길이 생성
         )
-        
-        partial_result = response.content.strip()
         logger.info(f"부분 결과 생성 완료: 길이={len(partial_result)}자")
         
         return partial_result
             
 
     
+    async def _generate_user_facing_text(
+        self,
+        messages: List[ChatMessage],
+        context: AgentContext,
+        scratchpad: AgentScratchpad,
+        temperature: float
+    ) -> str:
+        """
+        사용자에게 보여줄 텍스트 생성
+        
+        context.stream_callback 이 있고 프로바이더가 스트리밍을 지원하면 청크가 도착할 때마다
+        누적 텍스트로 콜백을 호출합니다. 스트리밍 실패 시 일반 호출로 폴백합니다.
+        """
+        stream = getattr(self.llm_provider, "stream_generate", None)
+        if context.stream_callback is not None and stream is not None:
+            accumulated = ""
+            usage: Dict[str, Any] = {}
+            try:
+                async for chunk in stream(messages, temperature=temperature, usage_sink=usage):
+                    accumulated += chunk
+                    try:
+                        await context.stream_callback(accumulated)
+                    except Exception as callback_error:
+                        logger.warning(f"스트리밍 콜백 실패: {callback_error}")
+                if accumulated.strip():
+                    # 프로바이더가 사용량을 채우지 않았으면 generate 경로와 같은 방식으로 추정
+                    scratchpad.record_llm_usage(usage or {
+                        "input_tokens": sum(estimate_tokens(m.content) for m in messages),
+                        "output_tokens": estimate_tokens(accumulated)
+                    })
+                    return accumulated.strip()
+                logger.warning("스트리밍 응답이 비어 있어 일반 호출로 폴백")
+            except Exception as e:
+                logger.warning(f"스트리밍 생성 실패, 일반 호출로 폴백: {e}")
+        
+        response = await self._call_llm(scratchpad, messages, temperature=temperature)
+        return response.content.strip()
+    
     # 헬퍼 메서드들
     
     def _create_thinking_system_prompt(self, context: AgentContext) -> str:
@@ -986,8 +1422,8 @@ class ReactEngine:
 이전 대화 맥락도 고려하세요."""
         )
     
-    def _create_action_system_prompt(self, context: AgentContext, tools_info: List[Dict]) -> str:
-        """행동 결정을 위한 시스템 프롬프트(도구 메타데이터/별칭/예시 포함)"""
+    def _render_action_system_prompt(self, tools_info: List[Dict]) -> str:
+        """행동 결정 프롬프트 템플릿 렌더링 (목표 미포함, 목표는 호출 시 별도 메시지로 전달)"""
         # 도구 상세 설명 문자열 구성
         tool_lines: List[str] = []
         for t in tools_info:
@@ -1026,8 +1462,7 @@ class ReactEngine:
         downloads_path = str(Path.home() / "Downloads")
 
         return f"""당신은 사용 가능한 MCP 도구들을 활용해 사용자의 목표를 실행하는 에이전트입니다.
-
-목표: {context.goal}
+목표는 이 지침 뒤의 "목표:" 메시지로 주어집니다.
 
 🔍 실제 시스템 경로 정보:
 - 홈 디렉토리: {home_path}
@@ -1210,8 +1645,8 @@ class ReactEngine:
 
 🚨 도구 이름 규칙:
 - 절대로 "filesystem.mkdir", "notion_todo.create" 같은 방식으로 쓰지 마세요
-- 올바른 형태: "tool_name": "filesystem", "parameters": {"action": "mkdir", ...}
-- 올바른 형태: "tool_name": "notion_todo", "parameters": {"action": "create", ...}
+- 올바른 형태: "tool_name": "filesystem", "parameters": {{"action": "mkdir", ...}}
+- 올바른 형태: "tool_name": "notion_todo", "parameters": {{"action": "create", ...}}
 
 🚨 경로 사용 규칙:
 - 반드시 위에 제공된 실제 경로를 사용하세요!
@@ -1220,6 +1655,28 @@ class ReactEngine:
 - 잘못된 예: "/Users/your_username/Desktop/새폴더"
 """
     
+    def _create_fused_system_prompt(self) -> str:
+        """융합 모드 시스템 프롬프트 (행동 결정 프롬프트 + 융합 응답 형식)"""
+        return self._get_action_system_prompt() + """
+
+[융합 응답 형식] 이번 호출에서는 사고, 행동, 목표 달성 여부를 하나의 JSON으로 함께 출력하세요.
+위의 행동 형식 대신 아래 형식을 사용합니다.
+{
+  "thought": "현재 상황 요약과 다음 행동을 선택한 이유 (2-4문장)",
+  "goal_achieved": false,
+  "action_type": "tool_call",
+  "tool_name": "사용할 도구 이름",
+  "parameters": {},
+  "answer": "",
+  "reasoning": "행동 선택 근거"
+}
+
+규칙:
+- goal_achieved: 지금까지의 실행 결과만으로 목표가 이미 완료되었으면 true, 확실하지 않으면 false
+- goal_achieved가 true이면 추가 도구는 실행되지 않습니다
+- action_type이 "final_answer"이면 answer에 사용자에게 보낼 간결한 답변(최대 2줄)을 작성하세요
+- JSON 이외의 텍스트는 출력하지 마세요"""
+    
     def _create_action_user_prompt(self, thought: ThoughtRecord, scratchpad: AgentScratchpad) -> str:
         """행동 결정을 위한 사용자 프롬프트"""
         return f"""방금 전 사고 내용:
@@ -1367,6 +1824,14 @@ class ReactEngine:
         
         return False
     
+    def _record_goal_check_skip(self, scratchpad: AgentScratchpad, kind: str, use_llm: bool) -> None:
+        """LLM 목표 판정을 생략한 확인 기록 (LLM 판정 대상이었던 경우만)"""
+        if not use_llm:
+            return
+        scratchpad.goal_checks["skipped"] += 1
+        if self.goal_classifier:
+            self.goal_classifier.record_skip(kind)
+    
     def _quick_goal_check(self, scratchpad: AgentScratchpad, context: AgentContext) -> bool:
         """빠른 휴리스틱 목표 달성 판단"""
         if not scratchpad.steps:
@@ -0,0 +1,393 @@
+"""LLM 응답 캐시 모듈
+
+LLMProvider.generate_response 앞단에서 동작하는 선택적(opt-in) 응답 캐시.
+
+조회 방식:
+- 정확 일치: 메시지 + temperature + max_tokens + response_mime_type 해시
+- 근사 일치: 결정적 프롬프트(복잡도 분석 등)에 한해
+  임베딩 코사인 유사도가 임계값 이상인 기존 응답 재사용
+
+프롬프트 유형은 ChatMessage.metadata 의 "prompt_type" 으로 지정하며,
+"cache_text" 가 있으면 근사 일치 임베딩에 메시지 전체 대신 해당 텍스트를 사용합니다.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..utils.performance import PerformanceMonitor, global_performance_monitor
+
+
+PROMPT_TYPE_KEY = "prompt_type"
+CACHE_TEXT_KEY = "cache_text"
+DEFAULT_PROMPT_TYPE = "default"
+
+# 근사 일치를 허용하는 결정적 프롬프트 유형
+# goal_check 는 목표 + 실행 기록 전체가 입력이라 "✅ 성공"/"❌ 실패" 차이만 있는 기록도
+# 유사도가 임계값을 넘을 수 있으므로 정확 일치만 허용
+DEFAULT_SEMANTIC_PROMPT_TYPES = ("complexity",)
+
+EmbedFn = Callable[[str], Awaitable[Optional[Any]]]
+
+
+@dataclass
+class _CacheEntry:
+    """캐시 항목"""
+    response: Any
+    prompt_type: str
+    bucket: str
+    created_at: float
+    vector: Optional[np.ndarray] = None
+    hits: int = 0
+
+
+def get_prompt_type(messages: Iterable[Any]) -> str:
+    """메시지 metadata 에서 프롬프트 유형 추출"""
+    for msg in messages:
+        metadata = getattr(msg, "metadata", None) or {}
+        prompt_type = metadata.get(PROMPT_TYPE_KEY)
+        if prompt_type:
+            return str(prompt_type)
+    return DEFAULT_PROMPT_TYPE
+
+
+def _cache_text(messages: List[Any]) -> str:
+    """근사 일치용 텍스트 (cache_text 우선, 없으면 마지막 사용자 메시지)"""
+    for msg in messages:
+        metadata = getattr(msg, "metadata", None) or {}
+        if metadata.get(CACHE_TEXT_KEY):
+            return str(metadata[CACHE_TEXT_KEY])
+    for msg in reversed(messages):
+        if getattr(msg, "role", "") == "user":
+            return msg.content
+    return messages[-1].content if messages else ""
+
+
+def _hash(payload: Any) -> str:
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    TTL + LRU 기반 LLM 응답 캐시
+
+    특징:
+    - 정확 일치 조회 후, 허용된 프롬프트 유형에 한해 임베딩 근사 일치 조회
+    - 프롬프트 유형별 캐시 제외(opt-out)
+    - 동일 키 동시 요청은 한 번만 생성 (single-flight)
+    - 히트/미스 지표를 global_performance_monitor 로 전송
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 300.0,
+        similarity_threshold: float = 0.95,
+        semantic_prompt_types: Iterable[str] = DEFAULT_SEMANTIC_PROMPT_TYPES,
+        disabled_prompt_types: Iterable[str] = (),
+        embed_fn: Optional[EmbedFn] = None,
+        monitor: Optional[PerformanceMonitor] = None,
+        name: str = "llm_response"
+    ):
+        """
+        Args:
+            max_entries: 최대 캐시 항목 수 (초과 시 LRU 제거)
+            ttl_seconds: 항목 유효 시간 (초)
+            similarity_threshold: 근사 일치 코사인 유사도 임계값
+            semantic_prompt_types: 근사 일치를 허용할 프롬프트 유형
+            disabled_prompt_types: 캐시를 사용하지 않을 프롬프트 유형
+            embed_fn: 텍스트 -> 임베딩 비동기 함수 (None이면 근사 일치 비활성)
+            monitor: 지표를 기록할 PerformanceMonitor
+            name: 지표 이름
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.semantic_prompt_types = set(semantic_prompt_types)
+        self.disabled_prompt_types = set(disabled_prompt_types)
+        self.embed_fn = embed_fn
+        self.monitor = monitor or global_performance_monitor
+        self.name = name
+
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._embed_disabled = False
+
+        # 통계
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # ---- 키 생성 ----
+
+    @staticmethod
+    def make_key(messages: List[Any], model: str, temperature: float,
+                 max_tokens: Optional[int], options: Dict[str, Any]) -> str:
+        """정확 일치 키 생성"""
+        return _hash({
+            "model": model,
+            "messages": [[getattr(m, "role", ""), getattr(m, "content", "")] for m in messages],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "mime": options.get("response_mime_type"),
+            "options": {k: v for k, v in options.items() if k != "response_mime_type"},
+        })
+
+    @staticmethod
+    def make_bucket(messages: List[Any], prompt_type: str, model: str, temperature: float,
+                    max_tokens: Optional[int], options: Dict[str, Any]) -> str:
+        """근사 일치 대상 그룹 키 (시스템 프롬프트와 생성 설정이 같은 항목끼리만 비교)"""
+        return _hash({
+            "prompt_type": prompt_type,
+            "model": model,
+            "system": [m.content for m in messages if getattr(m, "role", "") == "system"],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "options": options,
+        })
+
+    # ---- 조회/저장 ----
+
+    async def get_or_generate(
+        self,
+        messages: List[Any],
+        generate: Callable[[], Awaitable[Any]],
+        *,
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """캐시 조회 후 미스이면 generate() 호출 결과를 저장하여 반환"""
+        options = options or {}
+        prompt_type = get_prompt_type(messages)
+
+        if prompt_type in self.disabled_prompt_types:
+            self.bypassed += 1
+            self._record("bypass", prompt_type)
+            return await generate()
+
+        key = self.make_key(messages, model, temperature, max_tokens, options)
+
+        entry = self._get_entry(key)
+        if entry is not None:
+            self.exact_hits += 1
+            self._record("hit_exact", prompt_type)
+            return self._as_hit(entry, "exact")
+
+        # 동일 요청이 이미 진행 중이면 그 결과를 공유
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.exact_hits += 1
+            self._record("hit_exact", prompt_type)
+            response = await asyncio.shield(pending)
+            return self._copy(response, {"cache": "inflight"})
+
+        bucket = None
+        vector = None
+        if prompt_type in self.semantic_prompt_types and self.embed_fn is not None:
+            bucket = self.make_bucket(messages, prompt_type, model, temperature, max_tokens, options)
+            vector = await self._embed(_cache_text(messages))
+            if vector is not None:
+                match = self._find_similar(bucket, vector)
+                if match is not None:
+                    entry, similarity = match
+                    self.semantic_hits += 1
+                    self._record("hit_semantic", prompt_type)
+                    return self._as_hit(entry, "semantic", similarity)
+
+        self.misses += 1
+        self._record("miss", prompt_type)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await generate()
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # 대기자가 없어도 경고가 남지 않도록 소비
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(response)
+        if self._is_cacheable(response):
+            self._store(key, _CacheEntry(
+                response=response,
+                prompt_type=prompt_type,
+                bucket=bucket or "",
+                created_at=time.monotonic(),
+                vector=vector,
+            ))
+        return response
+
+    def _get_entry(self, key: str) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._is_expired(entry):
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        entry.hits += 1
+        return entry
+
+    def _find_similar(self, bucket: str, vector: np.ndarray) -> Optional[Tuple[_CacheEntry, float]]:
+        """같은 그룹에서 가장 유사한 항목 검색"""
+        best_key = None
+        best_score = self.similarity_threshold
+        for key, entry in list(self._entries.items()):
+            if entry.bucket != bucket or entry.vector is None:
+                continue
+            if self._is_expired(entry):
+                del self._entries[key]
+                self.expirations += 1
+                continue
+            if entry.vector.shape != vector.shape:
+                continue
+            score = float(np.dot(entry.vector, vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        entry = self._entries[best_key]
+        self._entries.move_to_end(best_key)
+        entry.hits += 1
+        return entry, best_score
+
+    def _store(self, key: str, entry: _CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return self.ttl_seconds is not None and time.monotonic() - entry.created_at > self.ttl_seconds
+
+    @staticmethod
+    def _is_cacheable(response: Any) -> bool:
+        """빈 응답이나 오류 응답은 저장하지 않음"""
+        if response is None or not getattr(response, "content", ""):
+            return False
+        metadata = getattr(response, "metadata", None) or {}
+        return "error" not in metadata
+
+    async def _embed(self, text: str) -> Optional[np.ndarray]:
+        """근사 일치용 정규화 임베딩 (실패 시 근사 일치 비활성화)"""
+        if self._embed_disabled or not text:
+            return None
+        try:
+            raw = await self.embed_fn(text)  # type: ignore[misc]
+        except Exception as e:
+            logger.warning(f"응답 캐시 임베딩 실패, 근사 일치 비활성화: {e}")
+            self._embed_disabled = True
+            return None
+        if raw is None:
+            return None
+        vector = np.asarray(raw, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def _as_hit(self, entry: _CacheEntry, lookup: str, similarity: Optional[float] = None) -> Any:
+        extra: Dict[str, Any] = {"cache": lookup}
+        if similarity is not None:
+            extra["cache_similarity"] = round(similarity, 4)
+        logger.debug(f"LLM 응답 캐시 히트: type={entry.prompt_type}, lookup={lookup}")
+        return self._copy(entry.response, extra)
+
+    @staticmethod
+    def _copy(response: Any, extra: Dict[str, Any]) -> Any:
+        """캐시된 응답을 metadata 만 바꿔 복사 (원본 보존)"""
+        metadata = dict(getattr(response, "metadata", None) or {})
+        metadata.update(extra)
+        if dataclasses.is_dataclass(response):
+            return dataclasses.replace(response, metadata=metadata)
+        return response
+
+    def _record(self, outcome: str, prompt_type: str) -> None:
+        try:
+            self.monitor.record_cache_access(self.name, outcome)
+            self.monitor.record_cache_access(f"{self.name}:{prompt_type}", outcome)
+        except Exception:
+            pass
+
+    # ---- 관리 ----
+
+    def invalidate(self, prompt_type: Optional[str] = None) -> int:
+        """항목 삭제 (prompt_type 지정 시 해당 유형만)"""
+        if prompt_type is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            return removed
+        keys = [k for k, e in self._entries.items() if e.prompt_type == prompt_type]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        hits = self.exact_hits + self.semantic_hits
+        lookups = hits + self.misses
+        by_type: Dict[str, int] = {}
+        for entry in self._entries.values():
+            by_type[entry.prompt_type] = by_type.get(entry.prompt_type, 0) + 1
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": hits,
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": (hits / lookups * 100) if lookups > 0 else 0,
+            "entries_by_prompt_type": by_type,
+            "semantic_enabled": self.embed_fn is not None and not self._embed_disabled,
+        }
+
+
+async def _embed_with_memory_provider(text: str) -> Optional[Any]:
+    """장기기억 시스템의 임베딩 제공자로 임베딩 생성"""
+    from ..memory.embedding_provider import get_embedding_provider
+    provider = await get_embedding_provider()
+    return await provider.encode_text(text)
+
+
+def create_response_cache(config: Any) -> Optional[LLMResponseCache]:
+    """설정에 따라 응답 캐시 생성 (비활성화 시 None)"""
+    if not getattr(config, "llm_response_cache_enabled", False):
+        return None
+
+    disabled = getattr(config, "llm_response_cache_disabled_types", "") or ""
+    cache = LLMResponseCache(
+        max_entries=getattr(config, "llm_response_cache_max_entries", 512),
+        ttl_seconds=getattr(config, "llm_response_cache_ttl", 300),
+        similarity_threshold=getattr(config, "llm_response_cache_similarity", 0.95),
+        disabled_prompt_types=[t.strip() for t in disabled.split(",") if t.strip()],
+        embed_fn=_embed_with_memory_provider if getattr(config, "llm_response_cache_semantic", True) else None,
+    )
+    logger.info(
+        f"LLM 응답 캐시 활성화: max_entries={cache.max_entries}, ttl={cache.ttl_seconds}s, "
+        f"semantic={cache.embed_fn is not None}"
+    )
+    return cache
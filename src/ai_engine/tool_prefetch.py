@@ -0,0 +1,95 @@
+"""
+읽기 전용 도구 추측 실행 (Speculative Prefetch)
+
+ReAct 루프가 LLM의 사고/행동 결정을 기다리는 동안, 목표와 이전 단계로부터
+곧 호출될 가능성이 높은 읽기 전용 도구(system_time, notion_todo list 등)를 미리 실행합니다.
+결과는 ToolExecutor의 요청 단위 메모(RequestToolMemo)에 들어가므로,
+실제로 선택된 행동이 같은 호출이면 execute_tool 이 메모에서 결과를 가져옵니다.
+
+부작용이 있는 호출은 ToolMetadata.is_read_only_call 로 걸러 절대 추측 실행하지 않습니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from .agent_state import AgentContext, AgentScratchpad
+from ..mcp.registry import ToolRegistry
+from ..mcp.executor import ToolExecutor, RequestToolMemo
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SpeculativePrefetcher:
+    """
+    목표 키워드와 이전 단계를 보고 읽기 전용 도구 호출을 예측해 미리 실행하는 예측기
+
+    예측된 매개변수는 행동 결정 프롬프트의 예시와 같은 형태를 사용해야 메모 적중률이 높습니다.
+    """
+
+    # (도구 이름, 매개변수, 목표 키워드)
+    DEFAULT_RULES: List[Tuple[str, Dict[str, Any], Tuple[str, ...]]] = [
+        ("system_time", {}, (
+            "오늘", "내일", "모레", "어제", "이번주", "이번 주", "다음주", "다음 주", "주말",
+            "날짜", "시간", "몇 시", "몇시", "요일", "마감", "이번달", "이번 달"
+        )),
+        ("notion_todo", {"action": "list"}, (
+            "할일", "할 일", "투두", "todo", "task", "태스크"
+        )),
+        ("notion_calendar", {"action": "list"}, (
+            "일정", "캘린더", "calendar", "스케줄", "약속"
+        )),
+    ]
+
+    def __init__(self, tool_executor: ToolExecutor, tool_registry: ToolRegistry,
+                 max_prefetch: int = 3,
+                 rules: Optional[List[Tuple[str, Dict[str, Any], Tuple[str, ...]]]] = None):
+        self.tool_executor = tool_executor
+        self.tool_registry = tool_registry
+        self.max_prefetch = max_prefetch
+        self.rules = rules if rules is not None else self.DEFAULT_RULES
+        self.stats: Dict[str, int] = {"requests": 0, "prefetched": 0, "prefetch_hits": 0, "cancelled": 0}
+
+    def predict(self, context: AgentContext, scratchpad: AgentScratchpad) -> List[Tuple[str, Dict[str, Any]]]:
+        """목표와 이전 단계로부터 곧 호출될 읽기 전용 도구 호출 예측"""
+        goal = context.goal.lower()
+        # 이미 성공적으로 관찰한 호출은 다시 예측하지 않음
+        observed = {
+            self._call_key(step.action.tool_name, step.action.parameters)
+            for step in scratchpad.steps
+            if step.action and step.action.tool_name and step.observation and step.observation.success
+        }
+        available = set(self.tool_registry.get_catalog_snapshot().names)
+
+        predictions: List[Tuple[str, Dict[str, Any]]] = []
+        for tool_name, params, keywords in self.rules:
+            if tool_name not in available or not any(k in goal for k in keywords):
+                continue
+            if self._call_key(tool_name, params) in observed:
+                continue
+            predictions.append((tool_name, dict(params)))
+        return predictions[:self.max_prefetch]
+
+    def prefetch(self, context: AgentContext, scratchpad: AgentScratchpad) -> int:
+        """예측한 읽기 전용 호출을 현재 요청 메모에 백그라운드로 시작 (LLM 호출과 겹쳐 실행), 새로 시작한 개수 반환"""
+        started = sum(
+            1 for tool_name, params in self.predict(context, scratchpad)
+            if self.tool_executor.prefetch(tool_name, params)
+        )
+        if started:
+            logger.debug(f"도구 추측 실행 시작: {started}개")
+        return started
+
+    def _call_key(self, tool_name: str, parameters: Optional[Dict[str, Any]]) -> Optional[str]:
+        metadata = self.tool_registry.get_tool_metadata(tool_name)
+        return RequestToolMemo.make_key(metadata, parameters) if metadata else None
+
+    def record(self, memo_stats: Dict[str, int]) -> None:
+        """요청 1건의 메모 통계 중 추측 실행 관련 값 누적"""
+        self.stats["requests"] += 1
+        for name in ("prefetched", "prefetch_hits", "cancelled"):
+            self.stats[name] += memo_stats.get(name, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """누적 추측 실행 통계 (적중률 포함)"""
+        prefetched = self.stats["prefetched"]
+        return {**self.stats, "hit_rate": self.stats["prefetch_hits"] / prefetched if prefetched else 0.0}
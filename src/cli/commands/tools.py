@@ -179,6 +179,7 @@ def execute(tool_name, parameters, sync):
             exec_time = result.result.execution_time if result.result.execution_time is not None else 0.0
             click.echo(f"   실행 ID: {result.context.execution_id}")
             click.echo(f"   실행 시간: {exec_time:.3f}초")
+            click.echo(f"   대기 시간: {result.queue_wait_time:.3f}초")
             click.echo(f"   상태: {result.result.status.value}")
             
             # 리소스 사용량
@@ -416,13 +417,16 @@ def execute_natural_language(text: str, user_id: str):
     async def _run():
         click.echo("🧠 에이전틱 의사결정 + MCP 실행 초기화...")
         integration = MCPIntegration()
-        await integration.initialize()
+        try:
+            await integration.initialize()
 
-        click.echo(f"💬 입력: {text}")
-        result = await integration.process_user_request(text, user_id=user_id)
+            click.echo(f"💬 입력: {text}")
+            result = await integration.process_user_request(text, user_id=user_id)
 
-        click.echo("\n✅ 결과:")
-        click.echo(result)
+            click.echo("\n✅ 결과:")
+            click.echo(result)
+        finally:
+            await integration.cleanup()
 
     try:
         asyncio.run(_run())
@@ -6,7 +6,7 @@ Pydantic Settings를 사용하여 환경 변수를 자동으로 로드하고
 """
 
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 from enum import Enum
@@ -50,10 +50,67 @@ class Settings(BaseSettings):
     # AI 설정
     google_ai_api_key: str = Field(default="", description="Google Gemini API 키")
     ai_model: str = Field(default="gemini-2.5-pro", description="사용할 AI 모델")
+    ai_fast_model: str = Field(default="gemini-2.5-flash", description="빠른 계층 모델 (프롬프트 프로필 tier=fast 호출과 헤지 요청에 사용, 비우면 ai_model 사용)")
     ai_temperature: float = Field(default=0.7, description="AI 응답 온도")
     ai_max_tokens: int = Field(default=8192, description="AI 최대 토큰 수")
     gemini_api_rate_limit: int = Field(default=60, description="Gemini API 분당 요청 제한")
     
+    # LLM 호출 스케줄러 (프로세스 공용 동시성/분당 한도/우선순위)
+    llm_scheduler_enabled: bool = Field(default=True, description="Gemini 호출을 공용 스케줄러(AIMD 동시성, RPM/TPM, 우선순위)로 조율")
+    llm_initial_concurrency: int = Field(default=4, description="LLM 동시 호출 시작 한도 (AIMD로 자동 조정)")
+    llm_max_concurrency: int = Field(default=16, description="LLM 동시 호출 최대 한도")
+    llm_tokens_per_minute: int = Field(default=0, description="분당 LLM 토큰 한도 (0이면 회계만 하고 제한 없음)")
+    llm_queue_deadlines: str = Field(default="interactive:30,normal:60,background:120", description="우선순위별 대기 마감 시간(초), 초과 시 실행하지 않고 폐기 (우선순위:초, 쉼표 구분)")
+    
+    # LLM 응답 캐시 설정 (opt-in)
+    llm_response_cache_enabled: bool = Field(default=False, description="LLM 응답 캐시 사용 여부")
+    llm_response_cache_ttl: int = Field(default=300, description="LLM 응답 캐시 유효 시간 (초)")
+    llm_response_cache_max_entries: int = Field(default=512, description="LLM 응답 캐시 최대 항목 수")
+    llm_response_cache_semantic: bool = Field(default=True, description="결정적 프롬프트의 임베딩 근사 일치 사용 여부")
+    llm_response_cache_similarity: float = Field(default=0.95, description="근사 일치 코사인 유사도 임계값")
+    llm_response_cache_disabled_types: str = Field(default="", description="캐시를 사용하지 않을 프롬프트 유형 (쉼표 구분)")
+    
+    # 프롬프트 프로필 (호출 지점별 출력 예산/중단 시퀀스/응답 스키마)
+    llm_prompt_profiles_enabled: bool = Field(default=True, description="프롬프트 유형별 출력 토큰 예산/중단 시퀀스/스키마 적용 여부")
+    llm_prompt_budget_autotune: bool = Field(default=True, description="실제 출력 토큰 분포(p95)로 프롬프트별 예산 자동 조정")
+    llm_reasoning_token_reserve: int = Field(default=1024, description="strong 계층 모델 내부 추론(thinking) 토큰용으로 예산에 더하는 여유분 (추론 없는 모델은 0)")
+    llm_fast_reasoning_token_reserve: int = Field(default=256, description="fast 계층 모델 내부 추론(thinking) 토큰용 여유분 (추론 없는 모델은 0)")
+    llm_hedging_enabled: bool = Field(default=False, description="사용자 대기 호출이 p90 지연을 넘기면 빠른 모델로 헤지 요청을 보내고 먼저 끝난 응답 사용")
+    llm_hedge_percentile: float = Field(default=90.0, description="헤지 요청을 보내기 전 기다릴 호출 지점별 지연 백분위수")
+    llm_hedge_min_samples: int = Field(default=20, description="헤지를 시작하는 호출 지점별 최소 지연 표본 수")
+    llm_prompt_prefix_cache_enabled: bool = Field(default=True, description="고정 시스템 프롬프트(접두부) 렌더링 결과 재사용")
+    llm_context_cache_enabled: bool = Field(default=False, description="고정 접두부를 Gemini 컨텍스트 캐시에 등록하고 접미부만 전송 (캐시 저장 비용 발생)")
+    llm_context_cache_ttl: int = Field(default=3600, description="Gemini 컨텍스트 캐시 TTL(초)")
+    llm_context_cache_min_tokens: int = Field(default=1024, description="컨텍스트 캐시에 등록할 최소 접두부 토큰 수 (모델별 API 최소 크기)")
+    
+    # 로컬 복잡도 라우터 설정 (요청 복잡도 LLM 분석 대체)
+    complexity_router_enabled: bool = Field(default=True, description="학습된 로컬 분류기로 요청 복잡도 라우팅 (불확실할 때만 LLM 분석)")
+    complexity_router_threshold: float = Field(default=0.75, description="로컬 라우팅 결정 최소 예측 확률")
+    complexity_router_min_samples: int = Field(default=30, description="로컬 라우터 학습을 시작하는 최소 기록 수")
+    complexity_router_path: str = Field(default="", description="라우팅 학습 데이터/모델 경로 (비우면 data/complexity_router)")
+    
+    # ReAct 엔진 설정
+    react_fused_mode: bool = Field(default=False, description="사고/행동/목표 판단을 한 번의 JSON 호출로 처리하는 융합 모드")
+    react_history_token_budget: int = Field(default=6000, description="ReAct 히스토리 프롬프트 토큰 예산 (0이면 제한 없음)")
+    react_tool_prefetch: bool = Field(default=False, description="LLM 응답 대기 중 읽기 전용 도구 추측 실행 여부 (키워드 추측이라 prefetch_hits 적중률 확인 후 활성화)")
+    react_plan_max_parallel: int = Field(default=4, description="계획 실행 시 한 번에 병렬 실행할 최대 단계 수 (1이면 순차 실행)")
+    react_goal_fastpath: bool = Field(default=True, description="단일 행동 의도는 로컬 규칙/학습 신호로 목표 달성을 판단해 LLM 판정 생략")
+    react_goal_fastpath_threshold: float = Field(default=0.8, description="목표 달성 빠른 판단 신뢰도 임계값 (미만이면 LLM 판정)")
+    react_goal_fastpath_audit_every: int = Field(default=5, description="빠른 판단 N회마다 1회 LLM으로 검증 (0이면 검증 안 함, get_goal_check_stats 의 audit_agreement_rate 확인 후 늘림)")
+    
+    # 동시 요청 처리 설정
+    request_max_concurrent: int = Field(default=4, description="에이전틱 엔진 전체 동시 처리 요청 수")
+    request_max_per_user: int = Field(default=1, description="사용자당 동시 처리 요청 수 (1이면 사용자별 순차 처리)")
+    request_max_queue_per_user: int = Field(default=5, description="사용자당 최대 대기 요청 수")
+    
+    # 도구 실행 설정
+    tool_max_concurrency: int = Field(default=4, description="병렬 도구 실행 동시 상한 (0이면 제한 없음)")
+    tool_concurrency_limits: str = Field(
+        default="notion_todo:2/8,notion_calendar:2/8,apple_notes:1/4,communication:2/8",
+        description="도구/카테고리별 벌크헤드 (도구명 또는 카테고리:동시 실행 수[/최대 대기 수], 쉼표 구분)"
+    )
+    tool_sync_workers: int = Field(default=2, description="동기 모드 도구 실행용 상주 이벤트 루프 워커 수")
+    
     # Notion 설정
     notion_api_token: Optional[str] = Field(default=None, description="Notion API 토큰")
     notion_todo_database_id: Optional[str] = Field(default=None, description="Notion 할일 데이터베이스 ID")
@@ -122,6 +179,28 @@ class Settings(BaseSettings):
         if not self.admin_user_ids:
             return []
         return [uid.strip() for uid in self.admin_user_ids.split(',') if uid.strip()]
+    
+    def get_tool_bulkheads(self) -> Dict[str, Tuple[int, Optional[int]]]:
+        """도구/카테고리별 (동시 실행 수, 최대 대기 수) 반환 (대기 수 생략 시 None)"""
+        bulkheads: Dict[str, Tuple[int, Optional[int]]] = {}
+        for item in (self.tool_concurrency_limits or "").split(','):
+            name, _, value = item.partition(':')
+            concurrency, _, queue = value.strip().partition('/')
+            if not name.strip() or not concurrency.isdigit() or (queue and not queue.isdigit()):
+                continue
+            bulkheads[name.strip()] = (int(concurrency), int(queue) if queue else None)
+        return bulkheads
+        
+    def get_llm_queue_deadlines(self) -> Dict[str, float]:
+        """LLM 우선순위별 대기 마감 시간 반환"""
+        deadlines: Dict[str, float] = {}
+        for item in (self.llm_queue_deadlines or "").split(','):
+            name, _, value = item.partition(':')
+            try:
+                deadlines[name.strip()] = float(value)
+            except ValueError:
+                continue
+        return deadlines
         
     def get_project_root(self) -> Path:
         """프로젝트 루트 디렉토리 반환"""
@@ -6,7 +6,7 @@ Discord Bot과 AI 엔진 간의 메시지 처리를 담당하는 모듈
 import asyncio
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable
 from loguru import logger
 
 # AI 엔진 관련 import
@@ -198,8 +198,17 @@ class AIMessageHandler:
         except Exception as e:
             logger.error(f"Gemini Provider 비동기 초기화 중 오류: {e}")
     
-    async def process_message(self, user_message: str, user_id: str, channel_id: str) -> AIResponse:
-        """사용자 메시지 처리: LLM이 도구 선택/실행(MCP)까지 담당"""
+    async def process_message(
+        self,
+        user_message: str,
+        user_id: str,
+        channel_id: str,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> AIResponse:
+        """사용자 메시지 처리: LLM이 도구 선택/실행(MCP)까지 담당
+
+        stream_callback 이 주어지면 최종 답변 생성 중 누적 텍스트로 호출됩니다.
+        """
         try:
             # MCP 통합 초기화 (한 번만)
             await self._ensure_mcp()
@@ -239,7 +248,8 @@ class AIMessageHandler:
                 pass
 
             detailed = await self._mcp.process_user_request_detailed(
-                user_message, user_id=user_id, conversation_history=history
+                user_message, user_id=user_id, conversation_history=history,
+                stream_callback=stream_callback
             )
             content_text = detailed.get("text", "")
             exec_info = detailed.get("execution") or {}
@@ -424,6 +434,12 @@ class AIMessageHandler:
             self._mcp = MCPIntegration()
             await self._mcp.initialize()
     
+    async def cleanup(self) -> None:
+        """MCP 통합 정리 (Apple MCP 서버 프로세스 종료 포함)"""
+        if self._mcp is not None:
+            await self._mcp.cleanup()
+            self._mcp = None
+    
     # 키워드 기반 도구 상태 질의 제거 (에이전틱 판단/명령어 기반으로만 동작)
 
     async def _make_agentic_tool_decision(self, user_message: str) -> Optional[Dict[str, Any]]:
@@ -806,6 +822,14 @@ def get_ai_handler() -> AIMessageHandler:
         logger.info("AI Handler 초기화 완료")
     return _ai_handler
 
+async def cleanup_ai_handler():
+    """전역 AI 핸들러 정리"""
+    global _ai_handler
+    
+    if _ai_handler is not None:
+        await _ai_handler.cleanup()
+        _ai_handler = None
+
 async def process_discord_message(
     user_message: str,
     user_id: int, 
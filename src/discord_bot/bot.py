@@ -17,7 +17,8 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from .ai_handler import get_ai_handler
+from .ai_handler import get_ai_handler, cleanup_ai_handler
+from .streaming import StreamingReply
 
 from src.utils.logger import get_discord_logger
 from src.config import Settings
@@ -349,10 +350,13 @@ class DiscordBot:
                         pass
                     self.logger.info(f"AI Handler 상태: {await ai_handler.get_status()}")
                     
+                    # 최종 답변은 생성되는 대로 하나의 메시지를 수정하며 표시
+                    streaming_reply = StreamingReply(message)
                     ai_response = await ai_handler.process_message(
                         content, 
                         str(message.author.id), 
-                        str(message.channel.id)
+                        str(message.channel.id),
+                        stream_callback=streaming_reply.update
                     )
                     
                     self.logger.info(f"AI 응답 받음: {ai_response.content[:100] if ai_response.content else 'Empty response'}...")
@@ -377,8 +381,15 @@ class DiscordBot:
                     else:
                         self.logger.debug(f"시스템 알림 생략: notice='{system_notice}', type={type(system_notice)}")
                     
-                    # 2) 비서 메시지 전송 (메인 응답)
-                    await message.reply(ai_response.content)
+                    # 2) 비서 메시지 전송 (메인 응답) - 스트리밍 중이던 메시지가 있으면 최종 내용으로 수정
+                    if streaming_reply.started:
+                        await streaming_reply.finish(ai_response.content)
+                        self.logger.info(
+                            f"스트리밍 응답 완료: 첫 청크 {streaming_reply.first_chunk_latency:.2f}초, "
+                            f"수정 {streaming_reply.edit_count}회"
+                        )
+                    else:
+                        await message.reply(ai_response.content)
                     
                     # 세션에 AI 응답 저장
                     await self.session_manager.update_conversation_turn(
@@ -476,6 +487,9 @@ class DiscordBot:
             # 세션 관리 중지 (Phase 2 Step 2.4)
             await self.session_manager.stop()
             
+            # MCP 통합 정리 (장기 실행 Apple MCP 서버 프로세스 종료)
+            await cleanup_ai_handler()
+            
             await self.bot.close()
             self.logger.info("Discord Bot 중지 완료")
         except Exception as e:
@@ -789,8 +803,9 @@ class DiscordBot:
                         "사용자가 부담 없이 빠르게 확인/진행을 결정할 수 있도록 부드럽게 권유해줘."
                     )
                     try:
+                        # 사용자 대기 중인 요청보다 뒤로 밀리는 background 우선순위 (LLM 스케줄러)
                         resp = await prov.generate_response([
-                            ChatMessage(role='system', content=sys_msg),
+                            ChatMessage(role='system', content=sys_msg, metadata={"prompt_type": "proactive"}),
                             ChatMessage(role='user', content=usr)
                         ], temperature=0.3)
                         content = (resp.content or "").strip()
@@ -0,0 +1,137 @@
+"""
+Discord 스트리밍 응답
+
+LLM 스트림의 누적 텍스트를 하나의 Discord 메시지에 점진적으로 반영합니다.
+첫 청크가 도착하면 바로 답장을 보내고, 이후에는 일정 간격으로만 메시지를 수정하여
+Discord 편집 속도 제한에 걸리지 않도록 합니다.
+"""
+
+import asyncio
+import time
+from typing import List, Optional
+
+import discord
+
+from src.utils.logger import get_discord_logger
+
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+
+class StreamingReply:
+    """
+    하나의 Discord 메시지를 스로틀링하며 수정하는 스트리밍 답장
+
+    사용 예:
+        reply = StreamingReply(message)
+        await handler.process_message(..., stream_callback=reply.update)
+        await reply.finish(final_text)
+    """
+
+    def __init__(self,
+                 message: discord.Message,
+                 min_edit_interval: float = 1.0,
+                 cursor: str = " ▌"):
+        """
+        Args:
+            message: 답장 대상 원본 메시지
+            min_edit_interval: 메시지 수정 최소 간격 (초)
+            cursor: 생성 중임을 표시하는 접미사
+        """
+        self.message = message
+        self.min_edit_interval = min_edit_interval
+        self.cursor = cursor
+        self.logger = get_discord_logger()
+
+        self.reply: Optional[discord.Message] = None
+        self.edit_count = 0
+        self.first_chunk_latency: Optional[float] = None
+
+        self._started_at = time.time()
+        self._last_edit = 0.0
+        self._shown = ""
+        self._pending: Optional[str] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        """답장 메시지가 이미 전송되었는지 여부"""
+        return self.reply is not None
+
+    async def update(self, text: str) -> None:
+        """누적 텍스트 반영 (스트리밍 콜백)"""
+        if not text or not text.strip():
+            return
+
+        if self.reply is None:
+            async with self._lock:
+                if self.reply is None:
+                    self.first_chunk_latency = time.time() - self._started_at
+                    self.reply = await self.message.reply(self._render(text, streaming=True))
+                    self._shown = text
+                    self._last_edit = time.time()
+                    self.logger.debug(f"스트리밍 첫 청크 전송: {self.first_chunk_latency:.2f}초")
+                    return
+
+        self._pending = text
+        wait = self.min_edit_interval - (time.time() - self._last_edit)
+        if wait <= 0:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            # 간격이 남았으면 마지막 텍스트만 지연 반영
+            self._flush_task = asyncio.create_task(self._delayed_flush(wait))
+
+    async def _delayed_flush(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        async with self._lock:
+            text = self._pending
+            self._pending = None
+            if self.reply is None or text is None or text == self._shown:
+                return
+            try:
+                await self.reply.edit(content=self._render(text, streaming=True))
+                self._shown = text
+                self.edit_count += 1
+            except discord.HTTPException as e:
+                self.logger.warning(f"스트리밍 메시지 수정 실패: {e}")
+            finally:
+                self._last_edit = time.time()
+
+    async def finish(self, text: str) -> None:
+        """최종 텍스트로 마무리 (2000자 초과분은 후속 메시지로 전송)"""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._pending = None
+
+        chunks = self._split(text)
+        async with self._lock:
+            if self.reply is None:
+                self.reply = await self.message.reply(chunks[0])
+            else:
+                try:
+                    await self.reply.edit(content=chunks[0])
+                    self.edit_count += 1
+                except discord.HTTPException as e:
+                    self.logger.warning(f"스트리밍 최종 수정 실패, 새 메시지로 전송: {e}")
+                    self.reply = await self.message.reply(chunks[0])
+            self._shown = text
+
+        for extra in chunks[1:]:
+            await self.message.channel.send(extra)
+
+    def _render(self, text: str, streaming: bool) -> str:
+        suffix = self.cursor if streaming else ""
+        limit = DISCORD_MESSAGE_LIMIT - len(suffix)
+        if len(text) > limit:
+            text = text[:limit - 1] + "…"
+        return text + suffix
+
+    @staticmethod
+    def _split(text: str) -> List[str]:
+        if not text:
+            return [""]
+        return [text[i:i + DISCORD_MESSAGE_LIMIT] for i in range(0, len(text), DISCORD_MESSAGE_LIMIT)]
@@ -1,5 +1,6 @@
 from .event_bus import get_event_bus, EventType
 from .container import get_container, get_component_manager
+from .request_scheduler import FairRequestScheduler, SchedulerOverloadedError
 
 async def initialize_step_9_1() -> bool:
     """Step 9.1 초기화"""
@@ -7,7 +7,7 @@
 
 import asyncio
 import time
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Callable, Awaitable
 from datetime import datetime
 
 from ..ai_engine.agent_state import AgentContext, AgentResult
@@ -17,6 +17,7 @@ from ..ai_engine.prompt_templates import PromptManager
 from ..mcp.registry import ToolRegistry
 from ..mcp.executor import ToolExecutor
 from ..utils.logger import get_logger
+from .complexity_router import ComplexityRouter, create_complexity_router
 
 logger = get_logger(__name__)
 
@@ -51,6 +52,11 @@ class AgenticController:
             timeout_seconds=300
         )
         
+        # 로컬 복잡도 라우터 (설정 complexity_router_enabled, 불확실할 때만 LLM 분석)
+        self.complexity_router: Optional[ComplexityRouter] = create_complexity_router(
+            getattr(llm_provider, "config", None)
+        )
+        
         # 성능 통계
         self.stats = {
             "total_requests": 0,
@@ -75,7 +81,8 @@ class AgenticController:
         force_react: bool = False,
         use_advanced_planning: bool = True,  # Phase 2: 고급 계획 기능 활성화
         max_iterations: int = 10,
-        timeout_seconds: int = 300
+        timeout_seconds: int = 300,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         사용자 요청 처리 (적응적 라우팅)
@@ -88,6 +95,7 @@ class AgenticController:
             use_advanced_planning: 고급 계획 기능 사용 여부
             max_iterations: 최대 반복 횟수
             timeout_seconds: 타임아웃 (초)
+            stream_callback: 최종 답변 스트리밍 콜백 (누적 텍스트 전달, ReAct 경로에서만 사용)
             
         Returns:
             Dict: 처리 결과 {"text": str, "execution": dict, "metadata": dict}
@@ -104,13 +112,15 @@ class AgenticController:
                 logger.info("고급 계획 기반 ReAct 엔진 사용 결정")
                 self.stats["react_requests"] += 1
                 result = await self._process_with_advanced_planning(
-                    user_input, user_id, conversation_history, max_iterations, timeout_seconds
+                    user_input, user_id, conversation_history, max_iterations, timeout_seconds,
+                    stream_callback
                 )
             else:
                 logger.info("기본 ReAct 엔진 사용 결정")
                 self.stats["react_requests"] += 1
                 result = await self._process_with_react_engine(
-                    user_input, user_id, conversation_history, max_iterations, timeout_seconds
+                    user_input, user_id, conversation_history, max_iterations, timeout_seconds,
+                    stream_callback
                 )
         else:
             logger.info("레거시 처리 방식 사용 결정")
@@ -122,8 +132,10 @@ class AgenticController:
         # 통계 업데이트 (안전한 처리)
         try:
             execution_time = time.time() - start_time
-            success = result.get("execution", {}).get("status") == "success"
-            self._update_stats(execution_time, success)
+            status = result.get("execution", {}).get("status")
+            self._update_stats(execution_time, status == "success")
+            if self.complexity_router and not force_react:
+                self.complexity_router.record(user_input, complexity_analysis, status, execution_time)
         except Exception as stats_error:
             logger.error(f"통계 업데이트 실패 (처리는 계속): {stats_error}")
             # 통계 업데이트 실패해도 메인 처리는 계속 진행
@@ -133,10 +145,18 @@ class AgenticController:
     def get_stats(self) -> Dict[str, Any]:
         """성능 통계 반환"""
         logger.debug("성능 통계 조회")
+        profiles = getattr(self.llm_provider, "prompt_profiles", None)
+        hedger = getattr(self.llm_provider, "hedger", None)
+        prefix_cache = getattr(self.llm_provider, "prefix_cache", None)
         return {
             **self.stats,
             "react_usage_rate": self.stats["react_requests"] / max(self.stats["total_requests"], 1),
-            "legacy_usage_rate": self.stats["legacy_requests"] / max(self.stats["total_requests"], 1)
+            "legacy_usage_rate": self.stats["legacy_requests"] / max(self.stats["total_requests"], 1),
+            "goal_checks": self.react_engine.get_goal_check_stats(),
+            "complexity_router": self.complexity_router.get_stats() if self.complexity_router else {},
+            "prompt_profiles": profiles.get_stats() if profiles else {},
+            "hedging": hedger.get_stats() if hedger else {},
+            "prefix_cache": prefix_cache.get_stats() if prefix_cache else {}
         }
     
     async def health_check(self) -> Dict[str, Any]:
@@ -179,7 +199,8 @@ class AgenticController:
         user_id: str,
         conversation_history: Optional[List[Dict[str, Any]]],
         max_iterations: int,
-        timeout_seconds: int
+        timeout_seconds: int,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """ReAct 엔진을 사용한 처리"""
         logger.info(f"ReAct 엔진 처리 시작: 사용자={user_id}, 입력='{user_input[:50]}...', "
@@ -194,7 +215,8 @@ class AgenticController:
                 available_tools=list(self.tool_registry.list_tools()),
                 max_iterations=max_iterations,
                 timeout_seconds=timeout_seconds,
-                constraints={"conversation_history": (conversation_history or [])[:10]}
+                constraints={"conversation_history": (conversation_history or [])[:10]},
+                stream_callback=stream_callback
             )
             
             logger.debug(f"AgentContext 생성 완료: 세션={context.session_id}, "
@@ -260,7 +282,8 @@ class AgenticController:
         user_id: str,
         conversation_history: Optional[List[Dict[str, Any]]],
         max_iterations: int,
-        timeout_seconds: int
+        timeout_seconds: int,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """고급 계획 기반 처리 (Phase 2)"""
         try:
@@ -271,7 +294,8 @@ class AgenticController:
                 goal=user_input,
                 available_tools=self.tool_registry.list_tools(),
                 max_iterations=max_iterations,
-                timeout_seconds=timeout_seconds
+                timeout_seconds=timeout_seconds,
+                stream_callback=stream_callback
             )
             
             # 고급 계획 기반 실행
@@ -423,7 +447,8 @@ class AgenticController:
                 'use_react': False,  # 간단한 요청은 ReAct 불필요
                 'complexity': 'simple',
                 'complexity_score': 2,
-                'reasoning': '간단한 응답 요청'
+                'reasoning': '간단한 응답 요청',
+                'source': 'heuristic'
             }
         
         # TODO 관련 단순 요청 (4-5점)
@@ -432,9 +457,18 @@ class AgenticController:
                 'use_react': True,   # TODO 작업은 ReAct 필요
                 'complexity': 'medium',
                 'complexity_score': 4,
-                'reasoning': '단일 TODO 작업'
+                'reasoning': '단일 TODO 작업',
+                'source': 'heuristic'
             }
         
+        # 학습된 로컬 라우터 (확신할 때만 사용, 아니면 LLM 분석)
+        if self.complexity_router:
+            routed = self.complexity_router.predict(user_input)
+            if routed is not None:
+                logger.info(f"복잡도 분석 완료(로컬): {routed['complexity']} "
+                            f"(신뢰도: {routed['router_confidence']:.2f})")
+                return routed
+        
         try:
             from ..ai_engine.llm_provider import ChatMessage
             
@@ -453,12 +487,16 @@ class AgenticController:
 점수: [1-10]
 이유: [분석 근거]"""
 
-            messages = [ChatMessage(role="user", content=analysis_prompt)]
+            messages = [ChatMessage(
+                role="user",
+                content=analysis_prompt,
+                metadata={"prompt_type": "complexity", "cache_text": user_input}
+            )]
             
+            # 출력 예산/중단 시퀀스("이유:" 전에서 중단)는 "complexity" 프롬프트 프로필
             response = await self.llm_provider.generate_response(
                 messages,
-                temperature=0.2,  # 빠른 판단을 위해 온도 감소
-                max_tokens=4096   # 요청에 따라 4096으로 상향
+                temperature=0.2  # 빠른 판단을 위해 온도 감소
             )
             
             if response and response.content:
@@ -494,7 +532,8 @@ class AgenticController:
                     "use_react": use_react,
                     "complexity": complexity,
                     "complexity_score": complexity_score,
-                    "reasoning": f"LLM 분석: {complexity} 복잡도, 점수 {complexity_score}/10"
+                    "reasoning": f"LLM 분석: {complexity} 복잡도, 점수 {complexity_score}/10",
+                    "source": "llm"
                 }
             else:
                 raise Exception("LLM 응답이 비어있음")
@@ -508,7 +547,8 @@ class AgenticController:
                 "use_react": True,
                 "complexity": "medium",
                 "complexity_score": 5,
-                "reasoning": "LLM 분석 실패, 중간 복잡도로 안전하게 처리"
+                "reasoning": "LLM 분석 실패, 중간 복잡도로 안전하게 처리",
+                "source": "fallback"
             }
     
     def _update_stats(self, execution_time: float, success: bool) -> None:
@@ -0,0 +1,361 @@
+"""
+로컬 복잡도 라우터
+
+AgenticController 가 요청마다 LLM으로 복잡도를 분석하는 대신, 과거 라우팅 기록
+(요청, 복잡도 점수, 처리 결과)으로 학습한 작은 분류기로 처리 경로를 결정합니다.
+
+- 특징: 문자 1~3-gram 을 crc32 해시로 고정 크기 벡터에 사상 (한글 띄어쓰기/오타에 강함)
+- 모델: 다항 로지스틱 회귀 (simple / react / planning), 추론은 1ms 미만
+- 신뢰도가 임계값 미만이거나 학습 표본이 부족하면 None 을 반환해 LLM 분석으로 위임
+
+디스크 구성 (data_dir):
+- samples.jsonl: 라우팅 기록 추가 전용 로그 (재학습 시 최근 max_samples 개로 압축)
+- model.npz:     학습된 가중치와 메타 정보
+"""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+LABELS = ("simple", "react", "planning")
+
+# 라벨별 컨트롤러 라우팅 결과 (complexity_score 는 기존 LLM 분석 구간의 대표값)
+_ROUTES: Dict[str, Dict[str, Any]] = {
+    "simple": {"use_react": False, "complexity": "simple", "complexity_score": 2},
+    "react": {"use_react": True, "complexity": "medium", "complexity_score": 5},
+    "planning": {"use_react": True, "complexity": "complex", "complexity_score": 8},
+}
+
+# 처리 결과가 실패로 보는 실행 상태
+_FAILED_STATUSES = ("error", "failure", "partial_failure")
+
+
+def label_for_score(score: int) -> str:
+    """복잡도 점수 → 라우팅 라벨 (1-3 단순, 4-6 ReAct, 7-10 고급 계획)"""
+    if score <= 3:
+        return "simple"
+    if score >= 7:
+        return "planning"
+    return "react"
+
+
+def _normalize(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFC", text or "").lower().split())
+
+
+class ComplexityRouter:
+    """
+    문자 n-gram 로지스틱 회귀 기반 요청 복잡도 분류기
+
+    사용 흐름:
+        analysis = router.predict(user_input)       # None 이면 LLM 분석
+        ... 요청 처리 ...
+        router.record(user_input, analysis, result)  # 학습 데이터 기록, 주기적 재학습
+    """
+
+    SAMPLES_FILE = "samples.jsonl"
+    MODEL_FILE = "model.npz"
+
+    def __init__(self,
+                 data_dir: Optional[Union[str, Path]] = None,
+                 threshold: float = 0.75,
+                 min_samples: int = 30,
+                 retrain_every: int = 20,
+                 max_samples: int = 2000,
+                 dim: int = 1 << 14,
+                 ngram_range: Tuple[int, int] = (1, 3)):
+        """
+        Args:
+            data_dir: 학습 데이터/모델 저장 경로 (None이면 메모리 전용)
+            threshold: 로컬 결정을 내릴 최소 예측 확률 (미만이면 LLM으로 위임)
+            min_samples: 학습을 시작하는 최소 표본 수
+            retrain_every: 새 표본 N개마다 백그라운드 재학습
+            max_samples: 학습에 사용할 최근 표본 수 상한
+            dim: 해시 특징 차원
+            ngram_range: 문자 n-gram 길이 범위
+        """
+        self.data_dir = Path(data_dir) if data_dir else None
+        self.threshold = threshold
+        self.min_samples = max(len(LABELS), min_samples)
+        self.retrain_every = max(1, retrain_every)
+        self.max_samples = max_samples
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+        self._samples: List[Dict[str, Any]] = []
+        self._weights: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._new_since_train = 0
+        self._training: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+        self.stats: Dict[str, float] = {
+            "local": 0, "deferred": 0, "untrained": 0, "recorded": 0,
+            "train_runs": 0, "holdout_accuracy": 0.0, "predict_time_total": 0.0
+        }
+
+        if self.data_dir:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            self._load()
+
+    # ---- 특징/추론 ----
+
+    def featurize(self, text: str) -> np.ndarray:
+        """해시된 문자 n-gram 인덱스 (중복 제거)"""
+        padded = f" {_normalize(text)} "
+        low, high = self.ngram_range
+        indices = {
+            zlib.crc32(padded[i:i + n].encode("utf-8")) % self.dim
+            for n in range(low, high + 1)
+            for i in range(len(padded) - n + 1)
+        }
+        return np.fromiter(indices, dtype=np.int64, count=len(indices))
+
+    def _probabilities(self, indices: np.ndarray,
+                       weights: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+        W, b = weights
+        logits = W[:, indices].sum(axis=1) + b
+        logits -= logits.max()
+        exp = np.exp(logits)
+        return exp / exp.sum()
+
+    def predict(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        로컬 라우팅 결정
+
+        Returns:
+            컨트롤러 복잡도 분석과 같은 형태의 dict, 모델이 없거나 불확실하면 None
+        """
+        weights = self._weights
+        if weights is None:
+            self.stats["untrained"] += 1
+            return None
+
+        started = time.perf_counter()
+        probs = self._probabilities(self.featurize(text), weights)
+        self.stats["predict_time_total"] += time.perf_counter() - started
+
+        best = int(probs.argmax())
+        confidence = float(probs[best])
+        if confidence < self.threshold:
+            self.stats["deferred"] += 1
+            logger.debug(f"로컬 라우터 불확실 ({LABELS[best]}, {confidence:.2f}) → LLM 분석")
+            return None
+
+        self.stats["local"] += 1
+        label = LABELS[best]
+        return {
+            **_ROUTES[label],
+            "reasoning": f"로컬 라우터: {label} (신뢰도 {confidence:.2f})",
+            "source": "router",
+            "router_confidence": confidence
+        }
+
+    # ---- 학습 데이터 ----
+
+    def record(self, text: str, analysis: Dict[str, Any], status: Optional[str],
+               execution_time: float) -> None:
+        """
+        요청 1건의 (요청, 복잡도 점수, 처리 결과) 기록
+
+        로컬 라우터가 스스로 내린 결정은 처리에 실패한 경우에만 교정 표본으로 학습합니다.
+        LLM 분석 실패 시의 기본값(source="fallback")은 실제 판단이 아니므로 학습하지 않습니다.
+        """
+        source = analysis.get("source", "llm")
+        if source == "fallback":
+            return
+        label = label_for_score(int(analysis.get("complexity_score", 5)))
+        if status in _FAILED_STATUSES and label == "simple":
+            label = "react"  # 단순 경로 실패 → 도구 사용이 필요했던 요청
+        elif source == "router":
+            return
+
+        sample = {
+            "text": text,
+            "score": analysis.get("complexity_score"),
+            "label": label,
+            "source": source,
+            "status": status,
+            "latency": round(execution_time, 3),
+            "ts": time.time()
+        }
+        with self._lock:
+            self._samples.append(sample)
+            if len(self._samples) > self.max_samples:
+                del self._samples[:len(self._samples) - self.max_samples]
+            self._new_since_train += 1
+            self._append_sample(sample)
+        self.stats["recorded"] += 1
+        self._maybe_retrain()
+
+    def _maybe_retrain(self) -> None:
+        if self._training is not None and not self._training.done():
+            return
+        if self._new_since_train < self.retrain_every and self._weights is not None:
+            return
+        if len(self._samples) < self.min_samples or len({s["label"] for s in self._samples}) < 2:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.train()
+            return
+        self._training = loop.create_task(asyncio.to_thread(self.train))
+        self._training.add_done_callback(self._on_trained)
+
+    @staticmethod
+    def _on_trained(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"로컬 복잡도 라우터 학습 실패: {task.exception()}")
+
+    # ---- 학습 ----
+
+    def train(self, epochs: int = 8, learning_rate: float = 0.5, l2: float = 1e-4) -> Dict[str, Any]:
+        """누적 표본으로 재학습 (최근 20% 홀드아웃 정확도 측정 후 전체 표본으로 최종 학습)"""
+        with self._lock:
+            samples = list(self._samples)
+            self._new_since_train = 0
+            self._compact_samples()
+        data = [(self.featurize(s["text"]), LABELS.index(s["label"])) for s in samples if s["label"] in LABELS]
+        if len(data) < self.min_samples:
+            return {"trained": False, "samples": len(data)}
+
+        split = int(len(data) * 0.8)
+        holdout = data[split:]
+        accuracy = 0.0
+        if holdout:
+            trial = self._fit(data[:split], epochs, learning_rate, l2)
+            correct = sum(int(self._probabilities(x, trial).argmax() == y) for x, y in holdout)
+            accuracy = correct / len(holdout)
+
+        self._weights = self._fit(data, epochs, learning_rate, l2)
+        self.stats["train_runs"] += 1
+        self.stats["holdout_accuracy"] = accuracy
+        self._save_model(len(data), accuracy)
+        logger.info(f"로컬 복잡도 라우터 학습 완료: 표본={len(data)}, 홀드아웃 정확도={accuracy:.2f}")
+        return {"trained": True, "samples": len(data), "holdout_accuracy": accuracy}
+
+    def _fit(self, data: List[Tuple[np.ndarray, int]], epochs: int, learning_rate: float,
+             l2: float) -> Tuple[np.ndarray, np.ndarray]:
+        """희소 특징 SGD 로 다항 로지스틱 회귀 학습 (클래스 빈도 역수 가중)"""
+        W = np.zeros((len(LABELS), self.dim), dtype=np.float32)
+        b = np.zeros(len(LABELS), dtype=np.float32)
+        counts = np.bincount([y for _, y in data], minlength=len(LABELS)).astype(np.float32)
+        class_weight = np.where(counts > 0, len(data) / (len(LABELS) * np.maximum(counts, 1)), 0.0)
+
+        order = list(range(len(data)))
+        rng = random.Random(0)
+        for epoch in range(epochs):
+            rng.shuffle(order)
+            rate = learning_rate / math.sqrt(epoch + 1)
+            for i in order:
+                indices, y = data[i]
+                grad = self._probabilities(indices, (W, b))
+                grad[y] -= 1.0
+                grad *= rate * class_weight[y]
+                # 긴 문장일수록 특징당 갱신 폭을 줄여 과대 반영 방지
+                scale = 1.0 / math.sqrt(max(len(indices), 1))
+                W[:, indices] -= (grad * scale)[:, None] + rate * l2 * W[:, indices]
+                b -= grad
+        return W, b
+
+    # ---- 저장/로드 ----
+
+    def _append_sample(self, sample: Dict[str, Any]) -> None:
+        if not self.data_dir:
+            return
+        try:
+            with open(self.data_dir / self.SAMPLES_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning(f"라우팅 표본 기록 실패: {e}")
+
+    def _compact_samples(self) -> None:
+        """표본 로그를 메모리에 유지 중인 최근 표본으로 다시 작성 (잠금 보유 상태에서 호출)"""
+        if not self.data_dir:
+            return
+        tmp = self.data_dir / (self.SAMPLES_FILE + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                for sample in self._samples:
+                    f.write(json.dumps(sample, ensure_ascii=False) + "\n")
+            tmp.replace(self.data_dir / self.SAMPLES_FILE)
+        except OSError as e:
+            logger.warning(f"라우팅 표본 로그 압축 실패: {e}")
+
+    def _save_model(self, samples: int, accuracy: float) -> None:
+        if not self.data_dir or self._weights is None:
+            return
+        W, b = self._weights
+        tmp = self.data_dir / (self.MODEL_FILE + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                np.savez_compressed(f, W=W, b=b, dim=self.dim, ngram_range=np.array(self.ngram_range),
+                                    labels=np.array(LABELS), samples=samples, accuracy=accuracy)
+            tmp.replace(self.data_dir / self.MODEL_FILE)
+        except OSError as e:
+            logger.warning(f"라우터 모델 저장 실패: {e}")
+
+    def _load(self) -> None:
+        samples_path = self.data_dir / self.SAMPLES_FILE
+        if samples_path.exists():
+            with open(samples_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._samples.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+            self._samples = self._samples[-self.max_samples:]
+
+        model_path = self.data_dir / self.MODEL_FILE
+        if not model_path.exists():
+            return
+        try:
+            with np.load(model_path) as data:
+                if (int(data["dim"]) != self.dim or tuple(data["ngram_range"]) != tuple(self.ngram_range)
+                        or tuple(data["labels"]) != LABELS):
+                    logger.info("라우터 모델 설정이 달라 재학습 대기")
+                    return
+                self._weights = (data["W"].astype(np.float32), data["b"].astype(np.float32))
+                self.stats["holdout_accuracy"] = float(data["accuracy"])
+            logger.info(f"로컬 복잡도 라우터 로드: 표본={len(self._samples)}")
+        except Exception as e:
+            logger.warning(f"라우터 모델 로드 실패, 재학습 대기: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """로컬 결정률, 평균 추론 시간, 학습 상태"""
+        predictions = self.stats["local"] + self.stats["deferred"]
+        return {
+            **self.stats,
+            "trained": self._weights is not None,
+            "samples": len(self._samples),
+            "local_rate": self.stats["local"] / predictions if predictions else 0.0,
+            "avg_predict_ms": self.stats["predict_time_total"] / predictions * 1000 if predictions else 0.0
+        }
+
+
+def create_complexity_router(config: Any) -> Optional[ComplexityRouter]:
+    """설정에 따라 로컬 복잡도 라우터 생성 (비활성화 시 None)"""
+    if not getattr(config, "complexity_router_enabled", False):
+        return None
+    data_dir = getattr(config, "complexity_router_path", "") or None
+    if data_dir is None and hasattr(config, "get_data_dir"):
+        data_dir = config.get_data_dir() / "complexity_router"
+    return ComplexityRouter(
+        data_dir=data_dir,
+        threshold=getattr(config, "complexity_router_threshold", 0.75),
+        min_samples=getattr(config, "complexity_router_min_samples", 30),
+    )
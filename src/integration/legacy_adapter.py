@@ -6,7 +6,7 @@
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Awaitable, TYPE_CHECKING
 
 from .agentic_controller import AgenticController
 from ..ai_engine.llm_provider import LLMProvider, GeminiProvider
@@ -15,6 +15,9 @@ from ..mcp.registry import ToolRegistry
 from ..mcp.executor import ToolExecutor
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from ..mcp.apple_client import AppleAppsManager
+
 logger = get_logger(__name__)
 
 
@@ -41,6 +44,9 @@ class LegacyMCPAdapter:
         # AgenticController는 도구 등록 후에 초기화
         self.agentic_controller = None
         
+        # Apple MCP 도구가 공유하는 장기 실행 서버 연결 소유자 (cleanup 에서 종료)
+        self.apple_manager: Optional['AppleAppsManager'] = None
+        
         # 호환성을 위한 설정
         self.config = {}
         
@@ -112,8 +118,8 @@ class LegacyMCPAdapter:
             from ..mcp.apple_tools import register_apple_tools
             from ..mcp.apple_client import AppleAppsManager
 
-            apple_manager = AppleAppsManager()
-            apple_tools = register_apple_tools(apple_manager)
+            self.apple_manager = AppleAppsManager()
+            apple_tools = register_apple_tools(self.apple_manager)
 
             registered = 0
             for tool in apple_tools:
@@ -174,6 +180,7 @@ class LegacyMCPAdapter:
         user_input: str,
         user_id: str = "default",
         conversation_history: Optional[List[Dict[str, Any]]] = None,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> Dict[str, Any]:
         """
         사용자 요청 처리 (상세 결과 반환, 기존 인터페이스 유지)
@@ -182,6 +189,7 @@ class LegacyMCPAdapter:
             user_input: 사용자 입력
             user_id: 사용자 ID
             conversation_history: 대화 히스토리
+            stream_callback: 최종 답변 스트리밍 콜백 (누적 텍스트 전달)
             
         Returns:
             Dict[str, Any]: 상세 처리 결과
@@ -197,7 +205,8 @@ class LegacyMCPAdapter:
             result = await self.agentic_controller.process_request(
                 user_input=user_input,
                 user_id=user_id,
-                conversation_history=conversation_history
+                conversation_history=conversation_history,
+                stream_callback=stream_callback
             )
             
             # 기존 인터페이스에 맞게 형식 조정
@@ -218,6 +227,12 @@ class LegacyMCPAdapter:
                 }
             }
     
+    async def cleanup(self) -> None:
+        """어댑터가 띄운 Apple MCP 서버 프로세스 종료 (공유 도구 실행 엔진은 소유자가 정리)"""
+        if self.apple_manager is not None:
+            await self.apple_manager.close()
+            self.apple_manager = None
+    
     # 기존 MCPIntegration의 다른 메서드들을 위한 호환성 메서드들
     
     def get_available_tools(self) -> List[str]:
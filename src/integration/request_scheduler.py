@@ -0,0 +1,164 @@
+"""
+공정 동시 요청 스케줄러
+
+하나의 프로세스에서 여러 Discord 사용자의 요청을 동시에 처리하기 위해
+에이전틱 엔진 앞단에서 전체 동시 실행 수와 사용자별 동시 실행 수를 제한합니다.
+자리가 나면 대기 중인 사용자들을 라운드로빈으로 깨우므로, 한 사용자가 요청을
+몰아 보내도 다른 사용자의 요청이 뒤로 밀리지 않습니다.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, TypeVar
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SchedulerOverloadedError(Exception):
+    """사용자별 대기열이 가득 차 요청을 받을 수 없음"""
+    pass
+
+
+class FairRequestScheduler:
+    """
+    사용자별 공정성을 보장하는 제한된 동시 요청 스케줄러
+
+    - 전체 동시 실행 수: max_concurrent
+    - 사용자당 동시 실행 수: max_per_user (기본 1, 같은 사용자의 메시지는 도착 순서대로 처리)
+    - 사용자당 대기 요청 수: max_queue_per_user (초과 시 SchedulerOverloadedError)
+
+    사용 예:
+        async with scheduler.slot(user_id):
+            result = await controller.process_request(...)
+    """
+
+    def __init__(self, max_concurrent: int = 4, max_per_user: int = 1,
+                 max_queue_per_user: int = 5):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_per_user = max(1, max_per_user)
+        self.max_queue_per_user = max(0, max_queue_per_user)
+
+        self._active_total = 0
+        self._active: Dict[str, int] = {}
+        # 라운드로빈 순서를 유지하는 사용자별 대기열
+        self._waiting: "OrderedDict[str, deque[asyncio.Future]]" = OrderedDict()
+
+        self.stats: Dict[str, float] = {
+            "admitted": 0, "queued": 0, "rejected": 0,
+            "total_wait": 0.0, "max_wait": 0.0
+        }
+
+    @contextlib.asynccontextmanager
+    async def slot(self, user_id: str) -> AsyncIterator[None]:
+        """실행 슬롯 획득 (대기 후) 및 종료 시 반납"""
+        await self._acquire(user_id)
+        try:
+            yield
+        finally:
+            self._release(user_id)
+
+    async def run(self, user_id: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """슬롯을 잡은 상태로 factory() 실행"""
+        async with self.slot(user_id):
+            return await factory()
+
+    async def _acquire(self, user_id: str) -> None:
+        if not self._waiting.get(user_id) and self._can_start(user_id):
+            self._start(user_id)
+            return
+
+        queue = self._waiting.setdefault(user_id, deque())
+        if len(queue) >= self.max_queue_per_user:
+            self.stats["rejected"] += 1
+            if not queue:
+                self._waiting.pop(user_id, None)
+            raise SchedulerOverloadedError(f"사용자 {user_id}의 대기 요청이 너무 많습니다 ({len(queue)}건)")
+
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        self.stats["queued"] += 1
+        queued_at = time.time()
+        logger.debug(f"요청 대기: user={user_id}, 실행 중={self._active_total}/{self.max_concurrent}")
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소된 경우 반납
+                self._release(user_id)
+            else:
+                self._remove_waiter(user_id, future)
+            raise
+
+        wait = time.time() - queued_at
+        self.stats["total_wait"] += wait
+        self.stats["max_wait"] = max(self.stats["max_wait"], wait)
+
+    def _can_start(self, user_id: str) -> bool:
+        return (self._active_total < self.max_concurrent
+                and self._active.get(user_id, 0) < self.max_per_user)
+
+    def _start(self, user_id: str) -> None:
+        self._active_total += 1
+        self._active[user_id] = self._active.get(user_id, 0) + 1
+        self.stats["admitted"] += 1
+
+    def _release(self, user_id: str) -> None:
+        self._active_total -= 1
+        remaining = self._active.get(user_id, 1) - 1
+        if remaining > 0:
+            self._active[user_id] = remaining
+        else:
+            self._active.pop(user_id, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """빈 슬롯을 대기 중인 사용자들에게 라운드로빈으로 배분"""
+        while self._active_total < self.max_concurrent:
+            for user_id in list(self._waiting):
+                queue = self._waiting[user_id]
+                while queue and queue[0].done():
+                    queue.popleft()  # 취소된 대기자 정리
+                if not queue:
+                    del self._waiting[user_id]
+                    continue
+                if self._active.get(user_id, 0) >= self.max_per_user:
+                    continue
+                future = queue.popleft()
+                if queue:
+                    self._waiting.move_to_end(user_id)  # 다음 차례는 다른 사용자에게
+                else:
+                    del self._waiting[user_id]
+                self._start(user_id)
+                future.set_result(None)
+                break
+            else:
+                return  # 지금 시작할 수 있는 대기자가 없음
+
+    def _remove_waiter(self, user_id: str, future: asyncio.Future) -> None:
+        queue = self._waiting.get(user_id)
+        if queue is None:
+            return
+        with contextlib.suppress(ValueError):
+            queue.remove(future)
+        if not queue:
+            self._waiting.pop(user_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """스케줄러 상태 및 누적 통계"""
+        queued = self.stats["queued"]
+        return {
+            **self.stats,
+            "active": self._active_total,
+            "active_users": len(self._active),
+            "waiting": sum(len(q) for q in self._waiting.values()),
+            "avg_wait": self.stats["total_wait"] / queued if queued else 0.0,
+            "max_concurrent": self.max_concurrent,
+            "max_per_user": self.max_per_user
+        }
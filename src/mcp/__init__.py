@@ -13,7 +13,7 @@ MCP (Model Context Protocol) 모듈
 
 from .protocol import MCPProtocol, MCPMessage, MCPRequest, MCPResponse, MCPError
 from .base_tool import BaseTool, ToolMetadata, ToolParameter, ToolResult
-from .registry import ToolRegistry, get_registry, register_tool, get_tool
+from .registry import ToolRegistry, ToolCatalogSnapshot, get_registry, register_tool, get_tool
 from .executor import ToolExecutor, ExecutionResult, ExecutionMode, get_executor, execute_tool
 
 __all__ = [
@@ -27,6 +27,7 @@ __all__ = [
     "ToolParameter", 
     "ToolResult",
     "ToolRegistry",
+    "ToolCatalogSnapshot",
     "get_registry",
     "register_tool",
     "get_tool",
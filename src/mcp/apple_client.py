@@ -13,6 +13,8 @@ from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from .apple_connection import AppleMCPConnection, MCPConnectionError
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,10 +50,13 @@ class MCPResponse:
 class AppleMCPClient:
     """Apple MCP 서버와 통신하는 Python 클라이언트"""
     
-    def __init__(self, server_path: str = "external/apple-mcp"):
+    def __init__(self, server_path: str = "external/apple-mcp",
+                 connection: Optional[AppleMCPConnection] = None):
         self.server_path = server_path
         self.server_process = None
         self.request_id = 0
+        # 장기 실행 서버 연결 (없으면 호출마다 서버 프로세스를 새로 실행)
+        self.connection = connection
         
     def _get_next_id(self) -> int:
         """다음 요청 ID 생성"""
@@ -60,6 +65,9 @@ class AppleMCPClient:
     
     async def _send_request(self, method: str, params: Dict[str, Any]) -> MCPResponse:
         """JSON-RPC 요청을 Apple MCP 서버로 전송"""
+        if self.connection is not None:
+            return await self._send_request_persistent(method, params)
+        
         request = MCPRequest(
             method=method,
             params=params,
@@ -123,6 +131,27 @@ class AppleMCPClient:
                 error={"code": -1, "message": str(e)}
             )
     
+    async def _send_request_persistent(self, method: str, params: Dict[str, Any]) -> MCPResponse:
+        """장기 실행 서버 연결을 통해 JSON-RPC 요청 전송"""
+        metric_key = method
+        if method == "tools/call" and params.get("name"):
+            metric_key = f"{method}:{params['name']}"
+        
+        try:
+            response_data = await self.connection.request(method, params, metric_key=metric_key)
+            return MCPResponse(
+                id=response_data.get("id"),
+                result=response_data.get("result"),
+                error=response_data.get("error")
+            )
+        except (MCPConnectionError, asyncio.TimeoutError) as e:
+            message = str(e) or f"Apple MCP 응답 시간 초과 ({method})"
+            logger.error(f"Apple MCP 통신 오류: {message}")
+            return MCPResponse(
+                id=None,
+                error={"code": -1, "message": message}
+            )
+    
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Apple MCP 도구 호출"""
         response = await self._send_request("tools/call", {
@@ -491,8 +520,14 @@ class AppleMapsClient:
 class AppleAppsManager:
     """Apple 앱들을 통합 관리하는 클래스"""
     
-    def __init__(self, server_path: str = "external/apple-mcp"):
-        self.mcp_client = AppleMCPClient(server_path)
+    def __init__(self, server_path: str = "external/apple-mcp",
+                 server_command: Optional[List[str]] = None,
+                 persistent: bool = True):
+        # 서버 프로세스는 매니저가 소유하며 첫 요청 시 시작됨
+        self.connection = (
+            AppleMCPConnection(server_path, command=server_command) if persistent else None
+        )
+        self.mcp_client = AppleMCPClient(server_path, connection=self.connection)
         
         # 각 앱별 클라이언트 초기화
         self.contacts = AppleContactsClient(self.mcp_client)
@@ -503,6 +538,22 @@ class AppleAppsManager:
         self.calendar = AppleCalendarClient(self.mcp_client)
         self.maps = AppleMapsClient(self.mcp_client)
     
+    async def start(self) -> None:
+        """Apple MCP 서버 프로세스 미리 시작"""
+        if self.connection is not None:
+            await self.connection.start()
+    
+    async def close(self) -> None:
+        """Apple MCP 서버 프로세스 종료"""
+        if self.connection is not None:
+            await self.connection.close()
+    
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """서버 연결 상태 및 메서드별 지연 시간 히스토그램"""
+        if self.connection is None:
+            return {"persistent": False}
+        return {"persistent": True, **self.connection.get_stats()}
+    
     async def get_available_tools(self) -> List[Dict[str, Any]]:
         """사용 가능한 도구 목록 조회"""
         return await self.mcp_client.list_tools()
@@ -517,9 +568,10 @@ class AppleAppsManager:
 
 
 # 편의를 위한 팩토리 함수
-def create_apple_apps_manager(server_path: str = "external/apple-mcp") -> AppleAppsManager:
+def create_apple_apps_manager(server_path: str = "external/apple-mcp",
+                              server_command: Optional[List[str]] = None) -> AppleAppsManager:
     """Apple Apps Manager 인스턴스 생성"""
-    return AppleAppsManager(server_path)
+    return AppleAppsManager(server_path, server_command=server_command)
 
 
 # 사용 예시
@@ -552,6 +604,8 @@ async def example_usage():
         location="테스트 장소"
     )
     print(f"이벤트 생성 결과: {event_result}")
+    
+    await manager.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Apple MCP Persistent Connection
+장기 실행 Apple MCP 서버 프로세스와 줄 단위(newline-delimited) JSON-RPC로 통신
+
+- 서버 프로세스는 한 번만 띄우고 stdin/stdout 스트림을 재사용
+- 응답은 `id`로 요청과 매칭하므로 여러 호출을 동시에 진행 가능
+- 프로세스가 종료되거나 응답 읽기에 실패하면 프로세스를 정리하고 대기 중인 요청을 실패 처리,
+  다음 호출에서 재시작
+- 메서드별 지연 시간 히스토그램 제공
+"""
+
+import asyncio
+import json
+import logging
+import time
+from bisect import bisect_left
+from typing import Dict, List, Any, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SERVER_COMMAND = ["bun", "run", "index.ts"]
+
+# stdout 줄 버퍼 한도 (asyncio 기본 64KiB는 메모 본문/메일 목록 응답 한 줄에도 부족)
+DEFAULT_STREAM_LIMIT = 32 * 1024 * 1024
+
+# 지연 시간 히스토그램 버킷 상한 (밀리초)
+DEFAULT_LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class MCPConnectionError(Exception):
+    """Apple MCP 서버 연결 오류"""
+    pass
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        # 마지막 칸은 최대 버킷을 초과한 관측치 (+Inf)
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, latency_seconds: float, success: bool = True) -> None:
+        """관측치 기록"""
+        latency_ms = latency_seconds * 1000.0
+        self.counts[bisect_left(self.buckets_ms, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+        if not success:
+            self.errors += 1
+
+    def percentile(self, q: float) -> float:
+        """버킷 상한 기준 백분위수 추정 (밀리초)"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index < len(self.buckets_ms):
+                    return float(self.buckets_ms[index])
+                return self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환"""
+        labels = [f"le_{int(b)}ms" for b in self.buckets_ms] + ["le_inf"]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "buckets": dict(zip(labels, self.counts))
+        }
+
+
+class AppleMCPConnection:
+    """장기 실행 Apple MCP 서버 프로세스에 대한 다중화 연결"""
+
+    def __init__(
+        self,
+        server_path: str = "external/apple-mcp",
+        command: Optional[List[str]] = None,
+        request_timeout: float = 60.0,
+        max_restarts: int = 5,
+        restart_backoff: float = 0.5,
+        restart_cooldown: float = 300.0,
+        stream_limit: int = DEFAULT_STREAM_LIMIT
+    ):
+        """
+        Args:
+            server_path: 서버 작업 디렉토리
+            command: 서버 실행 명령 (기본: bun run index.ts, 테스트 시 Python 대역 서버 지정 가능)
+            request_timeout: 요청당 응답 대기 시간 (초)
+            max_restarts: 연속 재시작 허용 횟수 (성공 응답 시 초기화)
+            restart_backoff: 재시작 간 기본 대기 시간 (초, 연속 실패마다 2배)
+            restart_cooldown: 재시작 한도 도달 후 다시 시도를 허용하기까지의 시간 (초)
+            stream_limit: 응답 한 줄(JSON-RPC 메시지 1개)의 최대 바이트 수
+        """
+        self.server_path = server_path
+        self.command = list(command) if command else list(DEFAULT_SERVER_COMMAND)
+        self.request_timeout = request_timeout
+        self.max_restarts = max_restarts
+        self.restart_backoff = restart_backoff
+        self.restart_cooldown = restart_cooldown
+        self.stream_limit = stream_limit
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._next_id = 0
+        self._closed = False
+
+        # 통계
+        self.start_count = 0
+        self.crash_count = 0
+        self._consecutive_restarts = 0
+        self._restarts_exhausted_at: Optional[float] = None
+        self.latency: Dict[str, LatencyHistogram] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """서버 프로세스 실행 여부"""
+        return self.process is not None and self.process.returncode is None
+
+    @property
+    def in_flight(self) -> int:
+        """응답 대기 중인 요청 수"""
+        return len(self._pending)
+
+    def _get_next_id(self) -> int:
+        """다음 요청 ID 생성"""
+        self._next_id += 1
+        return self._next_id
+
+    async def start(self) -> None:
+        """서버 프로세스 시작 (이미 실행 중이면 무시)"""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+            self._write_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self.is_running:
+                return
+
+            self._closed = False
+            if self.start_count > 0:
+                if self._consecutive_restarts >= self.max_restarts:
+                    now = time.monotonic()
+                    if self._restarts_exhausted_at is None:
+                        self._restarts_exhausted_at = now
+                    remaining = self.restart_cooldown - (now - self._restarts_exhausted_at)
+                    if remaining > 0:
+                        raise MCPConnectionError(
+                            f"Apple MCP 서버 재시작 한도 초과 ({self.max_restarts}회), "
+                            f"{remaining:.0f}초 후 재시도 가능"
+                        )
+                    # 쿨다운이 지나면 재시작 횟수를 초기화하고 다시 시도
+                    logger.info("Apple MCP 서버 재시작 쿨다운 경과, 재시작 횟수 초기화")
+                    self._consecutive_restarts = 0
+                    self._restarts_exhausted_at = None
+                delay = self.restart_backoff * (2 ** self._consecutive_restarts)
+                self._consecutive_restarts += 1
+                logger.warning(
+                    f"Apple MCP 서버 재시작 ({self._consecutive_restarts}/{self.max_restarts}), "
+                    f"{delay:.2f}초 대기"
+                )
+                await asyncio.sleep(delay)
+
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    *self.command,
+                    cwd=self.server_path,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    limit=self.stream_limit
+                )
+            except (OSError, ValueError) as e:
+                self.start_count += 1
+                raise MCPConnectionError(f"Apple MCP 서버 실행 실패: {e}") from e
+
+            self.start_count += 1
+            self._reader_task = asyncio.create_task(self._read_loop(self.process))
+            self._stderr_task = asyncio.create_task(self._drain_stderr(self.process))
+            logger.info(f"Apple MCP 서버 시작 (pid={self.process.pid})")
+
+    async def close(self) -> None:
+        """서버 프로세스 종료"""
+        self._closed = True
+        process = self.process
+        self.process = None
+
+        if process is not None and process.returncode is None:
+            try:
+                if process.stdin is not None:
+                    process.stdin.close()
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except (asyncio.TimeoutError, ProcessLookupError):
+                try:
+                    process.kill()
+                    await process.wait()
+                except ProcessLookupError:
+                    pass
+
+        for task in (self._reader_task, self._stderr_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._reader_task = None
+        self._stderr_task = None
+
+        self._fail_pending(MCPConnectionError("Apple MCP 연결이 종료되었습니다"))
+
+    async def request(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        timeout: Optional[float] = None,
+        metric_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """JSON-RPC 요청 전송 후 같은 id의 응답 메시지 반환
+
+        Args:
+            method: JSON-RPC 메서드
+            params: 요청 파라미터
+            timeout: 응답 대기 시간 (기본: request_timeout)
+            metric_key: 지연 시간 히스토그램 키 (기본: method)
+        """
+        if not self.is_running:
+            await self.start()
+
+        process = self.process
+        request_id = self._get_next_id()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending[request_id] = future
+
+        payload = json.dumps({
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": request_id
+        }, ensure_ascii=False) + "\n"
+
+        started = time.perf_counter()
+        success = False
+        try:
+            async with self._write_lock:
+                if process is None or process.stdin is None or process.returncode is not None:
+                    raise MCPConnectionError("Apple MCP 서버가 실행 중이 아닙니다")
+                process.stdin.write(payload.encode())
+                await process.stdin.drain()
+
+            message = await asyncio.wait_for(
+                future, timeout=timeout if timeout is not None else self.request_timeout
+            )
+            success = "error" not in message or message.get("error") is None
+            self._consecutive_restarts = 0
+            return message
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise MCPConnectionError(f"Apple MCP 서버 쓰기 실패: {e}") from e
+        finally:
+            self._pending.pop(request_id, None)
+            self._histogram(metric_key or method).observe(time.perf_counter() - started, success)
+
+    def _histogram(self, method: str) -> LatencyHistogram:
+        histogram = self.latency.get(method)
+        if histogram is None:
+            histogram = self.latency[method] = LatencyHistogram()
+        return histogram
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        """stdout에서 응답을 읽어 대기 중인 요청에 전달"""
+        failure: Optional[str] = None
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+
+                text = line.decode(errors="replace").strip()
+                if not text.startswith("{"):
+                    # 서버가 stdout에 찍는 로그 등은 무시
+                    if text:
+                        logger.debug(f"Apple MCP stdout: {text}")
+                    continue
+
+                try:
+                    message = json.loads(text)
+                except json.JSONDecodeError:
+                    logger.debug(f"Apple MCP JSON 파싱 실패: {text[:200]}")
+                    continue
+
+                future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.LimitOverrunError, ValueError) as e:
+            # readline()은 한도 초과 시 LimitOverrunError를 ValueError로 바꿔 던짐
+            failure = f"응답 한 줄이 스트림 한도({self.stream_limit}바이트)를 초과했습니다: {e}"
+        except Exception as e:
+            failure = f"응답 읽기 오류: {e}"
+
+        if self._closed or process is not self.process:
+            return
+
+        self.crash_count += 1
+        if failure is not None:
+            # 스트림 위치를 더 이상 신뢰할 수 없으므로 살아 있는 프로세스를 종료하고 즉시 재시작 대상으로 표시
+            logger.error(f"Apple MCP {failure} - 서버 프로세스를 종료하고 다음 요청 시 재시작")
+            self.process = None
+            self._fail_pending(MCPConnectionError(f"Apple MCP {failure}"))
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            try:
+                # 읽지 않은 stdout이 남아 있으면 파이프 정리가 끝나지 않을 수 있어 시간 제한
+                await asyncio.wait_for(process.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                pass
+            return
+
+        # EOF: 프로세스 종료 (크래시 또는 정상 종료)
+        returncode = await process.wait()
+        logger.warning(f"Apple MCP 서버 종료 감지 (returncode={returncode}), 다음 요청 시 재시작")
+        self._fail_pending(
+            MCPConnectionError(f"Apple MCP 서버가 종료되었습니다 (returncode={returncode})")
+        )
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        """stderr 파이프가 가득 차지 않도록 계속 비움"""
+        try:
+            while True:
+                line = await process.stderr.readline()
+                if not line:
+                    break
+                text = line.decode(errors="replace").strip()
+                if text:
+                    logger.debug(f"Apple MCP stderr: {text}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+
+    def _fail_pending(self, error: Exception) -> None:
+        """대기 중인 모든 요청을 실패 처리"""
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 및 메서드별 지연 시간 통계"""
+        return {
+            "running": self.is_running,
+            "pid": self.process.pid if self.process else None,
+            "in_flight": self.in_flight,
+            "start_count": self.start_count,
+            "crash_count": self.crash_count,
+            "latency": {method: h.to_dict() for method, h in self.latency.items()}
+        }
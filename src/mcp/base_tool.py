@@ -135,6 +135,23 @@ class ToolMetadata:
     requires_auth: bool = False
     timeout: int = 30  # 기본 타임아웃 30초
     rate_limit: Optional[int] = None  # 분당 호출 제한
+    side_effects: bool = True  # 외부 상태를 변경할 수 있는지 (기본값은 보수적으로 True)
+    read_only_actions: List[str] = field(default_factory=list)  # side_effects 도구라도 읽기 전용인 action 값
+    idempotent: bool = False  # 같은 매개변수로 반복 호출해도 결과/효과가 같은지 (요청 단위 메모 대상)
+    terminal: bool = False  # 호출 1회 성공으로 단일 의도 요청이 끝나는 도구인지 (목표 달성 빠른 판단용)
+    terminal_actions: List[str] = field(default_factory=list)  # terminal 이 아니어도 성공 시 요청을 끝낼 수 있는 action 값
+    
+    def is_read_only_call(self, parameters: Dict[str, Any]) -> bool:
+        """주어진 매개변수로 호출할 때 부작용이 없는지 여부 (추측 실행/메모 재사용 판단용)"""
+        if not self.side_effects:
+            return True
+        return bool(self.read_only_actions) and parameters.get("action") in self.read_only_actions
+    
+    def is_terminal_call(self, parameters: Dict[str, Any]) -> bool:
+        """주어진 매개변수로 호출이 성공하면 단일 의도 요청을 마무리할 수 있는지 여부"""
+        if self.terminal:
+            return True
+        return bool(self.terminal_actions) and (parameters or {}).get("action") in self.terminal_actions
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -148,7 +165,12 @@ class ToolMetadata:
             "tags": self.tags,
             "requires_auth": self.requires_auth,
             "timeout": self.timeout,
-            "rate_limit": self.rate_limit
+            "rate_limit": self.rate_limit,
+            "side_effects": self.side_effects,
+            "read_only_actions": self.read_only_actions,
+            "idempotent": self.idempotent,
+            "terminal": self.terminal,
+            "terminal_actions": self.terminal_actions
         }
 
 
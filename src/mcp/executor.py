@@ -6,21 +6,24 @@ MCP 도구 실행 엔진
 """
 
 import asyncio
+import contextlib
+import contextvars
+import dataclasses
+import itertools
 import logging
 import time
 import resource
 import signal
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import json
 import threading
-from concurrent.futures import ThreadPoolExecutor
 import psutil
 import os
 
-from .base_tool import BaseTool, ToolResult, ExecutionStatus
+from .base_tool import BaseTool, ToolResult, ExecutionStatus, ToolMetadata, ToolCategory
 from .registry import ToolRegistry, get_registry
 
 logger = logging.getLogger(__name__)
@@ -41,6 +44,8 @@ class ResourceLimits:
     max_execution_time: Optional[int] = 30  # 최대 실행 시간 (초)
     max_open_files: Optional[int] = 100  # 최대 열린 파일 수
     max_network_connections: Optional[int] = 50  # 최대 네트워크 연결 수
+    max_concurrency: Optional[int] = None  # 벌크헤드 동시 실행 수 (도구/카테고리별, None이면 제한 없음)
+    max_queue: Optional[int] = None  # 벌크헤드 대기 수 상한 (초과 시 즉시 거절, None이면 제한 없음)
 
 
 @dataclass
@@ -67,6 +72,8 @@ class ExecutionResult:
     result: ToolResult
     resource_usage: Dict[str, Any] = field(default_factory=dict)
     warnings: List[str] = field(default_factory=list)
+    cached: bool = False  # 요청 단위 메모에서 재사용된 결과인지
+    queue_wait_time: float = 0.0  # 벌크헤드/동시 실행 슬롯 대기 시간 (초, 실행 시간과 별도)
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -79,10 +86,207 @@ class ExecutionResult:
             "mode": self.context.mode.value,
             "result": self.result.to_dict(),
             "resource_usage": self.resource_usage,
-            "warnings": self.warnings
+            "warnings": self.warnings,
+            "cached": self.cached,
+            "queue_wait_time": self.queue_wait_time
         }
 
 
+class RequestToolMemo:
+    """
+    요청 단위 도구 결과 메모
+    
+    읽기 전용 또는 멱등(idempotent)으로 선언된 호출의 결과를 도구 이름 + 정규화된 매개변수 키로
+    보관합니다. 진행 중인 호출도 Future로 보관하므로 같은 호출이 동시에 들어오면 한 번만 실행됩니다.
+    같은 카테고리의 쓰기 호출이 실행되면 해당 카테고리의 항목은 모두 폐기됩니다.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, "asyncio.Future[ExecutionResult]"] = {}
+        self._categories: Dict[str, ToolCategory] = {}
+        self._prefetched: set = set()
+        self.stats: Dict[str, int] = {
+            "hits": 0, "misses": 0, "prefetched": 0, "prefetch_hits": 0,
+            "invalidated": 0, "cancelled": 0
+        }
+    
+    @staticmethod
+    def make_key(metadata: ToolMetadata, parameters: Optional[Dict[str, Any]]) -> str:
+        """도구 이름 + 메타데이터 기본값을 채운 정규화 매개변수 키"""
+        params = dict(parameters or {})
+        for param in metadata.parameters:
+            if param.name not in params and param.default is not None:
+                params[param.name] = param.default
+        return f"{metadata.name}:{json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)}"
+    
+    def get(self, key: str) -> Optional["asyncio.Future[ExecutionResult]"]:
+        return self._entries.get(key)
+    
+    def put(self, key: str, category: ToolCategory, future: "asyncio.Future[ExecutionResult]",
+            prefetched: bool = False) -> None:
+        self._entries[key] = future
+        self._categories[key] = category
+        if prefetched:
+            self._prefetched.add(key)
+            self.stats["prefetched"] += 1
+    
+    def mark_hit(self, key: str) -> None:
+        self.stats["hits"] += 1
+        if key in self._prefetched:
+            self._prefetched.discard(key)
+            self.stats["prefetch_hits"] += 1
+    
+    def discard(self, key: str) -> None:
+        future = self._entries.pop(key, None)
+        self._categories.pop(key, None)
+        self._prefetched.discard(key)
+        if future is not None and not future.done():
+            future.cancel()
+    
+    def invalidate(self, category: ToolCategory) -> int:
+        """쓰기 호출 이후 같은 카테고리의 항목 폐기"""
+        keys = [key for key, cat in self._categories.items() if cat == category]
+        for key in keys:
+            self.discard(key)
+        self.stats["invalidated"] += len(keys)
+        return len(keys)
+    
+    def close(self) -> Dict[str, int]:
+        """남은 진행 중 호출(사용되지 않은 추측 실행 등) 취소 후 통계 반환"""
+        for future in self._entries.values():
+            if not future.done():
+                future.cancel()
+                self.stats["cancelled"] += 1
+        self._entries.clear()
+        self._categories.clear()
+        self._prefetched.clear()
+        return dict(self.stats)
+
+
+# 현재 요청의 메모 (asyncio 태스크 컨텍스트를 따라 전파)
+_current_memo: contextvars.ContextVar[Optional[RequestToolMemo]] = contextvars.ContextVar(
+    "tool_request_memo", default=None
+)
+
+
+class BulkheadFull(Exception):
+    """벌크헤드 대기열이 가득 차 실행을 거절함"""
+    pass
+
+
+class Bulkhead:
+    """
+    도구/카테고리별 격리 구획 (동시 실행 세마포어 + 대기 수 상한)
+    
+    느린 도구가 자기 구획의 슬롯만 점유하도록 하여 다른 도구의 실행을 막지 않습니다.
+    """
+    
+    def __init__(self, name: str, max_concurrency: int, max_queue: Optional[int] = None):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.waiting = 0
+        self.active = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats: Dict[str, float] = {"admitted": 0, "rejected": 0, "wait_total": 0.0, "max_waiting": 0}
+    
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """슬롯 획득 (대기 수 상한을 넘으면 BulkheadFull)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._semaphore.locked() and self.max_queue is not None and self.waiting >= self.max_queue:
+            self.stats["rejected"] += 1
+            raise BulkheadFull(f"'{self.name}' 실행 대기열이 가득 찼습니다 (대기 {self.waiting}건)")
+        
+        queued_at = time.monotonic()
+        self.waiting += 1
+        self.stats["max_waiting"] = max(self.stats["max_waiting"], self.waiting)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.stats["admitted"] += 1
+        self.stats["wait_total"] += time.monotonic() - queued_at
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self._semaphore.release()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        admitted = self.stats["admitted"]
+        return {
+            **self.stats,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "avg_wait": self.stats["wait_total"] / admitted if admitted else 0.0
+        }
+
+
+class WorkerLoopPool:
+    """
+    동기(SYNC) 모드 도구용 상주 이벤트 루프 스레드 풀
+    
+    호출마다 asyncio.run 으로 새 이벤트 루프를 만들지 않고, 워커 스레드마다 하나씩 띄워 둔
+    이벤트 루프에서 코루틴을 실행합니다. 진행 중 작업이 가장 적은 루프로 배정합니다.
+    """
+    
+    def __init__(self, size: int = 2):
+        self.size = max(1, size)
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._threads: List[threading.Thread] = []
+        self._in_flight: List[int] = []
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> None:
+        if self._loops:
+            return
+        for i in range(self.size):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._run_loop, args=(loop,),
+                                      name=f"tool-sync-worker-{i}", daemon=True)
+            thread.start()
+            self._loops.append(loop)
+            self._threads.append(thread)
+            self._in_flight.append(0)
+    
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+    
+    async def run(self, coro: Any, timeout: Optional[float] = None) -> Any:
+        """워커 루프에서 코루틴 실행 (타임아웃/취소 시 워커 쪽 태스크도 취소)"""
+        with self._lock:
+            self._ensure_started()
+            index = min(range(len(self._loops)), key=self._in_flight.__getitem__)
+            self._in_flight[index] += 1
+        future = asyncio.run_coroutine_threadsafe(coro, self._loops[index])
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        finally:
+            if not future.done():
+                future.cancel()
+            with self._lock:
+                self._in_flight[index] -= 1
+    
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """워커 루프 중지 및 스레드 종료 대기"""
+        with self._lock:
+            loops, threads = self._loops, self._threads
+            self._loops, self._threads, self._in_flight = [], [], []
+        for loop in loops:
+            loop.call_soon_threadsafe(loop.stop)
+        for loop, thread in zip(loops, threads):
+            thread.join(timeout=timeout)
+            if not thread.is_alive():
+                loop.close()
+
+
 class ResourceMonitor:
     """리소스 모니터링"""
     
@@ -169,9 +373,21 @@ class ToolExecutor:
     안전하고 효율적인 도구 실행을 담당합니다.
     """
     
-    def __init__(self, registry: Optional[ToolRegistry] = None):
+    def __init__(self, registry: Optional[ToolRegistry] = None,
+                 max_concurrency: Optional[int] = None,
+                 bulkheads: Optional[Dict[str, ResourceLimits]] = None,
+                 sync_workers: int = 2):
+        """
+        Args:
+            registry: 도구 레지스트리 (없으면 전역 레지스트리)
+            max_concurrency: 병렬 실행 시 기본 동시 실행 상한 (None이면 제한 없음)
+            bulkheads: 도구명 또는 카테고리 값별 리소스 제한 (예: {"apple_notes": ResourceLimits(max_concurrency=1, max_queue=4),
+                       "communication": ResourceLimits(max_concurrency=2)}). 도구명 항목이 카테고리 항목보다 우선하며,
+                       실행 시 limits 를 지정하지 않으면 해당 항목이 그 도구의 리소스 제한으로도 쓰입니다.
+            sync_workers: 동기 모드 도구를 실행할 상주 이벤트 루프 워커 수
+        """
         self.registry = registry or get_registry()
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self.sync_workers = WorkerLoopPool(sync_workers)
         self.active_executions: Dict[str, ExecutionContext] = {}
         self.execution_history: List[ExecutionResult] = []
         self.max_history_size = 1000
@@ -179,6 +395,12 @@ class ToolExecutor:
         # 기본 리소스 제한
         self.default_limits = ResourceLimits()
         
+        # 동시성 제한 (벌크헤드 세마포어는 첫 사용 시 생성)
+        self.max_concurrency = max_concurrency if max_concurrency and max_concurrency > 0 else None
+        self.bulkhead_limits: Dict[str, ResourceLimits] = dict(bulkheads or {})
+        self._bulkheads: Dict[str, Bulkhead] = {}
+        self._execution_seq = itertools.count(1)
+        
         # 실행 결과 콜백
         self.result_callbacks: List[Callable[[ExecutionResult], None]] = []
     
@@ -191,6 +413,140 @@ class ToolExecutor:
         if callback in self.result_callbacks:
             self.result_callbacks.remove(callback)
     
+    @contextlib.contextmanager
+    def request_scope(self):
+        """
+        요청 단위 메모 범위 (이미 활성화된 범위가 있으면 그대로 재사용)
+        
+        사용 예:
+            with executor.request_scope() as memo:
+                ...  # 이 안의 execute_tool 호출은 memo를 공유
+            memo.stats
+        """
+        memo = _current_memo.get()
+        if memo is not None:
+            yield memo
+            return
+        memo = RequestToolMemo()
+        token = _current_memo.set(memo)
+        try:
+            yield memo
+        finally:
+            _current_memo.reset(token)
+            memo.close()
+    
+    def prefetch(self, tool_name: str, parameters: Dict[str, Any]) -> bool:
+        """
+        읽기 전용 호출을 현재 요청 메모에 미리 실행해 둠 (결과는 기다리지 않음)
+        
+        Returns:
+            새로 시작했으면 True (메모 범위 밖, 부작용 가능 호출, 이미 메모된 호출이면 False)
+        """
+        memo = _current_memo.get()
+        metadata = self.registry.get_tool_metadata(tool_name)
+        if memo is None or metadata is None or not metadata.is_read_only_call(parameters):
+            return False
+        key = RequestToolMemo.make_key(metadata, parameters)
+        if memo.get(key) is not None:
+            return False
+        memo.put(key, metadata.category, asyncio.ensure_future(self._execute_in_slot(tool_name, parameters)),
+                 prefetched=True)
+        return True
+    
+    async def _execute_memoized(self, tool_name: str, parameters: Dict[str, Any],
+                                run: Callable[[], Any]) -> ExecutionResult:
+        """요청 메모를 거쳐 실행 (메모 범위 밖이면 그대로 실행)"""
+        memo = _current_memo.get()
+        metadata = self.registry.get_tool_metadata(tool_name) if memo is not None else None
+        if metadata is None:
+            return await run()
+        
+        read_only = metadata.is_read_only_call(parameters or {})
+        if not (read_only or metadata.idempotent):
+            # 쓰기 호출: 같은 카테고리의 메모 결과는 더 이상 유효하지 않음
+            memo.invalidate(metadata.category)
+            try:
+                return await run()
+            finally:
+                memo.invalidate(metadata.category)
+        
+        key = RequestToolMemo.make_key(metadata, parameters)
+        future = memo.get(key)
+        if future is not None:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # 호출자 자신이 취소된 경우
+                result = None
+            except Exception:
+                result = None
+            if result is not None and result.result.is_success:
+                memo.mark_hit(key)
+                logger.info(f"요청 메모 결과 재사용: {tool_name}")
+                return dataclasses.replace(result, cached=True)
+            memo.discard(key)
+        
+        memo.stats["misses"] += 1
+        if not read_only:
+            # 멱등 쓰기도 상태는 바꾸므로 같은 카테고리의 읽기 결과는 폐기
+            memo.invalidate(metadata.category)
+        future = asyncio.ensure_future(run())
+        memo.put(key, metadata.category, future)
+        result = await asyncio.shield(future)
+        if not result.result.is_success:
+            memo.discard(key)
+        return result
+    
+    async def _execute_in_slot(self, tool_name: str, parameters: Dict[str, Any],
+                               mode: ExecutionMode = ExecutionMode.ASYNC,
+                               limits: Optional[ResourceLimits] = None,
+                               execution_id: Optional[str] = None,
+                               gate: Any = None) -> ExecutionResult:
+        """도구의 벌크헤드 슬롯(그리고 지정 시 전체 상한)을 잡은 뒤 실행, 대기 시간은 실행 시간과 따로 기록"""
+        bulkhead_name, bulkhead_limits = self._resolve_bulkhead(tool_name)
+        queued_at = time.monotonic()
+        try:
+            async with self._bulkhead_slot(bulkhead_name, bulkhead_limits):
+                async with gate or contextlib.nullcontext():
+                    return await self._run_tool(tool_name, parameters, mode, limits or bulkhead_limits,
+                                                execution_id, queue_wait=time.monotonic() - queued_at)
+        except BulkheadFull as e:
+            logger.warning(f"도구 실행 거절 (벌크헤드 대기열 초과): {tool_name} - {e}")
+            result = ExecutionResult(
+                context=ExecutionContext(
+                    tool_name=tool_name,
+                    parameters=parameters,
+                    execution_id=execution_id or f"{tool_name}_{int(time.time() * 1000)}_{next(self._execution_seq)}",
+                    mode=mode
+                ),
+                result=ToolResult(status=ExecutionStatus.ERROR, error_message=str(e)),
+                warnings=[f"bulkhead_rejected:{bulkhead_name}"],
+                queue_wait_time=time.monotonic() - queued_at
+            )
+            self._add_to_history(result)
+            return result
+    
+    def _resolve_bulkhead(self, tool_name: str) -> Tuple[Optional[str], Optional[ResourceLimits]]:
+        """도구에 적용할 벌크헤드 (도구명 항목 우선, 없으면 카테고리 항목)"""
+        if tool_name in self.bulkhead_limits:
+            return tool_name, self.bulkhead_limits[tool_name]
+        metadata = self.registry.get_tool_metadata(tool_name)
+        category = metadata.category.value if metadata else None
+        if category in self.bulkhead_limits:
+            return category, self.bulkhead_limits[category]
+        return None, None
+    
+    def _bulkhead_slot(self, name: Optional[str], limits: Optional[ResourceLimits]):
+        """벌크헤드 동시 실행 슬롯 (제한이 없으면 빈 컨텍스트)"""
+        if name is None or limits is None or not limits.max_concurrency:
+            return contextlib.nullcontext()
+        bulkhead = self._bulkheads.get(name)
+        if bulkhead is None:
+            bulkhead = Bulkhead(name, limits.max_concurrency, limits.max_queue)
+            self._bulkheads[name] = bulkhead
+        return bulkhead.slot()
+    
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any],
                           mode: ExecutionMode = ExecutionMode.ASYNC,
                           limits: Optional[ResourceLimits] = None,
@@ -208,9 +564,20 @@ class ToolExecutor:
         Returns:
             실행 결과
         """
-        # 실행 컨텍스트 생성
+        return await self._execute_memoized(
+            tool_name, parameters,
+            lambda: self._execute_in_slot(tool_name, parameters, mode, limits, execution_id)
+        )
+    
+    async def _run_tool(self, tool_name: str, parameters: Dict[str, Any],
+                        mode: ExecutionMode = ExecutionMode.ASYNC,
+                        limits: Optional[ResourceLimits] = None,
+                        execution_id: Optional[str] = None,
+                        queue_wait: float = 0.0) -> ExecutionResult:
+        """도구 실행 본체 (동시성 슬롯 획득 이후 호출)"""
+        # 실행 컨텍스트 생성 (병렬 실행 시 ID 충돌 방지를 위해 순번 부여)
         if execution_id is None:
-            execution_id = f"{tool_name}_{int(time.time() * 1000)}"
+            execution_id = f"{tool_name}_{int(time.time() * 1000)}_{next(self._execution_seq)}"
         
         context = ExecutionContext(
             tool_name=tool_name,
@@ -233,7 +600,7 @@ class ToolExecutor:
                     status=ExecutionStatus.ERROR,
                     error_message=f"도구를 찾을 수 없습니다: {tool_name}"
                 )
-                return ExecutionResult(context=context, result=result)
+                return ExecutionResult(context=context, result=result, queue_wait_time=queue_wait)
             
             # 리소스 모니터 설정
             monitor = ResourceMonitor(context.limits)
@@ -259,7 +626,8 @@ class ToolExecutor:
             execution_result = ExecutionResult(
                 context=context,
                 result=result,
-                resource_usage=resource_usage
+                resource_usage=resource_usage,
+                queue_wait_time=queue_wait
             )
             
             # 리소스 위반 경고 추가
@@ -283,7 +651,7 @@ class ToolExecutor:
                 error_message=f"실행 중 예외 발생: {str(e)}"
             )
             
-            execution_result = ExecutionResult(context=context, result=result)
+            execution_result = ExecutionResult(context=context, result=result, queue_wait_time=queue_wait)
             self._add_to_history(execution_result)
             
             return execution_result
@@ -324,18 +692,17 @@ class ToolExecutor:
     
     async def _execute_sync(self, tool: BaseTool, parameters: Dict[str, Any],
                           context: ExecutionContext, monitor: ResourceMonitor) -> ToolResult:
-        """동기 실행 (스레드 풀 사용)"""
+        """동기 실행 (상주 워커 이벤트 루프에서 실행, 호출자 이벤트 루프를 막지 않음)"""
         try:
             timeout = context.limits.max_execution_time or 30
-            
-            # 스레드 풀에서 실행
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self.executor,
-                lambda: asyncio.run(tool.safe_execute(parameters))
+            return await self.sync_workers.run(tool.safe_execute(parameters), timeout=timeout)
+        
+        except asyncio.TimeoutError:
+            logger.error(f"도구 실행 타임아웃: {context.tool_name}")
+            return ToolResult(
+                status=ExecutionStatus.TIMEOUT,
+                error_message=f"실행 타임아웃 ({timeout}초)"
             )
-            
-            return result
         
         except Exception as e:
             logger.error(f"동기 실행 중 예외: {context.tool_name} - {e}")
@@ -345,7 +712,8 @@ class ToolExecutor:
             )
     
     async def execute_multiple(self, executions: List[Dict[str, Any]],
-                             parallel: bool = False) -> List[ExecutionResult]:
+                             parallel: bool = False,
+                             max_concurrency: Optional[int] = None) -> List[ExecutionResult]:
         """
         여러 도구 동시 실행
         
@@ -353,23 +721,33 @@ class ToolExecutor:
             executions: 실행할 도구들의 정보 목록
                 [{"tool_name": "...", "parameters": {...}, ...}, ...]
             parallel: 병렬 실행 여부
+            max_concurrency: 병렬 실행 동시 상한 (None이면 엔진 기본값)
             
         Returns:
-            실행 결과 목록
+            실행 결과 목록 (입력 순서 유지)
         """
         if parallel:
-            # 병렬 실행
-            tasks = []
-            for exec_info in executions:
-                task = self.execute_tool(
-                    tool_name=exec_info["tool_name"],
-                    parameters=exec_info.get("parameters", {}),
-                    mode=exec_info.get("mode", ExecutionMode.ASYNC),
-                    limits=exec_info.get("limits")
+            # 병렬 실행: 도구별 슬롯을 먼저 잡은 뒤 전체 상한을 잡아
+            # 제한된 도구를 기다리는 작업이 다른 도구의 자리를 점유하지 않도록 함
+            limit = max_concurrency if max_concurrency is not None else self.max_concurrency
+            gate = asyncio.Semaphore(limit) if limit and limit > 0 else None
+            
+            async def run(exec_info: Dict[str, Any]) -> ExecutionResult:
+                tool_name = exec_info["tool_name"]
+                parameters = exec_info.get("parameters", {})
+                return await self._execute_memoized(
+                    tool_name, parameters,
+                    lambda: self._execute_in_slot(
+                        tool_name, parameters,
+                        mode=exec_info.get("mode", ExecutionMode.ASYNC),
+                        limits=exec_info.get("limits"),
+                        execution_id=exec_info.get("execution_id"),
+                        gate=gate
+                    )
                 )
-                tasks.append(task)
             
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            results = await asyncio.gather(*(run(exec_info) for exec_info in executions),
+                                           return_exceptions=True)
             
             # 예외 처리
             execution_results = []
@@ -400,7 +778,8 @@ class ToolExecutor:
                     tool_name=exec_info["tool_name"],
                     parameters=exec_info.get("parameters", {}),
                     mode=exec_info.get("mode", ExecutionMode.ASYNC),
-                    limits=exec_info.get("limits")
+                    limits=exec_info.get("limits"),
+                    execution_id=exec_info.get("execution_id")
                 )
                 results.append(result)
             
@@ -460,6 +839,7 @@ class ToolExecutor:
         
         avg_execution_time = sum(r.result.execution_time or 0 
                                for r in self.execution_history) / total_executions
+        avg_queue_wait_time = sum(r.queue_wait_time for r in self.execution_history) / total_executions
         
         return {
             "total_executions": total_executions,
@@ -468,7 +848,9 @@ class ToolExecutor:
             "timeouts": timeouts,
             "success_rate": successful / total_executions * 100,
             "average_execution_time": avg_execution_time,
-            "active_executions": len(self.active_executions)
+            "average_queue_wait_time": avg_queue_wait_time,
+            "active_executions": len(self.active_executions),
+            "bulkheads": {name: bulkhead.get_stats() for name, bulkhead in self._bulkheads.items()}
         }
     
     def _add_to_history(self, result: ExecutionResult) -> None:
@@ -499,8 +881,8 @@ class ToolExecutor:
         for execution_id in active_ids:
             await self.cancel_execution(execution_id)
         
-        # 스레드 풀 종료
-        self.executor.shutdown(wait=True)
+        # 동기 모드 워커 루프 종료
+        self.sync_workers.shutdown()
         
         logger.info("도구 실행 엔진 정리 완료")
 
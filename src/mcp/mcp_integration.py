@@ -8,10 +8,11 @@ AI 엔진과 MCP 도구들을 통합하여 실제 작업을 수행할 수 있도
 import asyncio
 import os
 import json
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, TYPE_CHECKING, Callable, Awaitable
 
 if TYPE_CHECKING:
     from ..integration.legacy_adapter import LegacyMCPAdapter
+    from .apple_client import AppleAppsManager
 from pathlib import Path
 import unicodedata
 import re
@@ -21,13 +22,14 @@ from ..ai_engine.llm_provider import GeminiProvider, MockLLMProvider, ChatMessag
 from ..ai_engine.decision_engine import AgenticDecisionEngine, DecisionContext
 from ..ai_engine.prompt_templates import PromptManager
 from .registry import ToolRegistry
-from .executor import ToolExecutor
+from .executor import ToolExecutor, ResourceLimits
 from .protocol import MCPMessage, MCPRequest, MCPResponse
 from ..config import get_settings
 from ..utils.logger import get_logger
 
 # 새로운 에이전틱 AI 시스템 import
 from ..integration.legacy_adapter import LegacyMCPAdapter
+from ..integration.request_scheduler import FairRequestScheduler, SchedulerOverloadedError
 
 logger = get_logger(__name__)
 
@@ -39,6 +41,8 @@ class MCPIntegration:
     기존 인터페이스를 완전히 유지하면서 내부적으로는 진정한 에이전틱 AI를 사용합니다.
     """
     
+    OVERLOADED_MESSAGE = "이전 요청들을 처리하는 중이에요. 잠시 후 다시 보내주세요."
+    
     def __init__(self):
         self.config = get_settings()
         
@@ -54,11 +58,29 @@ class MCPIntegration:
         )
         
         self.tool_registry = ToolRegistry()
-        self.tool_executor = ToolExecutor(self.tool_registry)
+        self.tool_executor = ToolExecutor(
+            self.tool_registry,
+            max_concurrency=self.config.tool_max_concurrency,
+            bulkheads={
+                name: ResourceLimits(max_concurrency=concurrency, max_queue=queue)
+                for name, (concurrency, queue) in self.config.get_tool_bulkheads().items()
+            },
+            sync_workers=self.config.tool_sync_workers
+        )
         
         # 새로운 에이전틱 AI 어댑터 초기화
         self.agentic_adapter: Optional['LegacyMCPAdapter'] = None  # 지연 초기화
         
+        # Apple MCP 도구가 공유하는 장기 실행 서버 연결 소유자 (cleanup 에서 종료)
+        self.apple_manager: Optional['AppleAppsManager'] = None
+        
+        # 엔진 앞단 동시 요청 스케줄러 (전체 상한 + 사용자별 공정성)
+        self.request_scheduler = FairRequestScheduler(
+            max_concurrent=self.config.request_max_concurrent,
+            max_per_user=self.config.request_max_per_user,
+            max_queue_per_user=self.config.request_max_queue_per_user
+        )
+        
         # 에이전틱 모드 설정 (환경변수로 제어 가능)
         self.agentic_enabled = os.getenv("PAI_AGENTIC_ENABLED", "true").lower() == "true"
         
@@ -124,8 +146,8 @@ class MCPIntegration:
             from .apple_tools import register_apple_tools
             from .apple_client import AppleAppsManager
 
-            apple_manager = AppleAppsManager()
-            apple_tools = register_apple_tools(apple_manager)
+            self.apple_manager = AppleAppsManager()
+            apple_tools = register_apple_tools(self.apple_manager)
 
             registered = 0
             for tool in apple_tools:
@@ -140,6 +162,15 @@ class MCPIntegration:
         except Exception as e:
             logger.warning(f"Apple MCP 도구 등록 건너뜀: {e}")
     
+    async def cleanup(self) -> None:
+        """에이전틱 어댑터, Apple MCP 서버 프로세스, 도구 실행 엔진 정리"""
+        if self.agentic_adapter is not None:
+            await self.agentic_adapter.cleanup()
+        if self.apple_manager is not None:
+            await self.apple_manager.close()
+            self.apple_manager = None
+        await self.tool_executor.cleanup()
+    
     async def process_user_request(
         self,
         user_input: str,
@@ -155,11 +186,16 @@ class MCPIntegration:
             # 새로운 에이전틱 AI 시스템 사용
             await self._ensure_agentic_adapter()
             assert self.agentic_adapter is not None  # 타입 체커를 위한 assertion
-            return await self.agentic_adapter.process_user_request(
-                user_input=user_input,
-                user_id=user_id,
-                conversation_history=conversation_history
-            )
+            try:
+                async with self.request_scheduler.slot(user_id):
+                    return await self.agentic_adapter.process_user_request(
+                        user_input=user_input,
+                        user_id=user_id,
+                        conversation_history=conversation_history
+                    )
+            except SchedulerOverloadedError as e:
+                logger.warning(f"요청 거부: {e}")
+                return self.OVERLOADED_MESSAGE
         else:
             # 기존 방식 (레거시 모드)
             detailed = await self._process_user_request_legacy(
@@ -172,6 +208,7 @@ class MCPIntegration:
         user_input: str,
         user_id: str = "default",
         conversation_history: Optional[List[Dict[str, Any]]] = None,
+        stream_callback: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> Dict[str, Any]:
         """
         사용자 요청 처리 (상세 결과 반환, 에이전틱 AI 업그레이드)
@@ -182,11 +219,17 @@ class MCPIntegration:
             # 새로운 에이전틱 AI 시스템 사용
             await self._ensure_agentic_adapter()
             assert self.agentic_adapter is not None  # 타입 체커를 위한 assertion
-            return await self.agentic_adapter.process_user_request_detailed(
-                user_input=user_input,
-                user_id=user_id,
-                conversation_history=conversation_history
-            )
+            try:
+                async with self.request_scheduler.slot(user_id):
+                    return await self.agentic_adapter.process_user_request_detailed(
+                        user_input=user_input,
+                        user_id=user_id,
+                        conversation_history=conversation_history,
+                        stream_callback=stream_callback
+                    )
+            except SchedulerOverloadedError as e:
+                logger.warning(f"요청 거부: {e}")
+                return {"text": self.OVERLOADED_MESSAGE, "execution": None}
         else:
             # 기존 방식 (레거시 모드)
             return await self._process_user_request_legacy(
@@ -837,7 +880,9 @@ class MCPIntegration:
                 nm = c.get('name','')
                 lines.append(f"- {nm}")
             user = "\n".join(lines)
-            msgs = [ChatMessage(role="system", content=system), ChatMessage(role="user", content=user)]
+            # 사용자가 응답을 기다리는 중인 선택 → interactive 우선순위 (LLM 스케줄러)
+            msgs = [ChatMessage(role="system", content=system, metadata={"priority": "interactive"}),
+                    ChatMessage(role="user", content=user)]
             # 선택 안정화를 위해 temperature=0.0, 그리고 텍스트 MIME으로 강제
             logger.debug(
                 f"Agentic(FS): 후보 선택 프롬프트 — kind={kind}, count={len(candidates)}, question='{question}'"
@@ -1501,6 +1546,7 @@ async def run_integration_test():
         response = await integration.process_user_request(request)
         print(f"AI 비서: {response}")
     
+    await integration.cleanup()
     print("\n✅ MCP 통합 시스템 테스트 완료")
 
 
@@ -7,7 +7,7 @@ MCP 도구 레지스트리
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Type, Set, Callable, Any
+from typing import Dict, List, Optional, Type, Set, Callable, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import importlib
@@ -35,6 +35,30 @@ class ToolRegistration:
         return self.instance is not None and self.instance._initialized
 
 
+@dataclass(frozen=True)
+class ToolCatalogSnapshot:
+    """
+    활성화된 도구 메타데이터의 불변 스냅샷
+    
+    등록/해제/활성화/비활성화 시에만 새 버전이 만들어지므로,
+    호출측은 version 을 키로 프롬프트 등 파생 데이터를 캐싱할 수 있습니다.
+    """
+    version: int
+    tools: Tuple[ToolMetadata, ...] = ()
+    
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """도구 이름 목록 (정렬됨)"""
+        return tuple(md.name for md in self.tools)
+    
+    def get(self, tool_name: str) -> Optional[ToolMetadata]:
+        """이름으로 메타데이터 조회"""
+        for md in self.tools:
+            if md.name == tool_name:
+                return md
+        return None
+
+
 class ToolRegistry:
     """
     도구 레지스트리
@@ -49,6 +73,11 @@ class ToolRegistry:
         self._listeners: List[Callable] = []
         self._lock = asyncio.Lock()
         
+        # 등록 시점에 확보한 메타데이터와 카탈로그 스냅샷
+        self._metadata: Dict[str, ToolMetadata] = {}
+        self._catalog_version = 0
+        self._catalog_snapshot: Optional[ToolCatalogSnapshot] = None
+        
     async def register_tool(self, tool_class: Type[BaseTool], 
                            auto_initialize: bool = True) -> bool:
         """
@@ -87,6 +116,8 @@ class ToolRegistry:
                 
                 # 레지스트리에 등록
                 self._tools[tool_name] = registration
+                self._metadata[tool_name] = metadata
+                self._invalidate_catalog()
                 
                 # 카테고리별 인덱싱
                 if metadata.category not in self._categories:
@@ -133,6 +164,8 @@ class ToolRegistry:
 
                 registration = ToolRegistration(tool_class=instance.__class__, instance=instance)
                 self._tools[tool_name] = registration
+                self._metadata[tool_name] = metadata
+                self._invalidate_catalog()
 
                 # 카테고리/태그 인덱싱
                 if metadata.category not in self._categories:
@@ -174,8 +207,7 @@ class ToolRegistry:
                     await registration.instance.cleanup()
                 
                 # 메타데이터 가져오기
-                temp_instance = registration.tool_class()
-                metadata = temp_instance.metadata
+                metadata = self._metadata.get(tool_name) or registration.tool_class().metadata
                 
                 # 카테고리에서 제거
                 if metadata.category in self._categories:
@@ -192,6 +224,8 @@ class ToolRegistry:
                 
                 # 레지스트리에서 제거
                 del self._tools[tool_name]
+                self._metadata.pop(tool_name, None)
+                self._invalidate_catalog()
                 
                 logger.info(f"도구 등록 해제 완료: {tool_name}")
                 
@@ -253,6 +287,11 @@ class ToolRegistry:
         if tool_name not in self._tools:
             return None
         
+        # 등록 시점에 확보한 메타데이터 재사용 (임시 인스턴스 생성 방지)
+        cached = self._metadata.get(tool_name)
+        if cached is not None:
+            return cached
+        
         registration = self._tools[tool_name]
         
         try:
@@ -297,6 +336,28 @@ class ToolRegistry:
         
         return sorted(list(tools))
     
+    @property
+    def catalog_version(self) -> int:
+        """도구 카탈로그 버전 (등록/해제/활성화/비활성화 시 증가)"""
+        return self._catalog_version
+    
+    def get_catalog_snapshot(self) -> ToolCatalogSnapshot:
+        """활성화된 도구들의 불변 메타데이터 스냅샷 (버전이 바뀔 때만 재생성)"""
+        snapshot = self._catalog_snapshot
+        if snapshot is None or snapshot.version != self._catalog_version:
+            tools = tuple(
+                md for md in (self.get_tool_metadata(name) for name in self.list_tools())
+                if md is not None
+            )
+            snapshot = ToolCatalogSnapshot(version=self._catalog_version, tools=tools)
+            self._catalog_snapshot = snapshot
+        return snapshot
+    
+    def _invalidate_catalog(self) -> None:
+        """카탈로그 변경 시 버전 증가 및 스냅샷 폐기"""
+        self._catalog_version += 1
+        self._catalog_snapshot = None
+    
     def get_categories(self) -> List[ToolCategory]:
         """등록된 도구 카테고리 목록"""
         return sorted(list(self._categories.keys()), key=lambda x: x.value)
@@ -311,6 +372,7 @@ class ToolRegistry:
             return False
         
         self._tools[tool_name].enabled = True
+        self._invalidate_catalog()
         logger.info(f"도구 활성화: {tool_name}")
         return True
     
@@ -321,6 +383,7 @@ class ToolRegistry:
         
         registration = self._tools[tool_name]
         registration.enabled = False
+        self._invalidate_catalog()
         
         # 인스턴스가 있으면 정리
         if registration.instance:
@@ -358,6 +421,7 @@ class ToolRegistry:
         
         return {
             "total_tools": total_tools,
+            "catalog_version": self._catalog_version,
             "enabled_tools": enabled_tools,
             "initialized_tools": initialized_tools,
             "categories": category_counts,
@@ -455,6 +519,8 @@ class ToolRegistry:
             success = await registration.instance.initialize()
             
             if success:
+                self._metadata[tool_name] = registration.instance.metadata
+                self._invalidate_catalog()
                 logger.info(f"도구 재로드 완료: {tool_name}")
             else:
                 logger.error(f"도구 재로드 실패: {tool_name}")
@@ -5,6 +5,7 @@ AI가 과거 행동 패턴을 학습하고 기억하는 RAG 기반 시스템을
 
 주요 컴포넌트:
 - VectorStore: ChromaDB 기반 벡터 데이터베이스
+- EmbeddingCache: 콘텐츠 주소 기반 임베딩 캐시
 - MemoryManager: 기억 생명주기 관리
 - RAGEngine: 검색 증강 생성 엔진
 - MemoryModels: 기억 데이터 구조 정의
@@ -15,13 +16,17 @@ from .models import (
     Memory, MemoryType, ImportanceLevel,
     ActionMemory, ConversationMemory, ProjectMemory, UserPreferenceMemory
 )
-from .embedding_provider import QwenEmbeddingProvider, get_embedding_provider
+from .embedding_provider import QwenEmbeddingProvider, EmbeddingBatchService, get_embedding_provider
+from .embedding_cache import EmbeddingCache
+from .vector_backends import VectorBackend, ChromaBackend, NumpyBackend, create_vector_backend
 
 __all__ = [
     "VectorStore", "VectorDocument", "CollectionType",
     "Memory", "MemoryType", "ImportanceLevel", 
     "ActionMemory", "ConversationMemory", "ProjectMemory", "UserPreferenceMemory",
-    "QwenEmbeddingProvider", "get_embedding_provider"
+    "QwenEmbeddingProvider", "EmbeddingBatchService", "get_embedding_provider",
+    "EmbeddingCache",
+    "VectorBackend", "ChromaBackend", "NumpyBackend", "create_vector_backend"
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,300 @@
+"""
+임베딩 캐시 - 콘텐츠 주소 기반 (content-addressed)
+
+모델명 + 정규화된 텍스트의 해시를 키로 임베딩을 캐싱합니다.
+메모리에는 LRU로 최근 항목만 유지하고, 모든 항목은 디스크의
+메모리 맵(float32) 파일에 기록되어 재시작 후에도 재사용됩니다.
+
+디스크 구성 (cache_dir):
+- vectors.f32: (capacity, dim) float32 행렬 (np.memmap)
+- index.tsv:   "키<TAB>행 번호" 추가 전용 로그
+- meta.json:   임베딩 차원 정보
+"""
+
+import hashlib
+import json
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC + 공백 정리)"""
+    if not text:
+        return ""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(model_name: str, text: str) -> str:
+    """모델명과 정규화된 텍스트로 캐시 키 생성"""
+    payload = f"{model_name}\x00{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    LRU 메모리 캐시 + 메모리 맵 디스크 저장소
+
+    특징:
+    - 같은 모델/텍스트에 대해 트랜스포머 추론을 한 번만 수행
+    - 메모리에서 밀려난 항목도 디스크에서 다시 읽어옴
+    - 히트/미스 통계 제공
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    INDEX_FILE = "index.tsv"
+    META_FILE = "meta.json"
+
+    def __init__(self,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_memory_entries: int = 2048,
+                 max_disk_entries: int = 200_000):
+        """
+        임베딩 캐시 초기화
+
+        Args:
+            cache_dir: 디스크 캐시 경로 (None이면 메모리 전용)
+            max_memory_entries: 메모리에 유지할 최대 항목 수
+            max_disk_entries: 디스크에 기록할 최대 항목 수
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.logger = get_logger("embedding_cache")
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._disk_index: Dict[str, int] = {}
+        self._next_row = 0  # 다음에 기록할 행 (로드 시 건너뛴 줄이 있어도 사용 중인 행과 겹치지 않도록 최대 행 + 1)
+        self._dim: Optional[int] = None
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._index_file = None
+        self._disk_full_logged = False
+        self._lock = threading.RLock()
+
+        # 통계
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.cache_dir is not None:
+            self._load()
+
+    # ---- 조회/저장 ----
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """캐시된 임베딩 조회"""
+        return self.get_by_key(make_cache_key(model_name, text))
+
+    def put(self, model_name: str, text: str, embedding: Any) -> None:
+        """임베딩 저장"""
+        self.put_by_key(make_cache_key(model_name, text), embedding)
+
+    def get_by_key(self, key: str) -> Optional[np.ndarray]:
+        """키로 캐시된 임베딩 조회"""
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return vector
+
+            row = self._disk_index.get(key)
+            if row is not None and self._vectors is not None:
+                # 디스크에서 읽어 메모리로 승격
+                vector = np.array(self._vectors[row], dtype=np.float32)
+                self._remember(key, vector)
+                self.disk_hits += 1
+                return vector
+
+            self.misses += 1
+            return None
+
+    def put_by_key(self, key: str, embedding: Any) -> None:
+        """키로 임베딩 저장"""
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if vector.size == 0:
+            return
+
+        with self._lock:
+            self._remember(key, vector)
+            if self.cache_dir is not None and key not in self._disk_index:
+                self._spill(key, vector)
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        """메모리 LRU에 추가"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # ---- 디스크 저장소 ----
+
+    def _load(self) -> None:
+        """디스크 캐시 로드"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            meta_path = self.cache_dir / self.META_FILE
+            vectors_path = self.cache_dir / self.VECTORS_FILE
+            index_path = self.cache_dir / self.INDEX_FILE
+
+            if meta_path.exists() and vectors_path.exists():
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                self._dim = int(meta["dim"])
+                row_bytes = self._dim * np.dtype(np.float32).itemsize
+                self._capacity = vectors_path.stat().st_size // row_bytes
+
+                if self._capacity > 0:
+                    self._vectors = np.memmap(
+                        vectors_path, dtype=np.float32, mode="r+",
+                        shape=(self._capacity, self._dim)
+                    )
+
+                if index_path.exists():
+                    with open(index_path, "r", encoding="utf-8") as f:
+                        for line in f:
+                            parts = line.rstrip("\n").split("\t")
+                            if not line.endswith("\n") or len(parts) != 2 or not parts[1].isdigit():
+                                continue  # 중단된 쓰기로 잘린 줄
+                            row = int(parts[1])
+                            self._next_row = max(self._next_row, row + 1)
+                            if row < self._capacity:
+                                self._disk_index[parts[0]] = row
+
+            self._index_file = open(index_path, "a", encoding="utf-8")
+            self.logger.info(f"임베딩 캐시 로드: {len(self._disk_index)}개 항목 ({self.cache_dir})")
+
+        except Exception as e:
+            self.logger.warning(f"임베딩 캐시 로드 실패, 디스크 캐시 초기화: {e}")
+            self._reset_disk()
+
+    def _reset_disk(self) -> None:
+        """손상되었거나 차원이 맞지 않는 디스크 캐시 초기화"""
+        self._close_files()
+        self._disk_index.clear()
+        self._next_row = 0
+        self._dim = None
+        self._capacity = 0
+        for name in (self.VECTORS_FILE, self.INDEX_FILE, self.META_FILE):
+            path = self.cache_dir / name
+            if path.exists():
+                path.unlink()
+        self._index_file = open(self.cache_dir / self.INDEX_FILE, "a", encoding="utf-8")
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """필요 시 메모리 맵 파일 확장 (2배씩)"""
+        if rows <= self._capacity:
+            return
+
+        new_capacity = min(max(rows, self._capacity * 2, 1024), self.max_disk_entries)
+        vectors_path = self.cache_dir / self.VECTORS_FILE
+
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+
+        with open(vectors_path, "ab") as f:
+            f.truncate(new_capacity * self._dim * np.dtype(np.float32).itemsize)
+
+        self._vectors = np.memmap(
+            vectors_path, dtype=np.float32, mode="r+", shape=(new_capacity, self._dim)
+        )
+        self._capacity = new_capacity
+
+    def _spill(self, key: str, vector: np.ndarray) -> None:
+        """디스크에 임베딩 기록"""
+        try:
+            if self._dim is None:
+                self._dim = int(vector.size)
+                (self.cache_dir / self.META_FILE).write_text(
+                    json.dumps({"dim": self._dim}), encoding="utf-8"
+                )
+            elif vector.size != self._dim:
+                self.logger.warning(
+                    f"임베딩 차원 변경 감지 ({self._dim} -> {vector.size}), 디스크 캐시 초기화"
+                )
+                self._reset_disk()
+                self._spill(key, vector)
+                return
+
+            row = self._next_row
+            if row >= self.max_disk_entries:
+                if not self._disk_full_logged:
+                    self.logger.warning(f"디스크 임베딩 캐시 용량 도달: {self.max_disk_entries}개")
+                    self._disk_full_logged = True
+                return
+
+            self._ensure_capacity(row + 1)
+            self._vectors[row] = vector
+            # 벡터를 먼저 디스크에 반영해야 중단 시 인덱스가 빈(0) 행을 가리키지 않음
+            self._vectors.flush()
+            self._next_row = row + 1
+            self._index_file.write(f"{key}\t{row}\n")
+            self._index_file.flush()
+            self._disk_index[key] = row
+
+        except Exception as e:
+            self.logger.error(f"임베딩 캐시 디스크 기록 실패: {e}")
+
+    def flush(self) -> None:
+        """디스크에 변경 사항 반영"""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+            if self._index_file is not None:
+                self._index_file.flush()
+
+    def _close_files(self) -> None:
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def close(self) -> None:
+        """캐시 파일 닫기"""
+        with self._lock:
+            self._close_files()
+
+    def clear(self) -> None:
+        """메모리 및 디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._memory.clear()
+            if self.cache_dir is not None:
+                self._reset_disk()
+            self.memory_hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    # ---- 통계 ----
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 히트/미스 통계 반환"""
+        hits = self.memory_hits + self.disk_hits
+        total_requests = hits + self.misses
+        return {
+            "memory_size": len(self._memory),
+            "max_memory_entries": self.max_memory_entries,
+            "disk_size": len(self._disk_index),
+            "max_disk_entries": self.max_disk_entries,
+            "dimension": self._dim,
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (hits / total_requests * 100) if total_requests > 0 else 0
+        }
+
+    def __len__(self) -> int:
+        return len(set(self._memory) | set(self._disk_index))
@@ -3,11 +3,15 @@
 
 Qwen/Qwen3-Embedding-0.6B 모델을 사용하여 텍스트를 벡터로 변환합니다.
 효율적인 메모리 사용과 배치 처리를 지원합니다.
+모델 추론은 전용 워커 스레드에서 실행되며, 동시에 들어온 요청은 마이크로 배치로 묶입니다.
 """
 
 import asyncio
+import time
 import torch
-from typing import List, Optional, Union
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from datetime import datetime
@@ -17,6 +21,172 @@ import gc
 from ..utils.logger import get_logger
 
 
+class EmbeddingBatchService:
+    """
+    임베딩 마이크로 배치 서비스
+    
+    동시에 들어온 단일 텍스트 요청을 큐에 모아 최대 배치 크기 또는 최대 대기 시간에
+    도달하면 한 번의 모델 호출로 처리합니다. 모델 호출은 전용 워커 스레드에서 실행되므로
+    이벤트 루프(Discord 등)를 막지 않습니다.
+    """
+    
+    def __init__(self,
+                 encode_fn: Callable[[List[str]], np.ndarray],
+                 max_batch_size: int = 32,
+                 max_wait_ms: float = 5.0,
+                 name: str = "embedding"):
+        """
+        Args:
+            encode_fn: 텍스트 리스트를 (N, D) float32 배열로 변환하는 동기 함수
+            max_batch_size: 한 번에 처리할 최대 텍스트 수
+            max_wait_ms: 첫 요청 이후 배치를 채우기 위해 기다리는 최대 시간 (밀리초)
+            name: 워커 스레드 이름 접두사
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max(0.0, max_wait_ms)
+        self.name = name
+        
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        
+        # 통계
+        self.batch_count = 0
+        self.item_count = 0
+        self.max_queue_depth = 0
+        self.total_encode_time = 0.0
+        self.total_wait_time = 0.0
+        self.batch_size_histogram: Counter = Counter()
+    
+    @property
+    def queue_depth(self) -> int:
+        """처리 대기 중인 요청 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """모델 추론 전용 단일 워커 스레드"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+        return self._executor
+    
+    def _ensure_worker(self):
+        """현재 이벤트 루프에 배치 워커 태스크 준비"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker_task is None or self._worker_task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker_task = loop.create_task(self._batch_loop())
+    
+    async def submit(self, text: str) -> np.ndarray:
+        """단일 텍스트를 배치 큐에 넣고 임베딩 결과를 기다림"""
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, future, time.perf_counter()))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return await future
+    
+    async def encode_many(self, texts: List[str]) -> np.ndarray:
+        """이미 묶인 텍스트 리스트를 큐를 거치지 않고 워커 스레드에서 인코딩"""
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        loop = asyncio.get_running_loop()
+        chunks = []
+        for start in range(0, len(texts), self.max_batch_size):
+            chunk = texts[start:start + self.max_batch_size]
+            chunks.append(await loop.run_in_executor(self._get_executor(), self._run_batch, chunk))
+        return np.concatenate(chunks, axis=0) if len(chunks) > 1 else chunks[0]
+    
+    def _run_batch(self, texts: List[str]) -> np.ndarray:
+        """워커 스레드에서 실행되는 배치 인코딩"""
+        started = time.perf_counter()
+        embeddings = np.asarray(self.encode_fn(texts), dtype=np.float32)
+        if embeddings.ndim == 1:
+            embeddings = embeddings.reshape(1, -1)
+        
+        self.total_encode_time += time.perf_counter() - started
+        self.batch_count += 1
+        self.item_count += len(texts)
+        self.batch_size_histogram[len(texts)] += 1
+        return embeddings
+    
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future, float]]:
+        """첫 요청을 기다린 뒤 max_wait_ms 동안 배치를 채움"""
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        
+        while len(batch) < self.max_batch_size:
+            # 이미 쌓여 있는 요청은 기다리지 않고 바로 가져옴
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _batch_loop(self):
+        """큐에서 요청을 모아 워커 스레드로 전달하는 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            
+            # 이미 취소된 요청은 인코딩하지 않음
+            batch = [item for item in batch if not item[1].done()]
+            if not batch:
+                continue
+            
+            now = time.perf_counter()
+            self.total_wait_time += sum(now - enqueued for _, _, enqueued in batch)
+            
+            texts = [text for text, _, _ in batch]
+            try:
+                embeddings = await loop.run_in_executor(self._get_executor(), self._run_batch, texts)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for row, (_, future, _) in zip(embeddings, batch):
+                if not future.done():
+                    future.set_result(row)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 깊이와 배치 크기 통계"""
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "batch_count": self.batch_count,
+            "item_count": self.item_count,
+            "avg_batch_size": self.item_count / self.batch_count if self.batch_count else 0.0,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "avg_encode_ms": (self.total_encode_time / self.batch_count * 1000) if self.batch_count else 0.0,
+            "avg_queue_wait_ms": (self.total_wait_time / self.item_count * 1000) if self.item_count else 0.0
+        }
+    
+    async def close(self):
+        """워커 태스크와 스레드 종료"""
+        if self._worker_task is not None and not self._worker_task.done():
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+        self._worker_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
 class QwenEmbeddingProvider:
     """
     Qwen3-Embedding-0.6B 모델을 사용한 임베딩 제공자
@@ -24,15 +194,21 @@ class QwenEmbeddingProvider:
     특징:
     - 0.6B 파라미터로 빠른 추론 속도
     - 높은 품질의 임베딩 생성
-    - 배치 처리 지원
+    - 배치 처리 지원 (동시 요청 마이크로 배치)
+    - 전용 워커 스레드에서 추론 (이벤트 루프 비차단)
     - 메모리 효율적 관리
     """
     
+    # 지정한 모델 로딩 실패 시 사용하는 기본 모델
+    FALLBACK_MODEL_NAME = "all-MiniLM-L6-v2"
+    
     def __init__(self, 
                  model_name: str = "Qwen/Qwen2.5-Coder-0.5B-Instruct",  # 실제 사용 가능한 모델명
                  device: Optional[str] = None,
                  cache_dir: Optional[str] = None,
-                 max_seq_length: int = 512):
+                 max_seq_length: int = 512,
+                 max_batch_size: int = 32,
+                 max_wait_ms: float = 5.0):
         """
         임베딩 제공자 초기화
         
@@ -41,6 +217,8 @@ class QwenEmbeddingProvider:
             device: 사용할 디바이스 (cuda, mps, cpu)
             cache_dir: 모델 캐시 디렉터리
             max_seq_length: 최대 시퀀스 길이
+            max_batch_size: 마이크로 배치 최대 크기
+            max_wait_ms: 마이크로 배치를 채우기 위한 최대 대기 시간 (밀리초)
         """
         self.model_name = model_name
         self.max_seq_length = max_seq_length
@@ -59,9 +237,18 @@ class QwenEmbeddingProvider:
             self.device = device
         
         self.model: Optional[SentenceTransformer] = None
+        # 실제로 로드된 모델명 (로딩 실패 시 폴백 모델명, 임베딩 캐시 키에 사용)
+        self.loaded_model_name: Optional[str] = None
         self._model_lock = threading.Lock()
         self._is_loaded = False
         
+        self._service = EmbeddingBatchService(
+            self._encode_sync,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            name="qwen_embedding"
+        )
+        
         self.logger.info(f"Qwen 임베딩 제공자 초기화: {model_name} on {self.device}")
     
     async def initialize(self):
@@ -86,12 +273,15 @@ class QwenEmbeddingProvider:
                     if hasattr(model, 'max_seq_length'):
                         model.max_seq_length = self.max_seq_length
                     
+                    self.loaded_model_name = self.model_name
                     return model
                 except Exception as e:
                     self.logger.warning(f"SentenceTransformer 로딩 실패: {e}")
                     # 폴백: 기본 임베딩 모델 사용
-                    self.logger.info("기본 임베딩 모델로 폴백")
-                    return SentenceTransformer('all-MiniLM-L6-v2', device=self.device)
+                    self.logger.info(f"기본 임베딩 모델로 폴백: {self.FALLBACK_MODEL_NAME}")
+                    model = SentenceTransformer(self.FALLBACK_MODEL_NAME, device=self.device)
+                    self.loaded_model_name = self.FALLBACK_MODEL_NAME
+                    return model
             
             # 비동기로 모델 로딩
             loop = asyncio.get_event_loop()
@@ -104,15 +294,35 @@ class QwenEmbeddingProvider:
             self.logger.error(f"모델 초기화 실패: {e}")
             raise
     
-    async def encode_text(self, text: str) -> Optional[List[float]]:
+    def _encode_sync(self, texts: List[str]) -> np.ndarray:
+        """워커 스레드에서 실행되는 모델 추론"""
+        with self._model_lock:
+            # GPU 메모리 정리
+            if self.device in ['cuda', 'mps']:
+                torch.cuda.empty_cache() if self.device == 'cuda' else None
+            
+            embeddings = self.model.encode(
+                texts,
+                convert_to_tensor=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+                batch_size=min(32, len(texts))  # 메모리 효율성
+            )
+        
+        return np.asarray(embeddings, dtype=np.float32)
+    
+    async def encode_text(self, text: str) -> Optional[np.ndarray]:
         """
         단일 텍스트를 인코딩
         
+        동시에 호출된 요청들은 마이크로 배치로 묶여 워커 스레드에서 처리됩니다.
+        
         Args:
             text: 인코딩할 텍스트
             
         Returns:
-            임베딩 벡터 또는 None
+            float32 임베딩 벡터 또는 None
         """
         if not self._is_loaded:
             await self.initialize()
@@ -121,32 +331,15 @@ class QwenEmbeddingProvider:
             # 텍스트 전처리
             text = self._preprocess_text(text)
             
-            # 인코딩 실행
-            with self._model_lock:
-                # GPU 메모리 정리
-                if self.device in ['cuda', 'mps']:
-                    torch.cuda.empty_cache() if self.device == 'cuda' else None
-                
-                # 임베딩 생성
-                embedding = self.model.encode(
-                    text,
-                    convert_to_tensor=False,
-                    normalize_embeddings=True,
-                    show_progress_bar=False
-                )
-                
-                # numpy array를 list로 변환
-                if isinstance(embedding, np.ndarray):
-                    embedding = embedding.tolist()
-                
-                self.logger.debug(f"임베딩 생성 완료: {len(embedding)} 차원")
-                return embedding
+            embedding = await self._service.submit(text)
+            self.logger.debug(f"임베딩 생성 완료: {len(embedding)} 차원")
+            return embedding
                 
         except Exception as e:
             self.logger.error(f"텍스트 인코딩 실패: {e}")
             return None
     
-    async def encode_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+    async def encode_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
         """
         배치 텍스트 인코딩
         
@@ -154,40 +347,23 @@ class QwenEmbeddingProvider:
             texts: 인코딩할 텍스트 리스트
             
         Returns:
-            임베딩 벡터 리스트
+            float32 임베딩 벡터 리스트
         """
         if not self._is_loaded:
             await self.initialize()
         
+        if not texts:
+            return []
+        
         try:
             # 텍스트 전처리
             processed_texts = [self._preprocess_text(text) for text in texts]
             
-            # 배치 인코딩 실행
-            with self._model_lock:
-                # GPU 메모리 정리
-                if self.device in ['cuda', 'mps']:
-                    torch.cuda.empty_cache() if self.device == 'cuda' else None
-                
-                # 배치 임베딩 생성
-                embeddings = self.model.encode(
-                    processed_texts,
-                    convert_to_tensor=False,
-                    normalize_embeddings=True,
-                    show_progress_bar=False,
-                    batch_size=min(32, len(processed_texts))  # 메모리 효율성
-                )
-                
-                # numpy arrays를 lists로 변환
-                result = []
-                for embedding in embeddings:
-                    if isinstance(embedding, np.ndarray):
-                        result.append(embedding.tolist())
-                    else:
-                        result.append(embedding)
-                
-                self.logger.debug(f"배치 임베딩 생성 완료: {len(result)}개 텍스트")
-                return result
+            embeddings = await self._service.encode_many(processed_texts)
+            result = list(embeddings)
+            
+            self.logger.debug(f"배치 임베딩 생성 완료: {len(result)}개 텍스트")
+            return result
                 
         except Exception as e:
             self.logger.error(f"배치 인코딩 실패: {e}")
@@ -217,7 +393,7 @@ class QwenEmbeddingProvider:
         try:
             # 테스트 텍스트로 차원 확인
             test_embedding = await self.encode_text("test")
-            return len(test_embedding) if test_embedding else 0
+            return len(test_embedding) if test_embedding is not None else 0
         except Exception as e:
             self.logger.error(f"임베딩 차원 확인 실패: {e}")
             return 0
@@ -226,15 +402,22 @@ class QwenEmbeddingProvider:
         """모델 정보 반환"""
         return {
             "model_name": self.model_name,
+            "loaded_model_name": self.loaded_model_name,
             "device": self.device,
             "max_seq_length": self.max_seq_length,
             "is_loaded": self._is_loaded,
             "cache_dir": self.cache_dir
         }
     
+    def get_service_stats(self) -> Dict[str, Any]:
+        """임베딩 서비스 큐 깊이 및 배치 크기 통계"""
+        return self._service.get_stats()
+    
     async def cleanup(self):
         """리소스 정리"""
         try:
+            await self._service.close()
+            
             if self.model is not None:
                 with self._model_lock:
                     # 모델 메모리 해제
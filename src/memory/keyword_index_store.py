@@ -0,0 +1,138 @@
+"""
+키워드 인덱스 저장소 - SQLite 기반
+
+BM25 키워드 인덱스(문서 길이, 포스팅별 TF)를 디스크에 저장합니다.
+재시작 시 ChromaDB에서 다시 읽어 토큰화할 필요 없이 저장된 포스팅을 그대로 불러옵니다.
+
+테이블 구성:
+- kw_documents: doc_id, content, length, metadata(JSON)
+- kw_postings:  token, doc_id, tf  (WITHOUT ROWID, token 기준 클러스터링)
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from ..utils.logger import get_logger
+
+
+class KeywordIndexStore:
+    """BM25 키워드 인덱스의 SQLite 영속 저장소"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS kw_documents (
+            doc_id   TEXT PRIMARY KEY,
+            content  TEXT NOT NULL,
+            length   INTEGER NOT NULL,
+            metadata TEXT NOT NULL DEFAULT '{}'
+        );
+        CREATE TABLE IF NOT EXISTS kw_postings (
+            token  TEXT NOT NULL,
+            doc_id TEXT NOT NULL,
+            tf     INTEGER NOT NULL,
+            PRIMARY KEY (token, doc_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_kw_postings_doc ON kw_postings(doc_id);
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.logger = get_logger("keyword_index_store")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """지연 연결 (첫 사용 시 스키마 생성)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    def upsert_document(self,
+                        doc_id: str,
+                        content: str,
+                        length: int,
+                        term_freqs: Dict[str, int],
+                        metadata: Optional[Dict[str, Any]] = None) -> None:
+        """문서와 포스팅 저장 (기존 문서는 교체)"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM kw_postings WHERE doc_id = ?", (doc_id,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO kw_documents (doc_id, content, length, metadata) "
+                    "VALUES (?, ?, ?, ?)",
+                    (doc_id, content, length, json.dumps(metadata or {}, ensure_ascii=False, default=str))
+                )
+                conn.executemany(
+                    "INSERT INTO kw_postings (token, doc_id, tf) VALUES (?, ?, ?)",
+                    [(token, doc_id, tf) for token, tf in term_freqs.items()]
+                )
+
+    def delete_document(self, doc_id: str) -> None:
+        """문서와 포스팅 삭제"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM kw_postings WHERE doc_id = ?", (doc_id,))
+                conn.execute("DELETE FROM kw_documents WHERE doc_id = ?", (doc_id,))
+
+    def clear(self) -> None:
+        """모든 인덱스 데이터 삭제"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM kw_postings")
+                conn.execute("DELETE FROM kw_documents")
+
+    def iter_documents(self) -> Iterator[Tuple[str, str, int, Dict[str, Any]]]:
+        """저장된 문서 순회: (doc_id, content, length, metadata)"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT doc_id, content, length, metadata FROM kw_documents"
+            ).fetchall()
+        for doc_id, content, length, metadata in rows:
+            yield doc_id, content, length, json.loads(metadata) if metadata else {}
+
+    def iter_postings(self) -> Iterator[Tuple[str, str, int]]:
+        """저장된 포스팅 순회 (token 순서): (token, doc_id, tf)"""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT token, doc_id, tf FROM kw_postings"
+            ).fetchall()
+        yield from rows
+
+    def count(self) -> int:
+        """저장된 문서 수"""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM kw_documents").fetchone()[0]
+
+    def snapshot(self, target_path: Union[str, Path]) -> Path:
+        """온라인 백업 API로 현재 인덱스 스냅샷 생성"""
+        target = Path(target_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            source = self._connect()
+            destination = sqlite3.connect(str(target))
+            try:
+                source.backup(destination)
+            finally:
+                destination.close()
+        self.logger.info(f"키워드 인덱스 스냅샷 생성: {target}")
+        return target
+
+    def close(self) -> None:
+        """연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
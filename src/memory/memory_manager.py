@@ -180,13 +180,13 @@ class MemoryManager:
             
             logger.info(f"기억 추가 성공: ID={memory.id}, 중요도={memory.metadata.importance_level.value}")
             
-            # RAG 엔진에 인덱싱 (일시적으로 비활성화)
-            # if self.rag_engine:
-            #     try:
-            #         await self.rag_engine.index_memory(memory)
-            #     except Exception as e:
-            #         logger.warning(f"RAG 인덱싱 실패: {e}")
-            #         # RAG 인덱싱 실패해도 기억 추가는 계속 진행
+            # RAG 키워드 인덱스 증분 갱신 (벡터는 위에서 이미 저장됨)
+            if self.rag_engine:
+                try:
+                    self.rag_engine.index_keywords(memory)
+                except Exception as e:
+                    logger.warning(f"RAG 인덱싱 실패: {e}")
+                    # RAG 인덱싱 실패해도 기억 추가는 계속 진행
             
             # 스토리지 용량 체크
             await self._check_storage_limits()
@@ -198,6 +198,67 @@ class MemoryManager:
             logger.error(f"기억 추가 중 오류: {e}")
             raise
     
+    async def add_memories(self, memories: List[BaseMemory]) -> List[str]:
+        """
+        여러 기억을 한 번에 추가 (대화 백필, 공지 아카이브 등 대량 입력용)
+        
+        컬렉션별로 묶어 한 번의 배치 임베딩과 컬렉션당 한 번의 add로 저장하고,
+        스토리지 한계 확인은 배치당 한 번만 수행합니다.
+        
+        Args:
+            memories: 추가할 기억 리스트
+            
+        Returns:
+            추가에 성공한 기억 ID 리스트
+        """
+        if not memories:
+            return []
+        
+        logger.debug(f"기억 일괄 추가 시작: {len(memories)}개")
+        
+        try:
+            # 자동 중요도 계산 및 컬렉션별 그룹화
+            documents_by_collection: Dict[CollectionType, List[VectorDocument]] = defaultdict(list)
+            for memory in memories:
+                if memory.metadata.importance_score == 0.0:
+                    memory.metadata.importance_score = await self._calculate_importance(memory)
+                    memory.metadata.importance_level = self._score_to_level(
+                        memory.metadata.importance_score
+                    )
+                
+                collection_type = self.type_to_collection.get(
+                    memory.memory_type,
+                    CollectionType.ACTION_MEMORY
+                )
+                documents_by_collection[collection_type].append(self._memory_to_vector_doc(memory))
+            
+            added_ids = await self.vector_store.add_documents(documents_by_collection)
+            
+            added = set(added_ids)
+            failed = [memory.id for memory in memories if memory.id not in added]
+            if failed:
+                logger.error(f"벡터 스토어 일괄 추가 실패: {len(failed)}개 ({failed[:5]})")
+            
+            # RAG 키워드 인덱스 증분 갱신
+            if self.rag_engine:
+                for memory in memories:
+                    if memory.id not in added:
+                        continue
+                    try:
+                        self.rag_engine.index_keywords(memory)
+                    except Exception as e:
+                        logger.warning(f"RAG 인덱싱 실패: {e}")
+            
+            # 스토리지 용량 체크 (배치당 한 번)
+            await self._check_storage_limits()
+            
+            logger.info(f"기억 일괄 추가 완료: {len(added_ids)}/{len(memories)}개")
+            return [memory.id for memory in memories if memory.id in added]
+            
+        except Exception as e:
+            logger.error(f"기억 일괄 추가 중 오류: {e}")
+            raise
+    
     def _memory_to_vector_doc(self, memory: BaseMemory) -> VectorDocument:
         """BaseMemory를 VectorDocument로 변환"""
         metadata = {
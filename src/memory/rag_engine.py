@@ -7,6 +7,7 @@ RAG 검색 엔진 - Step 4.3
 
 import re
 import math
+import heapq
 from collections import Counter, defaultdict
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -17,6 +18,7 @@ import numpy as np
 # 로컬 모듈
 from .vector_store import VectorStore, VectorDocument, CollectionType
 from .embedding_provider import QwenEmbeddingProvider
+from .keyword_index_store import KeywordIndexStore
 from .enhanced_models import (
     BaseMemory, ActionMemory, ConversationMemory, PreferenceMemory,
     MemoryType, ImportanceLevel, ActionType, MetadataSchema
@@ -94,39 +96,110 @@ class SearchQuery:
 
 
 class KeywordSearchEngine:
-    """키워드 기반 검색 엔진 (BM25 알고리즘)"""
-    
-    def __init__(self):
-        self.documents: List[Dict[str, Any]] = []
-        self.index: Dict[str, List[int]] = defaultdict(list)
-        self.document_lengths: List[int] = []
-        self.avg_doc_length: float = 0.0
+    """키워드 기반 검색 엔진 (BM25 알고리즘)
+    
+    역색인(inverted index)의 포스팅에 문서별 용어 빈도(TF)를 미리 저장하고,
+    코퍼스 통계(문서 수, 전체 길이)는 추가/삭제 시 O(1)로 갱신합니다.
+    store가 주어지면 변경 사항을 디스크에 즉시 기록하고, 첫 사용 시 저장된
+    포스팅을 그대로 불러옵니다 (재토큰화 없음).
+    """
+    
+    def __init__(self, store: Optional[KeywordIndexStore] = None):
+        self.store = store
+        self._loaded = store is None
+        # doc_id -> {'id', 'content', 'length', 'metadata', 'term_freqs'}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        # token -> {doc_id: tf}
+        self.index: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self.total_length: int = 0
         self.k1: float = 1.5  # BM25 파라미터
         self.b: float = 0.75  # BM25 파라미터
     
+    @property
+    def avg_doc_length(self) -> float:
+        """평균 문서 길이"""
+        return self.total_length / len(self.documents) if self.documents else 0.0
+    
+    def _ensure_loaded(self):
+        """저장소에서 인덱스 지연 로드"""
+        if self._loaded:
+            return
+        self._loaded = True
+        
+        for doc_id, content, length, metadata in self.store.iter_documents():
+            self.documents[doc_id] = {
+                'id': doc_id,
+                'content': content,
+                'length': length,
+                'metadata': metadata,
+                'term_freqs': {}
+            }
+            self.total_length += length
+        
+        for token, doc_id, tf in self.store.iter_postings():
+            doc = self.documents.get(doc_id)
+            if doc is None:
+                continue
+            doc['term_freqs'][token] = tf
+            self.index[token][doc_id] = tf
+    
     def add_document(self, doc_id: str, content: str, metadata: Optional[Dict[str, Any]] = None):
-        """문서 추가"""
+        """문서 추가 (같은 ID가 있으면 교체)"""
+        self._ensure_loaded()
+        if doc_id in self.documents:
+            self._remove_from_memory(doc_id)
+        
         tokens = self._tokenize(content)
-        doc_length = len(tokens)
+        term_freqs = Counter(tokens)
         
-        doc_info = {
+        self.documents[doc_id] = {
             'id': doc_id,
             'content': content,
-            'tokens': tokens,
-            'length': doc_length,
-            'metadata': metadata or {}
+            'length': len(tokens),
+            'metadata': metadata or {},
+            'term_freqs': term_freqs
         }
-        
-        doc_index = len(self.documents)
-        self.documents.append(doc_info)
-        self.document_lengths.append(doc_length)
-        
-        # 인덱스 업데이트
-        for token in set(tokens):
-            self.index[token].append(doc_index)
-        
-        # 평균 문서 길이 업데이트
-        self.avg_doc_length = sum(self.document_lengths) / len(self.document_lengths)
+        self.total_length += len(tokens)
+        
+        # 인덱스 업데이트 (포스팅에 TF 저장)
+        for token, tf in term_freqs.items():
+            self.index[token][doc_id] = tf
+        
+        if self.store is not None:
+            self.store.upsert_document(doc_id, content, len(tokens), term_freqs, metadata)
+    
+    def update_document(self, doc_id: str, content: str, metadata: Optional[Dict[str, Any]] = None):
+        """문서 갱신"""
+        self.add_document(doc_id, content, metadata)
+    
+    def remove_document(self, doc_id: str) -> bool:
+        """문서 삭제"""
+        self._ensure_loaded()
+        removed = self._remove_from_memory(doc_id)
+        if removed and self.store is not None:
+            self.store.delete_document(doc_id)
+        return removed
+    
+    def _remove_from_memory(self, doc_id: str) -> bool:
+        """메모리 인덱스에서 문서 제거"""
+        doc = self.documents.pop(doc_id, None)
+        if doc is None:
+            return False
+        
+        self.total_length -= doc['length']
+        for token in doc['term_freqs']:
+            postings = self.index.get(token)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.index[token]
+        return True
+    
+    def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """문서 정보 조회"""
+        self._ensure_loaded()
+        return self.documents.get(doc_id)
     
     def _tokenize(self, text: str) -> List[str]:
         """텍스트 토큰화"""
@@ -137,52 +210,87 @@ class KeywordSearchEngine:
         
         return korean_tokens + english_tokens + number_tokens
     
+    def _idf(self, df: int) -> float:
+        """IDF (항상 양수가 되도록 1을 더한 형태)"""
+        n_docs = len(self.documents)
+        return math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+    
     def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
         """BM25 기반 검색"""
-        query_tokens = self._tokenize(query)
-        scores = defaultdict(float)
+        self._ensure_loaded()
+        if not self.documents:
+            return []
         
-        for token in query_tokens:
-            if token in self.index:
-                df = len(self.index[token])  # 문서 빈도
-                idf = math.log((len(self.documents) - df + 0.5) / (df + 0.5))
-                
-                for doc_index in self.index[token]:
-                    doc = self.documents[doc_index]
-                    tf = doc['tokens'].count(token)  # 용어 빈도
-                    
-                    # BM25 점수 계산
-                    score = idf * (tf * (self.k1 + 1)) / (
-                        tf + self.k1 * (1 - self.b + self.b * doc['length'] / self.avg_doc_length)
-                    )
-                    scores[doc['id']] += score
+        scores: Dict[str, float] = defaultdict(float)
+        avg_doc_length = self.avg_doc_length or 1.0
+        length_norm = self.k1 * (1 - self.b)
+        length_scale = self.k1 * self.b / avg_doc_length
         
-        # 점수 정규화 (0-1 범위)
-        if scores:
-            max_score = max(scores.values())
-            normalized_scores = [(doc_id, score / max_score) for doc_id, score in scores.items()]
-        else:
-            normalized_scores = []
+        for token in set(self._tokenize(query)):
+            postings = self.index.get(token)
+            if not postings:
+                continue
+            
+            idf = self._idf(len(postings))
+            for doc_id, tf in postings.items():
+                doc_length = self.documents[doc_id]['length']
+                # BM25 점수 계산
+                scores[doc_id] += idf * (tf * (self.k1 + 1)) / (
+                    tf + length_norm + length_scale * doc_length
+                )
         
-        # 점수순 정렬
-        sorted_results = sorted(normalized_scores, key=lambda x: x[1], reverse=True)
-        return sorted_results[:limit]
+        if not scores:
+            return []
+        
+        # 전체 정렬 대신 힙 기반 top-k
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        
+        # 점수 정규화 (0-1 범위)
+        max_score = top[0][1] if top and top[0][1] > 0 else 1.0
+        return [(doc_id, score / max_score) for doc_id, score in top]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """인덱스 통계 반환"""
+        self._ensure_loaded()
+        return {
+            'document_count': len(self.documents),
+            'vocabulary_size': len(self.index),
+            'total_length': self.total_length,
+            'avg_doc_length': self.avg_doc_length,
+            'persistent': self.store is not None
+        }
+    
+    def snapshot(self, target_path: str):
+        """디스크 인덱스 스냅샷 생성"""
+        if self.store is None:
+            raise RuntimeError("영속 저장소가 설정되지 않은 키워드 인덱스입니다")
+        return self.store.snapshot(target_path)
     
     def clear(self):
         """인덱스 초기화"""
         self.documents.clear()
         self.index.clear()
-        self.document_lengths.clear()
-        self.avg_doc_length = 0.0
+        self.total_length = 0
+        if self.store is not None:
+            self.store.clear()
+        self._loaded = True
 
 
 class RAGSearchEngine:
     """RAG 검색 엔진 메인 클래스"""
     
-    def __init__(self, vector_store: VectorStore, embedding_provider: QwenEmbeddingProvider):
+    def __init__(self,
+                 vector_store: VectorStore,
+                 embedding_provider: QwenEmbeddingProvider,
+                 keyword_index_path: Optional[str] = None):
         self.vector_store = vector_store
         self.embedding_provider = embedding_provider
-        self.keyword_engine = KeywordSearchEngine()
+        
+        # 키워드 인덱스는 벡터 저장소 옆에 영속화 (재시작 후 재구축 불필요)
+        if keyword_index_path is None and getattr(vector_store, 'data_path', None) is not None:
+            keyword_index_path = str(vector_store.data_path / "keyword_index.db")
+        store = KeywordIndexStore(keyword_index_path) if keyword_index_path else None
+        self.keyword_engine = KeywordSearchEngine(store)
         
         # 검색 통계
         self.search_stats = {
@@ -218,21 +326,29 @@ class RAGSearchEngine:
             await self.vector_store.add_document(collection_type, vector_doc)
             
             # 2. 키워드 인덱스에 추가
-            searchable_content = self._create_searchable_content(memory)
-            self.keyword_engine.add_document(
-                memory.id, 
-                searchable_content,
-                {
-                    'memory_type': memory.memory_type.value,
-                    'importance': memory.importance.value,
-                    'tags': memory.tags,
-                    'keywords': memory.keywords
-                }
-            )
+            self.index_keywords(memory)
             
         except Exception as e:
             print(f"기억 인덱싱 실패 {memory.id}: {e}")
     
+    def index_keywords(self, memory: BaseMemory):
+        """기억을 키워드 인덱스에만 추가 (벡터 저장소는 호출자가 관리)"""
+        searchable_content = self._create_searchable_content(memory)
+        self.keyword_engine.add_document(
+            memory.id, 
+            searchable_content,
+            {
+                'memory_type': memory.memory_type.value,
+                'importance': memory.importance.value,
+                'tags': memory.tags,
+                'keywords': memory.keywords
+            }
+        )
+    
+    def remove_from_keyword_index(self, memory_id: str) -> bool:
+        """키워드 인덱스에서 기억 제거"""
+        return self.keyword_engine.remove_document(memory_id)
+    
     def _get_collection_type(self, memory_type: MemoryType) -> CollectionType:
         """메모리 타입을 컬렉션 타입으로 변환"""
         mapping = {
@@ -313,48 +429,43 @@ class RAGSearchEngine:
         """의미적 유사도 검색"""
         results = []
         
-        # 모든 컬렉션에서 검색
-        for collection_type in CollectionType:
-            try:
-                vector_results = await self.vector_store.search_similar(
-                    collection_type, query.text, n_results=query.limit * 2
-                )
-                
-                for result_dict in vector_results:
-                    # ChromaDB 결과에서 정보 추출
-                    doc_id = result_dict.get('ids', [''])[0] if result_dict.get('ids') else ''
-                    documents = result_dict.get('documents', [''])
-                    distances = result_dict.get('distances', [1.0])
-                    metadatas = result_dict.get('metadatas', [{}])
-                    
-                    if doc_id and documents:
-                        distance = distances[0] if distances else 1.0
-                        similarity = max(0.0, 1.0 - distance)  # 거리를 유사도로 변환
-                        
-                        # VectorDocument 객체 생성
-                        doc = VectorDocument(
-                            id=doc_id,
-                            content=documents[0],
-                            metadata=metadatas[0] if metadatas else {}
-                        )
-                        
-                        # 메모리 객체 복원 (실제로는 데이터베이스에서 가져와야 함)
-                        memory = self._create_mock_memory(doc)
-                        
-                        result = SearchResult(
-                            memory=memory,
-                            similarity_score=similarity,
-                            keyword_score=0.0,
-                            importance_score=self._calculate_importance_score(memory),
-                            recency_score=self._calculate_recency_score(memory),
-                            frequency_score=self._calculate_frequency_score(memory),
-                            final_score=0.0,  # 나중에 계산
-                            match_info={'method': 'semantic', 'collection': collection_type.value}
-                        )
-                        results.append(result)
-                    
-            except Exception as e:
-                print(f"의미적 검색 오류 ({collection_type.value}): {e}")
+        # 모든 컬렉션을 한 번에 검색 (쿼리 임베딩 1회, 컬렉션 질의 동시 실행, top-k 병합)
+        try:
+            vector_results = await self.vector_store.search_collections(
+                query.text, n_results=query.limit * 2
+            )
+        except Exception as e:
+            print(f"의미적 검색 오류: {e}")
+            return results
+        
+        for result_dict in vector_results:
+            doc_id = result_dict.get('id', '')
+            if not doc_id:
+                continue
+            
+            similarity = max(0.0, min(1.0, result_dict.get('similarity', 0.0)))
+            
+            # VectorDocument 객체 생성
+            doc = VectorDocument(
+                id=doc_id,
+                content=result_dict.get('content', ''),
+                metadata=result_dict.get('metadata') or {}
+            )
+            
+            # 메모리 객체 복원 (실제로는 데이터베이스에서 가져와야 함)
+            memory = self._create_mock_memory(doc)
+            
+            result = SearchResult(
+                memory=memory,
+                similarity_score=similarity,
+                keyword_score=0.0,
+                importance_score=self._calculate_importance_score(memory),
+                recency_score=self._calculate_recency_score(memory),
+                frequency_score=self._calculate_frequency_score(memory),
+                final_score=0.0,  # 나중에 계산
+                match_info={'method': 'semantic', 'collection': result_dict.get('collection')}
+            )
+            results.append(result)
         
         return results
     
@@ -571,9 +682,9 @@ class RAGSearchEngine:
     def _find_memory_by_id(self, memory_id: str) -> Optional[BaseMemory]:
         """ID로 메모리 찾기 (임시 구현)"""
         # 실제로는 데이터베이스에서 찾아야 함
-        for doc_info in self.keyword_engine.documents:
-            if doc_info['id'] == memory_id:
-                return self._create_mock_memory_from_doc(doc_info)
+        doc_info = self.keyword_engine.get_document(memory_id)
+        if doc_info:
+            return self._create_mock_memory_from_doc(doc_info)
         return None
     
     def _create_mock_memory_from_doc(self, doc_info: Dict[str, Any]) -> BaseMemory:
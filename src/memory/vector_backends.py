@@ -0,0 +1,791 @@
+"""
+벡터 저장소 백엔드
+
+VectorStore가 사용하는 컬렉션 저장소를 교체할 수 있도록 하는 백엔드 계층입니다.
+컬렉션 객체는 ChromaDB Collection과 같은 메서드(add/query/get/delete/count)와
+반환 형식을 제공하므로 VectorStore는 백엔드 종류와 무관하게 동작합니다.
+
+- ChromaBackend: ChromaDB PersistentClient 래퍼
+- NumpyBackend: 외부 서비스 없이 동작하는 순수 NumPy 구현
+  - 컬렉션별 정규화된 float32 임베딩을 메모리 맵 행렬로 저장
+  - 작은 컬렉션은 행렬곱 brute-force top-k
+  - 임계 크기 이상이면 HNSW 스타일 그래프 인덱스 사용
+    (백그라운드 스레드에서 구축해 메모리 맵 옆에 저장, 준비 전까지는 brute-force)
+  - 메타데이터 where 필터는 컬럼 배열에서 평가
+"""
+
+import heapq
+import json
+import math
+import os
+import random
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+try:
+    import chromadb
+    from chromadb.config import Settings
+    CHROMADB_AVAILABLE = True
+except ImportError:  # pragma: no cover - 선택적 의존성
+    chromadb = None
+    Settings = None
+    CHROMADB_AVAILABLE = False
+
+
+class VectorBackend(ABC):
+    """벡터 저장소 백엔드 인터페이스"""
+
+    name: str = "base"
+
+    @abstractmethod
+    def get_or_create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> Any:
+        """컬렉션을 가져오거나 생성"""
+
+    @abstractmethod
+    def delete_collection(self, name: str) -> None:
+        """컬렉션 삭제"""
+
+    def close(self) -> None:
+        """백엔드 리소스 정리"""
+
+
+class ChromaBackend(VectorBackend):
+    """ChromaDB 백엔드"""
+
+    name = "chroma"
+
+    def __init__(self, path: Union[str, Path]):
+        if not CHROMADB_AVAILABLE:
+            raise ImportError("chromadb가 설치되어 있지 않습니다")
+        self.client = chromadb.PersistentClient(
+            path=str(path),
+            settings=Settings(
+                anonymized_telemetry=False,
+                allow_reset=True
+            )
+        )
+
+    def get_or_create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> Any:
+        try:
+            collection = self.client.get_collection(name)
+        except Exception:
+            collection = self.client.create_collection(name=name, metadata=metadata)
+        return _ChromaCollection(collection)
+
+    def delete_collection(self, name: str) -> None:
+        self.client.delete_collection(name)
+
+
+def _as_embedding_lists(embeddings: Optional[Sequence[Any]]) -> Optional[List[List[float]]]:
+    """ChromaDB 0.5 는 리스트 임베딩만 받으므로 NumPy 배열을 리스트로 변환"""
+    if embeddings is None:
+        return None
+    return [e.tolist() if isinstance(e, np.ndarray) else list(e) for e in embeddings]
+
+
+class _ChromaCollection:
+    """ChromaDB Collection 래퍼 (임베딩 인자만 리스트로 변환, 나머지는 그대로 위임)"""
+
+    def __init__(self, collection: Any):
+        self._collection = collection
+
+    def add(self, embeddings: Optional[Sequence[Any]] = None, **kwargs: Any) -> Any:
+        return self._collection.add(embeddings=_as_embedding_lists(embeddings), **kwargs)
+
+    def upsert(self, embeddings: Optional[Sequence[Any]] = None, **kwargs: Any) -> Any:
+        return self._collection.upsert(embeddings=_as_embedding_lists(embeddings), **kwargs)
+
+    def query(self, query_embeddings: Optional[Sequence[Any]] = None, **kwargs: Any) -> Any:
+        return self._collection.query(query_embeddings=_as_embedding_lists(query_embeddings), **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._collection, name)
+
+
+# ---- 메타데이터 필터 ----
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "$eq": lambda a, b: a == b,
+    "$ne": lambda a, b: a != b,
+    "$gt": lambda a, b: a is not None and a > b,
+    "$gte": lambda a, b: a is not None and a >= b,
+    "$lt": lambda a, b: a is not None and a < b,
+    "$lte": lambda a, b: a is not None and a <= b,
+    "$in": lambda a, b: a in b,
+    "$nin": lambda a, b: a not in b,
+}
+
+
+def _column_mask(column: np.ndarray, condition: Any) -> np.ndarray:
+    """단일 컬럼 조건을 불리언 마스크로 평가"""
+    if not isinstance(condition, dict):
+        condition = {"$eq": condition}
+
+    mask = np.ones(len(column), dtype=bool)
+    for op, operand in condition.items():
+        compare = _COMPARATORS.get(op)
+        if compare is None:
+            raise ValueError(f"지원하지 않는 where 연산자: {op}")
+
+        if op in ("$eq", "$ne") and column.dtype != object:
+            result = column == operand
+            mask &= result if op == "$eq" else ~result
+            continue
+
+        mask &= np.fromiter(
+            (_safe_compare(compare, value, operand) for value in column),
+            dtype=bool, count=len(column)
+        )
+    return mask
+
+
+def _safe_compare(compare: Callable[[Any, Any], bool], value: Any, operand: Any) -> bool:
+    try:
+        return bool(compare(value, operand))
+    except TypeError:
+        return False
+
+
+# ---- HNSW 스타일 그래프 인덱스 ----
+
+class HNSWIndex:
+    """
+    코사인 유사도(정규화 벡터의 내적)용 계층형 탐색 가능 소세계 그래프
+
+    벡터는 외부 행렬(행 번호)로 참조하며, 그래프 구조만 save/load 로 저장합니다.
+    """
+
+    def __init__(self, vectors: Callable[[], np.ndarray], m: int = 16,
+                 ef_construction: int = 40, ef_search: int = 64, seed: int = 42):
+        self._vectors = vectors
+        self.m = m
+        self.m0 = m * 2
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._level_mult = 1.0 / math.log(m)
+        self._rng = random.Random(seed)
+        self._layers: List[Dict[int, List[int]]] = []
+        self._entry: Optional[int] = None
+        self._nodes: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, row: int) -> bool:
+        return row in self._nodes
+
+    def _similarities(self, query: np.ndarray, rows: Sequence[int]) -> np.ndarray:
+        return self._vectors()[list(rows)] @ query
+
+    def _search_layer(self, query: np.ndarray, entry_points: List[int],
+                      ef: int, layer: int) -> List[Tuple[float, int]]:
+        """단일 계층 탐색: 유사도 내림차순 (similarity, row) 리스트 반환"""
+        graph = self._layers[layer]
+        visited = set(entry_points)
+        sims = self._similarities(query, entry_points)
+        # candidates: 최대 힙(유사도 높은 순), results: 최소 힙(가장 나쁜 결과가 top)
+        candidates = [(-float(s), r) for s, r in zip(sims, entry_points)]
+        heapq.heapify(candidates)
+        results = [(float(s), r) for s, r in zip(sims, entry_points)]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            neg_sim, row = heapq.heappop(candidates)
+            if -neg_sim < results[0][0] and len(results) >= ef:
+                break
+            neighbors = [n for n in graph.get(row, ()) if n not in visited]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+            for sim, neighbor in zip(self._similarities(query, neighbors), neighbors):
+                sim = float(sim)
+                if len(results) < ef or sim > results[0][0]:
+                    heapq.heappush(candidates, (-sim, neighbor))
+                    heapq.heappush(results, (sim, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+
+        return sorted(results, reverse=True)
+
+    def _select_neighbors(self, candidates: List[Tuple[float, int]], limit: int) -> List[int]:
+        return [row for _, row in candidates[:limit]]
+
+    def add(self, row: int) -> None:
+        """행 번호의 벡터를 그래프에 삽입"""
+        if row in self._nodes:
+            return
+        query = self._vectors()[row]
+        level = int(-math.log(max(self._rng.random(), 1e-12)) * self._level_mult)
+        while len(self._layers) <= level:
+            self._layers.append({})
+
+        self._nodes.add(row)
+        if self._entry is None:
+            for layer in range(level + 1):
+                self._layers[layer][row] = []
+            self._entry = row
+            return
+
+        entry = [self._entry]
+        entry_level = self._node_level(self._entry)
+
+        for layer in range(entry_level, level, -1):
+            entry = [self._search_layer(query, entry, 1, layer)[0][1]]
+
+        for layer in range(min(level, entry_level), -1, -1):
+            found = self._search_layer(query, entry, self.ef_construction, layer)
+            limit = self.m0 if layer == 0 else self.m
+            neighbors = self._select_neighbors(found, limit)
+            graph = self._layers[layer]
+            graph[row] = list(neighbors)
+            for neighbor in neighbors:
+                links = graph.setdefault(neighbor, [])
+                links.append(row)
+                if len(links) > limit:
+                    sims = self._similarities(self._vectors()[neighbor], links)
+                    keep = np.argsort(-sims)[:limit]
+                    graph[neighbor] = [links[i] for i in keep]
+            entry = [r for _, r in found]
+
+        for layer in range(entry_level + 1, level + 1):
+            self._layers[layer].setdefault(row, [])
+        if level > entry_level:
+            self._entry = row
+
+    def _node_level(self, row: int) -> int:
+        for layer in range(len(self._layers) - 1, -1, -1):
+            if row in self._layers[layer]:
+                return layer
+        return 0
+
+    def save(self, path: Path, rows: int) -> None:
+        """그래프를 npz 로 저장 (rows: 그래프가 반영한 행 수, 임시 파일 기록 후 교체)"""
+        arrays: Dict[str, np.ndarray] = {
+            "meta": np.asarray([rows, -1 if self._entry is None else self._entry,
+                                len(self._layers), self.m], dtype=np.int64)
+        }
+        for layer, graph in enumerate(self._layers):
+            nodes = np.fromiter(graph.keys(), dtype=np.int64, count=len(graph))
+            lengths = np.fromiter((len(graph[n]) for n in nodes), dtype=np.int64, count=len(nodes))
+            arrays[f"nodes_{layer}"] = nodes
+            arrays[f"indptr_{layer}"] = np.concatenate(([0], np.cumsum(lengths)))
+            arrays[f"links_{layer}"] = np.fromiter(
+                (link for n in nodes for link in graph[n]), dtype=np.int64, count=int(lengths.sum()))
+
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, vectors: Callable[[], np.ndarray]) -> Tuple["HNSWIndex", int]:
+        """save 로 저장한 그래프 복원: (인덱스, 반영된 행 수)"""
+        with np.load(path) as data:
+            rows, entry, n_layers, m = (int(v) for v in data["meta"])
+            index = cls(vectors, m=m)
+            for layer in range(n_layers):
+                nodes, indptr, links = data[f"nodes_{layer}"], data[f"indptr_{layer}"], data[f"links_{layer}"]
+                index._layers.append({
+                    int(node): links[indptr[i]:indptr[i + 1]].tolist() for i, node in enumerate(nodes)
+                })
+        index._entry = None if entry < 0 else entry
+        index._nodes = set(index._layers[0]) if index._layers else set()
+        return index, rows
+
+    def search(self, query: np.ndarray, k: int, ef: Optional[int] = None) -> List[Tuple[float, int]]:
+        """근사 top-k 탐색: 유사도 내림차순 (similarity, row)"""
+        if self._entry is None:
+            return []
+        entry = [self._entry]
+        for layer in range(self._node_level(self._entry), 0, -1):
+            entry = [self._search_layer(query, entry, 1, layer)[0][1]]
+        return self._search_layer(query, entry, max(ef or self.ef_search, k), 0)[:k]
+
+
+# ---- NumPy 컬렉션 ----
+
+class NumpyCollection:
+    """
+    순수 NumPy 벡터 컬렉션 (ChromaDB Collection 호환 인터페이스)
+
+    디스크 구성 (collection_dir):
+    - vectors.f32: (capacity, dim) 정규화 float32 행렬 (np.memmap)
+    - records.jsonl: add/delete 추가 전용 로그 (id, 문서, 메타데이터, 행 번호)
+    - hnsw.npz: HNSW 그래프 (임계 크기 이상일 때, 반영된 행 수와 함께 저장)
+
+    HNSW 그래프는 임계 크기에 도달하면 백그라운드 스레드에서 구축(또는 저장본에서 복원 후
+    이후 행만 추가)하며, 준비되기 전 질의는 brute-force 로 처리합니다.
+    준비된 뒤에는 add() 에서 새 행을 점진적으로 삽입합니다.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    RECORDS_FILE = "records.jsonl"
+    HNSW_FILE = "hnsw.npz"
+
+    def __init__(self, name: str, path: Optional[Path] = None,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 hnsw_threshold: int = 20000):
+        self.name = name
+        self.metadata = metadata or {}
+        self.path = path
+        self.hnsw_threshold = hnsw_threshold
+        self.logger = get_logger("numpy_vector_backend")
+        self._lock = threading.RLock()
+
+        self._dim: Optional[int] = None
+        self._capacity = 0
+        self._vectors: Optional[np.ndarray] = None
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        # 행 상태 플래그 (행 수보다 크게 잡아 두고 두 배씩 늘림, 유효 범위는 [:len(self._ids)])
+        self._alive = np.zeros(0, dtype=bool)
+        self._has_vector = np.zeros(0, dtype=bool)
+        self._searchable = np.zeros(0, dtype=bool)  # alive & has_vector (벡터 검색 대상)
+        self._searchable_count = 0
+        self._row_of: Dict[str, int] = {}
+        self._column_cache: Dict[str, np.ndarray] = {}
+        self._hnsw: Optional[HNSWIndex] = None
+        self._hnsw_rows = 0  # 그래프에 반영된 행 수 (이 행 번호 미만은 모두 반영됨)
+        self._hnsw_saved_rows = 0
+        self._hnsw_thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._records_file = None
+
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._load()
+        self._maybe_start_hnsw_build()
+
+    # ---- 영속화 ----
+
+    def _load(self) -> None:
+        records_path = self.path / self.RECORDS_FILE
+        vectors_path = self.path / self.VECTORS_FILE
+
+        if records_path.exists():
+            with open(records_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 중단된 쓰기로 잘린 줄
+                    if record.get("op") == "dim":
+                        self._dim = int(record["dim"])
+                    elif record.get("op") == "add":
+                        self._append_row(record["id"], record["document"],
+                                         record.get("metadata") or {}, record["has_vector"])
+                    elif record.get("op") == "delete":
+                        self._tombstone(record["id"])
+
+        if self._dim is not None and vectors_path.exists():
+            row_bytes = self._dim * np.dtype(np.float32).itemsize
+            self._capacity = vectors_path.stat().st_size // row_bytes
+            if self._capacity > 0:
+                self._vectors = np.memmap(vectors_path, dtype=np.float32, mode="r+",
+                                          shape=(self._capacity, self._dim))
+
+        # 벡터 파일보다 많은 행은 기록 중 중단된 것이므로 벡터 없음으로 처리
+        n_rows = len(self._ids)
+        if n_rows > self._capacity:
+            self._searchable_count -= int(self._searchable[self._capacity:n_rows].sum())
+            self._has_vector[self._capacity:n_rows] = False
+            self._searchable[self._capacity:n_rows] = False
+
+        self._records_file = open(records_path, "a", encoding="utf-8")
+
+    def _log(self, record: Dict[str, Any]) -> None:
+        if self._records_file is not None:
+            self._records_file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if rows <= self._capacity:
+            return
+        new_capacity = max(rows, self._capacity * 2, 256)
+
+        if self.path is None:
+            grown = np.zeros((new_capacity, self._dim), dtype=np.float32)
+            if self._vectors is not None:
+                grown[:self._capacity] = self._vectors[:self._capacity]
+            self._vectors = grown
+        else:
+            vectors_path = self.path / self.VECTORS_FILE
+            # 백그라운드 HNSW 구축이 잠금 없이 읽으므로 교체 전까지 기존 맵을 유지
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            with open(vectors_path, "ab") as f:
+                f.truncate(new_capacity * self._dim * np.dtype(np.float32).itemsize)
+            self._vectors = np.memmap(vectors_path, dtype=np.float32, mode="r+",
+                                      shape=(new_capacity, self._dim))
+        self._capacity = new_capacity
+
+    def _ensure_row_capacity(self, rows: int) -> None:
+        """행 상태 플래그 배열 확장 (벡터 행렬과 같은 두 배 증가)"""
+        if rows <= len(self._alive):
+            return
+        new_capacity = max(rows, len(self._alive) * 2, 256)
+        for attr in ("_alive", "_has_vector", "_searchable"):
+            grown = np.zeros(new_capacity, dtype=bool)
+            current = getattr(self, attr)
+            grown[:len(current)] = current
+            setattr(self, attr, grown)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._save_hnsw()
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            if self._records_file is not None:
+                self._records_file.close()
+                self._records_file = None
+
+    # ---- HNSW 그래프 (백그라운드 구축/저장) ----
+
+    def _maybe_start_hnsw_build(self) -> None:
+        """임계 크기에 도달했고 그래프가 없으면 백그라운드 구축 시작"""
+        if (self._hnsw is not None or self._closed or len(self._ids) < self.hnsw_threshold
+                or (self._hnsw_thread is not None and self._hnsw_thread.is_alive())):
+            return
+        self._hnsw_thread = threading.Thread(
+            target=self._build_hnsw, name=f"hnsw-build-{self.name}", daemon=True
+        )
+        self._hnsw_thread.start()
+
+    def _load_saved_hnsw(self) -> Tuple[HNSWIndex, int]:
+        """저장된 그래프가 현재 행과 맞으면 복원, 아니면 빈 그래프"""
+        hnsw_path = self.path / self.HNSW_FILE if self.path is not None else None
+        if hnsw_path is not None and hnsw_path.exists():
+            try:
+                index, rows = HNSWIndex.load(hnsw_path, lambda: self._vectors)
+                if rows <= len(self._ids):
+                    self._hnsw_saved_rows = rows
+                    return index, rows
+                self.logger.warning(f"HNSW 저장본이 현재 행 수보다 많아 다시 구축: {self.name}")
+            except Exception as e:
+                self.logger.warning(f"HNSW 저장본 로드 실패, 다시 구축: {self.name} - {e}")
+        return HNSWIndex(lambda: self._vectors), 0
+
+    def _build_hnsw(self) -> None:
+        """
+        백그라운드 그래프 구축
+
+        기존 행은 컬렉션 잠금 없이 삽입하고(행은 추가 전용이라 변하지 않음), 구축 중 추가된
+        행만 잠금을 잡고 반영한 뒤 그래프를 교체·저장합니다.
+        """
+        try:
+            index, start = self._load_saved_hnsw()
+            self.logger.info(f"HNSW 인덱스 구축 시작: {self.name} ({start}/{len(self._ids)}행 복원)")
+            end = len(self._ids)
+            for row in range(start, end):
+                if self._closed:
+                    return
+                if self._has_vector[row]:
+                    index.add(row)
+
+            with self._lock:
+                if self._closed:
+                    return
+                for row in range(end, len(self._ids)):
+                    if self._has_vector[row]:
+                        index.add(row)
+                self._hnsw = index
+                self._hnsw_rows = len(self._ids)
+                self._save_hnsw()
+            self.logger.info(f"HNSW 인덱스 준비 완료: {self.name} ({len(index)}개 노드)")
+        except Exception as e:
+            self.logger.error(f"HNSW 인덱스 구축 실패 (brute-force 유지): {self.name} - {e}")
+
+    def _save_hnsw(self) -> None:
+        """그래프가 저장본보다 앞서 있으면 저장 (잠금 보유 상태에서 호출)"""
+        if self._hnsw is None or self.path is None or self._hnsw_rows == self._hnsw_saved_rows:
+            return
+        try:
+            self._hnsw.save(self.path / self.HNSW_FILE, self._hnsw_rows)
+            self._hnsw_saved_rows = self._hnsw_rows
+        except OSError as e:
+            self.logger.warning(f"HNSW 인덱스 저장 실패: {self.name} - {e}")
+
+    # ---- 내부 행 관리 ----
+
+    def _append_row(self, doc_id: str, document: str, metadata: Dict[str, Any], has_vector: bool) -> int:
+        if doc_id in self._row_of:
+            self._tombstone(doc_id)
+        row = len(self._ids)
+        self._ensure_row_capacity(row + 1)
+        self._ids.append(doc_id)
+        self._documents.append(document)
+        self._metadatas.append(metadata)
+        self._alive[row] = True
+        self._has_vector[row] = has_vector
+        self._searchable[row] = has_vector
+        self._searchable_count += int(has_vector)
+        self._row_of[doc_id] = row
+        self._column_cache.clear()
+        return row
+
+    def _tombstone(self, doc_id: str) -> bool:
+        row = self._row_of.pop(doc_id, None)
+        if row is None:
+            return False
+        self._alive[row] = False
+        if self._searchable[row]:
+            self._searchable[row] = False
+            self._searchable_count -= 1
+        return True
+
+    def _column(self, key: str) -> np.ndarray:
+        """메타데이터 키의 컬럼 배열 (지연 생성 후 캐싱)"""
+        column = self._column_cache.get(key)
+        if column is None:
+            values = [metadata.get(key) for metadata in self._metadatas]
+            if values and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+                column = np.asarray(values, dtype=np.float64)
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+            self._column_cache[key] = column
+        return column
+
+    def _where_mask(self, where: Optional[Dict[str, Any]]) -> np.ndarray:
+        """where 필터를 행 마스크로 평가"""
+        n_rows = len(self._ids)
+        mask = self._alive[:n_rows].copy()
+        if not where:
+            return mask
+
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._where_mask(clause)
+            elif key == "$or":
+                any_mask = np.zeros(n_rows, dtype=bool)
+                for clause in condition:
+                    any_mask |= self._where_mask(clause)
+                mask &= any_mask
+            else:
+                mask &= _column_mask(self._column(key), condition)
+        return mask
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    # ---- ChromaDB 호환 API ----
+
+    def add(self, ids: List[str], documents: Optional[List[str]] = None,
+            embeddings: Optional[List[Any]] = None,
+            metadatas: Optional[List[Dict[str, Any]]] = None) -> None:
+        """문서 추가 (같은 ID는 교체)"""
+        with self._lock:
+            documents = documents or [""] * len(ids)
+            metadatas = metadatas or [{} for _ in ids]
+
+            matrix = None
+            if embeddings is not None:
+                matrix = self._normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1))
+                if self._dim is None:
+                    self._dim = int(matrix.shape[1])
+                    self._log({"op": "dim", "dim": self._dim})
+                elif matrix.shape[1] != self._dim:
+                    raise ValueError(f"임베딩 차원 불일치: {matrix.shape[1]} != {self._dim}")
+
+            for i, doc_id in enumerate(ids):
+                row = self._append_row(doc_id, documents[i], metadatas[i] or {}, matrix is not None)
+                if matrix is not None:
+                    self._ensure_capacity(row + 1)
+                    self._vectors[row] = matrix[i]
+                self._log({"op": "add", "id": doc_id, "document": documents[i],
+                           "metadata": metadatas[i] or {}, "has_vector": matrix is not None})
+                if self._hnsw is not None:
+                    if matrix is not None:
+                        self._hnsw.add(row)
+                    self._hnsw_rows = row + 1
+
+            if self._records_file is not None:
+                self._records_file.flush()
+            self._maybe_start_hnsw_build()
+
+    def upsert(self, ids: List[str], documents: Optional[List[str]] = None,
+               embeddings: Optional[List[Any]] = None,
+               metadatas: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.add(ids=ids, documents=documents, embeddings=embeddings, metadatas=metadatas)
+
+    def delete(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None) -> None:
+        """문서 삭제"""
+        with self._lock:
+            targets = list(ids or [])
+            if where:
+                mask = self._where_mask(where)
+                targets.extend(self._ids[row] for row in np.flatnonzero(mask))
+            for doc_id in targets:
+                if self._tombstone(doc_id):
+                    self._log({"op": "delete", "id": doc_id})
+            if self._records_file is not None:
+                self._records_file.flush()
+
+    def count(self) -> int:
+        return len(self._row_of)
+
+    def get(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None,
+            limit: Optional[int] = None, include: Optional[List[str]] = None) -> Dict[str, Any]:
+        """ID 또는 필터로 문서 조회 (평면 리스트 반환)"""
+        with self._lock:
+            if ids is not None:
+                rows = [self._row_of[doc_id] for doc_id in ids if doc_id in self._row_of]
+            else:
+                rows = list(np.flatnonzero(self._where_mask(where)))
+            if limit is not None:
+                rows = rows[:limit]
+            return {
+                "ids": [self._ids[r] for r in rows],
+                "documents": [self._documents[r] for r in rows],
+                "metadatas": [self._metadatas[r] for r in rows],
+            }
+
+    def query(self, query_embeddings: Optional[List[Any]] = None,
+              query_texts: Optional[List[str]] = None, n_results: int = 10,
+              where: Optional[Dict[str, Any]] = None,
+              include: Optional[List[str]] = None) -> Dict[str, Any]:
+        """유사도 검색 (distance = 1 - 코사인 유사도)"""
+        with self._lock:
+            output = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+
+            if query_embeddings is not None:
+                queries = self._normalize(np.asarray(query_embeddings, dtype=np.float32).reshape(
+                    len(query_embeddings), -1))
+                for query in queries:
+                    self._append_result(output, self._vector_top_k(query, n_results, where))
+            else:
+                for text in query_texts or []:
+                    self._append_result(output, self._text_top_k(text, n_results, where))
+            return output
+
+    def _append_result(self, output: Dict[str, Any], hits: List[Tuple[float, int]]) -> None:
+        output["ids"].append([self._ids[r] for _, r in hits])
+        output["documents"].append([self._documents[r] for _, r in hits])
+        output["metadatas"].append([self._metadatas[r] for _, r in hits])
+        output["distances"].append([1.0 - score for score, _ in hits])
+
+    def _vector_top_k(self, query: np.ndarray, k: int,
+                      where: Optional[Dict[str, Any]]) -> List[Tuple[float, int]]:
+        if self._vectors is None or self._dim is None or query.shape[0] != self._dim:
+            return []
+
+        n_rows = len(self._ids)
+        if where:
+            mask = self._where_mask(where) & self._searchable[:n_rows]
+            n_candidates = int(mask.sum())
+        else:
+            # 필터가 없으면 플래그 배열 뷰를 그대로 사용 (그래프 경로는 행 수에 비례하는 작업 없음)
+            mask = self._searchable[:n_rows]
+            n_candidates = self._searchable_count
+        if n_candidates == 0:
+            return []
+
+        if self._hnsw is not None:
+            hits = self._graph_top_k(query, k, mask, n_candidates / n_rows)
+            if len(hits) >= min(k, n_candidates):
+                return hits
+
+        candidates = np.flatnonzero(mask)
+        scores = self._vectors[candidates] @ query
+        if candidates.size > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(candidates.size)
+        top = top[np.argsort(-scores[top])]
+        return [(float(scores[i]), int(candidates[i])) for i in top]
+
+    def _graph_top_k(self, query: np.ndarray, k: int, mask: np.ndarray,
+                     selectivity: float) -> List[Tuple[float, int]]:
+        """HNSW 그래프 탐색 (백그라운드 구축이 끝난 뒤에만 사용)"""
+        # 필터/삭제로 제외되는 행 비율(selectivity)을 고려해 탐색 폭을 넓힘
+        selectivity = max(selectivity, 1e-3)
+        ef = min(len(self._hnsw), int(max(k, self._hnsw.ef_search) / selectivity))
+        hits = self._hnsw.search(query, ef, ef=ef)
+        return [(score, row) for score, row in hits if mask[row]][:k]
+
+    def _text_top_k(self, text: str, k: int, where: Optional[Dict[str, Any]]) -> List[Tuple[float, int]]:
+        """임베딩 없이 토큰 겹침으로 점수화하는 폴백 검색"""
+        query_tokens = set(re.findall(r"[가-힣a-zA-Z0-9]+", text.lower()))
+        if not query_tokens:
+            return []
+        scored = []
+        for row in np.flatnonzero(self._where_mask(where)):
+            doc_tokens = set(re.findall(r"[가-힣a-zA-Z0-9]+", self._documents[row].lower()))
+            overlap = len(query_tokens & doc_tokens)
+            if overlap:
+                scored.append((overlap / len(query_tokens), int(row)))
+        return heapq.nlargest(k, scored)
+
+
+class NumpyBackend(VectorBackend):
+    """순수 NumPy 백엔드 (외부 서비스 불필요)"""
+
+    name = "numpy"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, hnsw_threshold: int = 20000):
+        """
+        Args:
+            path: 저장 경로 (None이면 메모리 전용)
+            hnsw_threshold: HNSW 그래프 탐색으로 전환할 컬렉션 크기
+        """
+        self.path = Path(path) if path else None
+        self.hnsw_threshold = hnsw_threshold
+        self._collections: Dict[str, NumpyCollection] = {}
+
+    def get_or_create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> NumpyCollection:
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = NumpyCollection(
+                name,
+                path=self.path / name if self.path else None,
+                metadata=metadata,
+                hnsw_threshold=self.hnsw_threshold
+            )
+            self._collections[name] = collection
+        return collection
+
+    def delete_collection(self, name: str) -> None:
+        collection = self._collections.pop(name, None)
+        if collection is not None:
+            collection.close()
+        if self.path is not None:
+            directory = self.path / name
+            for file_name in (NumpyCollection.VECTORS_FILE, NumpyCollection.RECORDS_FILE,
+                              NumpyCollection.HNSW_FILE):
+                file_path = directory / file_name
+                if file_path.exists():
+                    file_path.unlink()
+
+    def close(self) -> None:
+        for collection in self._collections.values():
+            collection.close()
+
+
+def create_vector_backend(backend_type: str, data_path: Union[str, Path]) -> VectorBackend:
+    """
+    백엔드 생성
+
+    Args:
+        backend_type: "chroma", "numpy" 또는 "auto" (ChromaDB가 있으면 chroma)
+        data_path: 데이터 저장 경로
+    """
+    data_path = Path(data_path)
+    if backend_type == "chroma" or (backend_type == "auto" and CHROMADB_AVAILABLE):
+        return ChromaBackend(data_path / "chroma_db")
+    if backend_type in ("numpy", "auto"):
+        return NumpyBackend(data_path / "numpy_store")
+    raise ValueError(f"알 수 없는 벡터 백엔드: {backend_type}")
@@ -6,6 +6,7 @@ AI의 장기기억을 위한 벡터 데이터베이스를 관리합니다.
 """
 
 import asyncio
+import heapq
 import os
 import json
 from datetime import datetime
@@ -14,14 +15,13 @@ from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 
-import chromadb
-from chromadb.config import Settings
-from chromadb.utils import embedding_functions
-from chromadb.api import ClientAPI
+import numpy as np
 
 from ..utils.logger import get_logger
 from ..ai_engine.llm_provider import LLMProvider
 from .embedding_provider import QwenEmbeddingProvider, get_embedding_provider
+from .embedding_cache import EmbeddingCache
+from .vector_backends import VectorBackend, ChromaBackend, create_vector_backend
 
 
 class CollectionType(Enum):
@@ -39,7 +39,7 @@ class VectorDocument:
     id: str
     content: str
     metadata: Dict[str, Any]
-    embedding: Optional[List[float]] = None
+    embedding: Optional[Union[List[float], np.ndarray]] = None
     timestamp: Optional[datetime] = None
     
     def __post_init__(self):
@@ -62,12 +62,17 @@ class VectorStore:
     
     AI의 장기기억을 위한 벡터 데이터베이스를 관리합니다.
     Google Gemini 임베딩을 사용하여 텍스트를 벡터로 변환하고 저장합니다.
+    컬렉션 저장소는 백엔드로 교체 가능하며, ChromaDB가 없으면 순수 NumPy 백엔드를 사용합니다.
     """
     
     def __init__(self, 
                  data_path: str = "data/memory",
                  llm_provider: Optional[LLMProvider] = None,
-                 embedding_provider: Optional[QwenEmbeddingProvider] = None):
+                 embedding_provider: Optional[QwenEmbeddingProvider] = None,
+                 embedding_cache: Optional[EmbeddingCache] = None,
+                 enable_embedding_cache: bool = True,
+                 backend: Optional[VectorBackend] = None,
+                 backend_type: str = "auto"):
         """
         벡터 저장소 초기화
         
@@ -75,6 +80,10 @@ class VectorStore:
             data_path: 데이터 저장 경로
             llm_provider: LLM 제공자 (사용 안함)
             embedding_provider: 임베딩 제공자 (Qwen3)
+            embedding_cache: 임베딩 캐시 (None이면 data_path/embedding_cache에 생성)
+            enable_embedding_cache: 임베딩 캐시 사용 여부
+            backend: 벡터 저장소 백엔드 (None이면 backend_type으로 생성)
+            backend_type: "auto", "chroma", "numpy" (auto는 ChromaDB가 있으면 chroma)
         """
         self.data_path = Path(data_path)
         self.data_path.mkdir(parents=True, exist_ok=True)
@@ -83,8 +92,15 @@ class VectorStore:
         self.embedding_provider = embedding_provider
         self.logger = get_logger("vector_store")
         
-        # ChromaDB 클라이언트 초기화
-        self.client: Optional[ClientAPI] = None
+        # 같은 텍스트를 다시 임베딩하지 않도록 콘텐츠 주소 기반 캐시 사용
+        if embedding_cache is None and enable_embedding_cache:
+            embedding_cache = EmbeddingCache(self.data_path / "embedding_cache")
+        self.embedding_cache = embedding_cache
+        
+        # 백엔드 (ChromaDB 또는 NumPy)
+        self.backend: Optional[VectorBackend] = backend
+        self.backend_type = backend_type
+        self.client = None
         self.collections: Dict[str, Any] = {}
         
         self.logger.info("벡터 저장소 초기화 시작")
@@ -92,18 +108,20 @@ class VectorStore:
     async def initialize(self):
         """비동기 초기화"""
         try:
-            # ChromaDB 클라이언트 생성
-            self.client = chromadb.PersistentClient(
-                path=str(self.data_path / "chroma_db"),
-                settings=Settings(
-                    anonymized_telemetry=False,
-                    allow_reset=True
-                )
-            )
+            # 백엔드 생성 (ChromaDB가 없으면 NumPy 백엔드)
+            if self.backend is None:
+                self.backend = create_vector_backend(self.backend_type, self.data_path)
+            if isinstance(self.backend, ChromaBackend):
+                self.client = self.backend.client
+            self.logger.info(f"벡터 저장소 백엔드: {self.backend.name}")
             
             # 임베딩 제공자 초기화
             if self.embedding_provider is None:
-                self.embedding_provider = await get_embedding_provider()
+                try:
+                    self.embedding_provider = await get_embedding_provider()
+                except Exception as e:
+                    # 임베딩 모델이 없어도 텍스트 폴백 검색으로 동작
+                    self.logger.warning(f"임베딩 제공자 초기화 실패, 텍스트 검색으로 동작: {e}")
             
             # 기본 컬렉션들 생성
             await self._create_default_collections()
@@ -124,18 +142,11 @@ class VectorStore:
         try:
             collection_name = collection_type.value
             
-            # 기존 컬렉션 확인
-            try:
-                collection = self.client.get_collection(collection_name)
-                self.logger.debug(f"기존 컬렉션 사용: {collection_name}")
-            except Exception:
-                # 새 컬렉션 생성
-                # 임베딩 함수는 기본값 사용 (나중에 Google Gemini로 대체)
-                collection = self.client.create_collection(
-                    name=collection_name,
-                    metadata={"type": collection_type.value}
-                )
-                self.logger.info(f"새 컬렉션 생성: {collection_name}")
+            collection = self.backend.get_or_create_collection(
+                collection_name,
+                metadata={"type": collection_type.value}
+            )
+            self.logger.debug(f"컬렉션 준비: {collection_name}")
             
             self.collections[collection_type.value] = collection
             return collection
@@ -167,17 +178,13 @@ class VectorStore:
                 document.embedding = await self._generate_embedding(document.content)
             
             # 메타데이터 준비
-            metadata = document.metadata.copy()
-            metadata.update({
-                "timestamp": document.timestamp.isoformat() if document.timestamp else datetime.now().isoformat(),
-                "content_length": len(document.content)
-            })
+            metadata = self._prepare_metadata(document)
             
             # 문서 추가
             collection.add(
                 ids=[document.id],
                 documents=[document.content],
-                embeddings=[document.embedding] if document.embedding else None,
+                embeddings=[document.embedding] if document.embedding is not None else None,
                 metadatas=[metadata]
             )
             
@@ -188,6 +195,73 @@ class VectorStore:
             self.logger.error(f"문서 추가 실패: {e}")
             return False
     
+    async def add_documents(self,
+                            documents_by_collection: Dict[CollectionType, List[VectorDocument]]) -> List[str]:
+        """
+        여러 문서를 한 번에 추가합니다
+        
+        임베딩이 없는 문서는 모두 모아 한 번의 배치 인코딩으로 처리하고,
+        컬렉션마다 한 번의 add 호출로 기록합니다.
+        
+        Args:
+            documents_by_collection: 컬렉션 타입별 추가할 문서 리스트
+            
+        Returns:
+            추가에 성공한 문서 ID 리스트
+        """
+        # 1. 누락된 임베딩을 한 번에 생성
+        pending = [
+            document
+            for documents in documents_by_collection.values()
+            for document in documents
+            if document.embedding is None
+        ]
+        if pending:
+            embeddings = await self._generate_embeddings([document.content for document in pending])
+            for document, embedding in zip(pending, embeddings):
+                document.embedding = embedding
+        
+        # 2. 컬렉션별 일괄 추가
+        added_ids: List[str] = []
+        for collection_type, documents in documents_by_collection.items():
+            if not documents:
+                continue
+            try:
+                collection = self.collections.get(collection_type.value)
+                if not collection:
+                    collection = await self._get_or_create_collection(collection_type)
+                
+                # Chroma는 한 번의 add에서 임베딩 유무가 섞이는 것을 허용하지 않음
+                with_embedding = [d for d in documents if d.embedding is not None]
+                without_embedding = [d for d in documents if d.embedding is None]
+                
+                for group, has_embedding in ((with_embedding, True), (without_embedding, False)):
+                    if not group:
+                        continue
+                    collection.add(
+                        ids=[d.id for d in group],
+                        documents=[d.content for d in group],
+                        embeddings=[d.embedding for d in group] if has_embedding else None,
+                        metadatas=[self._prepare_metadata(d) for d in group]
+                    )
+                    added_ids.extend(d.id for d in group)
+                
+                self.logger.debug(f"문서 일괄 추가 완료: {len(documents)}개 in {collection_type.value}")
+                
+            except Exception as e:
+                self.logger.error(f"문서 일괄 추가 실패 ({collection_type.value}): {e}")
+        
+        return added_ids
+    
+    def _prepare_metadata(self, document: VectorDocument) -> Dict[str, Any]:
+        """저장용 메타데이터 준비"""
+        metadata = document.metadata.copy()
+        metadata.update({
+            "timestamp": document.timestamp.isoformat() if document.timestamp else datetime.now().isoformat(),
+            "content_length": len(document.content)
+        })
+        return metadata
+    
     async def search_similar(self,
                            collection_type: CollectionType,
                            query: str,
@@ -213,29 +287,15 @@ class VectorStore:
             
             # 쿼리 임베딩 생성
             query_embedding = await self._generate_embedding(query)
-            if not query_embedding:
+            if query_embedding is None:
                 # 임베딩 실패시 텍스트 검색으로 폴백
                 return await self._text_search(collection, query, n_results, where)
             
             # 벡터 검색 수행
-            results = collection.query(
-                query_embeddings=[query_embedding],
-                n_results=n_results,
-                where=where,
-                include=["documents", "metadatas", "distances"]
+            search_results = await asyncio.to_thread(
+                self._query_collection, collection, query_embedding, n_results, where
             )
             
-            # 결과 정리
-            search_results = []
-            if results["ids"] and results["ids"][0]:
-                for i, doc_id in enumerate(results["ids"][0]):
-                    search_results.append({
-                        "id": doc_id,
-                        "content": results["documents"][0][i],
-                        "metadata": results["metadatas"][0][i],
-                        "similarity": 1 - results["distances"][0][i]  # 거리를 유사도로 변환
-                    })
-            
             self.logger.debug(f"검색 완료: {len(search_results)}개 결과")
             return search_results
             
@@ -243,6 +303,93 @@ class VectorStore:
             self.logger.error(f"검색 실패: {e}")
             return []
     
+    async def search_collections(self,
+                                 query: str,
+                                 collection_types: Optional[List[CollectionType]] = None,
+                                 n_results: int = 5,
+                                 where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        여러 컬렉션을 한 번에 검색합니다
+        
+        쿼리 임베딩은 한 번만 생성하고, 각 컬렉션 질의는 동시에 실행한 뒤
+        유사도 기준 상위 n_results개만 힙으로 병합합니다.
+        
+        Args:
+            query: 검색 쿼리
+            collection_types: 검색할 컬렉션 타입 목록 (None이면 전체)
+            n_results: 반환할 결과 수
+            where: 필터 조건
+            
+        Returns:
+            유사도 내림차순 검색 결과 리스트 (각 결과에 collection 포함)
+        """
+        try:
+            targets = [
+                (collection_type, self.collections.get(collection_type.value))
+                for collection_type in (collection_types or list(CollectionType))
+            ]
+            targets = [(ct, c) for ct, c in targets if c is not None]
+            if not targets:
+                return []
+            
+            # 쿼리 임베딩은 한 번만 생성
+            query_embedding = await self._generate_embedding(query)
+            
+            async def query_one(collection_type: CollectionType, collection) -> List[Dict[str, Any]]:
+                if query_embedding is None:
+                    results = await self._text_search(collection, query, n_results, where)
+                else:
+                    results = await asyncio.to_thread(
+                        self._query_collection, collection, query_embedding, n_results, where
+                    )
+                for result in results:
+                    result["collection"] = collection_type.value
+                return results
+            
+            per_collection = await asyncio.gather(
+                *(query_one(ct, c) for ct, c in targets),
+                return_exceptions=True
+            )
+            
+            candidates = []
+            for (collection_type, _), results in zip(targets, per_collection):
+                if isinstance(results, Exception):
+                    self.logger.error(f"컬렉션 검색 실패 ({collection_type.value}): {results}")
+                    continue
+                candidates.extend(results)
+            
+            merged = heapq.nlargest(n_results, candidates, key=lambda r: r["similarity"])
+            self.logger.debug(f"다중 컬렉션 검색 완료: {len(targets)}개 컬렉션, {len(merged)}개 결과")
+            return merged
+            
+        except Exception as e:
+            self.logger.error(f"다중 컬렉션 검색 실패: {e}")
+            return []
+    
+    def _query_collection(self,
+                          collection,
+                          query_embedding,
+                          n_results: int,
+                          where: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """임베딩으로 단일 컬렉션 질의 후 결과 정리"""
+        results = collection.query(
+            query_embeddings=[query_embedding],
+            n_results=n_results,
+            where=where,
+            include=["documents", "metadatas", "distances"]
+        )
+        
+        search_results = []
+        if results["ids"] and results["ids"][0]:
+            for i, doc_id in enumerate(results["ids"][0]):
+                search_results.append({
+                    "id": doc_id,
+                    "content": results["documents"][0][i],
+                    "metadata": results["metadatas"][0][i],
+                    "similarity": 1 - results["distances"][0][i]  # 거리를 유사도로 변환
+                })
+        return search_results
+    
     async def _text_search(self, collection, query: str, n_results: int, where: Optional[Dict]) -> List[Dict]:
         """텍스트 기반 폴백 검색"""
         try:
@@ -270,7 +417,13 @@ class VectorStore:
             self.logger.error(f"텍스트 검색 실패: {e}")
             return []
     
-    async def _generate_embedding(self, text: str) -> Optional[List[float]]:
+    async def _embedding_model_name(self) -> str:
+        """임베딩 캐시 키용 모델명 (폴백 모델이 로드될 수 있으므로 로딩 후 실제 모델명 사용)"""
+        if self.embedding_cache is not None and hasattr(self.embedding_provider, "initialize"):
+            await self.embedding_provider.initialize()
+        return getattr(self.embedding_provider, "loaded_model_name", None) or self.embedding_provider.model_name
+    
+    async def _generate_embedding(self, text: str) -> Optional[np.ndarray]:
         """
         텍스트의 임베딩을 생성합니다 (Qwen3 사용)
         
@@ -278,14 +431,22 @@ class VectorStore:
             text: 임베딩할 텍스트
             
         Returns:
-            임베딩 벡터 또는 None
+            float32 임베딩 벡터 또는 None
         """
         try:
             if self.embedding_provider:
-                # Qwen3 임베딩 생성
+                model_name = await self._embedding_model_name()
+                if self.embedding_cache is not None:
+                    cached = self.embedding_cache.get(model_name, text)
+                    if cached is not None:
+                        return cached
+                
+                # Qwen3 임베딩 생성 (동시 호출은 제공자 내부에서 마이크로 배치로 묶임)
                 embedding = await self.embedding_provider.encode_text(text)
-                if embedding:
+                if embedding is not None and len(embedding) > 0:
                     self.logger.debug(f"Qwen3 임베딩 생성 성공: {len(embedding)} 차원")
+                    if self.embedding_cache is not None:
+                        self.embedding_cache.put(model_name, text, embedding)
                     return embedding
             
             self.logger.warning("임베딩 제공자가 없거나 실패, None 반환")
@@ -295,6 +456,46 @@ class VectorStore:
             self.logger.error(f"임베딩 생성 실패: {e}")
             return None
     
+    async def _generate_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        여러 텍스트의 임베딩을 한 번의 배치 인코딩으로 생성합니다
+        
+        Args:
+            texts: 임베딩할 텍스트 리스트
+            
+        Returns:
+            텍스트 순서와 같은 임베딩 리스트 (실패한 항목은 None)
+        """
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        if not self.embedding_provider or not texts:
+            return embeddings
+        
+        try:
+            model_name = await self._embedding_model_name()
+            missing = []
+            for i, text in enumerate(texts):
+                cached = self.embedding_cache.get(model_name, text) if self.embedding_cache is not None else None
+                if cached is not None:
+                    embeddings[i] = cached
+                else:
+                    missing.append(i)
+            
+            if missing:
+                encoded = await self.embedding_provider.encode_batch([texts[i] for i in missing])
+                for i, embedding in zip(missing, encoded):
+                    if embedding is None or len(embedding) == 0:
+                        continue
+                    embeddings[i] = embedding
+                    if self.embedding_cache is not None:
+                        self.embedding_cache.put(model_name, texts[i], embedding)
+            
+            self.logger.debug(f"배치 임베딩 생성: {len(texts)}개 (인코딩 {len(missing)}개)")
+            
+        except Exception as e:
+            self.logger.error(f"배치 임베딩 생성 실패: {e}")
+        
+        return embeddings
+    
     async def get_document(self, collection_type: CollectionType, doc_id: str) -> Optional[Dict[str, Any]]:
         """
         특정 문서를 가져옵니다
@@ -395,7 +596,7 @@ class VectorStore:
             
             # 기존 컬렉션 삭제
             try:
-                self.client.delete_collection(collection_name)
+                self.backend.delete_collection(collection_name)
             except Exception:
                 pass  # 컬렉션이 없어도 무시
             
@@ -409,11 +610,21 @@ class VectorStore:
             self.logger.error(f"컬렉션 초기화 실패: {e}")
             return False
     
+    def get_embedding_cache_stats(self) -> Dict[str, Any]:
+        """임베딩 캐시 히트/미스 통계를 가져옵니다"""
+        if self.embedding_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.embedding_cache.get_stats()}
+    
     def close(self):
         """연결을 종료합니다"""
         try:
-            if self.client:
-                # ChromaDB는 자동으로 연결이 정리됨
+            if self.embedding_cache is not None:
+                self.embedding_cache.close()
+            
+            if self.backend:
+                # ChromaDB는 자동으로 연결이 정리됨, NumPy 백엔드는 파일 flush
+                self.backend.close()
                 self.collections.clear()
                 self.logger.info("벡터 저장소 연결 종료")
         except Exception as e:
@@ -554,7 +554,8 @@ class MonitoringDashboard:
             'real_time_system': list(self.real_time_data['system'])[-20:],  # 최근 20개
             'real_time_ai': list(self.real_time_data['ai'])[-20:],
             'system_report': self.report_generator.generate_system_report(hours=1),
-            'ai_report': self.report_generator.generate_ai_report(hours=1)
+            'ai_report': self.report_generator.generate_ai_report(hours=1),
+            'llm_usage': global_performance_monitor.get_llm_usage_statistics()
         }
     
     def create_dash_app(self):
@@ -610,6 +611,17 @@ class MonitoringDashboard:
                         ])
                     ])
                 ], width=6)
+            ], className="mb-4"),
+            
+            dbc.Row([
+                dbc.Col([
+                    dbc.Card([
+                        dbc.CardBody([
+                            html.H4("프롬프트별 토큰/지연", className="card-title"),
+                            html.Div(id="llm-usage-table")
+                        ])
+                    ])
+                ], width=12)
             ]),
             
             dcc.Interval(
@@ -623,7 +635,8 @@ class MonitoringDashboard:
             [Output('system-metrics-graph', 'figure'),
              Output('ai-metrics-graph', 'figure'),
              Output('system-status', 'children'),
-             Output('recent-alerts', 'children')],
+             Output('recent-alerts', 'children'),
+             Output('llm-usage-table', 'children')],
             [Input('interval-component', 'n_intervals')]
         )
         def update_dashboard(n):
@@ -648,11 +661,14 @@ class MonitoringDashboard:
             # 최근 알림
             recent_alerts = self._create_alerts_display()
             
-            return system_fig, ai_fig, system_status, recent_alerts
+            # 프롬프트별 토큰/지연
+            llm_usage = self._create_llm_usage_table(data['llm_usage'])
+            
+            return system_fig, ai_fig, system_status, recent_alerts, llm_usage
             
         except Exception as e:
             logger.error(f"대시보드 업데이트 오류: {e}")
-            return {}, {}, f"오류: {e}", "알림을 불러올 수 없습니다"
+            return {}, {}, f"오류: {e}", "알림을 불러올 수 없습니다", "사용량을 불러올 수 없습니다"
     
     def _create_system_graph(self, data: List[Dict]):
         """시스템 메트릭 그래프 생성"""
@@ -821,6 +837,34 @@ class MonitoringDashboard:
                 dbc.Alert(f"알림 데이터 로드 오류: {e}", color="danger")
             ])
     
+    def _create_llm_usage_table(self, usage: Dict[str, Dict[str, Any]]) -> html.Div:
+        """호출 지점별 입력/출력 토큰 및 지연 p50/p95 표 생성 (토큰 비중 큰 순)"""
+        if not usage:
+            return html.Div([
+                dbc.Alert("LLM 호출 기록이 없습니다", color="info")
+            ])
+        
+        header = html.Thead(html.Tr([
+            html.Th(title) for title in (
+                "호출 지점", "호출 수", "입력 p50/p95", "출력 p50/p95", "지연 p50/p95", "토큰 비중", "추정값 비율"
+            )
+        ]))
+        rows = [
+            html.Tr([
+                html.Td(name),
+                html.Td(stats['calls']),
+                html.Td(f"{stats['p50_prompt_tokens']:,} / {stats['p95_prompt_tokens']:,}"),
+                html.Td(f"{stats['p50_output_tokens']:,} / {stats['p95_output_tokens']:,}"),
+                html.Td(f"{stats['p50_latency']:.2f}초 / {stats['p95_latency']:.2f}초"),
+                html.Td(f"{stats['token_share']:.1f}%"),
+                html.Td(f"{stats['estimated_ratio'] * 100:.0f}%")
+            ])
+            for name, stats in usage.items()
+        ]
+        return html.Div([
+            dbc.Table([header, html.Tbody(rows)], bordered=True, hover=True, size="sm")
+        ])
+    
     def run_dashboard(self):
         """대시보드 실행"""
         app = self.create_dash_app()
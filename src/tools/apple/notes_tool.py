@@ -76,6 +76,8 @@ class AppleNotesTool(BaseTool):
                 )
             ],
             tags=["apple", "notes", "memo", "productivity"],
+            read_only_actions=["search", "read"],
+            terminal_actions=["create", "search", "update", "delete", "read"],
             timeout=10
         )
 
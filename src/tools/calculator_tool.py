@@ -62,6 +62,8 @@ class CalculatorTool(BaseTool):
             ],
             tags=["math", "calculation", "arithmetic", "numbers"],
             requires_auth=False,
+            side_effects=False,
+            terminal=True,
             timeout=5
         )
     
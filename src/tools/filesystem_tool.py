@@ -186,6 +186,7 @@ class FilesystemTool(BaseTool):
             ],
             requires_auth=False,
             timeout=20,
+            read_only_actions=["list", "stat"],
         )
 
     async def _initialize(self) -> None:
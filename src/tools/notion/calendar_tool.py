@@ -149,7 +149,9 @@ class CalendarTool(BaseTool):
             description="Notion 캘린더 데이터베이스에서 일정을 관리합니다",
             category=ToolCategory.PRODUCTIVITY,
             parameters=parameters,
-            tags=["notion", "calendar", "schedule", "productivity"]
+            tags=["notion", "calendar", "schedule", "productivity"],
+            read_only_actions=["get", "list"],
+            terminal_actions=["create", "update", "delete", "get", "list"]
         )
     
     async def _ensure_client(self):
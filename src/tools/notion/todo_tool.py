@@ -169,7 +169,9 @@ class TodoTool(BaseTool):
             description="Notion 할일 데이터베이스에서 할일을 관리합니다",
             category=ToolCategory.PRODUCTIVITY,
             parameters=parameters,
-            tags=["notion", "todo", "task", "productivity"]
+            tags=["notion", "todo", "task", "productivity"],
+            read_only_actions=["get", "list"],
+            terminal_actions=["create", "update", "delete", "get", "list", "complete"]
         )
     
     async def _ensure_client(self):
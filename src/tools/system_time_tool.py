@@ -50,7 +50,9 @@ class SystemTimeTool(BaseTool):
                     default="%Y년 %m월 %d일 %H시 %M분"
                 )
             ],
-            tags=["시간", "날짜", "시스템", "시간대"]
+            tags=["시간", "날짜", "시스템", "시간대"],
+            side_effects=False,
+            terminal=True
         )
     
     @property
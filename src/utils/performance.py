@@ -17,7 +17,9 @@ from enum import Enum
 import weakref
 import json
 import gc
+import math
 import sys
+from collections import deque
 
 from src.utils.logger import get_logger
 from src.utils.error_handler import handle_errors, retry_on_failure
@@ -295,6 +297,16 @@ class PerformanceMonitor:
         self._monitoring = False
         self._monitor_task: Optional[asyncio.Task] = None
         
+        # 캐시별 조회 결과 카운터 (예: {"llm_response": {"hit_exact": 3, "miss": 5}})
+        self.cache_counters: Dict[str, Dict[str, int]] = {}
+        
+        # 호출 지점(prompt_type)별 최근 LLM 호출 토큰/지연 기록
+        # 항목: (입력 토큰, 출력 토큰, 지연 초, API 집계 여부)
+        self.llm_usage_window = 500
+        self.llm_usage: Dict[str, deque] = {}
+        self.tokens_processed = 0
+        self._llm_usage_lock = threading.Lock()
+        
         # 시스템 메트릭 수집을 위한 프로세스 정보
         self.process = psutil.Process()
     
@@ -393,6 +405,69 @@ class PerformanceMonitor:
         if not success:
             self.error_count += 1
     
+    def record_cache_access(self, cache_name: str, outcome: str):
+        """캐시 조회 결과 기록 (outcome: hit_* / miss / bypass)"""
+        counters = self.cache_counters.setdefault(cache_name, {})
+        counters[outcome] = counters.get(outcome, 0) + 1
+    
+    def record_llm_usage(self, call_site: str, prompt_tokens: int, output_tokens: int,
+                         latency: float, from_api: bool = True):
+        """LLM 호출 1건의 토큰 사용량/지연 기록 (from_api=False 면 로컬 추정값)"""
+        with self._llm_usage_lock:
+            samples = self.llm_usage.get(call_site)
+            if samples is None:
+                samples = self.llm_usage[call_site] = deque(maxlen=self.llm_usage_window)
+            samples.append((prompt_tokens, output_tokens, latency, from_api))
+            self.tokens_processed += prompt_tokens + output_tokens
+    
+    @staticmethod
+    def _percentile(values: List[float], percentile: float) -> float:
+        ordered = sorted(values)
+        index = min(len(ordered) - 1, int(math.ceil(percentile / 100 * len(ordered))) - 1)
+        return ordered[max(0, index)]
+    
+    def get_llm_usage_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """호출 지점별 입력/출력 토큰 및 지연 p50/p95 (최근 기록 기준, 토큰 비중 큰 순)"""
+        with self._llm_usage_lock:
+            snapshot = {name: list(samples) for name, samples in self.llm_usage.items()}
+        
+        window_tokens = sum(p + o for samples in snapshot.values() for p, o, _, _ in samples)
+        stats: Dict[str, Dict[str, Any]] = {}
+        for name, samples in snapshot.items():
+            if not samples:
+                continue
+            prompt_tokens = [p for p, _, _, _ in samples]
+            output_tokens = [o for _, o, _, _ in samples]
+            latencies = [latency for _, _, latency, _ in samples]
+            total = sum(prompt_tokens) + sum(output_tokens)
+            stats[name] = {
+                "calls": len(samples),
+                "p50_prompt_tokens": self._percentile(prompt_tokens, 50),
+                "p95_prompt_tokens": self._percentile(prompt_tokens, 95),
+                "p50_output_tokens": self._percentile(output_tokens, 50),
+                "p95_output_tokens": self._percentile(output_tokens, 95),
+                "p50_latency": self._percentile(latencies, 50),
+                "p95_latency": self._percentile(latencies, 95),
+                "total_tokens": total,
+                "token_share": (total / window_tokens * 100) if window_tokens > 0 else 0,
+                "estimated_ratio": sum(1 for *_, from_api in samples if not from_api) / len(samples)
+            }
+        return dict(sorted(stats.items(), key=lambda item: item[1]["total_tokens"], reverse=True))
+    
+    def get_cache_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """캐시별 히트율 통계"""
+        stats = {}
+        for name, counters in self.cache_counters.items():
+            hits = sum(v for k, v in counters.items() if k.startswith("hit"))
+            lookups = hits + counters.get("miss", 0)
+            stats[name] = {
+                **counters,
+                "hits": hits,
+                "lookups": lookups,
+                "hit_rate": (hits / lookups * 100) if lookups > 0 else 0
+            }
+        return stats
+    
     def get_current_stats(self) -> Dict[str, Any]:
         """현재 성능 통계"""
         if not self.metrics_history:
@@ -437,9 +512,11 @@ class PerformanceMonitor:
             'successful_requests': self.request_count - self.error_count,
             'failed_requests': self.error_count,
             'avg_response_time': 0.0,
-            'active_sessions': len(asyncio.all_tasks()) if self.is_monitoring else 0,
+            'active_sessions': len(asyncio.all_tasks()) if self._monitoring else 0,
             'queue_size': 0,
-            'tokens_processed': getattr(self, 'tokens_processed', 0)
+            'tokens_processed': self.tokens_processed,
+            'caches': self.get_cache_statistics(),
+            'llm_usage': self.get_llm_usage_statistics()
         }
         
         # 평균 응답 시간 계산
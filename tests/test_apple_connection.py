@@ -0,0 +1,142 @@
+"""AppleMCPConnection 테스트 (bun 대신 Python 대역 서버 사용)"""
+
+import asyncio
+import sys
+import textwrap
+
+import pytest
+
+from src.mcp.apple_client import AppleMCPClient
+from src.mcp.apple_connection import AppleMCPConnection, MCPConnectionError
+
+
+STAND_IN_SERVER = textwrap.dedent('''
+    import json
+    import sys
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        method, params = request["method"], request.get("params", {})
+        if method == "crash":
+            sys.exit(3)
+        if method == "big":
+            result = {"text": "가" * params["size"]}
+        else:
+            result = params
+        sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}) + "\\n")
+        sys.stdout.flush()
+''')
+
+
+# 요청 N개를 모아 두었다가 역순으로 응답하는 대역 서버 (N은 첫 번째 인자)
+REORDERING_SERVER = textwrap.dedent('''
+    import json
+    import sys
+
+    batch_size = int(sys.argv[1])
+    buffered = []
+    for line in sys.stdin:
+        buffered.append(json.loads(line))
+        if len(buffered) < batch_size:
+            continue
+        for request in reversed(buffered):
+            result = {"content": request["params"]["arguments"]}
+            sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result}) + "\\n")
+        sys.stdout.flush()
+        buffered = []
+''')
+
+
+@pytest.fixture
+def server_command(tmp_path):
+    script = tmp_path / "stand_in_server.py"
+    script.write_text(STAND_IN_SERVER, encoding="utf-8")
+    return [sys.executable, str(script)]
+
+
+async def test_response_larger_than_default_stream_limit(server_command, tmp_path):
+    connection = AppleMCPConnection(str(tmp_path), command=server_command, request_timeout=10)
+    try:
+        message = await connection.request("big", {"size": 100_000})  # UTF-8 약 300KiB 한 줄
+        assert len(message["result"]["text"]) == 100_000
+        assert connection.is_running
+        assert connection.crash_count == 0
+    finally:
+        await connection.close()
+
+
+async def test_oversized_response_restarts_instead_of_hanging(server_command, tmp_path):
+    connection = AppleMCPConnection(
+        str(tmp_path), command=server_command, request_timeout=10,
+        restart_backoff=0.01, stream_limit=64 * 1024
+    )
+    try:
+        with pytest.raises(MCPConnectionError):
+            await connection.request("big", {"size": 100_000}, timeout=5)
+        assert not connection.is_running
+        assert connection.crash_count == 1
+
+        message = await connection.request("echo", {"value": 1})
+        assert message["result"] == {"value": 1}
+        assert connection.start_count == 2
+    finally:
+        await connection.close()
+
+
+async def test_crash_fails_pending_and_restarts(server_command, tmp_path):
+    connection = AppleMCPConnection(
+        str(tmp_path), command=server_command, request_timeout=10, restart_backoff=0.01
+    )
+    try:
+        assert (await connection.request("echo", {"n": 1}))["result"] == {"n": 1}
+        first_pid = connection.process.pid
+
+        with pytest.raises(MCPConnectionError):
+            await connection.request("crash", {}, timeout=5)
+        assert connection.crash_count == 1
+
+        assert (await connection.request("echo", {"n": 2}))["result"] == {"n": 2}
+        assert connection.process.pid != first_pid
+        assert connection.start_count == 2
+    finally:
+        await connection.close()
+
+
+async def test_restart_limit_recovers_after_cooldown(server_command, tmp_path):
+    connection = AppleMCPConnection(
+        str(tmp_path), command=server_command, request_timeout=10,
+        max_restarts=1, restart_backoff=0.01, restart_cooldown=0.2
+    )
+    try:
+        for _ in range(2):  # 최초 실행 + 재시작 1회 모두 크래시
+            with pytest.raises(MCPConnectionError):
+                await connection.request("crash", {}, timeout=5)
+
+        with pytest.raises(MCPConnectionError, match="재시작 한도"):
+            await connection.request("echo", {"n": 1}, timeout=5)
+
+        await asyncio.sleep(0.25)
+        assert (await connection.request("echo", {"n": 2}))["result"] == {"n": 2}
+    finally:
+        await connection.close()
+
+
+async def test_concurrent_calls_matched_by_id_out_of_order(tmp_path):
+    script = tmp_path / "reordering_server.py"
+    script.write_text(REORDERING_SERVER, encoding="utf-8")
+    connection = AppleMCPConnection(
+        str(tmp_path), command=[sys.executable, str(script), "5"], request_timeout=10
+    )
+    client = AppleMCPClient(str(tmp_path), connection=connection)
+    try:
+        # 서버는 5개가 모두 도착해야 응답하므로 호출들이 한 프로세스에서 동시에 진행 중이어야 함
+        results = await asyncio.gather(*(
+            client.call_tool("notes", {"operation": "search", "searchText": f"메모 {i}"})
+            for i in range(5)
+        ))
+        assert [r["content"]["searchText"] for r in results] == [f"메모 {i}" for i in range(5)]
+        assert connection.start_count == 1
+        assert connection.in_flight == 0
+        assert connection.get_stats()["latency"]["tools/call:notes"]["count"] == 5
+    finally:
+        await connection.close()
@@ -0,0 +1,86 @@
+"""콘텐츠 주소 임베딩 캐시 디스크 저장소 테스트"""
+
+import numpy as np
+
+from src.memory.embedding_cache import EmbeddingCache, make_cache_key
+
+
+def _vector(value: float) -> np.ndarray:
+    return np.full(4, value, dtype=np.float32)
+
+
+def test_disk_entries_survive_restart(tmp_path):
+    cache = EmbeddingCache(tmp_path, max_memory_entries=1)
+    cache.put("model", "첫 문장", _vector(1))
+    cache.put("model", "둘째 문장", _vector(2))
+    cache.close()
+
+    reopened = EmbeddingCache(tmp_path)
+    assert np.array_equal(reopened.get("model", "첫  문장 "), _vector(1))
+    assert np.array_equal(reopened.get("model", "둘째 문장"), _vector(2))
+    assert reopened.get("other-model", "첫 문장") is None
+    assert reopened.get_stats()["disk_hits"] == 2
+
+
+def test_spill_after_skipped_index_lines_does_not_reuse_rows(tmp_path):
+    cache = EmbeddingCache(tmp_path)
+    for i in range(3):
+        cache.put("model", f"문장 {i}", _vector(i))
+    cache.close()
+
+    # 행 0 항목이 손상되고 마지막 줄이 잘린 채로 중단된 상황
+    index_path = tmp_path / EmbeddingCache.INDEX_FILE
+    lines = index_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    index_path.write_text("".join(["손상된 줄\n"] + lines[1:] + [make_cache_key("model", "잘림") + "\t1"]),
+                          encoding="utf-8")
+
+    reopened = EmbeddingCache(tmp_path, max_memory_entries=1)
+    assert len(reopened._disk_index) == 2
+    reopened.put("model", "새 문장", _vector(9))
+    reopened.put("model", "다른 문장", _vector(7))  # 메모리에서 앞 항목을 밀어냄
+
+    for i in (1, 2):
+        assert np.array_equal(reopened.get("model", f"문장 {i}"), _vector(i))
+    assert np.array_equal(reopened.get("model", "새 문장"), _vector(9))
+    assert reopened.get("model", "잘림") is None
+
+
+class FallbackEmbeddingProvider:
+    """지정 모델 로딩에 실패해 폴백 모델을 쓰는 임베딩 제공자 대역"""
+
+    model_name = "Qwen/configured"
+
+    def __init__(self, loaded_model_name: str, dim: int):
+        self.loaded_model_name = None
+        self._loaded = loaded_model_name
+        self.dim = dim
+        self.encoded = 0
+
+    async def initialize(self):
+        self.loaded_model_name = self._loaded
+
+    async def encode_text(self, text):
+        self.encoded += 1
+        return np.ones(self.dim, dtype=np.float32)
+
+    async def encode_batch(self, texts):
+        return [await self.encode_text(text) for text in texts]
+
+
+async def test_vector_store_keys_cache_on_loaded_model(tmp_path):
+    from src.memory.vector_store import VectorStore
+
+    cache = EmbeddingCache(tmp_path / "cache")
+    fallback = FallbackEmbeddingProvider("all-MiniLM-L6-v2", dim=4)
+    store = VectorStore(str(tmp_path / "store"), embedding_provider=fallback, embedding_cache=cache)
+    await store._generate_embedding("같은 문장")
+
+    assert cache.get("all-MiniLM-L6-v2", "같은 문장") is not None
+    assert cache.get("Qwen/configured", "같은 문장") is None
+
+    # 설정 모델이 정상 로드된 실행은 폴백 벡터를 재사용하지 않음
+    qwen = FallbackEmbeddingProvider("Qwen/configured", dim=8)
+    store = VectorStore(str(tmp_path / "store"), embedding_provider=qwen, embedding_cache=cache)
+    embeddings = await store._generate_embeddings(["같은 문장"])
+    assert qwen.encoded == 1
+    assert len(embeddings[0]) == 8
@@ -0,0 +1,98 @@
+"""모델 계층/헤지 요청 테스트 (MockLLMProvider 의 계층별 인위적 지연 사용)"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.ai_engine.hedging import HedgedRequester
+from src.ai_engine.llm_provider import ChatMessage, MockLLMProvider
+from src.ai_engine.prompt_profiles import PromptProfileRegistry
+
+
+class TrackingMockProvider(MockLLMProvider):
+    """취소된 계층 호출을 기록하는 Mock"""
+
+    def __init__(self):
+        super().__init__()
+        self.prompt_profiles = None
+        self.hedger = HedgedRequester(percentile=90, min_samples=10, min_delay=0.01)
+        self.cancelled = []
+
+    async def _call_model(self, messages, temperature=0.7, max_tokens=None, model_tier="strong", **kwargs):
+        try:
+            return await super()._call_model(messages, temperature, max_tokens, model_tier=model_tier, **kwargs)
+        except asyncio.CancelledError:
+            self.cancelled.append(model_tier)
+            raise
+
+
+def _messages(prompt_type: str = "action"):
+    return [ChatMessage(role="user", content="테스트 요청", metadata={"prompt_type": prompt_type})]
+
+
+@pytest.fixture(autouse=True)
+def mock_echo_mode(monkeypatch):
+    monkeypatch.setenv("PAI_MOCK_MODE", "echo")
+
+
+async def _warm_up(provider: TrackingMockProvider, slow_delay: float) -> None:
+    """p90 = 빠른 지연이 되도록 빠른 표본 9개 + 느린 꼬리 표본 1개 축적"""
+    provider.tier_delays = {"strong": 0.02, "fast": 0.02}
+    for _ in range(9):
+        await provider.generate_response(_messages())
+    provider.tier_delays["strong"] = slow_delay
+    await provider.generate_response(_messages())
+
+
+async def test_slow_primary_is_hedged_and_cancelled():
+    provider = TrackingMockProvider()
+    await _warm_up(provider, slow_delay=0.5)
+    assert provider.hedger.stats["hedged"] == 0
+
+    provider.tier_delays = {"strong": 2.0, "fast": 0.02}
+    started = time.monotonic()
+    response = await provider.generate_response(_messages())
+    elapsed = time.monotonic() - started
+    await asyncio.sleep(0)  # 취소된 1차 호출 정리
+
+    assert response.metadata["model_tier"] == "fast"
+    assert elapsed < 0.5
+    assert provider.cancelled == ["strong"]
+    stats = provider.hedger.get_stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    # 0.5초 꼬리 표본 기준으로 절감 지연 추정
+    assert stats["estimated_saved_latency"] > 0.3
+
+
+async def test_fast_primary_wins_without_hedge():
+    provider = TrackingMockProvider()
+    await _warm_up(provider, slow_delay=0.5)
+
+    provider.tier_delays = {"strong": 0.005, "fast": 0.005}
+    response = await provider.generate_response(_messages())
+
+    assert response.metadata["model_tier"] == "strong"
+    assert provider.hedger.stats["hedged"] == 0
+    assert provider.cancelled == []
+
+
+async def test_background_calls_are_not_hedged():
+    provider = TrackingMockProvider()
+    await _warm_up(provider, slow_delay=0.5)
+
+    provider.tier_delays = {"strong": 0.1, "fast": 0.01}
+    response = await provider.generate_response(_messages("proactive"))
+
+    assert response.metadata["model_tier"] == "strong"
+    assert provider.hedger.stats["hedged"] == 0
+
+
+async def test_profile_tier_routes_to_fast_model():
+    provider = TrackingMockProvider()
+    provider.hedger = None
+    provider.prompt_profiles = PromptProfileRegistry()
+
+    assert (await provider.generate_response(_messages("goal_check"))).metadata["model_tier"] == "fast"
+    assert (await provider.generate_response(_messages("action"))).metadata["model_tier"] == "strong"
@@ -0,0 +1,173 @@
+"""LLM 호출 스케줄러 테스트 (AIMD, RPM/TPM 윈도우, 우선순위, 대기 마감)"""
+
+import asyncio
+
+import pytest
+
+from src.ai_engine import llm_scheduler
+from src.ai_engine.llm_scheduler import LLMDeadlineExceeded, LLMScheduler
+
+
+class OverloadError(Exception):
+    pass
+
+
+async def _hold(scheduler, release: asyncio.Event, priority: str = "normal", **kwargs):
+    async with scheduler.slot(priority, **kwargs):
+        await release.wait()
+
+
+async def _overload(scheduler):
+    with pytest.raises(OverloadError):
+        async with scheduler.slot():
+            raise OverloadError("429 Resource has been exhausted")
+
+
+async def test_concurrency_is_bounded_by_limit():
+    scheduler = LLMScheduler(initial_limit=2, max_limit=2)
+
+    async def call():
+        async with scheduler.slot():
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    stats = scheduler.get_stats()
+    assert stats["max_in_flight"] == 2
+    assert stats["succeeded"] == 6
+    assert stats["in_flight"] == 0
+
+
+async def test_aimd_backoff_and_recovery():
+    scheduler = LLMScheduler(initial_limit=8, max_limit=8, decrease_cooldown=60.0)
+
+    await _overload(scheduler)
+    assert scheduler.limit == 4
+    # 쿨다운 안의 연속 과부하는 한 번만 감소
+    await _overload(scheduler)
+    assert scheduler.limit == 4
+    assert scheduler.stats["overloaded"] == 2
+    assert scheduler.stats["decreases"] == 1
+
+    # 일반 오류는 한도에 영향 없음
+    with pytest.raises(ValueError):
+        async with scheduler.slot():
+            raise ValueError("파싱 실패")
+    assert scheduler.limit == 4
+    assert scheduler.stats["failed"] == 1
+
+    # 가산 증가: 한도만큼 성공하면 +1, max_limit 에서 멈춤
+    for _ in range(4):
+        async with scheduler.slot():
+            pass
+    assert scheduler.limit == pytest.approx(5, abs=0.2)
+    for _ in range(100):
+        async with scheduler.slot():
+            pass
+    assert scheduler.limit == 8
+
+
+async def test_decrease_respects_min_limit():
+    scheduler = LLMScheduler(initial_limit=1, min_limit=1, decrease_cooldown=0.0)
+    await _overload(scheduler)
+    assert scheduler.limit == 1
+
+
+async def test_priority_order_when_slot_frees():
+    scheduler = LLMScheduler(initial_limit=1, max_limit=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, release))
+    await asyncio.sleep(0)
+
+    order = []
+
+    async def call(priority):
+        async with scheduler.slot(priority):
+            order.append(priority)
+
+    tasks = [asyncio.create_task(call(p)) for p in ("background", "normal", "interactive", "normal")]
+    await asyncio.sleep(0)
+    assert scheduler.get_stats()["queued"] == 4
+
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    assert order == ["interactive", "normal", "normal", "background"]
+
+
+async def test_deadline_drops_queued_request_without_losing_slot():
+    scheduler = LLMScheduler(initial_limit=1, max_limit=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(LLMDeadlineExceeded):
+        async with scheduler.slot("interactive", deadline=0.05):
+            pass
+    assert scheduler.stats["dropped_deadline"] == 1
+
+    release.set()
+    await holder
+    async with scheduler.slot():
+        assert scheduler.get_stats()["in_flight"] == 1
+    stats = scheduler.get_stats()
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+
+
+async def test_cancel_while_queued_does_not_leak_slot():
+    scheduler = LLMScheduler(initial_limit=1, max_limit=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, release))
+    await asyncio.sleep(0)
+
+    waiter = asyncio.create_task(_hold(scheduler, asyncio.Event()))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    release.set()
+    await holder
+    async with asyncio.timeout(1):
+        async with scheduler.slot():
+            pass
+    assert scheduler.get_stats()["in_flight"] == 0
+
+
+async def test_rpm_window_throttles_until_expiry(monkeypatch):
+    monkeypatch.setattr(llm_scheduler, "_WINDOW_SECONDS", 0.2)
+    scheduler = LLMScheduler(initial_limit=4, requests_per_minute=2)
+    loop = asyncio.get_running_loop()
+
+    started = []
+
+    async def call():
+        async with scheduler.slot():
+            started.append(loop.time())
+
+    begin = loop.time()
+    await asyncio.gather(call(), call(), call())
+    assert started[1] - begin < 0.1
+    assert started[2] - begin >= 0.15
+    assert scheduler.stats["throttled"] >= 1
+
+
+async def test_tpm_window_uses_actual_tokens(monkeypatch):
+    monkeypatch.setattr(llm_scheduler, "_WINDOW_SECONDS", 0.2)
+    scheduler = LLMScheduler(initial_limit=4, tokens_per_minute=100)
+    loop = asyncio.get_running_loop()
+
+    # 추정 80 토큰을 예약했지만 실제 20 토큰만 사용 → 50 토큰 요청이 바로 시작
+    async with scheduler.slot(estimated_tokens=80) as ticket:
+        ticket.tokens = 20
+    begin = loop.time()
+    async with scheduler.slot(estimated_tokens=50) as ticket:
+        ticket.tokens = 50
+    assert loop.time() - begin < 0.1
+    assert scheduler.get_stats()["window_tokens"] == 70
+
+    # 윈도우 한도를 넘는 요청은 윈도우가 빌 때까지 대기
+    begin = loop.time()
+    async with scheduler.slot(estimated_tokens=60):
+        pass
+    assert loop.time() - begin >= 0.1
+    assert scheduler.stats["tokens"] == 70
@@ -0,0 +1,109 @@
+"""사용자별 공정 요청 스케줄러 테스트 (라운드로빈, 대기열 초과, 대기 중 취소)"""
+
+import asyncio
+
+import pytest
+
+from src.integration.request_scheduler import FairRequestScheduler, SchedulerOverloadedError
+
+
+async def _hold(scheduler, user_id: str, release: asyncio.Event):
+    async with scheduler.slot(user_id):
+        await release.wait()
+
+
+async def test_round_robin_between_users():
+    scheduler = FairRequestScheduler(max_concurrent=1, max_per_user=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, "holder", release))
+    await asyncio.sleep(0)
+
+    order = []
+
+    async def request(user_id, name):
+        async with scheduler.slot(user_id):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    # 사용자 A 가 요청을 몰아 보내도 B, C 가 A 의 두 번째 요청보다 먼저 처리
+    tasks = [asyncio.create_task(request(user, name)) for user, name in
+             (("A", "A1"), ("A", "A2"), ("A", "A3"), ("B", "B1"), ("C", "C1"))]
+    await asyncio.sleep(0)
+    assert scheduler.get_stats()["waiting"] == 5
+
+    release.set()
+    await asyncio.gather(holder, *tasks)
+    assert order == ["A1", "B1", "C1", "A2", "A3"]
+    stats = scheduler.get_stats()
+    assert stats["active"] == 0
+    assert stats["waiting"] == 0
+
+
+async def test_same_user_requests_run_in_order_while_others_proceed():
+    scheduler = FairRequestScheduler(max_concurrent=2, max_per_user=1)
+    release = asyncio.Event()
+    first = asyncio.create_task(_hold(scheduler, "A", release))
+    await asyncio.sleep(0)
+
+    second = asyncio.create_task(_hold(scheduler, "A", release))
+    other = asyncio.create_task(_hold(scheduler, "B", release))
+    await asyncio.sleep(0)
+    stats = scheduler.get_stats()
+    assert stats["active"] == 2  # A 1건 + B 1건
+    assert stats["waiting"] == 1  # A 의 두 번째 요청
+
+    release.set()
+    await asyncio.gather(first, second, other)
+    assert scheduler.get_stats()["admitted"] == 3
+
+
+async def test_per_user_queue_overflow_is_rejected():
+    scheduler = FairRequestScheduler(max_concurrent=4, max_per_user=1, max_queue_per_user=2)
+    release = asyncio.Event()
+    tasks = [asyncio.create_task(_hold(scheduler, "A", release)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(SchedulerOverloadedError):
+        async with scheduler.slot("A"):
+            pass
+    assert scheduler.stats["rejected"] == 1
+
+    # 다른 사용자는 영향 없음
+    async with scheduler.slot("B"):
+        pass
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.get_stats()["active"] == 0
+
+
+async def test_cancel_while_queued_does_not_leak_slot():
+    scheduler = FairRequestScheduler(max_concurrent=1)
+    release = asyncio.Event()
+    holder = asyncio.create_task(_hold(scheduler, "A", release))
+    await asyncio.sleep(0)
+
+    cancelled = asyncio.create_task(_hold(scheduler, "B", asyncio.Event()))
+    waiting = asyncio.create_task(_hold(scheduler, "C", release))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert scheduler.get_stats()["waiting"] == 1
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(holder, waiting), timeout=1)
+    stats = scheduler.get_stats()
+    assert stats["active"] == 0
+    assert stats["waiting"] == 0
+    assert stats["admitted"] == 2
+
+
+async def test_run_returns_factory_result():
+    scheduler = FairRequestScheduler()
+
+    async def work():
+        return "완료"
+
+    assert await scheduler.run("A", work) == "완료"
+    assert scheduler.get_stats()["active"] == 0
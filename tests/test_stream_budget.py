@@ -0,0 +1,80 @@
+"""스트림 호출의 프롬프트 프로필 예산/잘림 이어 쓰기 테스트 (MockLLMProvider 사용)"""
+
+from src.ai_engine.llm_provider import ChatMessage, LLMResponse, MockLLMProvider
+from src.ai_engine.prompt_profiles import PromptProfile, PromptProfileRegistry
+
+
+class TruncatingMockProvider(MockLLMProvider):
+    """첫 호출은 예산에서 잘린 응답, 이어 쓰기 호출은 나머지를 돌려주는 Mock"""
+
+    def __init__(self, replies):
+        super().__init__()
+        self.hedger = None
+        self.prompt_profiles = PromptProfileRegistry(
+            profiles=(PromptProfile("final_answer", max_tokens=64, max_tokens_ceiling=1024),),
+            reasoning_reserves={"strong": 0},
+        )
+        self.replies = list(replies)
+        self.calls = []
+
+    async def _call_model(self, messages, temperature=0.7, max_tokens=None, model_tier="strong", **kwargs):
+        self.calls.append({"messages": messages, "max_tokens": max_tokens})
+        content, finish_reason = self.replies.pop(0)
+        return LLMResponse(
+            content=content,
+            model=self.model_name,
+            usage={"input_tokens": 10, "output_tokens": len(content.split())},
+            metadata={"finish_reason": finish_reason},
+        )
+
+
+def _messages():
+    return [ChatMessage(role="user", content="결과를 정리해줘", metadata={"prompt_type": "final_answer"})]
+
+
+async def _collect(provider, **kwargs):
+    usage = {}
+    chunks = [chunk async for chunk in provider.stream_generate(_messages(), usage_sink=usage, **kwargs)]
+    return chunks, usage
+
+
+async def test_truncated_stream_continues_at_ceiling():
+    provider = TruncatingMockProvider([("앞부분 답변", "MAX_TOKENS"), (" 뒷부분 답변", "STOP")])
+
+    chunks, usage = await _collect(provider)
+
+    assert "".join(chunks) == "앞부분 답변 뒷부분 답변"
+    assert provider.calls[0]["max_tokens"] == 64
+    # 이어 쓰기는 상한 예산으로, 이미 보낸 부분을 어시스턴트 메시지로 넘겨 요청
+    stats = provider.prompt_profiles.get_stats()["final_answer"]
+    assert provider.calls[1]["max_tokens"] == stats["ceiling"] >= 1024
+    assert provider.calls[1]["messages"][-2].role == "assistant"
+    assert provider.calls[1]["messages"][-2].content == "앞부분 답변"
+    assert usage["output_tokens"] == 4
+    assert usage["input_tokens"] == 20
+    assert stats["calls"] == 2
+    assert stats["truncations"] == 1
+    assert stats["retries"] == 1
+    assert stats["budget"] > 64
+
+
+async def test_complete_stream_is_recorded_without_retry():
+    provider = TruncatingMockProvider([("짧은 답변", "STOP")])
+
+    chunks, usage = await _collect(provider)
+
+    assert chunks == ["짧은 답변"]
+    assert len(provider.calls) == 1
+    stats = provider.prompt_profiles.get_stats()["final_answer"]
+    assert stats["calls"] == 1
+    assert stats["truncations"] == 0
+    assert stats["p50_output_tokens"] > 0
+
+
+async def test_explicit_max_tokens_is_not_retried():
+    provider = TruncatingMockProvider([("잘린 답변", "MAX_TOKENS")])
+
+    chunks, _ = await _collect(provider, max_tokens=32)
+
+    assert chunks == ["잘린 답변"]
+    assert [call["max_tokens"] for call in provider.calls] == [32]
@@ -0,0 +1,122 @@
+"""NumpyCollection (순수 NumPy 벡터 백엔드) 테스트"""
+
+import numpy as np
+import pytest
+
+from src.memory.vector_backends import NumpyBackend, NumpyCollection
+
+
+def _unit(*values):
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def collection():
+    return NumpyCollection("test")
+
+
+def _add_basic(collection):
+    collection.add(
+        ids=["a", "b", "c"],
+        documents=["사과 문서", "바나나 문서", "체리 문서"],
+        embeddings=[_unit(1, 0, 0), _unit(0, 1, 0), _unit(0, 0, 1)],
+        metadatas=[{"kind": "fruit", "score": 1}, {"kind": "fruit", "score": 5}, {"kind": "memo", "score": 9}],
+    )
+
+
+def test_add_replace_delete(collection):
+    _add_basic(collection)
+    assert collection.count() == 3
+
+    result = collection.query(query_embeddings=[_unit(1, 0.1, 0)], n_results=1)
+    assert result["ids"] == [["a"]]
+    assert result["distances"][0][0] == pytest.approx(1 - _unit(1, 0.1, 0)[0], abs=1e-5)
+
+    # 같은 ID는 교체 (이전 행은 검색에서 제외)
+    collection.add(ids=["a"], documents=["새 사과"], embeddings=[_unit(0, 1, 0.1)], metadatas=[{"kind": "fruit"}])
+    assert collection.count() == 3
+    assert collection.get(ids=["a"])["documents"] == ["새 사과"]
+    result = collection.query(query_embeddings=[_unit(1, 0, 0)], n_results=3)
+    assert result["ids"][0].count("a") == 1
+
+    collection.delete(ids=["b"])
+    assert collection.count() == 2
+    result = collection.query(query_embeddings=[_unit(0, 1, 0)], n_results=3)
+    assert "b" not in result["ids"][0]
+    assert result["ids"][0][0] == "a"
+
+
+def test_where_filter(collection):
+    _add_basic(collection)
+
+    assert collection.get(where={"kind": "fruit"})["ids"] == ["a", "b"]
+    assert collection.get(where={"score": {"$gte": 5}})["ids"] == ["b", "c"]
+    assert collection.get(where={"kind": {"$in": ["memo"]}})["ids"] == ["c"]
+    assert collection.get(where={"$and": [{"kind": "fruit"}, {"score": {"$gt": 1}}]})["ids"] == ["b"]
+    assert collection.get(where={"$or": [{"score": 1}, {"kind": "memo"}]})["ids"] == ["a", "c"]
+
+    result = collection.query(query_embeddings=[_unit(0, 0, 1)], n_results=3, where={"kind": "fruit"})
+    assert set(result["ids"][0]) == {"a", "b"}
+
+    collection.delete(where={"kind": "fruit"})
+    assert collection.get()["ids"] == ["c"]
+
+
+def test_records_replay(tmp_path):
+    collection = NumpyCollection("persist", path=tmp_path / "persist")
+    _add_basic(collection)
+    collection.add(ids=["b"], documents=["바나나 교체"], embeddings=[_unit(1, 1, 0)], metadatas=[{"kind": "fruit"}])
+    collection.delete(ids=["c"])
+    collection.close()
+
+    reopened = NumpyCollection("persist", path=tmp_path / "persist")
+    assert reopened.count() == 2
+    assert reopened.get(ids=["b"])["documents"] == ["바나나 교체"]
+    assert reopened.get(ids=["c"])["ids"] == []
+    result = reopened.query(query_embeddings=[_unit(1, 1, 0)], n_results=2)
+    assert result["ids"][0] == ["b", "a"]
+
+    # 이어서 추가한 행도 기존 로그 뒤에 기록
+    reopened.add(ids=["d"], documents=["새 문서"], embeddings=[_unit(0, 0, 1)])
+    reopened.close()
+    assert NumpyCollection("persist", path=tmp_path / "persist").count() == 3
+
+
+def test_backend_delete_collection_removes_files(tmp_path):
+    backend = NumpyBackend(tmp_path)
+    _add_basic(backend.get_or_create_collection("memories"))
+    backend.delete_collection("memories")
+    assert backend.get_or_create_collection("memories").count() == 0
+
+
+def test_hnsw_matches_brute_force(tmp_path):
+    rng = np.random.default_rng(7)
+    vectors = rng.normal(size=(600, 16)).astype(np.float32)
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    collection = NumpyCollection("graph", path=tmp_path / "graph", hnsw_threshold=500)
+    collection.add(ids=ids, documents=ids, embeddings=vectors,
+                   metadatas=[{"parity": i % 2} for i in range(len(vectors))])
+    collection._hnsw_thread.join(timeout=60)
+    assert collection._hnsw is not None
+    assert (tmp_path / "graph" / NumpyCollection.HNSW_FILE).exists()
+
+    # 삭제된 행은 그래프에 남아 있어도 결과에서 제외
+    collection.delete(ids=ids[:10])
+    alive = np.arange(10, len(vectors))
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    k = 10
+    recalls = []
+    for query in rng.normal(size=(20, 16)).astype(np.float32):
+        query = query / np.linalg.norm(query)
+        expected = {ids[i] for i in alive[np.argsort(-(normalized[alive] @ query))[:k]]}
+        hits = collection.query(query_embeddings=[query], n_results=k)["ids"][0]
+        assert len(hits) == k
+        assert not set(hits) & set(ids[:10])
+        recalls.append(len(expected & set(hits)) / k)
+
+        filtered = collection.query(query_embeddings=[query], n_results=k, where={"parity": 0})["ids"][0]
+        assert all(int(doc_id.split("-")[1]) % 2 == 0 for doc_id in filtered)
+    assert np.mean(recalls) >= 0.9
+    collection.close()